@@ -0,0 +1,132 @@
+"""Range-partition bandwidth_samples hourly on sample_at.
+
+Revision ID: 549_partition_bandwidth_samples
+Revises: 548_inbox_observation_quarantine
+Create Date: 2026-10-16
+
+Retention used to DELETE expired raw samples row by row; at tens of thousands
+of samples a minute that bloats the table and keeps autovacuum busy. The table
+becomes ``PARTITION BY RANGE (sample_at)`` with hourly children
+(``bandwidth_samples_pYYYYMMDDHH``) and a DEFAULT partition, so retention can
+drop whole partitions (app.services.bandwidth_partitions). Partition keys must
+be part of the primary key, hence ``(id, sample_at)``.
+
+Existing rows are copied across. Hourly partitions are premade from the oldest
+sample (at most a week back) to a day ahead; anything older lands in the
+default partition and is trimmed by the next retention run. PostgreSQL only.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "549_partition_bandwidth_samples"
+down_revision: str | None = "548_inbox_observation_quarantine"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COLUMNS = (
+    "id, subscription_id, device_id, interface_id, rx_bps, tx_bps, "
+    "sample_at, created_at"
+)
+_COLUMN_DDL = """
+    id uuid NOT NULL,
+    subscription_id uuid NOT NULL REFERENCES subscriptions(id),
+    device_id uuid REFERENCES network_devices(id),
+    interface_id uuid REFERENCES device_interfaces(id),
+    rx_bps integer NOT NULL,
+    tx_bps integer NOT NULL,
+    sample_at timestamp with time zone NOT NULL,
+    created_at timestamp with time zone NOT NULL
+"""
+_INDEXES = (
+    ("ix_bandwidth_samples_sample_at", "sample_at"),
+    ("ix_bandwidth_samples_subscription_sample_at", "subscription_id, sample_at"),
+)
+_MAX_BACKFILL = timedelta(days=7)
+_PREMAKE = timedelta(hours=24)
+_SPAN = timedelta(hours=1)
+
+
+def _hour(ts: datetime) -> datetime:
+    return ts.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def _rename_legacy(suffix: str) -> None:
+    op.execute(f"ALTER TABLE bandwidth_samples RENAME TO bandwidth_samples_{suffix}")
+    op.execute(
+        f"ALTER INDEX bandwidth_samples_pkey RENAME TO bandwidth_samples_{suffix}_pkey"
+    )
+    for name, _columns in _INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {name} RENAME TO {name}_{suffix}")
+
+
+def _create_indexes() -> None:
+    for name, columns in _INDEXES:
+        op.execute(f"CREATE INDEX {name} ON bandwidth_samples ({columns})")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    _rename_legacy("unpartitioned")
+    op.execute(
+        f"""
+        CREATE TABLE bandwidth_samples ({_COLUMN_DDL},
+            CONSTRAINT bandwidth_samples_pkey PRIMARY KEY (id, sample_at)
+        ) PARTITION BY RANGE (sample_at)
+        """
+    )
+    _create_indexes()
+    op.execute(
+        "CREATE TABLE bandwidth_samples_default PARTITION OF bandwidth_samples DEFAULT"
+    )
+
+    now = datetime.now(UTC)
+    oldest = bind.execute(
+        sa.text("SELECT min(sample_at) FROM bandwidth_samples_unpartitioned")
+    ).scalar()
+    lower = _hour(max(oldest or now, now - _MAX_BACKFILL))
+    upper = _hour(now + _PREMAKE)
+    while lower <= upper:
+        name = f"bandwidth_samples_p{lower.strftime('%Y%m%d%H')}"
+        op.execute(
+            f"CREATE TABLE {name} PARTITION OF bandwidth_samples "
+            f"FOR VALUES FROM ('{lower.isoformat()}') "
+            f"TO ('{(lower + _SPAN).isoformat()}')"
+        )
+        lower += _SPAN
+
+    op.execute(
+        f"INSERT INTO bandwidth_samples ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM bandwidth_samples_unpartitioned"
+    )
+    op.execute("DROP TABLE bandwidth_samples_unpartitioned")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _rename_legacy("partitioned")
+    op.execute(
+        f"""
+        CREATE TABLE bandwidth_samples ({_COLUMN_DDL},
+            CONSTRAINT bandwidth_samples_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    _create_indexes()
+    op.execute(
+        f"INSERT INTO bandwidth_samples ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM bandwidth_samples_partitioned"
+    )
+    # Dropping the parent drops every partition with it.
+    op.execute("DROP TABLE bandwidth_samples_partitioned")
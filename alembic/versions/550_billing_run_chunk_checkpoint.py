@@ -0,0 +1,41 @@
+"""Record the invoice cycle's chunk checkpoint on billing runs.
+
+Revision ID: 550_billing_run_chunk_checkpoint
+Revises: 549_partition_bandwidth_samples
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "550_billing_run_chunk_checkpoint"
+down_revision: str | None = "549_partition_bandwidth_samples"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "billing_runs",
+        sa.Column("last_account_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.add_column(
+        "billing_runs",
+        sa.Column(
+            "chunks_completed",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("billing_runs", "chunks_completed")
+    op.drop_column("billing_runs", "last_account_id")
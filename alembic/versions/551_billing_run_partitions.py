@@ -0,0 +1,72 @@
+"""Add billing run partitions for the partitioned invoice cycle.
+
+Revision ID: 551_billing_run_partitions
+Revises: 550_billing_run_chunk_checkpoint
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "551_billing_run_partitions"
+down_revision: str | None = "550_billing_run_chunk_checkpoint"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if "billing_run_partitions" in inspect(bind).get_table_names():
+        return
+
+    op.create_table(
+        "billing_run_partitions",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "run_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("billing_runs.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("partition_index", sa.Integer(), nullable=False),
+        sa.Column("partition_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(name="billingrunstatus", create_type=False),
+            nullable=False,
+            server_default="running",
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_account_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("chunks_completed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("summary", postgresql.JSONB(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.UniqueConstraint(
+            "run_id", "partition_index", name="uq_billing_run_partitions_run_index"
+        ),
+    )
+    op.create_index(
+        "ix_billing_run_partitions_run_id", "billing_run_partitions", ["run_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_billing_run_partitions_run_id", table_name="billing_run_partitions"
+    )
+    op.drop_table("billing_run_partitions")
@@ -0,0 +1,53 @@
+"""Add the RADIUS projection change journal.
+
+Revision ID: 552_radius_projection_changes
+Revises: 551_billing_run_partitions
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "552_radius_projection_changes"
+down_revision: str | None = "551_billing_run_partitions"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if "radius_projection_changes" in inspect(bind).get_table_names():
+        return
+
+    op.create_table(
+        "radius_projection_changes",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("username", sa.String(120), nullable=False),
+        sa.Column("source", sa.String(40), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "ix_radius_projection_changes_created_at",
+        "radius_projection_changes",
+        ["created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_radius_projection_changes_created_at",
+        table_name="radius_projection_changes",
+    )
+    op.drop_table("radius_projection_changes")
@@ -0,0 +1,56 @@
+"""Add the usage octet delta journal and exact quota bucket octets.
+
+Revision ID: 553_usage_octet_deltas
+Revises: 552_radius_projection_changes
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "553_usage_octet_deltas"
+down_revision: str | None = "552_radius_projection_changes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    bucket_columns = {c["name"] for c in inspector.get_columns("quota_buckets")}
+    if "used_octets" not in bucket_columns:
+        op.add_column(
+            "quota_buckets", sa.Column("used_octets", sa.BigInteger(), nullable=True)
+        )
+    if "usage_octet_deltas" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "usage_octet_deltas",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("subscription_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("session_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("octets", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "ix_usage_octet_deltas_created_at", "usage_octet_deltas", ["created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_usage_octet_deltas_created_at", table_name="usage_octet_deltas")
+    op.drop_table("usage_octet_deltas")
+    op.drop_column("quota_buckets", "used_octets")
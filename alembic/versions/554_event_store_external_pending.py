@@ -0,0 +1,45 @@
+"""Add the external dispatch lane flag to the event store.
+
+Revision ID: 554_event_store_external_pending
+Revises: 553_usage_octet_deltas
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+from alembic import op
+
+revision: str = "554_event_store_external_pending"
+down_revision: str | None = "553_usage_octet_deltas"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    columns = {column["name"] for column in inspect(bind).get_columns("event_store")}
+    if "external_pending" in columns:
+        return
+
+    op.add_column(
+        "event_store",
+        sa.Column(
+            "external_pending",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.false(),
+        ),
+    )
+    op.create_index(
+        "ix_event_store_external_pending", "event_store", ["external_pending"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_store_external_pending", table_name="event_store")
+    op.drop_column("event_store", "external_pending")
@@ -0,0 +1,68 @@
+"""Push event outbox changes over LISTEN/NOTIFY.
+
+Revision ID: 555_event_store_notify
+Revises: 554_event_store_external_pending
+Create Date: 2026-10-16
+
+Every inserted ``event_store`` row and every status change into ``completed``
+or ``failed`` sends a notification on the ``event_store`` channel. The payload
+carries the row id, event id, status and ordering keys, which is what the
+terminal waiters and the outbox wake-up listener need. Notifications are
+delivered at commit, so listeners never see a row that rolled back.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "555_event_store_notify"
+down_revision: str | None = "554_event_store_external_pending"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_NOTIFY_FUNCTION = "event_store_notify"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION {_NOTIFY_FUNCTION}() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT'
+               OR NEW.status IN ('completed', 'failed')
+                  AND NEW.status IS DISTINCT FROM OLD.status THEN
+                PERFORM pg_notify(
+                    'event_store',
+                    json_build_object(
+                        'id', NEW.id,
+                        'event_id', NEW.event_id,
+                        'status', NEW.status,
+                        'account_id', NEW.account_id,
+                        'subscriber_id', NEW.subscriber_id
+                    )::text
+                );
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(f"DROP TRIGGER IF EXISTS trg_{_NOTIFY_FUNCTION} ON event_store")
+    op.execute(
+        f"""
+        CREATE TRIGGER trg_{_NOTIFY_FUNCTION}
+        AFTER INSERT OR UPDATE OF status ON event_store
+        FOR EACH ROW EXECUTE FUNCTION {_NOTIFY_FUNCTION}();
+        """
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(f"DROP TRIGGER IF EXISTS trg_{_NOTIFY_FUNCTION} ON event_store")
+    op.execute(f"DROP FUNCTION IF EXISTS {_NOTIFY_FUNCTION}()")
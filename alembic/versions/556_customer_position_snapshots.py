@@ -0,0 +1,119 @@
+"""Checkpoint customer positions behind a per-account posting sequence.
+
+Revision ID: 556_customer_position_snapshots
+Revises: 555_event_store_notify
+Create Date: 2026-10-16
+
+Existing posting groups are numbered per account, currency and authority in
+recording order. Snapshots start empty: the first staging in a scope, or the
+snapshot verifier's catch-up pass, creates the row and folds the history.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "556_customer_position_snapshots"
+down_revision: str | None = "555_event_store_notify"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_AUTHORITY = postgresql.ENUM(
+    "shadow",
+    "authoritative",
+    name="billingrecordauthority",
+    create_type=False,
+)
+_LANES = (
+    "collectible_receivable",
+    "unapplied_customer_credit",
+    "prepaid_funding_reserved",
+    "prepaid_funding_consumed",
+    "written_off_total",
+    "refunded_total",
+    "adjustment_total",
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    group_columns = {
+        column["name"] for column in inspector.get_columns("customer_posting_groups")
+    }
+    if "position_sequence" not in group_columns:
+        op.add_column(
+            "customer_posting_groups",
+            sa.Column("position_sequence", sa.Integer(), nullable=True),
+        )
+        op.execute(
+            """
+            UPDATE customer_posting_groups AS target
+            SET position_sequence = numbered.sequence
+            FROM (
+                SELECT id,
+                       row_number() OVER (
+                           PARTITION BY account_id, currency, authority
+                           ORDER BY recorded_at, id
+                       ) AS sequence
+                FROM customer_posting_groups
+            ) AS numbered
+            WHERE target.id = numbered.id
+            """
+        )
+        op.create_unique_constraint(
+            "uq_customer_posting_group_position_sequence",
+            "customer_posting_groups",
+            ["account_id", "currency", "authority", "position_sequence"],
+        )
+
+    if "customer_position_snapshots" in inspector.get_table_names():
+        return
+    op.create_table(
+        "customer_position_snapshots",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "account_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("subscribers.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("currency", sa.String(3), nullable=False),
+        sa.Column("authority", _AUTHORITY, nullable=False),
+        sa.Column("last_sequence", sa.Integer(), nullable=False),
+        sa.Column("through_sequence", sa.Integer(), nullable=False),
+        *(sa.Column(lane, sa.Numeric(18, 4), nullable=False) for lane in _LANES),
+        sa.Column("verified_at", sa.DateTime(timezone=True)),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.UniqueConstraint(
+            "account_id",
+            "currency",
+            "authority",
+            name="uq_customer_position_snapshot_scope",
+        ),
+        sa.CheckConstraint(
+            "through_sequence <= last_sequence",
+            name="ck_customer_position_snapshot_high_water",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("customer_position_snapshots")
+    op.drop_constraint(
+        "uq_customer_posting_group_position_sequence",
+        "customer_posting_groups",
+        type_="unique",
+    )
+    op.drop_column("customer_posting_groups", "position_sequence")
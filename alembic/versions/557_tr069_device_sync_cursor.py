@@ -0,0 +1,43 @@
+"""Track an incremental device-sync cursor per ACS server.
+
+Revision ID: 557_tr069_device_sync_cursor
+Revises: 556_customer_position_snapshots
+Create Date: 2026-10-16
+
+Both columns start empty, so each server's next sync is a full reconcile that
+sets the cursor for the incremental runs after it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+from alembic import op
+
+revision: str = "557_tr069_device_sync_cursor"
+down_revision: str | None = "556_customer_position_snapshots"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COLUMNS = ("device_sync_cursor", "device_full_sync_at")
+
+
+def upgrade() -> None:
+    existing = {
+        column["name"]
+        for column in inspect(op.get_bind()).get_columns("tr069_acs_servers")
+    }
+    for name in _COLUMNS:
+        if name not in existing:
+            op.add_column(
+                "tr069_acs_servers",
+                sa.Column(name, sa.DateTime(timezone=True), nullable=True),
+            )
+
+
+def downgrade() -> None:
+    for name in reversed(_COLUMNS):
+        op.drop_column("tr069_acs_servers", name)
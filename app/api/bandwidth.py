@@ -5,12 +5,8 @@ Provides endpoints for bandwidth time series data, real-time streaming,
 and usage statistics. Supports both admin and customer portal access.
 """
 
-import asyncio
-import json
 import logging
-import os
-import time
-from datetime import UTC, datetime, timedelta
+from datetime import datetime
 from typing import Any, cast
 from uuid import UUID
 
@@ -25,19 +21,10 @@ from app.models.catalog import Subscription
 from app.services.bandwidth import (
     add_directions_to_series,
     bandwidth_samples,
-    live_event_payload,
 )
-from app.services.db_session_adapter import db_session_adapter
-from app.services.metrics_store import get_metrics_store
+from app.services.bandwidth_live_hub import live_bandwidth_events
 from app.services.nas import get_mikrotik_pppoe_live_bandwidth
 
-# The MikroTik poller skips devices with no live viewer when running in
-# on_demand mode. Each SSE tick refreshes this subscription's score so the
-# poller knows someone is watching.
-_ACTIVE_VIEWERS_KEY = os.getenv(
-    "BANDWIDTH_ACTIVE_VIEWERS_KEY", "active:bandwidth:viewers"
-)
-
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/bandwidth", tags=["bandwidth"])
@@ -189,7 +176,7 @@ def get_live_bandwidth(
     """
     Server-Sent Events stream for real-time bandwidth updates.
 
-    Sends bandwidth updates approximately every second.
+    Pushes each new sample from the per-process live bandwidth hub.
     """
     bandwidth_samples.check_subscription_access(db, subscription_id, current_user)
     # Streaming responses outlive the route function. Release the request-scoped
@@ -199,86 +186,11 @@ def get_live_bandwidth(
     db.close()
 
     async def event_generator():
-        metrics_store = get_metrics_store()
-        redis_client = None
-        redis_url = os.getenv("REDIS_URL")
-        if redis_url:
-            try:
-                import redis.asyncio as aioredis
-
-                redis_client = aioredis.from_url(redis_url)
-            except Exception as exc:
-                logger.debug("active viewer redis init failed: %s", exc)
-                redis_client = None
-
-        try:
-            while True:
-                # Check if client disconnected
-                if await request.is_disconnected():
-                    break
-
-                # Signal the bandwidth poller that this subscription has a live
-                # viewer. ZADD overwrites the score, so each tick refreshes the
-                # TTL window; the poller treats memberships older than its TTL
-                # as gone.
-                if redis_client is not None:
-                    try:
-                        await redis_client.zadd(
-                            _ACTIVE_VIEWERS_KEY,
-                            {str(subscription_id): time.time()},
-                        )
-                    except Exception as exc:
-                        logger.debug("active viewer heartbeat failed: %s", exc)
-
-                current = {"rx_bps": 0.0, "tx_bps": 0.0}
-                try:
-                    # Primary source: VictoriaMetrics
-                    current = await metrics_store.get_current_bandwidth(
-                        str(subscription_id)
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Live bandwidth metrics query failed for %s: %s",
-                        subscription_id,
-                        e,
-                    )
-
-                try:
-                    # Fallback source: latest PostgreSQL sample (recent only)
-                    if current.get("rx_bps", 0) <= 0 and current.get("tx_bps", 0) <= 0:
-                        cutoff = datetime.now(UTC) - timedelta(minutes=2)
-                        with db_session_adapter.read_session() as sse_db:
-                            latest_sample = bandwidth_samples.get_latest_recent_sample(
-                                sse_db, subscription_id, cutoff
-                            )
-                            if latest_sample:
-                                current = {
-                                    "rx_bps": float(latest_sample.rx_bps or 0),
-                                    "tx_bps": float(latest_sample.tx_bps or 0),
-                                }
-                except Exception as e:
-                    logger.warning(
-                        "Live bandwidth DB fallback failed for %s: %s",
-                        subscription_id,
-                        e,
-                    )
-
-                yield {
-                    "event": "bandwidth",
-                    "data": json.dumps(live_event_payload(current, datetime.now(UTC))),
-                }
-
-                await asyncio.sleep(1)
-        finally:
-            if redis_client is not None:
-                try:
-                    # Drop our viewer membership immediately on disconnect so
-                    # the poller stops within one cycle rather than waiting
-                    # for the TTL to expire.
-                    await redis_client.zrem(_ACTIVE_VIEWERS_KEY, str(subscription_id))
-                    await redis_client.aclose()
-                except Exception as exc:
-                    logger.debug("active viewer cleanup failed: %s", exc)
+        async for event in live_bandwidth_events(
+            subscription_id=subscription_id,
+            is_disconnected=request.is_disconnected,
+        ):
+            yield event
 
     return EventSourceResponse(
         event_generator(),
@@ -125,6 +125,7 @@ celery_app.conf.task_routes = {
     "app.tasks.radius.reap_radacct_ghosts": {"queue": "ingestion"},
     "app.tasks.radius.reconcile_active_sessions": {"queue": "ingestion"},
     "app.tasks.usage.meter_usage_into_quota": {"queue": "ingestion"},
+    "app.tasks.usage.recompute_quota_usage": {"queue": "ingestion"},
     # Safety-net FUP reset runs off the billing queue on purpose, so expired
     # throttle/block enforcement is still lifted when the billing queue stalls.
     "app.tasks.usage.lift_expired_fup_enforcement": {"queue": "ingestion"},
@@ -148,6 +149,8 @@ celery_app.conf.task_routes = {
     # a buried invoice cycle is a missed billing day (the 2026-06-10 00:55
     # dispatch sat unexecuted behind ~6.6k queued default-queue tasks).
     "app.tasks.billing.run_invoice_cycle": {"queue": "billing"},
+    "app.tasks.billing.run_invoice_partition": {"queue": "billing"},
+    "app.tasks.billing.retry_invoice_partitions": {"queue": "billing"},
     "app.tasks.billing.run_billing_notifications": {"queue": "billing"},
     "app.tasks.autopay.charge_due_invoices": {"queue": "billing"},
     "app.tasks.arrangements.check_overdue_arrangements": {"queue": "billing"},
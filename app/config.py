@@ -187,6 +187,27 @@ class Settings:
     # tolerates no staleness can lower it. 30s is what the retired
     # `SettingsCache` used, so the default changes nothing.
     settings_cache_ttl_seconds: int = int(os.getenv("SETTINGS_CACHE_TTL_SECONDS", "30"))
+    # Per-process L1 in front of the Redis application cache
+    # (app/services/app_cache.py). Entries live at most APP_CACHE_L1_TTL_SECONDS
+    # and are evicted across workers over Redis pub/sub on every write, delete
+    # and tag invalidation; the TTL bounds staleness if a message is missed.
+    # APP_CACHE_L1_MAX_ENTRIES=0 turns the L1 off.
+    app_cache_l1_max_entries: int = int(os.getenv("APP_CACHE_L1_MAX_ENTRIES", "4096"))
+    app_cache_l1_ttl_seconds: float = float(os.getenv("APP_CACHE_L1_TTL_SECONDS", "5"))
+    # How long get_or_compute_json waits for another process recomputing the
+    # same key before computing it itself.
+    app_cache_single_flight_wait_seconds: float = float(
+        os.getenv("APP_CACHE_SINGLE_FLIGHT_WAIT_SECONDS", "5")
+    )
+    # Accounts per chunk of the invoice cycle (billing_automation). Each chunk
+    # is priced with a few IN queries and committed with its resume checkpoint.
+    billing_invoice_chunk_size: int = int(
+        os.getenv("BILLING_INVOICE_CHUNK_SIZE", "500")
+    )
+    # Partitions of the scheduled invoice cycle. Above 1, the cycle is split
+    # into subscriber-id ranges, each billed by its own Celery task under one
+    # billing run; failed partitions are retried on their own.
+    billing_invoice_partitions: int = int(os.getenv("BILLING_INVOICE_PARTITIONS", "1"))
 
     # Router Management
     router_sync_interval_hours: int = int(os.getenv("ROUTER_SYNC_INTERVAL_HOURS", "6"))
@@ -228,6 +249,92 @@ class Settings:
         "ROUTER_CONFIG_SSH_STRICT_HOST_KEY", "false"
     ).lower() in ("true", "1", "yes")
 
+    # SNMP transport for walks and probes. "native" speaks SNMP in-process
+    # (app/services/network/snmp_engine.py): no fork/exec per walk, typed
+    # varbinds, many concurrent walks per event loop. "subprocess" keeps the
+    # net-snmp binaries (snmpbulkwalk/snmpwalk/snmpget) as the fallback for an
+    # agent the native engine cannot talk to.
+    snmp_engine: str = os.getenv("SNMP_ENGINE", "native").strip().lower()
+
+    # ICMP reachability transport. "sweep" sends echo requests for a whole
+    # batch from one unprivileged ICMP socket (app/services/icmp_sweep.py);
+    # "subprocess" forks the system ping binary per host. The sweep falls back
+    # to subprocess automatically when ping sockets are not permitted.
+    ping_engine: str = os.getenv("PING_ENGINE", "sweep").strip().lower()
+    # Echo requests per second across one sweep, so a full-fleet pass stays
+    # gentle on the WireGuard tunnels to the OLT management subnets.
+    icmp_sweep_max_pps: int = int(os.getenv("ICMP_SWEEP_MAX_PPS", "200"))
+
+    # Syslog listener ingestion (app/syslog/pipeline.py). Datagrams queue up
+    # to SYSLOG_QUEUE_MAX and are dropped (and counted) beyond that instead of
+    # spawning a task each; the consumer parses and persists them in batches
+    # of up to SYSLOG_BATCH_SIZE, waiting at most SYSLOG_FLUSH_INTERVAL_SECONDS
+    # for a batch to fill. The source-IP -> OLT map is reloaded every
+    # SYSLOG_OLT_MAP_REFRESH_SECONDS rather than queried per message.
+    syslog_queue_max: int = int(os.getenv("SYSLOG_QUEUE_MAX", "10000"))
+    syslog_batch_size: int = int(os.getenv("SYSLOG_BATCH_SIZE", "500"))
+    syslog_flush_interval_seconds: float = float(
+        os.getenv("SYSLOG_FLUSH_INTERVAL_SECONDS", "0.5")
+    )
+    syslog_olt_map_refresh_seconds: int = int(
+        os.getenv("SYSLOG_OLT_MAP_REFRESH_SECONDS", "300")
+    )
+    # ONT LOS / dying-gasp burst correlation (app/syslog/correlator.py): when
+    # SYSLOG_BURST_PON_MIN_ONTS distinct ONTs on one PON go down within
+    # SYSLOG_BURST_WINDOW_SECONDS, one suspected outage is opened for the OLT;
+    # SYSLOG_BURST_OLT_MIN_PONS bursting PONs escalate it to an OLT-wide burst.
+    syslog_burst_window_seconds: float = float(
+        os.getenv("SYSLOG_BURST_WINDOW_SECONDS", "60")
+    )
+    syslog_burst_pon_min_onts: int = int(os.getenv("SYSLOG_BURST_PON_MIN_ONTS", "8"))
+    syslog_burst_olt_min_pons: int = int(os.getenv("SYSLOG_BURST_OLT_MIN_PONS", "3"))
+
+    # Bandwidth sample ingestion (app/services/bandwidth_ingest.py). Every
+    # ingest process joins the stream's consumer group under its own name
+    # (BANDWIDTH_INGEST_CONSUMER, default host-pid), so workers scale out by
+    # running more of them. Entries left unacked by a dead member for
+    # BANDWIDTH_INGEST_CLAIM_IDLE_MS are claimed by a live one; an entry
+    # delivered more than BANDWIDTH_INGEST_MAX_DELIVERIES times is dropped.
+    bandwidth_redis_stream: str = os.getenv(
+        "BANDWIDTH_REDIS_STREAM", "bandwidth:samples"
+    )
+    # Live SSE viewers (app/services/bandwidth_live_hub.py) keep their
+    # subscriptions scored here so the on-demand poller knows who is watching.
+    bandwidth_active_viewers_key: str = os.getenv(
+        "BANDWIDTH_ACTIVE_VIEWERS_KEY", "active:bandwidth:viewers"
+    )
+    bandwidth_ingest_consumer: str = os.getenv("BANDWIDTH_INGEST_CONSUMER", "")
+    bandwidth_ingest_claim_idle_ms: int = int(
+        os.getenv("BANDWIDTH_INGEST_CLAIM_IDLE_MS", "60000")
+    )
+    bandwidth_ingest_max_deliveries: int = int(
+        os.getenv("BANDWIDTH_INGEST_MAX_DELIVERIES", "5")
+    )
+    # Minute rollups (app/services/bandwidth_rollup.py) are pushed to
+    # VictoriaMetrics once their minute has been closed this long, so samples
+    # still in flight through other consumers are included.
+    bandwidth_rollup_grace_seconds: int = int(
+        os.getenv("BANDWIDTH_ROLLUP_GRACE_SECONDS", "30")
+    )
+    # MikroTik poller stream format (app/services/bandwidth_frames.py):
+    # "entries" = one XADD per queue sample; "compact" = one packed frame per
+    # NAS per cycle. Ingestion decodes both, so switching needs no drain.
+    bandwidth_stream_format: str = (
+        os.getenv("BANDWIDTH_STREAM_FORMAT", "entries").strip().lower()
+    )
+    # Poller shard mode (app/poller/sharding.py): run N `python -m app.poller`
+    # processes and each polls its rendezvous-hashed slice of the NAS devices.
+    # A member that misses BANDWIDTH_POLLER_SHARD_LEASE_SECONDS of heartbeats
+    # is dropped and its devices move to the others. Shard id defaults to
+    # host-pid.
+    bandwidth_poller_shard_mode: bool = os.getenv(
+        "BANDWIDTH_POLLER_SHARD_MODE", "false"
+    ).lower() in ("1", "true", "yes", "on")
+    bandwidth_poller_shard_id: str = os.getenv("BANDWIDTH_POLLER_SHARD_ID", "")
+    bandwidth_poller_shard_lease_seconds: int = int(
+        os.getenv("BANDWIDTH_POLLER_SHARD_LEASE_SECONDS", "30")
+    )
+
     # TR-069 settings
     tr069_periodic_inform_interval: int = int(
         os.getenv("TR069_PERIODIC_INFORM_INTERVAL", "300")
@@ -74,6 +74,18 @@ from app.services.session_hooks import install_session_hooks  # noqa: E402
 
 install_session_hooks()
 
+# Retire compiled permission sets and cached session verdicts after commits
+# that change RBAC grants or end bearer sessions.
+import app.services.auth_cache_invalidation  # noqa: E402,F401
+
+# Journal Subscription/AccessCredential changes for the incremental RADIUS
+# projection in the same transaction as the change itself.
+import app.services.radius_projection_journal  # noqa: E402,F401
+
+# Retire the cached compiled forwarding graph after commits that change
+# forwarding declarations, observations or the device context they check.
+import app.services.topology.forwarding_graph_invalidation  # noqa: E402,F401
+
 
 def dispose_engine() -> None:
     """Dispose pooled DB connections, especially after Celery prefork."""
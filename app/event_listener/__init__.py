@@ -0,0 +1 @@
+"""Event outbox wake-up listener (``python -m app.event_listener``)."""
@@ -0,0 +1,9 @@
+"""Entry point for running the event outbox wake-up listener as a module.
+
+Usage: python -m app.event_listener
+"""
+
+from app.event_listener.wakeup import main
+
+if __name__ == "__main__":
+    main()
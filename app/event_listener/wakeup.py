@@ -0,0 +1,164 @@
+"""Wake the outbox partition workers as soon as event rows are committed.
+
+The beat-driven ``dispatch_pending_events`` only runs every
+``event_dispatch_interval_seconds``. This process LISTENs on the
+``event_store`` channel instead. It waits a short grace period so the
+after-commit dispatch can handle the row in the emitting process, then queues
+``dispatch_event_partition`` for the partitions whose rows are still pending.
+Most events never reach the queue, and the ones left behind by a crash or an
+unavailable broker are picked up within the grace period rather than the beat.
+"""
+
+from __future__ import annotations
+
+import logging
+import signal
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.event_store import EventStatus, EventStore
+from app.services.event_notifications import (
+    EventStoreListener,
+    EventStoreNotification,
+)
+from app.services.events.outbox import ordering_key, partition_of
+
+logger = logging.getLogger(__name__)
+
+# Time left to the emitting process's after-commit dispatch before the row is
+# handed to a partition worker.
+WAKE_GRACE_SECONDS = 0.5
+# Idle wait between checks that the LISTEN connection is still there.
+_IDLE_WAIT_SECONDS = 30.0
+_RECONNECT_BACKOFF_SECONDS = 5.0
+
+
+class OutboxWakeup:
+    """Batch inserted-row notifications into partition worker wake-ups."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        enqueue: Callable[..., Any] | None = None,
+        grace_seconds: float = WAKE_GRACE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if enqueue is None:
+            from app.services.queue_adapter import enqueue_task
+
+            enqueue = enqueue_task
+        self._session_factory = session_factory
+        self._enqueue = enqueue
+        self._grace_seconds = grace_seconds
+        self._clock = clock
+        self._pending: dict[UUID, UUID] = {}
+        self._due_at: float | None = None
+
+    def observe(self, notifications: Iterable[EventStoreNotification]) -> None:
+        for item in notifications:
+            if item.status != EventStatus.pending.value or item.id is None:
+                continue
+            self._pending[item.id] = ordering_key(
+                item.id, item.account_id, item.subscriber_id
+            )
+            if self._due_at is None:
+                self._due_at = self._clock() + self._grace_seconds
+
+    def timeout(self) -> float:
+        """Seconds until the next flush is due (or the idle wait)."""
+        if self._due_at is None:
+            return _IDLE_WAIT_SECONDS
+        return max(0.0, self._due_at - self._clock())
+
+    def flush_due(self) -> list[int]:
+        if self._due_at is None or self._clock() < self._due_at:
+            return []
+        return self.flush()
+
+    def flush(self) -> list[int]:
+        """Queue the partition workers for rows that are still pending."""
+        pending, self._pending, self._due_at = self._pending, {}, None
+        if not pending:
+            return []
+        from app.models.domain_settings import SettingDomain
+        from app.services.settings_spec import resolve_value
+
+        db = self._session_factory()
+        try:
+            still_pending = {
+                row[0]
+                for row in db.query(EventStore.id)
+                .filter(EventStore.id.in_(list(pending)))
+                .filter(EventStore.status == EventStatus.pending)
+                .all()
+            }
+            raw_partitions = resolve_value(
+                db, SettingDomain.scheduler, "event_dispatch_partitions"
+            )
+        finally:
+            db.close()
+        try:
+            partitions = max(int(raw_partitions or 1), 1)
+        except (TypeError, ValueError):
+            partitions = 1
+        woken = sorted(
+            {partition_of(pending[row_id], partitions) for row_id in still_pending}
+        )
+        for partition in woken:
+            self._enqueue(
+                "app.tasks.events.dispatch_event_partition",
+                args=(partition, partitions),
+            )
+        if woken:
+            logger.info(
+                "event_outbox_wakeup",
+                extra={"pending": len(still_pending), "partitions": woken},
+            )
+        return woken
+
+
+def run(stop: threading.Event) -> None:
+    from app.db import SessionLocal
+
+    wakeup = OutboxWakeup(SessionLocal)
+    with SessionLocal() as db:
+        engine = db.get_bind().engine
+    listener = EventStoreListener(engine)
+    try:
+        while not stop.is_set():
+            if not listener.active:
+                listener.open()
+                if not listener.active:
+                    stop.wait(_RECONNECT_BACKOFF_SECONDS)
+                    continue
+                logger.info("event_outbox_listener_subscribed")
+            wakeup.observe(listener.wait(wakeup.timeout()))
+            try:
+                wakeup.flush_due()
+            except Exception:
+                logger.exception("event_outbox_wakeup_failed")
+    finally:
+        listener.close()
+
+
+def main() -> None:
+    """Entry point for the event outbox wake-up listener service."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    stop = threading.Event()
+
+    def handle_shutdown_signal(*_args: object) -> None:
+        logger.info("Received shutdown signal")
+        stop.set()
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, handle_shutdown_signal)
+    run(stop)
@@ -8,6 +8,12 @@ def _gauge_description(name: str, help_text: str, labels: list[str] | None = Non
     return GaugeMetricFamily(name, help_text, labels=labels)
 
 
+def _counter_description(name: str, help_text: str, labels: list[str] | None = None):  # noqa: ANN202 - prometheus collector protocol
+    from prometheus_client.core import CounterMetricFamily
+
+    return CounterMetricFamily(name, help_text, labels=labels)
+
+
 REQUEST_COUNT = Counter(
     "http_requests_total",
     "Total HTTP requests",
@@ -938,6 +944,152 @@ class _PollerHealthCollector(Collector):
 
 REGISTRY.register(_PollerHealthCollector())
 
+
+class _SyslogListenerHealthCollector(Collector):
+    """Exports syslog-listener ingestion health at scrape time.
+
+    Same cross-process arrangement as ``_PollerHealthCollector``: the listener
+    writes a Redis snapshot (``app.services.syslog_health``) and this reads it
+    on scrape, fail-soft. A growing ``syslog_listener_dropped_total`` means the
+    queue bound is being hit (an OLT storm outpacing batch persistence).
+    """
+
+    def describe(self):  # noqa: ANN201 - prometheus collector protocol
+        yield _gauge_description(
+            "syslog_listener_queue_depth", "Datagrams waiting in the ingest queue"
+        )
+        yield _gauge_description(
+            "syslog_listener_queue_capacity", "Ingest queue bound (SYSLOG_QUEUE_MAX)"
+        )
+        yield _counter_description(
+            "syslog_listener_received", "Datagrams received since listener start"
+        )
+        yield _counter_description(
+            "syslog_listener_dropped",
+            "Datagrams dropped on a full ingest queue since start",
+        )
+        yield _gauge_description(
+            "syslog_listener_flush_seconds",
+            "Batch processing latency (last / max since the previous snapshot)",
+            labels=["stat"],
+        )
+        yield _gauge_description(
+            "syslog_listener_snapshot_age_seconds",
+            "Seconds since the listener last published its counters (liveness)",
+        )
+
+    def collect(self):  # noqa: ANN201 - prometheus collector protocol
+        from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+        try:
+            from app.services.syslog_health import load_syslog_health
+
+            data = load_syslog_health()
+        except Exception:
+            return
+        if not data:
+            return
+
+        for key, help_text in (
+            ("queue_depth", "Datagrams waiting in the ingest queue"),
+            ("queue_capacity", "Ingest queue bound (SYSLOG_QUEUE_MAX)"),
+        ):
+            gauge = GaugeMetricFamily(f"syslog_listener_{key}", help_text)
+            gauge.add_metric([], float(data.get(key) or 0))
+            yield gauge
+
+        for key, help_text in (
+            ("received", "Datagrams received since listener start"),
+            ("dropped", "Datagrams dropped on a full ingest queue since start"),
+        ):
+            counter = CounterMetricFamily(f"syslog_listener_{key}", help_text)
+            counter.add_metric([], float(data.get(key) or 0))
+            yield counter
+
+        flush = GaugeMetricFamily(
+            "syslog_listener_flush_seconds",
+            "Batch processing latency (last / max since the previous snapshot)",
+            labels=["stat"],
+        )
+        for stat, key in (("last", "last_flush_seconds"), ("max", "max_flush_seconds")):
+            if data.get(key) is not None:
+                flush.add_metric([stat], float(data[key]))
+        yield flush
+
+        ts = data.get("ts")
+        if ts:
+            from datetime import UTC, datetime
+
+            try:
+                age = (datetime.now(UTC) - datetime.fromisoformat(ts)).total_seconds()
+            except ValueError:
+                return
+            gauge = GaugeMetricFamily(
+                "syslog_listener_snapshot_age_seconds",
+                "Seconds since the listener last published its counters (liveness)",
+            )
+            gauge.add_metric([], max(age, 0))
+            yield gauge
+
+
+REGISTRY.register(_SyslogListenerHealthCollector())
+
+
+class _EventOutboxCollector(Collector):
+    """Exports per-handler event outbox latency at scrape time.
+
+    Handlers run in workers and in web requests, so every dispatch folds its
+    run counts and seconds into a Redis hash (``app.services.event_outbox_health``)
+    and this reads it on scrape, fail-soft. Mean latency is
+    ``rate(event_handler_seconds_total) / rate(event_handler_runs_total)``.
+    Backlog depth per lane is the ``event_outbox`` observability state domain.
+    """
+
+    def describe(self):  # noqa: ANN201 - prometheus collector protocol
+        from prometheus_client.core import CounterMetricFamily
+
+        yield CounterMetricFamily(
+            "event_handler_runs",
+            "Event handler runs by outcome",
+            labels=["handler", "status"],
+        )
+        yield CounterMetricFamily(
+            "event_handler_seconds",
+            "Seconds spent in event handlers by outcome",
+            labels=["handler", "status"],
+        )
+
+    def collect(self):  # noqa: ANN201 - prometheus collector protocol
+        from prometheus_client.core import CounterMetricFamily
+
+        try:
+            from app.services.event_outbox_health import load_handler_timings
+
+            timings = load_handler_timings()
+        except Exception:
+            return
+        if not timings:
+            return
+
+        runs = CounterMetricFamily(
+            "event_handler_runs",
+            "Event handler runs by outcome",
+            labels=["handler", "status"],
+        )
+        seconds = CounterMetricFamily(
+            "event_handler_seconds",
+            "Seconds spent in event handlers by outcome",
+            labels=["handler", "status"],
+        )
+        for (handler, status), (count, total) in sorted(timings.items()):
+            runs.add_metric([handler, status], float(count))
+            seconds.add_metric([handler, status], total)
+        yield runs
+        yield seconds
+
+
+REGISTRY.register(_EventOutboxCollector())
+
 GENIEACS_IDENTITY_RECOVERY_EVENTS = Counter(
     "genieacs_identity_recovery_events_total",
     "Total GenieACS identity recovery events",
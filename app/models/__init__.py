@@ -45,6 +45,7 @@ from app.models.billing import (  # noqa: F401
     BillingAccountCreditAllocationItem,
     BillingAccountLedgerEntry,
     BillingRun,
+    BillingRunPartition,
     BillingRunStatus,
     ConsolidatedCreditConsumptionReconciliationEvidence,
     ConsolidatedPaymentReturnDocumentReconstructionEvidence,
@@ -238,6 +239,7 @@ from app.models.customer_experience import (  # noqa: F401
 from app.models.customer_identity import CustomerIdentityIndex  # noqa: F401
 from app.models.customer_subledger import (  # noqa: F401
     CustomerPositionEffect,
+    CustomerPositionSnapshot,
     CustomerPostingGroup,
     CustomerSubledgerAuthorityCutover,
     CustomerSubledgerOpeningPosition,
@@ -789,6 +791,7 @@ from app.models.quote_mirror import (  # noqa: F401
 )
 from app.models.radius import (  # noqa: F401
     RadiusClient,
+    RadiusProjectionChange,
     RadiusServer,
     RadiusSyncJob,
     RadiusSyncRun,
@@ -1045,6 +1048,7 @@ from app.models.usage import (  # noqa: F401
     SubscriberDailyUsage,
     UsageCharge,
     UsageChargeStatus,
+    UsageOctetDelta,
     UsageRatingRun,
     UsageRatingRunStatus,
     UsageRecord,
@@ -17,6 +17,9 @@ from app.db import Base
 
 
 class BandwidthSample(Base):
+    # On PostgreSQL the table is range-partitioned hourly on sample_at with a
+    # (id, sample_at) primary key; see app.services.bandwidth_partitions. The
+    # ORM keeps ``id`` alone as its identity (ids are UUIDs, so still unique).
     __tablename__ = "bandwidth_samples"
     __table_args__ = (
         Index("ix_bandwidth_samples_sample_at", "sample_at"),
@@ -2659,6 +2659,10 @@ class BillingRun(Base):
     invoices_created: Mapped[int] = mapped_column(Integer, default=0)
     lines_created: Mapped[int] = mapped_column(Integer, default=0)
     skipped: Mapped[int] = mapped_column(Integer, default=0)
+    # Keyset checkpoint of the invoice cycle: the last account of the last
+    # committed chunk. A failed scheduled run is resumed after it.
+    last_account_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    chunks_completed: Mapped[int] = mapped_column(Integer, default=0)
     error: Mapped[str | None] = mapped_column(Text)
 
     created_at: Mapped[datetime] = mapped_column(
@@ -2666,6 +2670,48 @@ class BillingRun(Base):
     )
 
 
+class BillingRunPartition(Base):
+    """One account range of a partitioned invoice cycle.
+
+    A partitioned run splits the billable accounts into ``partition_count``
+    subscriber-id ranges, each billed by its own worker task under the same
+    :class:`BillingRun`. The partition keeps its own chunk checkpoint and
+    summary so that only failed partitions are retried.
+    """
+
+    __tablename__ = "billing_run_partitions"
+    __table_args__ = (
+        UniqueConstraint(
+            "run_id", "partition_index", name="uq_billing_run_partitions_run_index"
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    run_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("billing_runs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    partition_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    partition_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[BillingRunStatus] = mapped_column(
+        Enum(BillingRunStatus), default=BillingRunStatus.running
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    last_account_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    chunks_completed: Mapped[int] = mapped_column(Integer, default=0)
+    summary: Mapped[dict | None] = mapped_column(JSONB)
+    error: Mapped[str | None] = mapped_column(Text)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+
+
 class BankReconciliationRun(Base):
     __tablename__ = "bank_reconciliation_runs"
 
@@ -13,6 +13,10 @@ become a shadow GL.
 
 Wrong postings are corrected by a linked reversal group. Posted economic
 history is never updated or deleted.
+
+:class:`CustomerPositionSnapshot` is a derived checkpoint, not evidence: lane
+totals folded through a per-account posting sequence, so position reads fold
+only the groups staged after it. It can always be rebuilt from the postings.
 """
 
 from __future__ import annotations
@@ -28,6 +32,7 @@ from sqlalchemy import (
     Enum,
     ForeignKey,
     Index,
+    Integer,
     Numeric,
     String,
     Text,
@@ -250,6 +255,15 @@ class CustomerPostingGroup(Base):
         Index("ix_customer_posting_group_account", "account_id", "currency"),
         Index("ix_customer_posting_group_source", "source_kind", "source_id"),
         Index("ix_customer_posting_group_authority", "authority"),
+        # Gap-free staging order within one account/currency/authority; the
+        # position snapshot's high-water mark is expressed in it.
+        UniqueConstraint(
+            "account_id",
+            "currency",
+            "authority",
+            "position_sequence",
+            name="uq_customer_posting_group_position_sequence",
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -291,6 +305,7 @@ class CustomerPostingGroup(Base):
         UUID(as_uuid=True),
         ForeignKey("customer_posting_groups.id", ondelete="RESTRICT"),
     )
+    position_sequence: Mapped[int | None] = mapped_column(Integer)
 
     actor: Mapped[str] = mapped_column(String(160), nullable=False)
     reason: Mapped[str] = mapped_column(Text, nullable=False)
@@ -340,3 +355,72 @@ class CustomerPositionEffect(Base):
     group: Mapped[CustomerPostingGroup] = relationship(
         "CustomerPostingGroup", back_populates="effects"
     )
+
+
+class CustomerPositionSnapshot(Base):
+    """Checkpointed lane totals for one account, currency and authority.
+
+    ``last_sequence`` allocates ``CustomerPostingGroup.position_sequence``
+    under this row's lock; the lanes hold every group through
+    ``through_sequence``. The two differ only while a checkpoint lags behind
+    groups sequenced before the snapshot existed.
+    """
+
+    __tablename__ = "customer_position_snapshots"
+    __table_args__ = (
+        UniqueConstraint(
+            "account_id",
+            "currency",
+            "authority",
+            name="uq_customer_position_snapshot_scope",
+        ),
+        CheckConstraint(
+            "through_sequence <= last_sequence",
+            name="ck_customer_position_snapshot_high_water",
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("subscribers.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    currency: Mapped[str] = mapped_column(String(3), nullable=False)
+    authority: Mapped[BillingRecordAuthority] = mapped_column(
+        _authority_enum, nullable=False
+    )
+    last_sequence: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    through_sequence: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    collectible_receivable: Mapped[Decimal] = mapped_column(
+        Numeric(18, 4), nullable=False, default=Decimal("0")
+    )
+    unapplied_customer_credit: Mapped[Decimal] = mapped_column(
+        Numeric(18, 4), nullable=False, default=Decimal("0")
+    )
+    prepaid_funding_reserved: Mapped[Decimal] = mapped_column(
+        Numeric(18, 4), nullable=False, default=Decimal("0")
+    )
+    prepaid_funding_consumed: Mapped[Decimal] = mapped_column(
+        Numeric(18, 4), nullable=False, default=Decimal("0")
+    )
+    written_off_total: Mapped[Decimal] = mapped_column(
+        Numeric(18, 4), nullable=False, default=Decimal("0")
+    )
+    refunded_total: Mapped[Decimal] = mapped_column(
+        Numeric(18, 4), nullable=False, default=Decimal("0")
+    )
+    adjustment_total: Mapped[Decimal] = mapped_column(
+        Numeric(18, 4), nullable=False, default=Decimal("0")
+    )
+
+    verified_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
@@ -66,6 +66,12 @@ class EventStore(Base):
     invoice_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
     service_order_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
 
+    # Set when the core lane deferred external-stage handlers (webhook
+    # delivery) to the separate external dispatch lane.
+    external_pending: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default="false", nullable=False, index=True
+    )
+
     # Tracking handlers that failed
     failed_handlers: Mapped[list[dict[str, str]] | None] = mapped_column(JSONB)
     handler_attempts: Mapped[list["EventHandlerAttempt"]] = relationship(
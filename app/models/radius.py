@@ -187,3 +187,24 @@ class RadiusSyncRun(Base):
     details: Mapped[dict | None] = mapped_column(JSON)
 
     job = relationship("RadiusSyncJob", back_populates="runs")
+
+
+class RadiusProjectionChange(Base):
+    """Journal of logins whose RADIUS projection inputs changed.
+
+    Written in the same flush as the Subscription or AccessCredential change
+    (see ``app.services.radius_projection_journal``) and drained by the
+    incremental projection pass, which rewrites only logins whose projected
+    rows differ from the target.
+    """
+
+    __tablename__ = "radius_projection_changes"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    username: Mapped[str] = mapped_column(String(120), nullable=False)
+    source: Mapped[str] = mapped_column(String(40), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC), index=True
+    )
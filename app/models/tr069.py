@@ -67,6 +67,12 @@ class Tr069AcsServer(Base):
     )  # seconds, default from settings.tr069_periodic_inform_interval
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     notes: Mapped[str | None] = mapped_column(Text)
+    # Newest ``_lastInform`` the device sync has applied; incremental syncs
+    # only fetch devices that informed after it.
+    device_sync_cursor: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    device_full_sync_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True)
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC)
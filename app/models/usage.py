@@ -74,6 +74,10 @@ class QuotaBucket(Base):
     # allowance before overage, alongside included + rollover).
     topup_gb: Mapped[Decimal] = mapped_column(Numeric(10, 2), default=0)
     overage_gb: Mapped[Decimal] = mapped_column(Numeric(10, 2), default=0)
+    # Exact octet total behind used_gb; incremental metering adds journaled
+    # deltas to it. NULL means not yet seeded: the next metering pass
+    # recomputes it from the period's sessions.
+    used_octets: Mapped[int | None] = mapped_column(BigInteger)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC)
@@ -88,6 +92,32 @@ class QuotaBucket(Base):
     usage_records = relationship("UsageRecord", back_populates="quota_bucket")
 
 
+class UsageOctetDelta(Base):
+    """Octets the accounting import added to (or moved off) a subscription.
+
+    Written in the import's transaction whenever a session's octet total,
+    subscription or start changes, and drained by incremental quota metering.
+    """
+
+    __tablename__ = "usage_octet_deltas"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    subscription_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), nullable=False
+    )
+    session_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    octets: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        index=True,
+    )
+
+
 class RadiusAccountingSession(Base):
     __tablename__ = "radius_accounting_sessions"
     __table_args__ = (
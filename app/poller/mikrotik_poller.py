@@ -12,7 +12,7 @@ import os
 import re
 import signal
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any, cast
@@ -21,6 +21,7 @@ from uuid import UUID
 import redis.asyncio as redis
 from routeros_api import RouterOsApiPool
 
+from app.config import settings
 from app.models.catalog import (
     CatalogOffer,
     NasDevice,
@@ -29,6 +30,8 @@ from app.models.catalog import (
     Subscription,
     SubscriptionStatus,
 )
+from app.poller.sharding import ShardCoordinator
+from app.services.bandwidth_frames import FORMAT_COMPACT, encode_frame, encode_sample
 from app.services.credential_crypto import decrypt_credential
 from app.services.db_session_adapter import db_session_adapter
 from app.services.poller_health import POLLER_HEALTH_KEY
@@ -152,6 +155,33 @@ class BandwidthSample:
     sample_at: datetime
 
 
+def _stream_entries(
+    samples: list[BandwidthSample], stream_format: str
+) -> list[dict[Any, Any]]:
+    """Stream entries for one cycle: per sample, or one frame per NAS."""
+    if stream_format != FORMAT_COMPACT:
+        return [
+            encode_sample(
+                subscription_id=sample.subscription_id,
+                nas_device_id=sample.nas_device_id,
+                queue_name=sample.queue_name,
+                rx_bps=sample.rx_bps,
+                tx_bps=sample.tx_bps,
+                sample_at=sample.sample_at,
+            )
+            for sample in samples
+        ]
+    by_device: dict[tuple[str, datetime], list[tuple[str, int, int]]] = {}
+    for sample in samples:
+        by_device.setdefault((sample.nas_device_id, sample.sample_at), []).append(
+            (sample.subscription_id, sample.rx_bps, sample.tx_bps)
+        )
+    return [
+        encode_frame(nas_device_id, sample_at, rows)
+        for (nas_device_id, sample_at), rows in by_device.items()
+    ]
+
+
 class MikroTikConnection:
     """
     Manages a persistent connection to a MikroTik device.
@@ -441,8 +471,14 @@ class DevicePool:
     Periodically refreshes the device list from the database.
     """
 
-    def __init__(self, refresh_interval: int = 60):
+    def __init__(
+        self,
+        refresh_interval: int = 60,
+        owns: Callable[[UUID], bool] | None = None,
+    ):
         self._connections: dict[UUID, MikroTikConnection] = {}
+        # Shard mode: only devices this process owns are connected and mapped.
+        self._owns = owns
         self._queue_mappings: dict[UUID, dict[str, UUID]] = {}
         self._login_mappings: dict[UUID, dict[str, UUID]] = {}
         # subscription_id -> (rx_cap_bps, tx_cap_bps) from the plan's provisioned
@@ -548,6 +584,8 @@ class DevicePool:
 
             for device in devices:
                 device_id = device.id
+                if self._owns is not None and not self._owns(device_id):
+                    continue
                 new_ids.add(device_id)
 
                 # Skip if already connected
@@ -687,6 +725,10 @@ class DevicePool:
             self._last_refresh = datetime.now(UTC)
             db.close()
 
+    def invalidate(self) -> None:
+        """Refresh on the next poll (e.g. after shard ownership changed)."""
+        self._last_refresh = None
+
     def _should_refresh(self) -> bool:
         if not self._last_refresh:
             return True
@@ -844,9 +886,19 @@ class BandwidthPoller:
     all devices and publishing them to a Redis stream.
     """
 
-    def __init__(self, poll_interval_ms: int = POLL_INTERVAL_MS):
+    def __init__(
+        self,
+        poll_interval_ms: int = POLL_INTERVAL_MS,
+        shard: ShardCoordinator | None = None,
+    ):
         self.poll_interval_ms = poll_interval_ms
-        self.device_pool = DevicePool()
+        if shard is None and settings.bandwidth_poller_shard_mode:
+            shard = ShardCoordinator(
+                settings.bandwidth_poller_shard_id or None,
+                lease_seconds=settings.bandwidth_poller_shard_lease_seconds,
+            )
+        self.shard = shard
+        self.device_pool = DevicePool(owns=shard.owns if shard else None)
         self._redis: redis.Redis | None = None
         self._running = False
         self._poll_count = 0
@@ -869,7 +921,10 @@ class BandwidthPoller:
 
         Individual XADD per sample yields one WAN round-trip each; on a remote
         Redis at 66ms RTT that bottlenecks the poller. A pipeline collapses
-        every sample in a poll cycle into a single network exchange.
+        every sample in a poll cycle into a single network exchange. With
+        BANDWIDTH_STREAM_FORMAT=compact each NAS's samples also share one
+        packed entry (app.services.bandwidth_frames), which cuts stream memory
+        and bytes on the wire several-fold.
         """
         if not samples:
             return
@@ -877,15 +932,7 @@ class BandwidthPoller:
         r = await self._get_redis()
         try:
             async with r.pipeline(transaction=False) as pipe:
-                for sample in samples:
-                    data: dict[bytes | str | int | float, bytes | str | int | float] = {
-                        "subscription_id": sample.subscription_id,
-                        "nas_device_id": sample.nas_device_id,
-                        "queue_name": sample.queue_name,
-                        "rx_bps": str(sample.rx_bps),
-                        "tx_bps": str(sample.tx_bps),
-                        "sample_at": sample.sample_at.isoformat(),
-                    }
+                for data in _stream_entries(samples, settings.bandwidth_stream_format):
                     pipe.xadd(REDIS_STREAM, data, maxlen=100000)
                 await asyncio.wait_for(pipe.execute(), timeout=REDIS_IO_TIMEOUT_SEC)
         except (TimeoutError, redis.RedisError) as exc:
@@ -915,9 +962,13 @@ class BandwidthPoller:
                 }
             )
             r = await self._get_redis()
-            await asyncio.wait_for(
-                r.set(POLLER_HEALTH_KEY, payload), timeout=REDIS_IO_TIMEOUT_SEC
+            # Shards write their own snapshot; load_poller_health aggregates.
+            write = (
+                self.shard.publish_health(r, payload)
+                if self.shard
+                else r.set(POLLER_HEALTH_KEY, payload)
             )
+            await asyncio.wait_for(write, timeout=REDIS_IO_TIMEOUT_SEC)
         except Exception:
             pass
 
@@ -938,8 +989,25 @@ class BandwidthPoller:
                 result.add(str(member))
         return result
 
+    async def _renew_shard_lease(self) -> None:
+        if self.shard is None:
+            return
+        try:
+            r = await self._get_redis()
+            changed = await asyncio.wait_for(
+                self.shard.heartbeat(r), timeout=REDIS_IO_TIMEOUT_SEC
+            )
+        except TimeoutError:
+            logger.warning("poller shard heartbeat timed out")
+            return
+        if changed:
+            # Pick up devices from a departed member, drop ones a new member
+            # now owns.
+            self.device_pool.invalidate()
+
     async def _poll_once(self):
         """Execute a single polling cycle."""
+        await self._renew_shard_lease()
         sample_time = datetime.now(UTC)
         samples = []
 
@@ -1038,6 +1106,8 @@ class BandwidthPoller:
         self._running = False
         await self.device_pool.close()
         if self._redis:
+            if self.shard:
+                await self.shard.leave(self._redis)
             await self._redis.close()
         logger.info("Bandwidth poller stopped")
 
@@ -0,0 +1,124 @@
+"""Shard NAS devices across several bandwidth poller processes.
+
+With ``BANDWIDTH_POLLER_SHARD_MODE`` enabled, each poller process is a member
+of a Redis-backed group. A member holds a lease: every cycle it writes its
+heartbeat into the :data:`POLLER_SHARD_MEMBERS_KEY` sorted set and expires
+members that missed ``lease_seconds`` of heartbeats (a crashed or partitioned
+process). Devices are assigned by rendezvous (highest-random-weight) hashing
+of ``device_id`` over the live members. The split is consistent: when a member
+joins or leaves, only the devices it gains or loses move, and every member
+computes the same owner without coordinating.
+
+When the member set changes, the poller forces a device-pool refresh. Devices
+it no longer owns are disconnected, and the dead member's devices are picked
+up within one lease period. While ownership moves, a device may be polled
+twice or skipped for a cycle. That costs one extra or one missing 5s sample.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import socket
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+from uuid import UUID
+
+from app.services.poller_health import (
+    POLLER_SHARD_HEALTH_KEY,
+    POLLER_SHARD_MEMBERS_KEY,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def default_member_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def _weight(member: str, device_id: UUID | str) -> bytes:
+    return hashlib.blake2b(f"{member}|{device_id}".encode(), digest_size=8).digest()
+
+
+def owner_of(device_id: UUID | str, members: Sequence[str]) -> str | None:
+    """The member that polls ``device_id`` (rendezvous hashing)."""
+    if not members:
+        return None
+    return max(members, key=lambda member: _weight(member, device_id))
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+class ShardCoordinator:
+    """Lease-based membership and device ownership for one poller process."""
+
+    def __init__(
+        self,
+        member_id: str | None = None,
+        *,
+        lease_seconds: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.member_id = member_id or default_member_id()
+        self.lease_seconds = max(1.0, float(lease_seconds))
+        self._clock = clock
+        # Until the first heartbeat succeeds this process owns everything it
+        # sees, like an unsharded poller.
+        self._members: tuple[str, ...] = (self.member_id,)
+
+    @property
+    def members(self) -> tuple[str, ...]:
+        return self._members
+
+    def owns(self, device_id: UUID) -> bool:
+        return owner_of(device_id, self._members) == self.member_id
+
+    async def heartbeat(self, client: Any) -> bool:
+        """Renew this member's lease and expire lapsed ones.
+
+        Returns True when the live member set changed, i.e. ownership must be
+        re-evaluated. On a Redis error the last known membership is kept.
+        """
+        now = self._clock()
+        expiry = now - self.lease_seconds
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.zadd(POLLER_SHARD_MEMBERS_KEY, {self.member_id: now})
+                pipe.zrangebyscore(POLLER_SHARD_MEMBERS_KEY, "-inf", expiry)
+                pipe.zremrangebyscore(POLLER_SHARD_MEMBERS_KEY, "-inf", expiry)
+                pipe.zrange(POLLER_SHARD_MEMBERS_KEY, 0, -1)
+                _added, expired, _removed, live = await pipe.execute()
+            if expired:
+                # A dead member's health snapshot would otherwise be counted
+                # in the fleet totals forever.
+                await client.hdel(POLLER_SHARD_HEALTH_KEY, *expired)
+        except Exception as exc:
+            logger.warning("poller shard heartbeat failed: %s", exc)
+            return False
+
+        members = tuple(sorted({_decode(m) for m in live} | {self.member_id}))
+        if members == self._members:
+            return False
+        logger.info(
+            "Poller shard %s: members %d -> %d",
+            self.member_id,
+            len(self._members),
+            len(members),
+        )
+        self._members = members
+        return True
+
+    async def publish_health(self, client: Any, payload: str) -> None:
+        await client.hset(POLLER_SHARD_HEALTH_KEY, self.member_id, payload)
+
+    async def leave(self, client: Any) -> None:
+        """Give up the lease now so the others take over without waiting."""
+        try:
+            await client.zrem(POLLER_SHARD_MEMBERS_KEY, self.member_id)
+            await client.hdel(POLLER_SHARD_HEALTH_KEY, self.member_id)
+        except Exception as exc:
+            logger.debug("poller shard leave failed: %s", exc)
@@ -1,8 +1,34 @@
+"""Redis-backed application cache with a per-process L1.
+
+Reads check a small in-process LRU (the L1) before Redis. L1 entries are held
+for at most ``APP_CACHE_L1_TTL_SECONDS`` and are evicted in every worker when
+a key is written, deleted or invalidated through this module: each change is
+published on the ``<namespace>:invalidate`` channel and a listener thread per
+process drops the matching L1 entries. The L1 only serves while that listener
+is subscribed, so a worker that lost its pub/sub connection falls back to
+Redis instead of serving entries it may not have heard about. Writes made to
+the cache database without going through this module are not seen by the L1
+until its TTL runs out.
+
+``get_or_compute_json`` recomputes an expired key once: concurrent callers in
+a process wait on a per-key lock, and across processes a short Redis lock lets
+one worker compute while the others poll for its result.
+
+Keys can carry tags (``set_json(..., tags=...)``); ``invalidate_tags`` deletes
+every key under a tag in bulk and evicts them from every L1.
+"""
+
 from __future__ import annotations
 
 import json
 import logging
 import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from threading import Lock
 from typing import Any, cast
 from urllib.parse import urlsplit, urlunsplit
@@ -10,12 +36,17 @@ from urllib.parse import urlsplit, urlunsplit
 import redis
 from redis.exceptions import RedisError
 
+from app.config import settings
+from app.metrics import record_cache_fallback, record_cache_lookup
 from app.services.redis_metrics import timed_operation
 
 logger = logging.getLogger(__name__)
 
 _CACHE_DB_DEFAULT = 3
 _CACHE_NAMESPACE_DEFAULT = "appcache:v1"
+_DELETE_BATCH = 500
+_TAG_TTL_FLOOR_SECONDS = 3600
+_FLIGHT_POLL_SECONDS = 0.05
 _cache_client: redis.Redis | None = None
 _cache_lock = Lock()
 
@@ -77,36 +108,264 @@ def get_cache_redis(force_reconnect: bool = False) -> redis.Redis | None:
             return None
 
 
+def key_family(key: str) -> str:
+    """Metrics label for ``key``: its first two segments after the namespace."""
+    namespace = _cache_namespace()
+    if key.startswith(f"{namespace}:"):
+        key = key[len(namespace) + 1 :]
+    return ":".join(key.split(":")[:2]) or "unknown"
+
+
+class LocalCache:
+    """Bounded LRU of raw JSON strings with a per-entry expiry.
+
+    Raw strings are stored, not decoded values, so a caller mutating what it
+    got back cannot change what the next caller sees.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, raw = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return raw
+
+    def put(self, key: str, raw: str, ttl_seconds: float | None = None) -> None:
+        if not self.enabled:
+            return
+        ttl = self.ttl_seconds
+        if ttl_seconds is not None:
+            ttl = min(ttl, float(ttl_seconds))
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, raw)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def evict(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def evict_prefixes(self, prefixes: Iterable[str]) -> None:
+        prefixes = tuple(prefixes)
+        if not prefixes:
+            return
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefixes)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def apply(self, message: str) -> None:
+        """Apply one invalidation message from :func:`encode_invalidation`."""
+        try:
+            payload = json.loads(message)
+        except (TypeError, json.JSONDecodeError):
+            logger.debug("app_cache_invalidation_decode_failed")
+            self.clear()
+            return
+        self.evict(str(key) for key in payload.get("keys") or ())
+        self.evict_prefixes(str(prefix) for prefix in payload.get("prefixes") or ())
+
+
+def encode_invalidation(keys: Iterable[str] = (), prefixes: Iterable[str] = ()) -> str:
+    return json.dumps({"keys": list(keys), "prefixes": list(prefixes)})
+
+
+def _invalidation_channel() -> str:
+    return f"{_cache_namespace()}:invalidate"
+
+
+class _InvalidationListener:
+    """Daemon thread that evicts L1 entries changed by other workers."""
+
+    def __init__(self, local: LocalCache) -> None:
+        self.local = local
+        self.ready = threading.Event()
+        self._started = False
+        self._lock = Lock()
+
+    def ensure_started(self) -> None:
+        if self._started:
+            return
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            threading.Thread(
+                target=self._run, name="app-cache-invalidation", daemon=True
+            ).start()
+
+    def _run(self) -> None:
+        backoff = 1.0
+        while True:
+            client = get_cache_redis()
+            if client is not None:
+                try:
+                    self._listen(client)
+                except Exception as exc:
+                    logger.warning("app_cache_invalidation_listener_failed: %s", exc)
+            # Messages may have been missed while unsubscribed.
+            self.ready.clear()
+            self.local.clear()
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    def _listen(self, client: redis.Redis) -> None:
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(_invalidation_channel())
+            self.local.clear()
+            self.ready.set()
+            while True:
+                message = pubsub.get_message(timeout=1.0)
+                if message and message.get("type") == "message":
+                    self.local.apply(str(message.get("data") or ""))
+        finally:
+            self.ready.clear()
+            pubsub.close()
+
+
+_l1_state: tuple[int, LocalCache, _InvalidationListener] | None = None
+_l1_lock = Lock()
+
+
+def _l1() -> LocalCache | None:
+    """This process's L1, or None while it is disabled or not yet in sync."""
+    global _l1_state
+
+    state = _l1_state
+    if state is None or state[0] != os.getpid():
+        with _l1_lock:
+            state = _l1_state
+            if state is None or state[0] != os.getpid():
+                # First use, or a forked child: threads do not survive fork.
+                local = LocalCache(
+                    settings.app_cache_l1_max_entries,
+                    settings.app_cache_l1_ttl_seconds,
+                )
+                state = (os.getpid(), local, _InvalidationListener(local))
+                _l1_state = state
+    _pid, local, listener = state
+    if not local.enabled:
+        return None
+    listener.ensure_started()
+    return local if listener.ready.is_set() else None
+
+
+def _publish_invalidation(
+    client: redis.Redis, keys: Iterable[str] = (), prefixes: Iterable[str] = ()
+) -> None:
+    keys, prefixes = list(keys), list(prefixes)
+    state = _l1_state
+    if state is not None:
+        state[1].evict(keys)
+        state[1].evict_prefixes(prefixes)
+    if not keys and not prefixes:
+        return
+    try:
+        with timed_operation("app_cache_publish"):
+            client.publish(_invalidation_channel(), encode_invalidation(keys, prefixes))
+    except RedisError as exc:
+        logger.debug("app_cache_publish_failed error=%s", exc)
+
+
+def _decode(key: str, raw: str | None) -> Any | None:
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        logger.debug("app_cache_decode_failed key=%s", key)
+        return None
+
+
 def get_json(key: str) -> Any | None:
+    local = _l1()
+    if local is not None:
+        raw = local.get(key)
+        if raw is not None:
+            record_cache_lookup(key_family(key), "l1_hit")
+            return _decode(key, raw)
     client = get_cache_redis()
     if client is None:
         return None
     try:
         with timed_operation("app_cache_get"):
             raw = cast(str | None, client.get(key))
-        if not raw:
-            return None
-        return json.loads(raw)
-    except (RedisError, json.JSONDecodeError) as exc:
+    except RedisError as exc:
         logger.debug("app_cache_get_failed key=%s error=%s", key, exc)
         return None
+    if not raw:
+        record_cache_lookup(key_family(key), "miss")
+        return None
+    record_cache_lookup(key_family(key), "hit")
+    if local is not None:
+        local.put(key, raw)
+    return _decode(key, raw)
 
 
 def get_many_json(keys: list[str]) -> dict[str, Any]:
     if not keys:
         return {}
-    client = get_cache_redis()
-    if client is None:
-        return {}
-    try:
-        with timed_operation("app_cache_mget"):
-            raw_values = cast(list[str | None], client.mget(keys))
-    except RedisError as exc:
-        logger.debug("app_cache_mget_failed keys=%s error=%s", len(keys), exc)
+    local = _l1()
+    raw_by_key: dict[str, str] = {}
+    if local is not None:
+        for key in keys:
+            raw = local.get(key)
+            if raw is not None:
+                raw_by_key[key] = raw
+                record_cache_lookup(key_family(key), "l1_hit")
+    missing = [key for key in keys if key not in raw_by_key]
+    client = get_cache_redis() if missing else None
+    if missing and client is None:
         return {}
+    if client is not None:
+        try:
+            with timed_operation("app_cache_mget"):
+                raw_values = cast(list[str | None], client.mget(missing))
+        except RedisError as exc:
+            logger.debug("app_cache_mget_failed keys=%s error=%s", len(keys), exc)
+            return {}
+        for key, raw in zip(missing, raw_values):
+            record_cache_lookup(key_family(key), "hit" if raw else "miss")
+            if not raw:
+                continue
+            raw_by_key[key] = raw
+            if local is not None:
+                local.put(key, raw)
 
     parsed: dict[str, Any] = {}
-    for key, raw in zip(keys, raw_values):
+    for key in keys:
+        raw = raw_by_key.get(key)
         if not raw:
             continue
         try:
@@ -116,19 +375,54 @@ def get_many_json(keys: list[str]) -> dict[str, Any]:
     return parsed
 
 
-def set_json(key: str, value: Any, ttl_seconds: int) -> bool:
+def _tag_key(tag: str) -> str:
+    return cache_key("tag", tag)
+
+
+def set_json(
+    key: str, value: Any, ttl_seconds: int, *, tags: Iterable[str] = ()
+) -> bool:
+    """Store ``value`` and evict ``key`` from every worker's L1.
+
+    ``tags`` register the key for :func:`invalidate_tags`. A tag set outlives
+    its longest-lived member, so an invalidation always finds every key.
+    """
     client = get_cache_redis()
     if client is None:
         return False
     try:
         encoded = json.dumps(value, default=str)
         ttl = max(1, int(ttl_seconds))
+        tags = list(tags)
         with timed_operation("app_cache_set"):
-            client.setex(key, ttl, encoded)
-        return True
+            if not tags:
+                client.setex(key, ttl, encoded)
+            else:
+                pipe = client.pipeline(transaction=False)
+                pipe.setex(key, ttl, encoded)
+                tag_ttl = max(ttl, _TAG_TTL_FLOOR_SECONDS)
+                for tag in tags:
+                    tag_key = _tag_key(tag)
+                    pipe.sadd(tag_key, key)
+                    # NX covers a freshly created set, GT only ever extends.
+                    pipe.expire(tag_key, tag_ttl, nx=True)
+                    pipe.expire(tag_key, tag_ttl, gt=True)
+                pipe.execute()
     except (RedisError, TypeError, ValueError) as exc:
         logger.debug("app_cache_set_failed key=%s error=%s", key, exc)
         return False
+    _publish_invalidation(client, keys=[key])
+    local = _l1()
+    if local is not None:
+        local.put(key, encoded, ttl)
+    return True
+
+
+def _unlink(client: redis.Redis, keys: list[str]) -> int:
+    deleted = 0
+    for start in range(0, len(keys), _DELETE_BATCH):
+        deleted += cast(int, client.unlink(*keys[start : start + _DELETE_BATCH]))
+    return deleted
 
 
 def delete_key(key: str) -> bool:
@@ -138,10 +432,11 @@ def delete_key(key: str) -> bool:
     try:
         with timed_operation("app_cache_delete"):
             client.delete(key)
-        return True
     except RedisError as exc:
         logger.debug("app_cache_delete_failed key=%s error=%s", key, exc)
         return False
+    _publish_invalidation(client, keys=[key])
+    return True
 
 
 def delete_many(keys: list[str]) -> int:
@@ -152,11 +447,143 @@ def delete_many(keys: list[str]) -> int:
         return 0
     try:
         with timed_operation("app_cache_delete_many"):
-            deleted = cast(int, client.delete(*keys))
-        return deleted
+            deleted = _unlink(client, keys)
     except RedisError as exc:
         logger.debug("app_cache_delete_many_failed keys=%s error=%s", len(keys), exc)
         return 0
+    _publish_invalidation(client, keys=keys)
+    return deleted
+
+
+def invalidate_keys(keys: Iterable[str]) -> None:
+    """Evict keys that were deleted with a raw client from every worker's L1."""
+    keys = list(keys)
+    client = get_cache_redis()
+    if client is None:
+        state = _l1_state
+        if state is not None:
+            state[1].evict(keys)
+        return
+    _publish_invalidation(client, keys=keys)
+
+
+def invalidate_tags(*tags: str) -> int:
+    """Delete every key registered under ``tags``; returns keys deleted."""
+    if not tags:
+        return 0
+    client = get_cache_redis()
+    if client is None:
+        return 0
+    tag_keys = [_tag_key(tag) for tag in tags]
+    try:
+        with timed_operation("app_cache_invalidate_tags"):
+            pipe = client.pipeline(transaction=False)
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members = cast(list[set[str]], pipe.execute())
+            keys = sorted({str(key) for group in members for key in group})
+            deleted = _unlink(client, keys) if keys else 0
+            client.unlink(*tag_keys)
+    except RedisError as exc:
+        logger.debug("app_cache_invalidate_tags_failed tags=%s error=%s", tags, exc)
+        return 0
+    _publish_invalidation(client, keys=keys)
+    return deleted
+
+
+class _Flights:
+    """Per-key locks so one thread per process recomputes a missing key."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._held: dict[str, tuple[Lock, list[int]]] = {}
+
+    @contextmanager
+    def hold(self, key: str) -> Iterator[None]:
+        with self._lock:
+            lock, waiters = self._held.setdefault(key, (Lock(), [0]))
+            waiters[0] += 1
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                waiters[0] -= 1
+                if not waiters[0]:
+                    self._held.pop(key, None)
+
+
+_flights = _Flights()
+
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def get_or_compute_json(
+    key: str,
+    compute: Callable[[], Any],
+    ttl_seconds: int,
+    *,
+    tags: Iterable[str] = (),
+    wait_seconds: float | None = None,
+) -> Any:
+    """Return the cached value of ``key``, computing it once when missing.
+
+    Concurrent misses in a process wait for the first caller. Across
+    processes a ``<key>:flight`` lock lets one worker compute while the others
+    poll for its result; after ``wait_seconds`` they compute it themselves
+    rather than stall. ``None`` results are not cached.
+    """
+    cached = get_json(key)
+    if cached is not None:
+        return cached
+    family = key_family(key)
+    with _flights.hold(key):
+        cached = get_json(key)
+        if cached is not None:
+            return cached
+        client = get_cache_redis()
+        if client is None:
+            record_cache_fallback(family, "redis_unavailable")
+            return compute()
+        wait = (
+            settings.app_cache_single_flight_wait_seconds
+            if wait_seconds is None
+            else wait_seconds
+        )
+        lock_key = f"{key}:flight"
+        token = secrets.token_hex(8)
+        try:
+            acquired = bool(
+                client.set(lock_key, token, nx=True, px=max(1, int(wait * 1000)))
+            )
+        except RedisError as exc:
+            logger.debug("app_cache_flight_lock_failed key=%s error=%s", key, exc)
+            acquired = True
+            token = ""
+        if not acquired:
+            deadline = time.monotonic() + wait
+            while time.monotonic() < deadline:
+                time.sleep(_FLIGHT_POLL_SECONDS)
+                cached = get_json(key)
+                if cached is not None:
+                    return cached
+            record_cache_fallback(family, "single_flight_timeout")
+        try:
+            value = compute()
+            if value is not None:
+                set_json(key, value, ttl_seconds, tags=tags)
+            return value
+        finally:
+            if acquired and token:
+                try:
+                    client.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+                except RedisError as exc:
+                    logger.debug("app_cache_flight_release_failed key=%s: %s", key, exc)
 
 
 def sadd(key: str, value: str, ttl_seconds: int | None = None) -> bool:
@@ -205,11 +632,16 @@ def scan_delete(prefix_key: str) -> int:
     if client is None:
         return 0
     deleted = 0
+    batch: list[str] = []
     try:
-        for key in client.scan_iter(match=f"{prefix_key}*"):
-            removed = cast(int, client.delete(key))
-            deleted += removed
-        return deleted
+        for key in client.scan_iter(match=f"{prefix_key}*", count=_DELETE_BATCH):
+            batch.append(cast(str, key))
+            if len(batch) >= _DELETE_BATCH:
+                deleted += _unlink(client, batch)
+                batch = []
+        if batch:
+            deleted += _unlink(client, batch)
     except RedisError as exc:
         logger.debug("app_cache_scan_delete_failed prefix=%s error=%s", prefix_key, exc)
-        return deleted
+    _publish_invalidation(client, prefixes=[prefix_key])
+    return deleted
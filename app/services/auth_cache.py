@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import logging
 import os
+import uuid
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
 from types import SimpleNamespace
 from typing import Any, cast
 
@@ -8,9 +12,24 @@ from redis.exceptions import RedisError
 
 from app.services import app_cache
 
+logger = logging.getLogger(__name__)
+
 _AUTH_NAMESPACE = "auth"
 _CLAIMS_TTL_SECONDS = 300
 _SESSION_TTL_SECONDS = 120
+# Compiled grants are keyed by the RBAC version, so any RBAC change retires
+# them at once; the TTL only bounds writes made outside the ORM (raw SQL).
+_GRANTS_TTL_SECONDS = 300
+_RBAC_VERSION_TTL_SECONDS = 30 * 86_400
+# A cached session verdict is re-checked against the revocation epochs on
+# every request; the TTL bounds revocations made outside the ORM.
+_SESSION_VALIDITY_TTL_SECONDS = 60
+# session_store prefix for bearer AuthSession revocation epochs. The "*"
+# principal is stamped when sessions are revoked in bulk without knowing whose.
+AUTH_SESSION_EPOCH_PREFIX = "auth_session"
+ALL_PRINCIPALS_EPOCH = "*"
+_SESSION_EPOCH_TTL_SECONDS = 3600
+_session_epoch_fallback: dict[str, str] = {}
 
 
 def _claims_ttl_seconds() -> int:
@@ -93,6 +112,28 @@ def set_claims(
     )
 
 
+def load_claims(
+    principal_type: str,
+    principal_id: str,
+    loader: Callable[[], tuple[list[str], list[str]]],
+) -> tuple[list[str], list[str]]:
+    """Cached claims, loaded once across concurrent requests when missing."""
+
+    def _compute() -> dict[str, list[str]]:
+        roles, scopes = loader()
+        return {"roles": list(roles), "scopes": list(scopes)}
+
+    payload = app_cache.get_or_compute_json(
+        _claims_key(principal_type, principal_id), _compute, _claims_ttl_seconds()
+    )
+    if isinstance(payload, dict):
+        roles = payload.get("roles")
+        scopes = payload.get("scopes")
+        if isinstance(roles, list) and isinstance(scopes, list):
+            return [str(role) for role in roles], [str(scope) for scope in scopes]
+    return loader()
+
+
 def get_session_context(session_id: str) -> dict[str, Any] | None:
     payload = app_cache.get_json(_session_key(session_id))
     return payload if isinstance(payload, dict) else None
@@ -156,6 +197,8 @@ def invalidate_principal(principal_type: str, principal_id: str) -> int:
     app_cache.delete_key(_principal_sessions_key(principal_type, principal_id))
     if app_cache.delete_key(_claims_key(principal_type, principal_id)):
         deleted += 1
+    if app_cache.delete_key(_grants_key(rbac_version(), principal_type, principal_id)):
+        deleted += 1
     return deleted
 
 
@@ -170,11 +213,220 @@ def invalidate_principal_strict(principal_type: str, principal_id: str) -> int:
         raw_session_ids = cast(set[object], client.smembers(index_key))
         session_ids = {str(value) for value in raw_session_ids}
         keys = [_session_key(session_id) for session_id in session_ids]
-        keys.extend((index_key, _claims_key(principal_type, principal_id)))
-        return cast(int, client.delete(*keys))
+        keys.extend(
+            (
+                index_key,
+                _claims_key(principal_type, principal_id),
+                _grants_key(rbac_version(), principal_type, principal_id),
+            )
+        )
+        deleted = cast(int, client.delete(*keys))
     except RedisError as exc:
         raise RuntimeError("Durable auth cache invalidation failed") from exc
+    app_cache.invalidate_keys(keys)
+    return deleted
 
 
 def invalidate_all_auth_cache() -> int:
-    return app_cache.scan_delete(app_cache.cache_key(_AUTH_NAMESPACE))
+    deleted = app_cache.scan_delete(app_cache.cache_key(_AUTH_NAMESPACE))
+    bump_rbac_version()
+    return deleted
+
+
+def _rbac_version_key() -> str:
+    return app_cache.cache_key(_AUTH_NAMESPACE, "rbac-version")
+
+
+def rbac_version() -> str:
+    """The current global RBAC version; served from the L1 between changes."""
+    value = app_cache.get_json(_rbac_version_key())
+    return str(value) if value else "0"
+
+
+def bump_rbac_version() -> bool:
+    """Retire every compiled permission set in every worker."""
+    return app_cache.set_json(
+        _rbac_version_key(), uuid.uuid4().hex, _RBAC_VERSION_TTL_SECONDS
+    )
+
+
+def _grants_key(version: str, principal_type: str, principal_id: str) -> str:
+    return app_cache.cache_key(
+        _AUTH_NAMESPACE, "grants", version, principal_type, principal_id
+    )
+
+
+def load_granted_permissions(
+    principal_type: str,
+    principal_id: str,
+    loader: Callable[[], Iterable[str]],
+) -> frozenset[str]:
+    """A principal's role and direct permission keys, compiled once per version."""
+    payload = app_cache.get_or_compute_json(
+        _grants_key(rbac_version(), principal_type, principal_id),
+        lambda: sorted(set(loader())),
+        _GRANTS_TTL_SECONDS,
+    )
+    if isinstance(payload, list):
+        return frozenset(str(key) for key in payload)
+    return frozenset(loader())
+
+
+def _session_validity_key(session_id: str) -> str:
+    return app_cache.cache_key(_AUTH_NAMESPACE, "session-valid", session_id)
+
+
+def _parse_instant(value: object) -> datetime | None:
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _latest_session_epoch(principal_type: str, principal_id: str) -> datetime | None:
+    """Latest revocation epoch; raises when the epoch store cannot be read."""
+    from app.services.session_store import latest_session_revocation_epoch
+
+    latest = latest_session_revocation_epoch(
+        AUTH_SESSION_EPOCH_PREFIX,
+        [f"{principal_type}:{principal_id}", ALL_PRINCIPALS_EPOCH],
+        _session_epoch_fallback,
+        require_durable=True,
+    )
+    return _parse_instant(latest) if latest else None
+
+
+def session_known_valid(
+    session_id: str, principal_type: str, principal_id: str, now: datetime
+) -> bool:
+    """Whether a cached verdict still vouches for this bearer session.
+
+    The verdict must belong to the same principal, be unexpired, and have been
+    taken after the latest revocation epoch for the principal (or for all).
+    """
+    payload = app_cache.get_json(_session_validity_key(session_id))
+    if not isinstance(payload, dict):
+        return False
+    if (payload.get("principal_type"), payload.get("principal_id")) != (
+        principal_type,
+        principal_id,
+    ):
+        return False
+    expires_at = _parse_instant(payload.get("expires_at"))
+    verified_at = _parse_instant(payload.get("verified_at"))
+    if expires_at is None or verified_at is None or expires_at <= now:
+        return False
+    try:
+        epoch = _latest_session_epoch(principal_type, principal_id)
+    except RuntimeError:
+        return False
+    return epoch is None or verified_at > epoch
+
+
+def remember_session_valid(
+    session_id: str,
+    principal_type: str,
+    principal_id: str,
+    *,
+    expires_at: datetime,
+    verified_at: datetime,
+) -> bool:
+    """Cache a database verdict; ``verified_at`` must precede the query."""
+    expires_at = expires_at if expires_at.tzinfo else expires_at.replace(tzinfo=UTC)
+    ttl = int(
+        min(_SESSION_VALIDITY_TTL_SECONDS, (expires_at - verified_at).total_seconds())
+    )
+    if ttl <= 0:
+        return False
+    return app_cache.set_json(
+        _session_validity_key(session_id),
+        {
+            "principal_type": principal_type,
+            "principal_id": principal_id,
+            "expires_at": expires_at.isoformat(),
+            "verified_at": verified_at.isoformat(),
+        },
+        ttl,
+    )
+
+
+def stamp_session_revocations(principals: Iterable[tuple[str, str]]) -> None:
+    """Stamp revocation epochs so cached session verdicts stop vouching.
+
+    Pass ``(ALL_PRINCIPALS_EPOCH, "")`` when the revoked principals are unknown.
+    Verdicts are only checked against durable epochs, so when one cannot be
+    written the cached verdicts are dropped instead.
+    """
+    from app.services.session_store import set_session_revocation_epoch
+
+    stamped = True
+    for principal_type, principal_id in set(principals):
+        epoch_principal = (
+            ALL_PRINCIPALS_EPOCH
+            if principal_type == ALL_PRINCIPALS_EPOCH
+            else f"{principal_type}:{principal_id}"
+        )
+        try:
+            set_session_revocation_epoch(
+                AUTH_SESSION_EPOCH_PREFIX,
+                epoch_principal,
+                _SESSION_EPOCH_TTL_SECONDS,
+                _session_epoch_fallback,
+                require_durable=True,
+            )
+        except Exception:
+            logger.warning("auth_session_epoch_stamp_failed", exc_info=True)
+            stamped = False
+    if not stamped:
+        invalidate_all_auth_cache()
+
+
+def _api_key_usage_key() -> str:
+    return app_cache.cache_key(_AUTH_NAMESPACE, "api-key-last-used")
+
+
+def buffer_api_key_use(api_key_id: str, used_at: datetime) -> bool:
+    """Record an API-key use for the next batched ``last_used_at`` write.
+
+    Returns False when Redis is unavailable so the caller can write directly.
+    """
+    client = app_cache.get_cache_redis()
+    if client is None:
+        return False
+    try:
+        client.hset(_api_key_usage_key(), api_key_id, used_at.isoformat())
+    except RedisError as exc:
+        logger.debug("api_key_usage_buffer_failed: %s", exc)
+        return False
+    return True
+
+
+def drain_api_key_usage() -> dict[str, datetime]:
+    """Take every buffered API-key use; the buffer is left empty."""
+    client = app_cache.get_cache_redis()
+    if client is None:
+        return {}
+    key = _api_key_usage_key()
+    draining = f"{key}:draining:{uuid.uuid4().hex}"
+    try:
+        # RENAME is atomic: uses buffered after it land in a fresh hash.
+        client.rename(key, draining)
+    except RedisError:
+        # No buffered uses (ERR no such key) or Redis unavailable.
+        return {}
+    try:
+        raw = cast(dict[Any, Any], client.hgetall(draining))
+        client.delete(draining)
+    except RedisError as exc:
+        logger.warning("api_key_usage_drain_failed: %s", exc)
+        return {}
+    drained: dict[str, datetime] = {}
+    for raw_id, raw_value in raw.items():
+        used_at = _parse_instant(
+            raw_value.decode() if isinstance(raw_value, bytes) else raw_value
+        )
+        if used_at is not None:
+            api_key_id = raw_id.decode() if isinstance(raw_id, bytes) else str(raw_id)
+            drained[api_key_id] = used_at
+    return drained
@@ -0,0 +1,128 @@
+"""Retire cached authorization state when RBAC rows or sessions change.
+
+Compiled permission sets (``auth_cache.load_granted_permissions``) are keyed by
+a global RBAC version, and cached bearer-session verdicts are checked against
+``session_store`` revocation epochs. These hooks bump both after the commit
+of any ORM flush or ORM bulk statement that touches the inputs. That covers
+role and permission grants and session revocation wherever they happen,
+without every writer having to remember to invalidate. Raw SQL is not seen
+here and is bounded by the cache TTLs.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.services.session_hooks import run_after_commit
+
+# AuthSession attributes whose change can end a session's validity.
+_SESSION_VALIDITY_ATTRS = ("status", "revoked_at", "expires_at")
+
+
+def _rbac_models() -> tuple[type, ...]:
+    from app.models.rbac import (
+        Permission,
+        Role,
+        RolePermission,
+        SubscriberPermission,
+        SubscriberRole,
+        SystemUserPermission,
+        SystemUserRole,
+    )
+
+    return (
+        Permission,
+        Role,
+        RolePermission,
+        SubscriberPermission,
+        SubscriberRole,
+        SystemUserPermission,
+        SystemUserRole,
+    )
+
+
+def _session_principal(auth_session: Any) -> tuple[str, str]:
+    if auth_session.system_user_id:
+        return "system_user", str(auth_session.system_user_id)
+    if auth_session.reseller_user_id:
+        return "reseller_user", str(auth_session.reseller_user_id)
+    return "subscriber", str(auth_session.subscriber_id)
+
+
+def pending_auth_changes(session: Session) -> tuple[bool, set[tuple[str, str]]]:
+    """``(rbac_changed, revoked_session_principals)`` for the pending flush."""
+    from app.models.auth import Session as AuthSession
+
+    rbac_models = _rbac_models()
+    rbac_changed = False
+    principals: set[tuple[str, str]] = set()
+    for objects, whole in (
+        (session.new, False),
+        (session.dirty, True),
+        (session.deleted, True),
+    ):
+        for obj in objects:
+            if isinstance(obj, rbac_models):
+                rbac_changed = True
+            elif whole and isinstance(obj, AuthSession):
+                if obj in session.deleted or any(
+                    inspect(obj).attrs[attr].history.has_changes()
+                    for attr in _SESSION_VALIDITY_ATTRS
+                ):
+                    principals.add(_session_principal(obj))
+    return rbac_changed, principals
+
+
+def _schedule(
+    session: Session, *, rbac_changed: bool, principals: set[tuple[str, str]]
+) -> None:
+    if not rbac_changed and not principals:
+        return
+
+    def _apply(_db: Session) -> None:
+        from app.services import auth_cache
+
+        if rbac_changed:
+            auth_cache.bump_rbac_version()
+        if principals:
+            auth_cache.stamp_session_revocations(principals)
+
+    run_after_commit(session, _apply)
+
+
+@event.listens_for(Session, "before_flush")
+def _retire_on_flush(
+    session: Session, _flush_context: object, _instances: object
+) -> None:
+    rbac_changed, principals = pending_auth_changes(session)
+    _schedule(session, rbac_changed=rbac_changed, principals=principals)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _retire_on_bulk_statement(state: ORMExecuteState) -> None:
+    if not (state.is_update or state.is_delete or state.is_insert):
+        return
+    mapper = state.bind_mapper
+    if mapper is None:
+        return
+    from app.models.auth import Session as AuthSession
+    from app.services.auth_cache import ALL_PRINCIPALS_EPOCH
+
+    if not issubclass(mapper.class_, (*_rbac_models(), AuthSession)):
+        return
+    if not state.session.in_transaction():
+        # The hook runs before the statement autobegins; begin now so the
+        # retirement waits for this statement's commit.
+        state.session.begin()
+    if issubclass(mapper.class_, _rbac_models()):
+        _schedule(state.session, rbac_changed=True, principals=set())
+    elif issubclass(mapper.class_, AuthSession) and not state.is_insert:
+        # A bulk UPDATE/DELETE does not say whose sessions it ended.
+        _schedule(
+            state.session,
+            rbac_changed=False,
+            principals={(ALL_PRINCIPALS_EPOCH, "")},
+        )
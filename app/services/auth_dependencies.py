@@ -1,5 +1,6 @@
 import logging
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from fastapi import Depends, Header, HTTPException, Request
@@ -18,6 +19,7 @@ from app.models.rbac import (
     SystemUserPermission,
     SystemUserRole,
 )
+from app.services import auth_cache
 from app.services.auth import (
     hash_api_key,
     hash_api_key_candidates,
@@ -96,6 +98,9 @@ def _touch_api_key_last_used(db: Session, api_key: ApiKey, now: datetime) -> Non
     last_used = _as_utc(api_key.last_used_at)
     if last_used is not None and now - last_used < _API_KEY_LAST_USED_REFRESH:
         return
+    if auth_cache.buffer_api_key_use(str(api_key.id), now):
+        # Written in bulk by app.tasks.security.flush_api_key_usage.
+        return
     api_key.last_used_at = now
     db.commit()
 
@@ -256,6 +261,45 @@ def _api_key_principal(
     return auth
 
 
+def _require_active_session(
+    db: Session,
+    session_id: object,
+    principal_type: str,
+    principal_id: object,
+    now: datetime,
+) -> None:
+    """Check the bearer session in the database and cache the verdict.
+
+    ``now`` is taken before the query, so a revocation committed while it runs
+    stamps an epoch later than the cached verdict and retires it.
+    """
+    query = (
+        db.query(AuthSession)
+        .filter(AuthSession.id == session_id)
+        .filter(AuthSession.status == SessionStatus.active)
+        .filter(AuthSession.revoked_at.is_(None))
+        .filter(AuthSession.expires_at > now)
+    )
+    if principal_type == "system_user":
+        query = query.filter(AuthSession.system_user_id == principal_id)
+    elif principal_type == "reseller_user":
+        # Layer 3: reseller_user bearer principals key the session on
+        # reseller_user_id, not subscriber_id.
+        query = query.filter(AuthSession.reseller_user_id == principal_id)
+    else:
+        query = query.filter(AuthSession.subscriber_id == principal_id)
+    session = query.first()
+    if not session:
+        raise HTTPException(status_code=401, detail="Unauthorized")
+    auth_cache.remember_session_valid(
+        str(session_id),
+        str(principal_type),
+        str(principal_id),
+        expires_at=session.expires_at,
+        verified_at=now,
+    )
+
+
 def require_user_auth(
     authorization: str | None = Header(default=None),
     x_api_key: str | None = Header(default=None),
@@ -298,24 +342,10 @@ def require_user_auth(
         raise HTTPException(status_code=401, detail="Unauthorized")
 
     now = datetime.now(UTC)
-    query = (
-        db.query(AuthSession)
-        .filter(AuthSession.id == session_id)
-        .filter(AuthSession.status == SessionStatus.active)
-        .filter(AuthSession.revoked_at.is_(None))
-        .filter(AuthSession.expires_at > now)
-    )
-    if principal_type == "system_user":
-        query = query.filter(AuthSession.system_user_id == principal_id)
-    elif principal_type == "reseller_user":
-        # Layer 3: reseller_user bearer principals key the session on
-        # reseller_user_id, not subscriber_id.
-        query = query.filter(AuthSession.reseller_user_id == principal_id)
-    else:
-        query = query.filter(AuthSession.subscriber_id == principal_id)
-    session = query.first()
-    if not session:
-        raise HTTPException(status_code=401, detail="Unauthorized")
+    if not auth_cache.session_known_valid(
+        str(session_id), str(principal_type), str(principal_id), now
+    ):
+        _require_active_session(db, session_id, principal_type, principal_id, now)
     roles, scopes = _claims_from_payload_or_db(
         db, str(principal_id), str(principal_type), payload
     )
@@ -460,83 +490,31 @@ def _expand_permission_keys(permission_key: str) -> list[str]:
     return keys
 
 
+@lru_cache(maxsize=4096)
+def _expanded_permission_key_set(permission_key: str) -> frozenset[str]:
+    return frozenset(_expand_permission_keys(permission_key))
+
+
 def has_permission(auth: dict, db: Session, permission_key: str) -> bool:
-    principal_id = auth["principal_id"]
-    principal_type = auth.get("principal_type", "subscriber")
     roles = set(auth.get("roles") or [])
     if "admin" in roles:
         return True
 
-    possible_keys = _expand_permission_keys(permission_key)
+    possible_keys = _expanded_permission_key_set(permission_key)
 
     scopes = set(auth.get("scopes") or [])
-    if scopes & set(possible_keys):
+    if scopes & possible_keys:
         return True
 
-    permissions = (
-        db.query(Permission)
-        .filter(Permission.key.in_(possible_keys))
-        .filter(Permission.is_active.is_(True))
-        .all()
-    )
-    if not permissions:
-        return False
-
-    permission_ids = [p.id for p in permissions]
-
-    has_role_permission: Any | None = None
-    has_direct_permission: Any | None = None
-    if principal_type == "system_user":
-        has_role_permission = (
-            db.query(RolePermission)
-            .join(Role, RolePermission.role_id == Role.id)
-            .join(SystemUserRole, SystemUserRole.role_id == Role.id)
-            .filter(SystemUserRole.system_user_id == principal_id)
-            .filter(RolePermission.permission_id.in_(permission_ids))
-            .filter(Role.is_active.is_(True))
-            .first()
-        )
-        has_direct_permission = (
-            db.query(SystemUserPermission)
-            .filter(SystemUserPermission.system_user_id == principal_id)
-            .filter(SystemUserPermission.permission_id.in_(permission_ids))
-            .first()
-        )
-    else:
-        has_role_permission = (
-            db.query(RolePermission)
-            .join(Role, RolePermission.role_id == Role.id)
-            .join(SubscriberRole, SubscriberRole.role_id == Role.id)
-            .filter(SubscriberRole.subscriber_id == principal_id)
-            .filter(RolePermission.permission_id.in_(permission_ids))
-            .filter(Role.is_active.is_(True))
-            .first()
-        )
-        has_direct_permission = (
-            db.query(SubscriberPermission)
-            .filter(SubscriberPermission.subscriber_id == principal_id)
-            .filter(SubscriberPermission.permission_id.in_(permission_ids))
-            .first()
-        )
-
-    return bool(has_role_permission or has_direct_permission)
+    # The compiled grant set (memoized on ``auth`` and, across requests, in
+    # the RBAC-versioned auth cache) answers every check without a query.
+    return bool(possible_keys & load_permission_keys(auth, db))
 
 
-def effective_permission_keys(auth: dict, db: Session) -> frozenset[str]:
-    """All permission keys the principal effectively holds, for UI gating.
-
-    Returns the raw granted keys (scopes + role + direct); the ``admin`` role
-    collapses to the ``"*"`` sentinel meaning "everything". A requirement is
-    checked by expanding it with ``_expand_permission_keys`` against this set
-    (see ``can``), mirroring ``has_permission`` — so the UI can hide what the
-    principal cannot do while the route stays the authority.
-    """
-    roles = set(auth.get("roles") or [])
-    if "admin" in roles:
-        return frozenset({"*"})
-    keys: set[str] = set(auth.get("scopes") or [])
-    principal_id = auth["principal_id"]
-    principal_type = auth.get("principal_type", "subscriber")
+def _granted_permission_keys(
+    db: Session, principal_type: str, principal_id: object
+) -> set[str]:
+    """Active role and direct permission keys held by the principal."""
     if principal_type == "system_user":
         role_rows = (
             db.query(Permission.key)
@@ -575,9 +553,32 @@ def effective_permission_keys(auth: dict, db: Session) -> frozenset[str]:
             .filter(SubscriberPermission.subscriber_id == principal_id)
             .filter(Permission.is_active.is_(True))
         )
-    keys.update(key for (key,) in role_rows.all())
+    keys = {key for (key,) in role_rows.all()}
     keys.update(key for (key,) in direct_rows.all())
-    return frozenset(keys)
+    return keys
+
+
+def effective_permission_keys(auth: dict, db: Session) -> frozenset[str]:
+    """All permission keys the principal effectively holds, for UI gating.
+
+    Returns the raw granted keys (scopes + role + direct); the ``admin`` role
+    collapses to the ``"*"`` sentinel meaning "everything". A requirement is
+    checked by expanding it with ``_expand_permission_keys`` against this set
+    (see ``can``), mirroring ``has_permission`` — so the UI can hide what the
+    principal cannot do while the route stays the authority. The role and
+    direct grants are compiled once per RBAC version (``auth_cache``).
+    """
+    roles = set(auth.get("roles") or [])
+    if "admin" in roles:
+        return frozenset({"*"})
+    principal_id = auth["principal_id"]
+    principal_type = auth.get("principal_type", "subscriber")
+    granted = auth_cache.load_granted_permissions(
+        str(principal_type),
+        str(principal_id),
+        lambda: _granted_permission_keys(db, principal_type, principal_id),
+    )
+    return frozenset(auth.get("scopes") or []) | granted
 
 
 def load_permission_keys(auth: dict, db: Session) -> frozenset[str]:
@@ -606,7 +607,7 @@ def can(request, permission_key: str) -> bool:
         return False
     if "*" in held:
         return True
-    return bool(set(_expand_permission_keys(permission_key)) & set(held))
+    return bool(_expanded_permission_key_set(permission_key) & set(held))
 
 
 def action_permitted(request, action) -> bool:
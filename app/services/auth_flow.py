@@ -690,16 +690,22 @@ def _load_rbac_claims(
     else:
         principal_type = principal_type_or_principal_id
         resolved_principal_id = principal_id
-    cached = auth_cache.get_claims(principal_type, str(resolved_principal_id))
-    if cached is not None:
-        return cached
+    return auth_cache.load_claims(
+        principal_type,
+        str(resolved_principal_id),
+        lambda: _query_rbac_claims(db, principal_type, resolved_principal_id),
+    )
+
+
+def _query_rbac_claims(
+    db: Session, principal_type: str, principal_id: str
+) -> tuple[list[str], list[str]]:
     if principal_type == "reseller_user":
         # Reseller portal authorization is enforced via reseller_users
         # membership (reseller_portal._get_reseller_user), not RBAC roles. A
         # reseller_user principal carries no system/subscriber roles.
-        auth_cache.set_claims(principal_type, str(resolved_principal_id), [], [])
         return [], []
-    principal_uuid = coerce_uuid(resolved_principal_id)
+    principal_uuid = coerce_uuid(principal_id)
     if principal_type == "system_user":
         roles = (
             db.query(Role)
@@ -749,12 +755,6 @@ def _load_rbac_claims(
         direct_permissions = []
     role_names = [role.name for role in roles]
     permission_keys = list({perm.key for perm in [*permissions, *direct_permissions]})
-    auth_cache.set_claims(
-        principal_type,
-        str(resolved_principal_id),
-        role_names,
-        permission_keys,
-    )
     return role_names, permission_keys
 
 
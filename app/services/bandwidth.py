@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from app.models.bandwidth import BandwidthSample
 from app.models.catalog import Subscription, SubscriptionStatus
 from app.schemas.bandwidth import BandwidthSampleCreate, BandwidthSampleUpdate
+from app.services.bandwidth_partitions import hot_sample_floor
 from app.services.common import apply_ordering, apply_pagination
 from app.services.response import ListResponseMixin, list_response
 
@@ -184,8 +185,11 @@ class BandwidthSamples(ListResponseMixin):
             query = query.filter(BandwidthSample.device_id == device_id)
         if interface_id:
             query = query.filter(BandwidthSample.interface_id == interface_id)
-        if start_at:
-            query = query.filter(BandwidthSample.sample_at >= start_at)
+        # Always bound sample_at from below so PostgreSQL prunes the hourly
+        # partitions to the live ones instead of scanning every child table.
+        query = query.filter(
+            BandwidthSample.sample_at >= (start_at or hot_sample_floor(db))
+        )
         if end_at:
             query = query.filter(BandwidthSample.sample_at <= end_at)
         query = query.group_by(bucket).order_by(bucket.asc())
@@ -573,7 +577,10 @@ class BandwidthSamples(ListResponseMixin):
             if sample_count_value > 0 and current_rx_bps <= 0 and current_tx_bps <= 0:
                 latest = (
                     db.query(BandwidthSample)
-                    .filter(BandwidthSample.subscription_id == subscription_id)
+                    .filter(
+                        BandwidthSample.subscription_id == subscription_id,
+                        BandwidthSample.sample_at >= start,
+                    )
                     .order_by(BandwidthSample.sample_at.desc())
                     .first()
                 )
@@ -643,7 +650,10 @@ class BandwidthSamples(ListResponseMixin):
             # Get latest sample for current
             latest = (
                 db.query(BandwidthSample)
-                .filter(BandwidthSample.subscription_id == subscription_id)
+                .filter(
+                    BandwidthSample.subscription_id == subscription_id,
+                    BandwidthSample.sample_at >= start,
+                )
                 .order_by(BandwidthSample.sample_at.desc())
                 .first()
             )
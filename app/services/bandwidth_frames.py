@@ -0,0 +1,137 @@
+"""Wire formats of the bandwidth sample stream.
+
+The stream carries two kinds of entries:
+
+* per-sample entries — one XADD per queue sample with string fields
+  (``subscription_id``, ``nas_device_id``, ``queue_name``, ``rx_bps``,
+  ``tx_bps``, ``sample_at``). Written by the RADIUS interim-update sampler
+  and, by default, by the MikroTik poller.
+* compact frames — one XADD per NAS per poll cycle (poller with
+  ``BANDWIDTH_STREAM_FORMAT=compact``). The cycle timestamp and NAS id are
+  stored once; each sample is a fixed 32-byte record of the raw 16-byte
+  subscription UUID and unsigned 64-bit rx/tx rates. Queue names are not
+  carried — no consumer reads them.
+
+A frame is marked by its ``v`` field. Consumers call :func:`decode_entry`,
+which accepts both, so producers can be switched without draining the stream.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from uuid import UUID
+
+FORMAT_ENTRIES = "entries"
+FORMAT_COMPACT = "compact"
+STREAM_FORMATS = (FORMAT_ENTRIES, FORMAT_COMPACT)
+
+FRAME_VERSION = b"1"
+_RECORD = struct.Struct("<16sQQ")
+
+
+class FrameError(ValueError):
+    """A stream entry that cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class DecodedSample:
+    subscription_id: UUID
+    nas_device_id: UUID | None
+    rx_bps: int
+    tx_bps: int
+    sample_at: datetime
+
+
+def encode_sample(
+    *,
+    subscription_id: str,
+    nas_device_id: str,
+    queue_name: str,
+    rx_bps: int,
+    tx_bps: int,
+    sample_at: datetime,
+) -> dict[str, str]:
+    """One per-sample entry (the original stream format)."""
+    return {
+        "subscription_id": subscription_id,
+        "nas_device_id": nas_device_id,
+        "queue_name": queue_name,
+        "rx_bps": str(rx_bps),
+        "tx_bps": str(tx_bps),
+        "sample_at": sample_at.isoformat(),
+    }
+
+
+def encode_frame(
+    nas_device_id: str | UUID | None,
+    sample_at: datetime,
+    samples: Iterable[tuple[str | UUID, int, int]],
+) -> dict[str, bytes]:
+    """One compact frame for a NAS's ``(subscription_id, rx_bps, tx_bps)``."""
+    records = b"".join(
+        _RECORD.pack(_uuid(subscription_id).bytes, max(0, rx), max(0, tx))
+        for subscription_id, rx, tx in samples
+    )
+    return {
+        "v": FRAME_VERSION,
+        "n": _uuid(nas_device_id).bytes if nas_device_id else b"",
+        "t": str(int(sample_at.timestamp() * 1000)).encode(),
+        "s": records,
+    }
+
+
+def is_frame(data: dict[bytes, bytes]) -> bool:
+    return b"v" in data
+
+
+def decode_frame(data: dict[bytes, bytes]) -> list[DecodedSample]:
+    version = data.get(b"v")
+    if version != FRAME_VERSION:
+        raise FrameError(f"unsupported frame version {version!r}")
+    try:
+        nas_raw = data.get(b"n") or b""
+        nas_device_id = UUID(bytes=nas_raw) if nas_raw else None
+        sample_at = datetime.fromtimestamp(int(data[b"t"]) / 1000, UTC)
+        records = data[b"s"]
+    except (KeyError, ValueError) as exc:
+        raise FrameError(str(exc)) from exc
+    if len(records) % _RECORD.size:
+        raise FrameError(f"truncated frame ({len(records)} bytes)")
+    return [
+        DecodedSample(
+            subscription_id=UUID(bytes=sub_raw),
+            nas_device_id=nas_device_id,
+            rx_bps=rx,
+            tx_bps=tx,
+            sample_at=sample_at,
+        )
+        for sub_raw, rx, tx in _RECORD.iter_unpack(records)
+    ]
+
+
+def decode_sample(data: dict[bytes, bytes]) -> DecodedSample:
+    try:
+        nas_raw = data.get(b"nas_device_id")
+        return DecodedSample(
+            subscription_id=UUID(data[b"subscription_id"].decode()),
+            nas_device_id=UUID(nas_raw.decode()) if nas_raw else None,
+            rx_bps=int(data[b"rx_bps"]),
+            tx_bps=int(data[b"tx_bps"]),
+            sample_at=datetime.fromisoformat(data[b"sample_at"].decode()),
+        )
+    except (KeyError, ValueError) as exc:
+        raise FrameError(str(exc)) from exc
+
+
+def decode_entry(data: dict[bytes, bytes]) -> list[DecodedSample]:
+    """All samples in a stream entry, whichever format it was written in."""
+    if is_frame(data):
+        return decode_frame(data)
+    return [decode_sample(data)]
+
+
+def _uuid(value: str | UUID) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
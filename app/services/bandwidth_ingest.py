@@ -0,0 +1,435 @@
+"""Redis stream -> ``bandwidth_samples`` ingestion.
+
+The MikroTik poller publishes one stream entry per queue sample, or one
+compact frame per NAS per cycle (``app.services.bandwidth_frames``). Ingestion is
+a consumer group so it scales out: every process — the long-running workers
+(``python -m app.services.bandwidth_ingest``) and the periodic
+``process_bandwidth_stream`` Celery task alike — reads under its own consumer
+name and Redis hands each entry to exactly one of them.
+
+Each pass claims entries another member left unacked for ``claim_idle_ms``
+(``XAUTOCLAIM``, i.e. a crashed worker's backlog), dropping any already
+delivered ``max_deliveries`` times so one poison entry cannot cycle forever,
+then reads new entries. Nothing re-reads the pending list from ``0``, so an
+unacked entry is retried once per idle period instead of on every pass.
+
+Rows go to PostgreSQL with ``COPY`` on the session's own connection and are
+acknowledged only after the transaction commits; a failed write stays pending
+for the next claimer. Committed samples are then folded into the shared
+minute rollups (``app.services.bandwidth_rollup``) that feed VictoriaMetrics.
+
+Usage:
+  python -m app.services.bandwidth_ingest
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+import redis
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.bandwidth import BandwidthSample
+from app.models.catalog import NasDevice
+from app.models.domain_settings import SettingDomain
+from app.services.bandwidth_frames import DecodedSample, FrameError, decode_entry
+from app.services.bandwidth_metrics_adapter import get_bandwidth_metrics_adapter
+from app.services.bandwidth_rollup import MinuteRollup
+from app.services.db_session_adapter import db_session_adapter
+
+logger = logging.getLogger(__name__)
+
+GROUP_NAME = "bandwidth_processor"
+# Consumers with nothing pending and idle this long (restarted workers, old
+# Celery children) are removed from the group by prune_idle_consumers().
+STALE_CONSUMER_IDLE_MS = 3_600_000
+_NAS_MAP_TTL_SECONDS = 300
+_SETTINGS_REFRESH_SECONDS = 60
+_POSTGRES_INTEGER_MAX = 2_147_483_647
+_POSTGRES_INTEGER_MIN = -2_147_483_648
+
+COPY_COLUMNS = (
+    "id",
+    "subscription_id",
+    "device_id",
+    "rx_bps",
+    "tx_bps",
+    "sample_at",
+    "created_at",
+)
+
+StreamEntry = tuple[bytes, dict[bytes, bytes] | None]
+
+
+def default_consumer_name() -> str:
+    """``BANDWIDTH_INGEST_CONSUMER``, else unique per host and process."""
+    return settings.bandwidth_ingest_consumer or (
+        f"{socket.gethostname()}-{os.getpid()}"
+    )
+
+
+# One decoded sample, whichever wire format its stream entry used.
+StreamSample = DecodedSample
+
+
+def _in_range(rate: int) -> bool:
+    return _POSTGRES_INTEGER_MIN <= rate <= _POSTGRES_INTEGER_MAX
+
+
+def parse_entries(msg_id: bytes, data: dict[bytes, bytes]) -> list[StreamSample]:
+    """Decode a per-sample entry or compact frame, dropping bad samples (logged)."""
+    try:
+        samples = decode_entry(data)
+    except FrameError as e:
+        logger.error("Failed to parse sample %s: %s", msg_id, e)
+        return []
+    valid = [s for s in samples if _in_range(s.rx_bps) and _in_range(s.tx_bps)]
+    if len(valid) < len(samples):
+        logger.warning(
+            "Skipped %d bandwidth samples in %s with out-of-range rates",
+            len(samples) - len(valid),
+            msg_id,
+        )
+    return valid
+
+
+class NasNetworkDeviceMap:
+    """NAS id -> topology network device id, cached for ``ttl_seconds``.
+
+    The poller's NAS set changes rarely, so one query per unseen NAS per TTL
+    replaces a query per batch.
+    """
+
+    def __init__(self, ttl_seconds: float = _NAS_MAP_TTL_SECONDS) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._by_nas: dict[UUID, UUID | None] = {}
+        self._loaded_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def resolve(self, db: Session, nas_ids: set[UUID]) -> dict[UUID, UUID | None]:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._loaded_at >= self._ttl_seconds:
+                self._by_nas = {}
+                self._loaded_at = now
+            missing = nas_ids - self._by_nas.keys()
+            if missing:
+                found: dict[UUID, UUID | None] = {
+                    nas_id: network_device_id
+                    for nas_id, network_device_id in db.execute(
+                        select(NasDevice.id, NasDevice.network_device_id).where(
+                            NasDevice.id.in_(missing)
+                        )
+                    ).all()
+                }
+                for nas_id in missing:
+                    self._by_nas[nas_id] = found.get(nas_id)
+            return {nas_id: self._by_nas.get(nas_id) for nas_id in nas_ids}
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._by_nas = {}
+
+
+_nas_network_devices = NasNetworkDeviceMap()
+
+
+def write_samples(db: Session, rows: Sequence[tuple[Any, ...]]) -> int:
+    """Append ``COPY_COLUMNS``-ordered rows to ``bandwidth_samples``.
+
+    Uses ``COPY ... FROM STDIN`` inside the session's transaction on
+    PostgreSQL; other dialects (the SQLite test database) fall back to an
+    executemany INSERT.
+    """
+    if not rows:
+        return 0
+    connection = db.connection()
+    if connection.dialect.name != "postgresql":
+        db.execute(
+            insert(BandwidthSample), [dict(zip(COPY_COLUMNS, row)) for row in rows]
+        )
+        return len(rows)
+    raw: Any = connection.connection.driver_connection
+    statement = (
+        f"COPY {BandwidthSample.__tablename__} ({', '.join(COPY_COLUMNS)}) FROM STDIN"
+    )
+    with raw.cursor() as cursor, cursor.copy(statement) as copy:
+        for row in rows:
+            copy.write_row(row)
+    return len(rows)
+
+
+class BandwidthStreamIngestor:
+    """One consumer-group member of the bandwidth sample stream."""
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        stream: str | None = None,
+        group: str = GROUP_NAME,
+        consumer: str | None = None,
+        claim_idle_ms: int | None = None,
+        max_deliveries: int | None = None,
+        nas_map: NasNetworkDeviceMap | None = None,
+    ) -> None:
+        self._client = client
+        self.stream = stream or settings.bandwidth_redis_stream
+        self.group = group
+        self.consumer = consumer or default_consumer_name()
+        self.claim_idle_ms = max(
+            1000, int(claim_idle_ms or settings.bandwidth_ingest_claim_idle_ms)
+        )
+        self.max_deliveries = max(
+            1, int(max_deliveries or settings.bandwidth_ingest_max_deliveries)
+        )
+        self._nas_map = nas_map or _nas_network_devices
+        self._claim_cursor: bytes | str = "0-0"
+
+    def ensure_group(self) -> None:
+        try:
+            self._client.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def run_once(self, *, batch_size: int, block_ms: int) -> dict[str, int]:
+        """Claim stale entries, read new ones, store and ack them."""
+        batch_size = max(1, int(batch_size))
+        entries = self._claim(batch_size)
+        if len(entries) < batch_size:
+            entries.extend(
+                self._read_new(
+                    batch_size - len(entries), block_ms=None if entries else block_ms
+                )
+            )
+        if not entries:
+            return {"processed": 0, "messages": 0}
+
+        processed = self._store(entries)
+        self._ack([msg_id for msg_id, _data in entries])
+        return {"processed": processed, "messages": len(entries)}
+
+    def prune_idle_consumers(
+        self, *, idle_ms: int = STALE_CONSUMER_IDLE_MS
+    ) -> list[str]:
+        """Delete other members with nothing pending that have been idle long."""
+        removed: list[str] = []
+        for info in self._client.xinfo_consumers(self.stream, self.group):
+            name = info["name"]
+            name = name.decode() if isinstance(name, bytes) else str(name)
+            if name == self.consumer or info["pending"] or info["idle"] < idle_ms:
+                continue
+            self._client.xgroup_delconsumer(self.stream, self.group, name)
+            removed.append(name)
+        return removed
+
+    # -- internals ----------------------------------------------------------
+
+    def _claim(self, count: int) -> list[StreamEntry]:
+        response = self._client.xautoclaim(
+            self.stream,
+            self.group,
+            self.consumer,
+            min_idle_time=self.claim_idle_ms,
+            start_id=self._claim_cursor,
+            count=count,
+        )
+        self._claim_cursor = response[0]
+        claimed: list[StreamEntry] = list(response[1])
+        # Entries trimmed from the stream while pending come back without
+        # data (Redis 6.2) or as a separate deleted-id list (Redis 7+).
+        gone = [msg_id for msg_id, data in claimed if data is None]
+        if len(response) > 2:
+            gone.extend(response[2])
+        live = [(msg_id, data) for msg_id, data in claimed if data is not None]
+        if not live:
+            self._ack(gone)
+            return []
+
+        deliveries = {
+            entry["message_id"]: entry["times_delivered"]
+            for entry in self._client.xpending_range(
+                self.stream,
+                self.group,
+                min=live[0][0],
+                max=live[-1][0],
+                count=len(live),
+                consumername=self.consumer,
+            )
+        }
+        poison = {
+            msg_id
+            for msg_id, _data in live
+            if deliveries.get(msg_id, 0) > self.max_deliveries
+        }
+        if poison:
+            logger.warning(
+                "Dropped %d bandwidth stream entries after %d deliveries",
+                len(poison),
+                self.max_deliveries,
+            )
+        self._ack(gone + sorted(poison))
+        return [(msg_id, data) for msg_id, data in live if msg_id not in poison]
+
+    def _read_new(self, count: int, *, block_ms: int | None) -> list[StreamEntry]:
+        response = self._client.xreadgroup(
+            groupname=self.group,
+            consumername=self.consumer,
+            streams={self.stream: ">"},
+            count=count,
+            block=block_ms,
+        )
+        if not response:
+            return []
+        return list(response[0][1])
+
+    def _store(self, entries: list[StreamEntry]) -> int:
+        samples = [
+            sample
+            for msg_id, data in entries
+            if data is not None
+            for sample in parse_entries(msg_id, data)
+        ]
+        if not samples:
+            return 0
+
+        with db_session_adapter.session() as db:
+            nas_ids = {s.nas_device_id for s in samples if s.nas_device_id}
+            device_by_nas = self._nas_map.resolve(db, nas_ids) if nas_ids else {}
+            # Filter orphaned subscription IDs first so a single bad FK cannot
+            # fail the whole COPY.
+            valid_ids = get_bandwidth_metrics_adapter().filter_valid_subscription_ids(
+                db, {s.subscription_id for s in samples}
+            )
+            created_at = datetime.now(UTC)
+            rows = [
+                (
+                    uuid4(),
+                    s.subscription_id,
+                    device_by_nas.get(s.nas_device_id) if s.nas_device_id else None,
+                    s.rx_bps,
+                    s.tx_bps,
+                    s.sample_at,
+                    created_at,
+                )
+                for s in samples
+                if s.subscription_id in valid_ids
+            ]
+            skipped = len(samples) - len(rows)
+            if skipped:
+                logger.warning(
+                    "Skipped %d bandwidth samples with orphaned subscription_ids",
+                    skipped,
+                )
+            written = write_samples(db, rows)
+
+        # Only committed samples count towards the minute rollups.
+        self._publish_rollups(s for s in samples if s.subscription_id in valid_ids)
+        return written
+
+    def _publish_rollups(self, samples: Iterable[StreamSample]) -> None:
+        rollup = MinuteRollup()
+        for s in samples:
+            rollup.add(
+                s.subscription_id, s.nas_device_id, s.rx_bps, s.tx_bps, s.sample_at
+            )
+        if not len(rollup):
+            return
+        # The samples are already in PostgreSQL; failing the pass here would
+        # redeliver and duplicate them, so a lost rollup is only logged.
+        try:
+            late = rollup.publish(self._client)
+        except redis.RedisError as e:
+            logger.warning("Failed to publish bandwidth minute rollups: %s", e)
+            return
+        if late:
+            logger.warning(
+                "Dropped %d late bandwidth rollups for already flushed minutes",
+                late,
+            )
+
+    def _ack(self, message_ids: Sequence[bytes]) -> None:
+        if message_ids:
+            self._client.xack(self.stream, self.group, *message_ids)
+
+
+def _read_settings() -> tuple[int, int]:
+    from app.services.settings_spec import resolve_integer
+
+    with db_session_adapter.read_session() as db:
+        return (
+            resolve_integer(db, SettingDomain.bandwidth, "batch_size"),
+            resolve_integer(db, SettingDomain.bandwidth, "redis_read_timeout_ms"),
+        )
+
+
+def run_worker(*, stop: threading.Event | None = None, client: Any = None) -> None:
+    """Ingest continuously until ``stop`` is set."""
+    stop = stop or threading.Event()
+    client = client or redis.from_url(settings.redis_url)
+    ingestor = BandwidthStreamIngestor(client)
+    ingestor.ensure_group()
+    logger.info(
+        "Bandwidth ingest worker %s joined %s/%s",
+        ingestor.consumer,
+        ingestor.stream,
+        ingestor.group,
+    )
+    batch_size, block_ms = _read_settings()
+    settings_read_at = time.monotonic()
+    failures = 0
+    try:
+        while not stop.is_set():
+            if time.monotonic() - settings_read_at >= _SETTINGS_REFRESH_SECONDS:
+                batch_size, block_ms = _read_settings()
+                settings_read_at = time.monotonic()
+            try:
+                result = ingestor.run_once(batch_size=batch_size, block_ms=block_ms)
+            except Exception:
+                failures += 1
+                logger.exception("Bandwidth ingest pass failed")
+                stop.wait(min(30.0, 2.0**failures))
+                continue
+            failures = 0
+            if result["messages"]:
+                logger.debug(
+                    "Ingested %s bandwidth samples (%s messages)",
+                    result["processed"],
+                    result["messages"],
+                )
+    finally:
+        client.close()
+        logger.info("Bandwidth ingest worker %s stopped", ingestor.consumer)
+
+
+def main() -> None:
+    """Entry point for a standalone ingest worker process."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+    stop = threading.Event()
+
+    def handle_signal(_signum, _frame) -> None:
+        logger.info("Received shutdown signal")
+        stop.set()
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, handle_signal)
+    run_worker(stop=stop)
+
+
+if __name__ == "__main__":
+    main()
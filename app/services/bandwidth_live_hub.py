@@ -0,0 +1,253 @@
+"""Per-process fan-out of live bandwidth samples to SSE viewers.
+
+The poller and the RADIUS interim sampler already XADD every reading to the
+bandwidth sample stream. Instead of each SSE connection polling
+VictoriaMetrics and Postgres once a second, one hub per process tails that
+stream with a single blocking XREAD and hands each new sample to the viewers
+of its subscription. A viewer only ever holds the latest sample, so a slow
+client skips readings rather than queueing them.
+
+The hub also owns the active-viewer heartbeat the on-demand poller reads: one
+pipelined ZADD for every watched subscription per heartbeat interval, and a
+ZREM once a subscription's last viewer leaves. The tail task runs only while
+someone is watching.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from app.config import settings
+from app.services.bandwidth import live_event_payload
+from app.services.bandwidth_frames import FrameError, decode_entry
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SECONDS = 5.0
+# A viewer with no new sample re-sends its latest one this often, so the chart
+# keeps ticking and a disconnect is noticed.
+IDLE_EVENT_SECONDS = 5.0
+# Readings older than this are "waiting for data", as the old Postgres
+# fallback only looked two minutes back.
+STALE_AFTER = timedelta(minutes=2)
+_READ_BLOCK_MS = 1000
+_READ_COUNT = 500
+_RETRY_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class LiveSample:
+    rx_bps: float
+    tx_bps: float
+    sample_at: datetime
+
+
+class LiveViewer:
+    """One SSE connection's view of one subscription."""
+
+    def __init__(self, subscription_id: str, latest: LiveSample | None) -> None:
+        self.subscription_id = subscription_id
+        self.latest = latest
+        self._wake = asyncio.Event()
+
+    def offer(self, sample: LiveSample) -> None:
+        self.latest = sample
+        self._wake.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for a new sample; False when ``timeout`` passes without one."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        except TimeoutError:
+            return False
+        self._wake.clear()
+        return True
+
+
+def _redis_client() -> Any:
+    import redis.asyncio as aioredis
+
+    return aioredis.from_url(settings.redis_url)
+
+
+class LiveBandwidthHub:
+    def __init__(
+        self,
+        *,
+        stream: str,
+        viewers_key: str,
+        redis_factory: Callable[[], Any] = _redis_client,
+        heartbeat_seconds: float = HEARTBEAT_SECONDS,
+    ) -> None:
+        self._stream = stream
+        self._viewers_key = viewers_key
+        self._redis_factory = redis_factory
+        self._heartbeat_seconds = heartbeat_seconds
+        self._viewers: dict[str, set[LiveViewer]] = {}
+        self._latest: dict[str, LiveSample] = {}
+        self._joined: set[str] = set()
+        self._left: set[str] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def watched(self) -> frozenset[str]:
+        return frozenset(self._viewers)
+
+    @asynccontextmanager
+    async def watch(self, subscription_id: object) -> AsyncIterator[LiveViewer]:
+        key = str(subscription_id)
+        viewer = LiveViewer(key, self._latest.get(key))
+        if key not in self._viewers:
+            self._viewers[key] = set()
+            self._joined.add(key)
+            self._left.discard(key)
+        self._viewers[key].add(viewer)
+        self._ensure_running()
+        try:
+            yield viewer
+        finally:
+            viewers = self._viewers.get(key)
+            if viewers is not None:
+                viewers.discard(viewer)
+                if not viewers:
+                    del self._viewers[key]
+                    self._latest.pop(key, None)
+                    self._joined.discard(key)
+                    self._left.add(key)
+
+    def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        task = self._task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        self._task = loop.create_task(self._run(), name="bandwidth-live-hub")
+
+    def dispatch(self, data: dict[bytes, bytes]) -> int:
+        """Hand one stream entry's samples to their viewers; returns matches."""
+        try:
+            samples = decode_entry(data)
+        except FrameError:
+            logger.debug("live bandwidth hub skipped an undecodable entry")
+            return 0
+        delivered = 0
+        for sample in samples:
+            key = str(sample.subscription_id)
+            viewers = self._viewers.get(key)
+            if not viewers:
+                continue
+            live = LiveSample(
+                rx_bps=float(sample.rx_bps),
+                tx_bps=float(sample.tx_bps),
+                sample_at=sample.sample_at,
+            )
+            self._latest[key] = live
+            for viewer in viewers:
+                viewer.offer(live)
+            delivered += 1
+        return delivered
+
+    async def _heartbeat(self, client: Any) -> None:
+        """One pipelined write of every watched score and every departure."""
+        watched = list(self._viewers)
+        left = list(self._left)
+        self._joined.clear()
+        self._left.clear()
+        if not watched and not left:
+            return
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                if watched:
+                    now = time.time()
+                    pipe.zadd(self._viewers_key, dict.fromkeys(watched, now))
+                if left:
+                    pipe.zrem(self._viewers_key, *left)
+                await pipe.execute()
+        except Exception as exc:
+            logger.debug("live bandwidth viewer heartbeat failed: %s", exc)
+
+    async def _run(self) -> None:
+        client = self._redis_factory()
+        last_id = "$"
+        next_heartbeat = 0.0
+        try:
+            while self._viewers or self._left:
+                now = time.monotonic()
+                if self._joined or self._left or now >= next_heartbeat:
+                    await self._heartbeat(client)
+                    next_heartbeat = now + self._heartbeat_seconds
+                if not self._viewers:
+                    break
+                try:
+                    response = await client.xread(
+                        {self._stream: last_id},
+                        count=_READ_COUNT,
+                        block=_READ_BLOCK_MS,
+                    )
+                except Exception as exc:
+                    logger.warning("live bandwidth stream read failed: %s", exc)
+                    await asyncio.sleep(_RETRY_SECONDS)
+                    continue
+                for _stream, entries in response or ():
+                    for entry_id, data in entries:
+                        last_id = entry_id
+                        self.dispatch(data)
+        finally:
+            # Detach before the first await so a viewer arriving during the
+            # close starts a fresh task instead of joining this one.
+            if self._task is asyncio.current_task():
+                self._task = None
+            try:
+                await client.aclose()
+            except Exception as exc:
+                logger.debug("live bandwidth hub redis close failed: %s", exc)
+
+
+_hub: LiveBandwidthHub | None = None
+
+
+def live_bandwidth_hub() -> LiveBandwidthHub:
+    global _hub
+    if _hub is None:
+        _hub = LiveBandwidthHub(
+            stream=settings.bandwidth_redis_stream,
+            viewers_key=settings.bandwidth_active_viewers_key,
+        )
+    return _hub
+
+
+def _event(sample: LiveSample | None) -> dict[str, str]:
+    now = datetime.now(UTC)
+    if sample is None or now - sample.sample_at > STALE_AFTER:
+        payload = live_event_payload({}, now, has_sample=False)
+    else:
+        payload = live_event_payload(
+            {"rx_bps": sample.rx_bps, "tx_bps": sample.tx_bps},
+            sample.sample_at,
+        )
+    return {"event": "bandwidth", "data": json.dumps(payload)}
+
+
+async def live_bandwidth_events(
+    *,
+    subscription_id: object,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    hub: LiveBandwidthHub | None = None,
+) -> AsyncIterator[dict[str, str]]:
+    """Yield SSE bandwidth events for a subscription from the shared hub.
+
+    Sends the latest known reading at once, then every new sample as the hub
+    receives it, and repeats the latest one when the stream is quiet.
+    """
+    async with (hub or live_bandwidth_hub()).watch(subscription_id) as viewer:
+        yield _event(viewer.latest)
+        while not await is_disconnected():
+            await viewer.wait(IDLE_EVENT_SECONDS)
+            yield _event(viewer.latest)
@@ -27,6 +27,9 @@ logger = logging.getLogger(__name__)
 VICTORIAMETRICS_URL = os.getenv("VICTORIAMETRICS_URL", "http://victoriametrics:8428")
 _DEFAULT_TIMEOUT = 30.0
 _DEFAULT_CACHE_TTL_SECONDS = 300  # 5 minutes
+# Unknown IDs are remembered briefly so a poller still emitting samples for a
+# deleted subscription costs one query per minute, not one per batch.
+_DEFAULT_NEGATIVE_CACHE_TTL_SECONDS = 60
 
 
 @dataclass
@@ -196,12 +199,19 @@ class SubscriptionIdCache:
     """TTL-based cache for valid subscription IDs.
 
     Reduces database queries for FK validation by caching known-valid
-    subscription IDs for a configurable TTL (default 5 minutes).
+    subscription IDs for a configurable TTL (default 5 minutes), and
+    known-missing ones for a shorter ``negative_ttl_seconds``.
     """
 
-    def __init__(self, ttl_seconds: float = _DEFAULT_CACHE_TTL_SECONDS):
+    def __init__(
+        self,
+        ttl_seconds: float = _DEFAULT_CACHE_TTL_SECONDS,
+        negative_ttl_seconds: float = _DEFAULT_NEGATIVE_CACHE_TTL_SECONDS,
+    ):
         self._ttl_seconds = ttl_seconds
+        self._negative_ttl_seconds = negative_ttl_seconds
         self._cache: _CacheEntry | None = None
+        self._missing: dict[UUID, float] = {}
 
     def _is_cache_valid(self) -> bool:
         if self._cache is None:
@@ -225,6 +235,16 @@ class SubscriptionIdCache:
         if not subscription_ids:
             return set()
 
+        now = time.monotonic()
+        if self._missing:
+            cutoff = now - self._negative_ttl_seconds
+            self._missing = {
+                sid: seen for sid, seen in self._missing.items() if seen >= cutoff
+            }
+            subscription_ids = subscription_ids - self._missing.keys()
+            if not subscription_ids:
+                return set()
+
         # Check cache first
         if self._is_cache_valid() and self._cache is not None:
             # Return intersection of requested IDs and cached valid IDs
@@ -247,6 +267,7 @@ class SubscriptionIdCache:
             # Update cache with new IDs
             self._cache.valid_ids.update(newly_valid)
             self._cache.cached_at = time.monotonic()
+            self._missing.update(dict.fromkeys(uncached - newly_valid, now))
 
             return cached_valid | newly_valid
 
@@ -261,12 +282,14 @@ class SubscriptionIdCache:
 
         # Refresh cache
         self._cache = _CacheEntry(valid_ids=valid_ids)
+        self._missing.update(dict.fromkeys(subscription_ids - valid_ids, now))
 
         return valid_ids
 
     def invalidate(self) -> None:
         """Clear the cache."""
         self._cache = None
+        self._missing = {}
 
 
 class BandwidthMetricsAdapter:
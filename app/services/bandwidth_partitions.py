@@ -0,0 +1,201 @@
+"""Hourly range partitions for ``bandwidth_samples``.
+
+On PostgreSQL the raw sample table is ``PARTITION BY RANGE (sample_at)``
+(migration ``549_partition_bandwidth_samples``) with one child table per UTC
+hour, named ``bandwidth_samples_pYYYYMMDDHH``, plus a ``DEFAULT`` partition
+that catches samples outside the premade range (clock-skewed pollers, late
+backfills). Retention drops whole expired partitions instead of running a
+DELETE over millions of rows, so there is no dead-tuple bloat and no
+autovacuum debt. Queries bounded on ``sample_at`` are pruned to the hours
+they cover by the planner.
+
+``cleanup_hot_data`` calls :func:`apply_retention` hourly: it premakes the
+next :data:`PREMAKE_HOURS` partitions, drops every partition wholly older than
+the cutoff and trims the default partition. On a non-partitioned table (SQLite
+tests, or a database not yet migrated) it falls back to the plain DELETE.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.models.bandwidth import BandwidthSample
+from app.models.domain_settings import SettingDomain
+from app.services.settings_spec import resolve_value
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "bandwidth_samples"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+PARTITION_PREFIX = f"{PARENT_TABLE}_p"
+PARTITION_SPAN = timedelta(hours=1)
+PREMAKE_HOURS = 24
+DEFAULT_HOT_RETENTION_HOURS = 24
+_NAME_FORMAT = "%Y%m%d%H"
+# DROP TABLE on a partition takes an ACCESS EXCLUSIVE lock on the parent; give
+# up quickly rather than queue every sample writer behind a long report query.
+_DDL_LOCK_TIMEOUT = "5s"
+
+
+@dataclass
+class RetentionResult:
+    created: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+    deleted: int = 0
+
+
+def partition_start(ts: datetime) -> datetime:
+    """Lower bound (inclusive) of the hourly partition holding ``ts``."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=UTC)
+    return ts.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def partition_name(start: datetime) -> str:
+    return f"{PARTITION_PREFIX}{partition_start(start).strftime(_NAME_FORMAT)}"
+
+
+def parse_partition_name(name: str) -> datetime | None:
+    """Start of the hour a partition covers, or None for non-hourly tables."""
+    if not name.startswith(PARTITION_PREFIX):
+        return None
+    try:
+        parsed = datetime.strptime(name[len(PARTITION_PREFIX) :], _NAME_FORMAT)
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=UTC)
+
+
+def expired_partitions(names: list[str], cutoff: datetime) -> list[str]:
+    """Hourly partitions whose whole range lies before ``cutoff``."""
+    expired = []
+    for name in names:
+        start = parse_partition_name(name)
+        if start is not None and start + PARTITION_SPAN <= cutoff:
+            expired.append(name)
+    return sorted(expired)
+
+
+def hot_retention_hours(db: Session) -> int:
+    value = resolve_value(db, SettingDomain.bandwidth, "hot_retention_hours")
+    try:
+        hours = int(str(value))
+    except (TypeError, ValueError):
+        return DEFAULT_HOT_RETENTION_HOURS
+    return hours if hours > 0 else DEFAULT_HOT_RETENTION_HOURS
+
+
+def hot_sample_floor(db: Session, now: datetime | None = None) -> datetime:
+    """Oldest ``sample_at`` that can still be stored.
+
+    Used as the lower bound for otherwise open-ended sample queries so the
+    planner only scans live partitions. One extra partition span is allowed
+    for the hour the retention run has not dropped yet.
+    """
+    now = now or datetime.now(UTC)
+    return now - timedelta(hours=hot_retention_hours(db)) - PARTITION_SPAN
+
+
+def is_partitioned(db: Session) -> bool:
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    return bool(
+        db.execute(
+            text(
+                "SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid "
+                "WHERE c.relname = :name AND pg_table_is_visible(c.oid)"
+            ),
+            {"name": PARENT_TABLE},
+        ).scalar()
+    )
+
+
+def list_partitions(db: Session) -> list[str]:
+    rows = db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = :name AND pg_table_is_visible(parent.oid)"
+        ),
+        {"name": PARENT_TABLE},
+    ).scalars()
+    return sorted(str(name) for name in rows)
+
+
+def ensure_partitions(
+    db: Session, *, now: datetime, hours_ahead: int = PREMAKE_HOURS
+) -> list[str]:
+    """Create the current and next ``hours_ahead`` hourly partitions."""
+    existing = set(list_partitions(db))
+    created = []
+    start = partition_start(now)
+    for offset in range(hours_ahead + 1):
+        lower = start + offset * PARTITION_SPAN
+        name = partition_name(lower)
+        if name in existing:
+            continue
+        upper = lower + PARTITION_SPAN
+        try:
+            # A savepoint per partition: creation fails if the default
+            # partition already holds rows for that hour, and that must not
+            # abort the rest of the run.
+            with db.begin_nested():
+                db.execute(
+                    text(
+                        f'CREATE TABLE IF NOT EXISTS "{name}" '
+                        f'PARTITION OF "{PARENT_TABLE}" '
+                        f"FOR VALUES FROM ('{lower.isoformat()}') "
+                        f"TO ('{upper.isoformat()}')"
+                    )
+                )
+        except DBAPIError as exc:
+            logger.warning("Could not create partition %s: %s", name, exc)
+            continue
+        created.append(name)
+    return created
+
+
+def drop_expired_partitions(db: Session, *, cutoff: datetime) -> list[str]:
+    dropped = []
+    for name in expired_partitions(list_partitions(db), cutoff):
+        try:
+            with db.begin_nested():
+                db.execute(text(f"SET LOCAL lock_timeout = '{_DDL_LOCK_TIMEOUT}'"))
+                db.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
+        except DBAPIError as exc:
+            # Retried on the next hourly run.
+            logger.warning("Could not drop partition %s: %s", name, exc)
+            continue
+        dropped.append(name)
+    return dropped
+
+
+def apply_retention(
+    db: Session, *, cutoff: datetime, now: datetime | None = None
+) -> RetentionResult:
+    """Premake upcoming partitions and remove samples older than ``cutoff``."""
+    if not is_partitioned(db):
+        result = db.execute(
+            delete(BandwidthSample).where(BandwidthSample.sample_at < cutoff)
+        )
+        return RetentionResult(deleted=int(getattr(result, "rowcount", 0) or 0))
+
+    outcome = RetentionResult(
+        created=ensure_partitions(db, now=now or datetime.now(UTC)),
+        dropped=drop_expired_partitions(db, cutoff=cutoff),
+    )
+    # Only stragglers land in the default partition; a DELETE there is small.
+    trimmed = db.execute(
+        text(f'DELETE FROM "{DEFAULT_PARTITION}" WHERE sample_at < :cutoff'),  # noqa: S608 — fixed table name; values are bind params
+        {"cutoff": cutoff},
+    )
+    outcome.deleted = int(getattr(trimmed, "rowcount", 0) or 0)
+    return outcome
@@ -0,0 +1,284 @@
+"""Minute rollups of bandwidth samples, built while the stream is consumed.
+
+``aggregate_to_metrics`` used to re-query ``bandwidth_samples`` a minute after
+the samples were written to compute per-subscription avg/max. Instead, every
+ingest pass folds its samples into per-subscription accumulators for the
+minute they were taken in (count, rx/tx sum, rx/tx max, first/last sample
+time) and merges them into a Redis hash per minute. Samples of one minute are
+spread over all consumer-group members, so the merge is a single Lua script
+per minute: sums and counts add, maxima keep the larger value, and the whole
+merge is atomic against the flush.
+
+:func:`flush_closed_windows` (the ``aggregate_to_metrics`` task) pushes every
+minute that ended more than ``BANDWIDTH_ROLLUP_GRACE_SECONDS`` ago to
+VictoriaMetrics via ``write_aggregates_batch``. It marks the minute done
+before reading it, so a partial arriving later is rejected rather than
+overwriting the complete aggregate with a fragment. Minute aggregates no
+longer depend on the raw PostgreSQL hot table, so its retention only has to
+cover the raw-sample charts.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from app.config import settings
+from app.services.bandwidth_metrics_adapter import (
+    BandwidthAggregate,
+    get_bandwidth_metrics_adapter,
+)
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 60
+KEY_PREFIX = "bandwidth:rollup"
+PENDING_KEY = f"{KEY_PREFIX}:pending"
+FLUSH_LOCK_KEY = f"{KEY_PREFIX}:flush_lock"
+# An unflushed window (no flusher running) expires rather than growing Redis;
+# a done marker outlives any partial that could still arrive for its minute.
+WINDOW_TTL_SECONDS = 3600
+DONE_TTL_SECONDS = 3600
+_FLUSH_LOCK_SECONDS = 120
+_FIELDS_PER_SUBSCRIPTION = 9
+
+# KEYS: window hash, done marker, pending zset.
+# ARGV: window epoch, ttl, then per subscription: id, count, rx_sum, tx_sum,
+# rx_max, tx_max, nas_device_id ('' if unknown), first_at, last_at.
+_MERGE_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+  return -1
+end
+local function keep(field, value, larger)
+  local current = redis.call('HGET', KEYS[1], field)
+  if not current
+    or (larger and tonumber(value) > tonumber(current))
+    or (not larger and tonumber(value) < tonumber(current)) then
+    redis.call('HSET', KEYS[1], field, value)
+  end
+end
+for i = 3, #ARGV, 9 do
+  local sub = ARGV[i]
+  redis.call('HINCRBY', KEYS[1], sub .. ':n', ARGV[i + 1])
+  redis.call('HINCRBY', KEYS[1], sub .. ':rs', ARGV[i + 2])
+  redis.call('HINCRBY', KEYS[1], sub .. ':ts', ARGV[i + 3])
+  keep(sub .. ':rm', ARGV[i + 4], true)
+  keep(sub .. ':tm', ARGV[i + 5], true)
+  if ARGV[i + 6] ~= '' then
+    redis.call('HSET', KEYS[1], sub .. ':nas', ARGV[i + 6])
+  end
+  keep(sub .. ':fa', ARGV[i + 7], false)
+  keep(sub .. ':la', ARGV[i + 8], true)
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('ZADD', KEYS[3], ARGV[1], ARGV[1])
+return 0
+"""
+
+
+def window_key(epoch: int) -> str:
+    return f"{KEY_PREFIX}:{epoch}"
+
+
+def done_key(epoch: int) -> str:
+    return f"{KEY_PREFIX}:{epoch}:done"
+
+
+def window_start(ts: datetime) -> int:
+    """Epoch second of the minute window ``ts`` falls in."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=UTC)
+    epoch = int(ts.timestamp())
+    return epoch - epoch % WINDOW_SECONDS
+
+
+@dataclass
+class MinuteAccumulator:
+    """Running count/sum/max/first/last for one subscription and minute."""
+
+    count: int = 0
+    rx_sum: int = 0
+    tx_sum: int = 0
+    rx_max: int = 0
+    tx_max: int = 0
+    first_at: float = 0.0
+    last_at: float = 0.0
+    nas_device_id: str = ""
+
+    def add(self, rx_bps: int, tx_bps: int, at: float, nas_device_id: str) -> None:
+        if self.count == 0:
+            self.rx_max, self.tx_max = rx_bps, tx_bps
+            self.first_at = self.last_at = at
+        else:
+            self.rx_max = max(self.rx_max, rx_bps)
+            self.tx_max = max(self.tx_max, tx_bps)
+            self.first_at = min(self.first_at, at)
+            self.last_at = max(self.last_at, at)
+        self.count += 1
+        self.rx_sum += rx_bps
+        self.tx_sum += tx_bps
+        if nas_device_id:
+            self.nas_device_id = nas_device_id
+
+
+class MinuteRollup:
+    """Per-pass accumulators, keyed by minute window then subscription."""
+
+    def __init__(self) -> None:
+        self._windows: dict[int, dict[str, MinuteAccumulator]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(subs) for subs in self._windows.values())
+
+    def add(
+        self,
+        subscription_id: Any,
+        nas_device_id: Any,
+        rx_bps: int,
+        tx_bps: int,
+        sample_at: datetime,
+    ) -> None:
+        epoch = window_start(sample_at)
+        subs = self._windows.setdefault(epoch, {})
+        acc = subs.setdefault(str(subscription_id), MinuteAccumulator())
+        acc.add(
+            rx_bps,
+            tx_bps,
+            sample_at.timestamp(),
+            str(nas_device_id) if nas_device_id else "",
+        )
+
+    def publish(self, client: Any, *, ttl_seconds: int = WINDOW_TTL_SECONDS) -> int:
+        """Merge every accumulator into Redis and reset.
+
+        Returns how many subscription-minutes were rejected because their
+        window had already been flushed.
+        """
+        windows, self._windows = self._windows, {}
+        merge = client.register_script(_MERGE_SCRIPT)
+        late = 0
+        for epoch, subs in sorted(windows.items()):
+            args: list[Any] = [epoch, ttl_seconds]
+            for sub, acc in subs.items():
+                args.extend(
+                    (
+                        sub,
+                        acc.count,
+                        acc.rx_sum,
+                        acc.tx_sum,
+                        acc.rx_max,
+                        acc.tx_max,
+                        acc.nas_device_id,
+                        repr(acc.first_at),
+                        repr(acc.last_at),
+                    )
+                )
+            status = merge(
+                keys=[window_key(epoch), done_key(epoch), PENDING_KEY], args=args
+            )
+            if int(status) < 0:
+                late += len(subs)
+        return late
+
+
+def _text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def window_aggregates(epoch: int, raw: dict[Any, Any]) -> list[BandwidthAggregate]:
+    """Turn a merged window hash into one aggregate per subscription."""
+    fields: dict[str, dict[str, str]] = {}
+    for key, value in raw.items():
+        sub, _sep, name = _text(key).rpartition(":")
+        fields.setdefault(sub, {})[name] = _text(value)
+    timestamp = datetime.fromtimestamp(epoch, UTC)
+    aggregates = []
+    for sub, values in sorted(fields.items()):
+        count = int(values.get("n", 0))
+        if count <= 0:
+            continue
+        aggregates.append(
+            BandwidthAggregate(
+                subscription_id=sub,
+                nas_device_id=values.get("nas") or None,
+                timestamp=timestamp,
+                rx_avg=int(values.get("rs", 0)) / count,
+                tx_avg=int(values.get("ts", 0)) / count,
+                rx_max=float(values.get("rm", 0)),
+                tx_max=float(values.get("tm", 0)),
+                sample_count=count,
+            )
+        )
+    return aggregates
+
+
+def _write_with_retry(
+    adapter: Any,
+    batch: list[BandwidthAggregate],
+    max_attempts: int,
+    sleep: Callable[[float], None],
+) -> Any:
+    result = adapter.write_aggregates_batch(batch)
+    attempts = 1
+    while not result.success and attempts < max_attempts:
+        sleep(0.5 * attempts)
+        attempts += 1
+        result = adapter.write_aggregates_batch(batch)
+    return result
+
+
+def flush_closed_windows(
+    client: Any,
+    *,
+    now: datetime | None = None,
+    grace_seconds: int | None = None,
+    max_attempts: int = 3,
+    adapter: Any = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict[str, Any]:
+    """Push every minute window closed for ``grace_seconds`` to VictoriaMetrics.
+
+    Only one flusher runs at a time (a Redis lock); a window whose write fails
+    stays pending and is retried on the next run.
+    """
+    now = now or datetime.now(UTC)
+    if grace_seconds is None:
+        grace_seconds = settings.bandwidth_rollup_grace_seconds
+    token = uuid.uuid4().hex
+    if not client.set(FLUSH_LOCK_KEY, token, nx=True, ex=_FLUSH_LOCK_SECONDS):
+        return {"pushed": 0, "windows": 0, "success": True, "skipped": "locked"}
+
+    adapter = adapter or get_bandwidth_metrics_adapter()
+    horizon = int(now.timestamp()) - WINDOW_SECONDS - max(0, int(grace_seconds))
+    pushed = windows = 0
+    success = True
+    try:
+        for raw_epoch in client.zrangebyscore(PENDING_KEY, "-inf", horizon):
+            epoch = int(_text(raw_epoch))
+            # Done first: from here on late partials for this minute are
+            # rejected by the merge script, so the read below is complete.
+            client.set(done_key(epoch), 1, ex=DONE_TTL_SECONDS)
+            batch = window_aggregates(epoch, client.hgetall(window_key(epoch)))
+            result = _write_with_retry(adapter, batch, max_attempts, sleep)
+            if not result.success:
+                success = False
+                logger.error(
+                    "Failed to push bandwidth rollup for %s after %d attempts: %s",
+                    datetime.fromtimestamp(epoch, UTC),
+                    max_attempts,
+                    result.error,
+                )
+                break
+            client.delete(window_key(epoch))
+            client.zrem(PENDING_KEY, raw_epoch)
+            pushed += result.written
+            windows += 1
+    finally:
+        if _text(client.get(FLUSH_LOCK_KEY) or b"") == token:
+            client.delete(FLUSH_LOCK_KEY)
+    return {"pushed": pushed, "windows": windows, "success": success}
@@ -15,6 +15,14 @@ Two rules shape the API:
 
 Position is derived only from these postings, per currency and semantic lane.
 There is no cross-currency total and no generic mutable balance.
+
+Reads start from a :class:`CustomerPositionSnapshot` checkpoint. Staging a
+group takes the snapshot row lock for its account, currency and authority,
+numbers the group in that scope's ``position_sequence`` and folds it into the
+checkpoint in the same transaction. A read then folds only the groups
+sequenced after ``through_sequence``. ``verify_position_snapshots`` checks
+checkpoint plus delta against a full fold; the snapshot is derived state and
+is rebuilt from postings on drift.
 """
 
 from __future__ import annotations
@@ -23,14 +31,18 @@ from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from decimal import Decimal
-from uuid import UUID
+from typing import NamedTuple
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.models.billing_contract import BillingRecordAuthority
 from app.models.customer_subledger import (
     CustomerPositionEffect,
+    CustomerPositionSnapshot,
     CustomerPostingGroup,
     CustomerSubledgerAuthorityCutover,
     PositionEffectKind,
@@ -161,6 +173,42 @@ _EVIDENCE_MOVES: dict[PositionEffectKind, str] = {
 }
 
 
+_LANES = (
+    "collectible_receivable",
+    "unapplied_customer_credit",
+    "prepaid_funding_reserved",
+    "prepaid_funding_consumed",
+    "written_off_total",
+    "refunded_total",
+    "adjustment_total",
+)
+
+_ScopeKey = tuple[UUID, BillingRecordAuthority]
+
+
+def _zero_lanes() -> dict[str, Decimal]:
+    return {lane: Decimal("0") for lane in _LANES}
+
+
+def _fold(
+    lanes: dict[str, Decimal],
+    effect: PositionEffectKind,
+    amount: Decimal,
+    reverses_group_id: UUID | None,
+) -> None:
+    """Apply one effect to the lanes. A reversal group negates its effects."""
+
+    sign = -1 if reverses_group_id is not None else 1
+    value = Decimal(amount) * sign
+    move = _LANE_MOVES.get(effect)
+    if move is not None:
+        lane, direction = move
+        lanes[lane] += value * direction
+    evidence_lane = _EVIDENCE_MOVES.get(effect)
+    if evidence_lane is not None:
+        lanes[evidence_lane] += value
+
+
 def _group_key(command: StagePostingGroupCommand, context: CommandContext) -> str:
     key = command.idempotency_key or context.idempotency_key
     if not key:
@@ -251,24 +299,89 @@ def _assert_replay_matches(
         )
 
 
-def stage_posting_group(
+def _lock_snapshot(
     db: Session,
-    command: StagePostingGroupCommand,
     *,
-    context: CommandContext,
-) -> CustomerPostingGroup:
-    """Stage one posting group inside the calling owner's transaction.
-
-    Flush-only: this participant never begins, commits, or rolls back a
-    transaction. Calling it outside an active owner command fails closed —
-    a posting group without its business result would be an orphan fact.
+    account_id: UUID,
+    currency: str,
+    authority: BillingRecordAuthority,
+) -> CustomerPositionSnapshot:
+    """Return one scope's snapshot while holding its transaction row lock.
+
+    Established through the conflict arbiter, like document sequences, so two
+    first stagers cannot both allocate from an absent row. A new snapshot
+    starts its allocator after any groups already sequenced in the scope and
+    its checkpoint at zero; the first staging or ``advance_position_snapshot``
+    folds those in.
     """
 
-    if not owner_command_active(db):
+    scope = (
+        CustomerPositionSnapshot.account_id == account_id,
+        CustomerPositionSnapshot.currency == currency,
+        CustomerPositionSnapshot.authority == authority,
+    )
+    last_sequence = db.scalar(
+        select(func.max(CustomerPostingGroup.position_sequence)).where(
+            CustomerPostingGroup.account_id == account_id,
+            CustomerPostingGroup.currency == currency,
+            CustomerPostingGroup.authority == authority,
+        )
+    )
+    values = {
+        "id": uuid4(),
+        "account_id": account_id,
+        "currency": currency,
+        "authority": authority,
+        "last_sequence": int(last_sequence or 0),
+        "through_sequence": 0,
+        **_zero_lanes(),
+    }
+    conflict_columns = [
+        CustomerPositionSnapshot.account_id,
+        CustomerPositionSnapshot.currency,
+        CustomerPositionSnapshot.authority,
+    ]
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        db.execute(
+            postgresql_insert(CustomerPositionSnapshot)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=conflict_columns)
+        )
+    elif dialect == "sqlite":
+        db.execute(
+            sqlite_insert(CustomerPositionSnapshot)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=conflict_columns)
+        )
+    else:  # pragma: no cover - production and tests use PostgreSQL/SQLite
+        if db.scalar(select(CustomerPositionSnapshot.id).where(*scope)) is None:
+            db.add(CustomerPositionSnapshot(**values))
+            db.flush()
+
+    snapshot = db.scalar(
+        select(CustomerPositionSnapshot)
+        .where(*scope)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    if snapshot is None:  # pragma: no cover - the insert/select invariant failed
         raise _error(
-            "posting_requires_owner_command",
-            "Posting groups are staged only inside an active owner command.",
+            "position_snapshot_unavailable",
+            "Customer position snapshot could not be established.",
+            account_id=str(account_id),
+            currency=currency,
         )
+    return snapshot
+
+
+def _stage_group(
+    db: Session,
+    command: StagePostingGroupCommand,
+    *,
+    context: CommandContext,
+    reverses_group_id: UUID | None,
+) -> CustomerPostingGroup:
     _validate(command, context)
 
     group_key = _group_key(command, context)
@@ -286,10 +399,18 @@ def stage_posting_group(
         _assert_replay_matches(existing, command)
         return existing
 
+    authority = permitted_authority(db)
+    snapshot = _lock_snapshot(
+        db,
+        account_id=command.account_id,
+        currency=command.currency,
+        authority=authority,
+    )
+    sequence = snapshot.last_sequence + 1
     group = CustomerPostingGroup(
         account_id=command.account_id,
         currency=command.currency,
-        authority=permitted_authority(db),
+        authority=authority,
         command_kind=command.command_kind,
         producer_owner=command.producer_owner.value,
         source_kind=command.source_kind.value,
@@ -299,6 +420,8 @@ def stage_posting_group(
         correlation_id=context.correlation_id,
         causation_id=context.causation_id,
         idempotency_key=group_key,
+        reverses_group_id=reverses_group_id,
+        position_sequence=sequence,
         actor=context.actor,
         reason=context.reason,
     )
@@ -320,9 +443,40 @@ def stage_posting_group(
             )
         )
     db.flush()
+    # A checkpoint created over existing history catches up here, once.
+    _advance_locked(db, snapshot)
+    lanes = {lane: Decimal(getattr(snapshot, lane)) for lane in _LANES}
+    for item in command.effects:
+        _fold(lanes, item.effect, item.amount, reverses_group_id)
+    for lane, value in lanes.items():
+        setattr(snapshot, lane, value)
+    snapshot.last_sequence = sequence
+    snapshot.through_sequence = sequence
+    db.flush()
     return group
 
 
+def stage_posting_group(
+    db: Session,
+    command: StagePostingGroupCommand,
+    *,
+    context: CommandContext,
+) -> CustomerPostingGroup:
+    """Stage one posting group inside the calling owner's transaction.
+
+    Flush-only: this participant never begins, commits, or rolls back a
+    transaction. Calling it outside an active owner command fails closed —
+    a posting group without its business result would be an orphan fact.
+    """
+
+    if not owner_command_active(db):
+        raise _error(
+            "posting_requires_owner_command",
+            "Posting groups are staged only inside an active owner command.",
+        )
+    return _stage_group(db, command, context=context, reverses_group_id=None)
+
+
 @dataclass(frozen=True)
 class StageReversalCommand:
     """Typed request to negate one complete original posting group.
@@ -411,7 +565,7 @@ def stage_reversal(
             reversal_id=str(already.id),
         )
 
-    reversal = stage_posting_group(
+    reversal = _stage_group(
         db,
         StagePostingGroupCommand(
             account_id=original.account_id,
@@ -436,27 +590,14 @@ def stage_reversal(
             idempotency_key=command.idempotency_key,
         ),
         context=context,
+        reverses_group_id=original.id,
     )
-    reversal.reverses_group_id = original.id
-    db.flush()
     return reversal
 
 
-def resolve_position(
-    db: Session,
-    *,
-    account_id: UUID,
-    currency: str,
-    authority: BillingRecordAuthority | None = None,
-) -> CustomerFinancialPosition:
-    """Derive the typed position for one account and currency.
-
-    Read-only aggregation over immutable postings. A reversal group negates
-    its original's contribution. ``authority`` defaults to what this owner is
-    currently permitted to write, so shadow evidence is compared against
-    shadow and an authoritative read never counts shadow rows.
-    """
-
+def _authority_scope(
+    db: Session, authority: BillingRecordAuthority | None
+) -> tuple[BillingRecordAuthority, tuple[BillingRecordAuthority, ...]]:
     cutover = authority_cutover(db) if authority is None else None
     resolved_authority = authority or (
         BillingRecordAuthority.authoritative
@@ -471,50 +612,110 @@ def resolve_position(
         if authority is None and cutover is not None
         else (resolved_authority,)
     )
-    lanes = {
-        "collectible_receivable": Decimal("0"),
-        "unapplied_customer_credit": Decimal("0"),
-        "prepaid_funding_reserved": Decimal("0"),
-        "prepaid_funding_consumed": Decimal("0"),
-        "written_off_total": Decimal("0"),
-        "refunded_total": Decimal("0"),
-        "adjustment_total": Decimal("0"),
-    }
+    return resolved_authority, authority_scope
 
-    rows = db.execute(
+
+def _fold_scopes(
+    db: Session,
+    account_ids: tuple[UUID, ...],
+    currency: str,
+    authority_scope: tuple[BillingRecordAuthority, ...],
+    *,
+    from_checkpoint: bool = True,
+) -> dict[_ScopeKey, dict[str, Decimal]]:
+    """Lanes per (account, authority): checkpoint plus delta, or a full fold.
+
+    The delta is read before the checkpoints, and rows at or below the
+    checkpoint read afterwards are dropped, so a group committed in between
+    is counted once.
+    """
+
+    statement = (
         select(
+            CustomerPostingGroup.account_id,
+            CustomerPostingGroup.authority,
             CustomerPositionEffect.effect,
             CustomerPositionEffect.amount,
             CustomerPostingGroup.reverses_group_id,
+            CustomerPostingGroup.position_sequence,
         )
         .join(
-            CustomerPostingGroup,
+            CustomerPositionEffect,
             CustomerPositionEffect.group_id == CustomerPostingGroup.id,
         )
         .where(
-            CustomerPostingGroup.account_id == account_id,
+            CustomerPostingGroup.account_id.in_(account_ids),
             CustomerPostingGroup.currency == currency,
             CustomerPostingGroup.authority.in_(authority_scope),
         )
-    ).all()
-
-    for effect, amount, reverses_group_id in rows:
-        sign = -1 if reverses_group_id is not None else 1
-        value = Decimal(amount) * sign
-        move = _LANE_MOVES.get(effect)
-        if move is not None:
-            lane, direction = move
-            lanes[lane] += value * direction
-        evidence_lane = _EVIDENCE_MOVES.get(effect)
-        if evidence_lane is not None:
-            lanes[evidence_lane] += value
-
-    return CustomerFinancialPosition(
-        account_id=account_id,
-        currency=currency,
-        authority=resolved_authority,
-        **lanes,
     )
+    if from_checkpoint:
+        statement = statement.outerjoin(
+            CustomerPositionSnapshot,
+            and_(
+                CustomerPositionSnapshot.account_id == CustomerPostingGroup.account_id,
+                CustomerPositionSnapshot.currency == CustomerPostingGroup.currency,
+                CustomerPositionSnapshot.authority == CustomerPostingGroup.authority,
+            ),
+        ).where(
+            or_(
+                CustomerPositionSnapshot.id.is_(None),
+                CustomerPostingGroup.position_sequence.is_(None),
+                CustomerPostingGroup.position_sequence
+                > CustomerPositionSnapshot.through_sequence,
+            )
+        )
+    rows = db.execute(statement).all()
+
+    lanes_by_scope: dict[_ScopeKey, dict[str, Decimal]] = {}
+    through: dict[_ScopeKey, int] = {}
+    if from_checkpoint:
+        checkpoints = db.execute(
+            select(
+                CustomerPositionSnapshot.account_id,
+                CustomerPositionSnapshot.authority,
+                CustomerPositionSnapshot.through_sequence,
+                *(getattr(CustomerPositionSnapshot, lane) for lane in _LANES),
+            ).where(
+                CustomerPositionSnapshot.account_id.in_(account_ids),
+                CustomerPositionSnapshot.currency == currency,
+                CustomerPositionSnapshot.authority.in_(authority_scope),
+            )
+        ).all()
+        for account_id, authority, through_sequence, *totals in checkpoints:
+            key = (account_id, authority)
+            through[key] = through_sequence
+            lanes_by_scope[key] = {
+                lane: Decimal(total) for lane, total in zip(_LANES, totals)
+            }
+
+    for account_id, authority, effect, amount, reverses_group_id, sequence in rows:
+        key = (account_id, authority)
+        if sequence is not None and sequence <= through.get(key, 0):
+            continue
+        lanes = lanes_by_scope.setdefault(key, _zero_lanes())
+        _fold(lanes, effect, amount, reverses_group_id)
+    return lanes_by_scope
+
+
+def resolve_position(
+    db: Session,
+    *,
+    account_id: UUID,
+    currency: str,
+    authority: BillingRecordAuthority | None = None,
+) -> CustomerFinancialPosition:
+    """Derive the typed position for one account and currency.
+
+    Read-only aggregation over immutable postings. A reversal group negates
+    its original's contribution. ``authority`` defaults to what this owner is
+    currently permitted to write, so shadow evidence is compared against
+    shadow and an authoritative read never counts shadow rows.
+    """
+
+    return resolve_positions(
+        db, account_ids=(account_id,), currency=currency, authority=authority
+    )[account_id]
 
 
 def resolve_positions(
@@ -534,69 +735,241 @@ def resolve_positions(
     ids = tuple(sorted(set(account_ids), key=str))
     if not ids:
         return {}
-    cutover = authority_cutover(db) if authority is None else None
-    resolved_authority = authority or (
-        BillingRecordAuthority.authoritative
-        if cutover is not None
-        else BillingRecordAuthority.shadow
-    )
-    authority_scope = (
-        (
-            BillingRecordAuthority.shadow,
-            BillingRecordAuthority.authoritative,
+    resolved_authority, authority_scope = _authority_scope(db, authority)
+    lanes_by_account = {account_id: _zero_lanes() for account_id in ids}
+    folded = _fold_scopes(db, ids, currency, authority_scope)
+    for (account_id, _authority), scope_lanes in folded.items():
+        lanes = lanes_by_account[account_id]
+        for lane, value in scope_lanes.items():
+            lanes[lane] += value
+    return {
+        account_id: CustomerFinancialPosition(
+            account_id=account_id,
+            currency=currency,
+            authority=resolved_authority,
+            **lanes,
         )
-        if authority is None and cutover is not None
-        else (resolved_authority,)
-    )
-    lanes_by_account = {
-        account_id: {
-            "collectible_receivable": Decimal("0"),
-            "unapplied_customer_credit": Decimal("0"),
-            "prepaid_funding_reserved": Decimal("0"),
-            "prepaid_funding_consumed": Decimal("0"),
-            "written_off_total": Decimal("0"),
-            "refunded_total": Decimal("0"),
-            "adjustment_total": Decimal("0"),
-        }
-        for account_id in ids
+        for account_id, lanes in lanes_by_account.items()
     }
-    rows = db.execute(
+
+
+class PositionSnapshotScope(NamedTuple):
+    """One checkpointed (account, currency, authority) scope."""
+
+    account_id: UUID
+    currency: str
+    authority: BillingRecordAuthority
+
+
+@dataclass(frozen=True)
+class PositionSnapshotVerification:
+    """Outcome of one sampled checkpoint-versus-full-fold comparison."""
+
+    checked: int
+    suspects: tuple[PositionSnapshotScope, ...]
+
+
+def lagging_position_snapshots(
+    db: Session, *, limit: int
+) -> list[PositionSnapshotScope]:
+    """Scopes whose checkpoint is missing or behind their sequenced groups."""
+
+    missing = db.execute(
         select(
             CustomerPostingGroup.account_id,
+            CustomerPostingGroup.currency,
+            CustomerPostingGroup.authority,
+        )
+        .outerjoin(
+            CustomerPositionSnapshot,
+            and_(
+                CustomerPositionSnapshot.account_id == CustomerPostingGroup.account_id,
+                CustomerPositionSnapshot.currency == CustomerPostingGroup.currency,
+                CustomerPositionSnapshot.authority == CustomerPostingGroup.authority,
+            ),
+        )
+        .where(CustomerPositionSnapshot.id.is_(None))
+        .distinct()
+        .limit(limit)
+    ).all()
+    behind = db.execute(
+        select(
+            CustomerPositionSnapshot.account_id,
+            CustomerPositionSnapshot.currency,
+            CustomerPositionSnapshot.authority,
+        )
+        .where(
+            CustomerPositionSnapshot.through_sequence
+            < CustomerPositionSnapshot.last_sequence
+        )
+        .limit(max(limit - len(missing), 0))
+    ).all()
+    return [PositionSnapshotScope(*row) for row in (*missing, *behind)]
+
+
+def _advance_locked(db: Session, snapshot: CustomerPositionSnapshot) -> int:
+    """Fold the groups between a locked snapshot's checkpoint and allocator."""
+
+    if snapshot.through_sequence == snapshot.last_sequence:
+        return 0
+    rows = db.execute(
+        select(
+            CustomerPostingGroup.id,
             CustomerPositionEffect.effect,
             CustomerPositionEffect.amount,
             CustomerPostingGroup.reverses_group_id,
         )
-        .join(
+        .outerjoin(
             CustomerPositionEffect,
             CustomerPositionEffect.group_id == CustomerPostingGroup.id,
         )
         .where(
-            CustomerPostingGroup.account_id.in_(ids),
-            CustomerPostingGroup.currency == currency,
-            CustomerPostingGroup.authority.in_(authority_scope),
+            CustomerPostingGroup.account_id == snapshot.account_id,
+            CustomerPostingGroup.currency == snapshot.currency,
+            CustomerPostingGroup.authority == snapshot.authority,
+            CustomerPostingGroup.position_sequence > snapshot.through_sequence,
+            CustomerPostingGroup.position_sequence <= snapshot.last_sequence,
         )
     ).all()
-    for account_id, effect, amount, reverses_group_id in rows:
-        lanes = lanes_by_account[account_id]
-        sign = -1 if reverses_group_id is not None else 1
-        value = Decimal(amount) * sign
-        move = _LANE_MOVES.get(effect)
-        if move is not None:
-            lane, direction = move
-            lanes[lane] += value * direction
-        evidence_lane = _EVIDENCE_MOVES.get(effect)
-        if evidence_lane is not None:
-            lanes[evidence_lane] += value
-    return {
-        account_id: CustomerFinancialPosition(
-            account_id=account_id,
-            currency=currency,
-            authority=resolved_authority,
-            **lanes,
+    lanes = {lane: Decimal(getattr(snapshot, lane)) for lane in _LANES}
+    groups: set[UUID] = set()
+    for group_id, effect, amount, reverses_group_id in rows:
+        groups.add(group_id)
+        if effect is not None:
+            _fold(lanes, effect, amount, reverses_group_id)
+    for lane, value in lanes.items():
+        setattr(snapshot, lane, value)
+    snapshot.through_sequence = snapshot.last_sequence
+    return len(groups)
+
+
+def advance_position_snapshot(db: Session, scope: PositionSnapshotScope) -> int:
+    """Fold a scope's groups after its checkpoint into it; flush-only.
+
+    Runs under the snapshot row lock, so no group is staged into the scope
+    meanwhile. Returns the number of groups folded.
+    """
+
+    snapshot = _lock_snapshot(
+        db,
+        account_id=scope.account_id,
+        currency=scope.currency,
+        authority=scope.authority,
+    )
+    folded = _advance_locked(db, snapshot)
+    db.flush()
+    return folded
+
+
+def _lanes_match(left: dict[str, Decimal], right: dict[str, Decimal]) -> bool:
+    return all(left.get(lane, 0) == right.get(lane, 0) for lane in _LANES)
+
+
+def verify_position_snapshots(
+    db: Session, *, sample_size: int
+) -> PositionSnapshotVerification:
+    """Compare checkpoint plus delta with a full fold for sampled scopes.
+
+    Unlocked, so a group staged between the two reads can make a scope look
+    drifted; suspects are confirmed by :func:`repair_position_snapshot`.
+    Matching snapshots are stamped ``verified_at``; flush-only.
+    """
+
+    sample = [
+        PositionSnapshotScope(*row)
+        for row in db.execute(
+            select(
+                CustomerPositionSnapshot.account_id,
+                CustomerPositionSnapshot.currency,
+                CustomerPositionSnapshot.authority,
+            )
+            .order_by(func.random())
+            .limit(sample_size)
+        ).all()
+    ]
+    by_currency: dict[str, list[PositionSnapshotScope]] = {}
+    for scope in sample:
+        by_currency.setdefault(scope.currency, []).append(scope)
+
+    suspects: list[PositionSnapshotScope] = []
+    verified: list[PositionSnapshotScope] = []
+    for currency, scopes in by_currency.items():
+        ids = tuple(sorted({scope.account_id for scope in scopes}, key=str))
+        authorities = tuple({scope.authority for scope in scopes})
+        checkpointed = _fold_scopes(db, ids, currency, authorities)
+        full = _fold_scopes(db, ids, currency, authorities, from_checkpoint=False)
+        for scope in scopes:
+            key = (scope.account_id, scope.authority)
+            if _lanes_match(checkpointed.get(key, {}), full.get(key, {})):
+                verified.append(scope)
+            else:
+                suspects.append(scope)
+    if verified:
+        db.execute(
+            update(CustomerPositionSnapshot)
+            .where(
+                tuple_(
+                    CustomerPositionSnapshot.account_id,
+                    CustomerPositionSnapshot.currency,
+                    CustomerPositionSnapshot.authority,
+                ).in_([tuple(scope) for scope in verified])
+            )
+            .values(verified_at=datetime.now(UTC))
+            .execution_options(synchronize_session=False)
         )
-        for account_id, lanes in lanes_by_account.items()
-    }
+    return PositionSnapshotVerification(checked=len(sample), suspects=tuple(suspects))
+
+
+def repair_position_snapshot(db: Session, scope: PositionSnapshotScope) -> bool:
+    """Re-verify one scope under its lock and rebuild it on drift; flush-only.
+
+    Returns True when the checkpoint had drifted. The rebuilt snapshot holds
+    the full fold of every sequenced group, so its checkpoint is current.
+    """
+
+    snapshot = _lock_snapshot(
+        db,
+        account_id=scope.account_id,
+        currency=scope.currency,
+        authority=scope.authority,
+    )
+    key = (scope.account_id, scope.authority)
+    ids = (scope.account_id,)
+    authorities = (scope.authority,)
+    checkpointed = _fold_scopes(db, ids, scope.currency, authorities).get(key, {})
+    full = _fold_scopes(
+        db, ids, scope.currency, authorities, from_checkpoint=False
+    ).get(key, {})
+    if _lanes_match(checkpointed, full):
+        snapshot.verified_at = datetime.now(UTC)
+        db.flush()
+        return False
+
+    lanes = _zero_lanes()
+    for effect, amount, reverses_group_id in db.execute(
+        select(
+            CustomerPositionEffect.effect,
+            CustomerPositionEffect.amount,
+            CustomerPostingGroup.reverses_group_id,
+        )
+        .join(
+            CustomerPostingGroup,
+            CustomerPositionEffect.group_id == CustomerPostingGroup.id,
+        )
+        .where(
+            CustomerPostingGroup.account_id == scope.account_id,
+            CustomerPostingGroup.currency == scope.currency,
+            CustomerPostingGroup.authority == scope.authority,
+            CustomerPostingGroup.position_sequence <= snapshot.last_sequence,
+        )
+    ).all():
+        _fold(lanes, effect, amount, reverses_group_id)
+    for lane, value in lanes.items():
+        setattr(snapshot, lane, value)
+    snapshot.through_sequence = snapshot.last_sequence
+    snapshot.verified_at = datetime.now(UTC)
+    db.flush()
+    return True
 
 
 __all__ = [
@@ -604,11 +977,17 @@ __all__ = [
     "CustomerSubledgerError",
     "EffectInput",
     "PositionEffectKind",
+    "PositionSnapshotScope",
+    "PositionSnapshotVerification",
     "PostingCommandKind",
     "StagePostingGroupCommand",
+    "advance_position_snapshot",
     "authority_cutover",
+    "lagging_position_snapshots",
+    "repair_position_snapshot",
     "resolve_position",
     "resolve_positions",
     "stage_posting_group",
     "stage_reversal",
+    "verify_position_snapshots",
 ]
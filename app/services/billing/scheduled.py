@@ -7,9 +7,11 @@ transaction, and logging boundary for scheduled billing automation.
 from __future__ import annotations
 
 import logging
+from uuid import UUID
 
 from billiard.exceptions import SoftTimeLimitExceeded
 
+from app.config import settings
 from app.services import billing_automation as billing_automation_service
 from app.services.billing_enforcement_guards import (
     billing_enforcement_health,
@@ -25,6 +27,21 @@ def run_invoice_cycle() -> dict[str, int]:
     logger.info("Starting billing invoice cycle")
     session = SessionLocal()
     try:
+        partitions = settings.billing_invoice_partitions
+        if partitions > 1:
+            started = billing_automation_service.start_partitioned_invoice_cycle(
+                session, partitions
+            )
+            logger.info(
+                "Billing invoice cycle %s queued as %d partitions",
+                started["run_id"],
+                started["queued"],
+            )
+            return {
+                "processed": 0,
+                "errors": partitions - started["queued"],
+                "partitions": partitions,
+            }
         result = billing_automation_service.run_invoice_cycle(session)
         processed = result.get("subscriptions_billed", 0)
         errors = result.get("errors", 0)
@@ -43,6 +60,34 @@ def run_invoice_cycle() -> dict[str, int]:
         session.close()
 
 
+def run_invoice_partition(run_id: str, partition_index: int) -> dict[str, object]:
+    session = SessionLocal()
+    try:
+        return billing_automation_service.run_invoice_partition(
+            session, UUID(run_id), partition_index
+        )
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def retry_invoice_partitions(run_id: str) -> dict[str, object]:
+    session = SessionLocal()
+    try:
+        result = billing_automation_service.retry_failed_invoice_partitions(
+            session, UUID(run_id)
+        )
+        logger.info("Billing run %s: retrying partitions %s", run_id, result["retried"])
+        return result
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 def mark_invoices_overdue() -> dict[str, int]:
     logger.info("Starting overdue invoice detection")
     session = SessionLocal()
@@ -442,6 +487,58 @@ def audit_funded_inactive_exposure() -> dict:
         session.close()
 
 
+_POSITION_SNAPSHOT_ADVANCE_LIMIT = 500
+_POSITION_SNAPSHOT_SAMPLE_SIZE = 200
+
+
+def verify_customer_position_snapshots() -> dict[str, int]:
+    """Catch lagging position checkpoints up, then verify a random sample.
+
+    Each scope commits on its own, so no snapshot lock is held across scopes
+    while owner commands stage postings.
+    """
+    from app.services.billing import customer_subledger
+
+    session = SessionLocal()
+    try:
+        advanced = folded = 0
+        for scope in customer_subledger.lagging_position_snapshots(
+            session, limit=_POSITION_SNAPSHOT_ADVANCE_LIMIT
+        ):
+            folded += customer_subledger.advance_position_snapshot(session, scope)
+            session.commit()
+            advanced += 1
+        verification = customer_subledger.verify_position_snapshots(
+            session, sample_size=_POSITION_SNAPSHOT_SAMPLE_SIZE
+        )
+        session.commit()
+        repaired = 0
+        for scope in verification.suspects:
+            if customer_subledger.repair_position_snapshot(session, scope):
+                repaired += 1
+                logger.error(
+                    "customer_position_snapshot_drift: account=%s currency=%s "
+                    "authority=%s",
+                    scope.account_id,
+                    scope.currency,
+                    scope.authority.value,
+                )
+            session.commit()
+        result = {
+            "advanced": advanced,
+            "groups_folded": folded,
+            "checked": verification.checked,
+            "repaired": repaired,
+        }
+        logger.info("customer_position_snapshots: %s", result)
+        return result
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
 def run_billing_notifications() -> dict[str, int | bool]:
     logger.info("Starting billing notifications run")
     session = SessionLocal()
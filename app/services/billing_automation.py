@@ -3,17 +3,21 @@ from __future__ import annotations
 import enum
 import logging
 from calendar import monthrange
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, func, or_
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.orm.exc import ObjectDeletedError
 
+from app.config import settings
 from app.models.billing import (
     BillingRun,
+    BillingRunPartition,
     BillingRunStatus,
     Invoice,
     InvoiceDueDateBasis,
@@ -316,17 +320,30 @@ def _period_end(start: datetime, cycle: BillingCycle) -> datetime:
     return _add_months(start, 1)
 
 
-def _resolve_price(db: Session, subscription: Subscription):
+def _resolve_price(
+    db: Session,
+    subscription: Subscription,
+    prefetch: _InvoiceChunkPrefetch | None = None,
+):
     if subscription.offer_version_id:
-        version_prices = (
-            db.query(OfferVersionPrice)
-            .filter(OfferVersionPrice.offer_version_id == subscription.offer_version_id)
-            .filter(OfferVersionPrice.price_type == PriceType.recurring)
-            .filter(OfferVersionPrice.is_active.is_(True))
-            .order_by(OfferVersionPrice.created_at.desc(), OfferVersionPrice.id.desc())
-            .limit(2)
-            .all()
-        )
+        if prefetch is not None:
+            version_prices = prefetch.version_prices.get(
+                subscription.offer_version_id, []
+            )[:2]
+        else:
+            version_prices = (
+                db.query(OfferVersionPrice)
+                .filter(
+                    OfferVersionPrice.offer_version_id == subscription.offer_version_id
+                )
+                .filter(OfferVersionPrice.price_type == PriceType.recurring)
+                .filter(OfferVersionPrice.is_active.is_(True))
+                .order_by(
+                    OfferVersionPrice.created_at.desc(), OfferVersionPrice.id.desc()
+                )
+                .limit(2)
+                .all()
+            )
         if len(version_prices) > 1:
             logger.warning(
                 "Multiple active recurring offer-version prices for subscription %s "
@@ -342,15 +359,18 @@ def _resolve_price(db: Session, subscription: Subscription):
                 # SOT: subscription-owned cadence wins; price cadence is fallback.
                 subscription.billing_cycle or version_price.billing_cycle,
             )
-    offer_prices = (
-        db.query(OfferPrice)
-        .filter(OfferPrice.offer_id == subscription.offer_id)
-        .filter(OfferPrice.price_type == PriceType.recurring)
-        .filter(OfferPrice.is_active.is_(True))
-        .order_by(OfferPrice.created_at.desc(), OfferPrice.id.desc())
-        .limit(2)
-        .all()
-    )
+    if prefetch is not None:
+        offer_prices = prefetch.offer_prices.get(subscription.offer_id, [])[:2]
+    else:
+        offer_prices = (
+            db.query(OfferPrice)
+            .filter(OfferPrice.offer_id == subscription.offer_id)
+            .filter(OfferPrice.price_type == PriceType.recurring)
+            .filter(OfferPrice.is_active.is_(True))
+            .order_by(OfferPrice.created_at.desc(), OfferPrice.id.desc())
+            .limit(2)
+            .all()
+        )
     if len(offer_prices) > 1:
         logger.warning(
             "Multiple active recurring offer prices for subscription %s (offer %s); "
@@ -425,17 +445,25 @@ def _active_tax_rate_id(db: Session, tax_rate_id) -> bool:
     return rate is not None and bool(rate.is_active)
 
 
-def _tax_rate_for_catalog_percent(db: Session, vat_percent: Decimal | None):
+def _catalog_percent_candidates(vat_percent: Decimal | None) -> set[Decimal]:
+    """Tax-rate values matching a catalog VAT percent (stored as 7.5 or 0.075)."""
     if vat_percent is None:
-        return None
+        return set()
     percent = Decimal(str(vat_percent))
     if percent <= Decimal("0.00"):
-        return None
+        return set()
     candidates = {percent}
     if percent > Decimal("1.00"):
         candidates.add(percent / Decimal("100"))
     else:
         candidates.add(percent * Decimal("100"))
+    return candidates
+
+
+def _tax_rate_for_catalog_percent(db: Session, vat_percent: Decimal | None):
+    candidates = _catalog_percent_candidates(vat_percent)
+    if not candidates:
+        return None
     rates = db.query(TaxRate).filter(TaxRate.is_active.is_(True)).all()
     for rate in rates:
         current = Decimal(str(rate.rate))
@@ -462,7 +490,14 @@ def _resolve_offer_tax_rate_id(db: Session, offer: CatalogOffer | None):
     return None
 
 
-def _resolve_tax_rate_id(db: Session, subscription: Subscription):
+def _resolve_tax_rate_id(
+    db: Session,
+    subscription: Subscription,
+    prefetch: _InvoiceChunkPrefetch | None = None,
+):
+    if prefetch is not None:
+        return prefetch.tax_rate_id(subscription)
+
     def _is_active(tax_rate_id) -> bool:
         return _active_tax_rate_id(db, tax_rate_id)
 
@@ -509,6 +544,211 @@ def _default_tax_application(db: Session) -> TaxApplication:
     return TaxApplication.exclusive
 
 
+@dataclass(frozen=True, slots=True)
+class _CycleBillingPolicy:
+    """Run-wide tax and add-on settings, read once per invoice cycle."""
+
+    active_tax_rates: dict[UUID, Decimal]
+    default_tax_rate_id: UUID | None
+    tax_application: TaxApplication
+    require_active_route: bool
+
+    @classmethod
+    def load(cls, db: Session) -> _CycleBillingPolicy:
+        rates = db.query(TaxRate.id, TaxRate.rate).filter(TaxRate.is_active.is_(True))
+        return cls(
+            active_tax_rates={rate_id: Decimal(str(rate)) for rate_id, rate in rates},
+            default_tax_rate_id=_default_tax_rate_id(db),
+            tax_application=_default_tax_application(db),
+            require_active_route=_setting_truthy(
+                db, "bill_ip_addon_requires_active_route", default=False
+            ),
+        )
+
+    def is_active(self, tax_rate_id) -> bool:
+        return tax_rate_id in self.active_tax_rates
+
+    def offer_tax_rate_id(self, offer: CatalogOffer | None):
+        """Same decision as :func:`_resolve_offer_tax_rate_id`."""
+        if offer is None:
+            return self.default_tax_rate_id
+        percent = Decimal(str(offer.vat_percent or "0"))
+        if percent > Decimal("0.00"):
+            candidates = _catalog_percent_candidates(percent)
+            for rate_id, rate in self.active_tax_rates.items():
+                if rate in candidates:
+                    return rate_id
+            return self.default_tax_rate_id
+        if bool(offer.with_vat):
+            return self.default_tax_rate_id
+        return None
+
+
+@dataclass(slots=True)
+class _InvoiceChunkPrefetch:
+    """Price, tax and add-on inputs for one chunk of the invoice cycle.
+
+    Loaded with one IN query per table so ``_resolve_price``,
+    ``_resolve_tax_rate_id`` and ``_resolve_recurring_addon_charges`` make
+    the same decisions without querying per subscription. The subscriber
+    and address maps also keep those rows in the identity map for the chunk.
+    """
+
+    policy: _CycleBillingPolicy
+    version_prices: dict[UUID, list[OfferVersionPrice]]
+    offer_prices: dict[UUID, list[OfferPrice]]
+    subscribers: dict[UUID, Subscriber]
+    addresses: dict[UUID, Address]
+    addon_rows: dict[UUID, list[tuple[SubscriptionAddOn, AddOn]]]
+    addon_prices: dict[UUID, _RecurringAddonPrice]
+    route_counts: dict[tuple[UUID, int], int]
+
+    @classmethod
+    def load(
+        cls,
+        db: Session,
+        subscriptions: list[Subscription],
+        policy: _CycleBillingPolicy,
+    ) -> _InvoiceChunkPrefetch:
+        subscription_ids = [sub.id for sub in subscriptions]
+        account_ids = {sub.subscriber_id for sub in subscriptions}
+        version_ids = {sub.offer_version_id for sub in subscriptions} - {None}
+        offer_ids = {sub.offer_id for sub in subscriptions}
+        address_ids = {sub.service_address_id for sub in subscriptions} - {None}
+
+        version_prices: dict[UUID, list[OfferVersionPrice]] = {}
+        if version_ids:
+            for version_price in (
+                db.query(OfferVersionPrice)
+                .filter(OfferVersionPrice.offer_version_id.in_(version_ids))
+                .filter(OfferVersionPrice.price_type == PriceType.recurring)
+                .filter(OfferVersionPrice.is_active.is_(True))
+                .order_by(
+                    OfferVersionPrice.created_at.desc(), OfferVersionPrice.id.desc()
+                )
+            ):
+                version_prices.setdefault(version_price.offer_version_id, []).append(
+                    version_price
+                )
+        offer_prices: dict[UUID, list[OfferPrice]] = {}
+        for offer_price in (
+            db.query(OfferPrice)
+            .filter(OfferPrice.offer_id.in_(offer_ids))
+            .filter(OfferPrice.price_type == PriceType.recurring)
+            .filter(OfferPrice.is_active.is_(True))
+            .order_by(OfferPrice.created_at.desc(), OfferPrice.id.desc())
+        ):
+            offer_prices.setdefault(offer_price.offer_id, []).append(offer_price)
+
+        subscribers = {
+            row.id: row
+            for row in db.query(Subscriber).filter(Subscriber.id.in_(account_ids))
+        }
+        addresses = (
+            {
+                row.id: row
+                for row in db.query(Address).filter(Address.id.in_(address_ids))
+            }
+            if address_ids
+            else {}
+        )
+
+        addon_rows: dict[UUID, list[tuple[SubscriptionAddOn, AddOn]]] = {}
+        for sub_addon, add_on in (
+            db.query(SubscriptionAddOn, AddOn)
+            .join(AddOn, AddOn.id == SubscriptionAddOn.add_on_id)
+            .filter(SubscriptionAddOn.subscription_id.in_(subscription_ids))
+        ):
+            addon_rows.setdefault(sub_addon.subscription_id, []).append(
+                (sub_addon, add_on)
+            )
+        addon_prices: dict[UUID, _RecurringAddonPrice] = {}
+        add_on_ids = {add_on.id for rows in addon_rows.values() for _, add_on in rows}
+        if add_on_ids:
+            grouped: dict[UUID, list[AddOnPrice]] = {}
+            for addon_price in (
+                db.query(AddOnPrice)
+                .filter(AddOnPrice.add_on_id.in_(add_on_ids))
+                .filter(AddOnPrice.is_active.is_(True))
+                .filter(AddOnPrice.price_type == PriceType.recurring)
+            ):
+                grouped.setdefault(addon_price.add_on_id, []).append(addon_price)
+            addon_prices = {
+                add_on_id: _RecurringAddonPrice(
+                    amount=round_money(prices[0].amount or 0),
+                    currency=str(prices[0].currency or "NGN"),
+                    multiple_active_prices=len(prices) > 1,
+                )
+                for add_on_id, prices in grouped.items()
+            }
+
+        route_counts: dict[tuple[UUID, int], int] = {}
+        if policy.require_active_route and addon_rows:
+            route_counts = {
+                (subscriber_id, prefix_length): count
+                for subscriber_id, prefix_length, count in (
+                    db.query(
+                        SubscriberAdditionalRoute.subscriber_id,
+                        SubscriberAdditionalRoute.prefix_length,
+                        func.count(SubscriberAdditionalRoute.id),
+                    )
+                    .filter(SubscriberAdditionalRoute.subscriber_id.in_(account_ids))
+                    .filter(SubscriberAdditionalRoute.is_active.is_(True))
+                    .group_by(
+                        SubscriberAdditionalRoute.subscriber_id,
+                        SubscriberAdditionalRoute.prefix_length,
+                    )
+                )
+            }
+
+        return cls(
+            policy=policy,
+            version_prices=version_prices,
+            offer_prices=offer_prices,
+            subscribers=subscribers,
+            addresses=addresses,
+            addon_rows=addon_rows,
+            addon_prices=addon_prices,
+            route_counts=route_counts,
+        )
+
+    def tax_rate_id(self, subscription: Subscription):
+        """Same decision as :func:`_resolve_tax_rate_id`."""
+        if subscription.service_address_id:
+            address = self.addresses.get(subscription.service_address_id)
+            if (
+                address
+                and address.tax_rate_id
+                and self.policy.is_active(address.tax_rate_id)
+            ):
+                return address.tax_rate_id
+        subscriber = self.subscribers.get(subscription.subscriber_id)
+        if (
+            subscriber
+            and subscriber.tax_rate_id
+            and self.policy.is_active(subscriber.tax_rate_id)
+        ):
+            return subscriber.tax_rate_id
+        return self.policy.offer_tax_rate_id(subscription.offer)
+
+    def overlapping_addons(
+        self,
+        subscription_id: UUID,
+        period_start: datetime,
+        period_end: datetime,
+    ) -> list[tuple[SubscriptionAddOn, AddOn]]:
+        rows = []
+        for sub_addon, add_on in self.addon_rows.get(subscription_id, ()):
+            start_at = _as_utc(sub_addon.start_at)
+            end_at = _as_utc(sub_addon.end_at)
+            if start_at is not None and start_at >= period_end:
+                continue
+            if end_at is not None and end_at <= period_start:
+                continue
+            rows.append((sub_addon, add_on))
+        return rows
+
+
 def _prorated_amount(
     full_amount: Decimal,
     period_start: datetime,
@@ -771,6 +1011,7 @@ def _resolve_recurring_addon_charges(
     usage_start: datetime,
     usage_end: datetime,
     invoice_currency: str,
+    prefetch: _InvoiceChunkPrefetch | None = None,
 ) -> tuple[tuple[_RecurringAddonCharge, ...], tuple[PostpaidChargePreviewIssue, ...]]:
     """Resolve the exact recurring add-on inputs used by invoice execution.
 
@@ -791,27 +1032,37 @@ def _resolve_recurring_addon_charges(
     # Add-ons that OVERLAP [period_start, period_end): started before the period
     # ends and not yet ended when it begins. (Proration below handles the partial
     # overlap; a degenerate row that slips through bills 0 and is skipped.)
-    rows = (
-        db.query(SubscriptionAddOn, AddOn)
-        .join(AddOn, AddOn.id == SubscriptionAddOn.add_on_id)
-        .filter(SubscriptionAddOn.subscription_id == subscription.id)
-        .filter(
-            (SubscriptionAddOn.start_at.is_(None))
-            | (SubscriptionAddOn.start_at < period_end)
+    rows: Sequence[tuple[SubscriptionAddOn, AddOn]]
+    if prefetch is not None:
+        rows = prefetch.overlapping_addons(subscription.id, period_start, period_end)
+        require_active_route = prefetch.policy.require_active_route
+    else:
+        rows = (
+            db.query(SubscriptionAddOn, AddOn)
+            .join(AddOn, AddOn.id == SubscriptionAddOn.add_on_id)
+            .filter(SubscriptionAddOn.subscription_id == subscription.id)
+            .filter(
+                (SubscriptionAddOn.start_at.is_(None))
+                | (SubscriptionAddOn.start_at < period_end)
+            )
+            .filter(
+                (SubscriptionAddOn.end_at.is_(None))
+                | (SubscriptionAddOn.end_at > period_start)
+            )
+            .tuples()
+            .all()
         )
-        .filter(
-            (SubscriptionAddOn.end_at.is_(None))
-            | (SubscriptionAddOn.end_at > period_start)
+        require_active_route = _setting_truthy(
+            db, "bill_ip_addon_requires_active_route", default=False
         )
-        .all()
-    )
     charges: list[_RecurringAddonCharge] = []
     issues: list[PostpaidChargePreviewIssue] = []
-    require_active_route = _setting_truthy(
-        db, "bill_ip_addon_requires_active_route", default=False
-    )
     for sub_addon, add_on in rows:
-        priced = _addon_recurring_price(db, add_on.id)
+        priced = (
+            prefetch.addon_prices.get(add_on.id)
+            if prefetch is not None
+            else _addon_recurring_price(db, add_on.id)
+        )
         if priced is None:
             continue
         unit, currency = priced.amount, priced.currency
@@ -847,8 +1098,14 @@ def _resolve_recurring_addon_charges(
             and add_on.ip_is_public
             and add_on.ip_prefix_length is not None
         ):
-            active_routes = _active_ip_route_count(
-                db, subscription.subscriber_id, add_on.ip_prefix_length
+            active_routes = (
+                prefetch.route_counts.get(
+                    (subscription.subscriber_id, add_on.ip_prefix_length), 0
+                )
+                if prefetch is not None
+                else _active_ip_route_count(
+                    db, subscription.subscriber_id, add_on.ip_prefix_length
+                )
             )
             billable_qty = min(int(qty), active_routes)
             if billable_qty <= 0:
@@ -915,6 +1172,7 @@ def _bill_recurring_addons(
     usage_start: datetime,
     usage_end: datetime,
     tax_rate_id,
+    prefetch: _InvoiceChunkPrefetch | None = None,
 ) -> int:
     """Stage the recurring add-on lines resolved by the current owner formula."""
 
@@ -926,6 +1184,7 @@ def _bill_recurring_addons(
         usage_start=usage_start,
         usage_end=usage_end,
         invoice_currency=invoice.currency or "NGN",
+        prefetch=prefetch,
     )
     for issue in issues:
         logger.warning(
@@ -940,9 +1199,12 @@ def _bill_recurring_addons(
             },
         )
     added = 0
-    tax_application = (
-        _default_tax_application(db) if tax_rate_id else TaxApplication.exempt
-    )
+    if not tax_rate_id:
+        tax_application = TaxApplication.exempt
+    elif prefetch is not None:
+        tax_application = prefetch.policy.tax_application
+    else:
+        tax_application = _default_tax_application(db)
     for charge in charges:
         billing_line_key = _billing_line_key(
             subscription.id,
@@ -1356,6 +1618,7 @@ def reconcile_billing_run_audit(db: Session, run_id: UUID) -> bool:
 
 
 _ABANDONED_RUN_MAX_AGE_HOURS = 12
+_RESUMABLE_RUN_MAX_AGE_HOURS = 24
 
 
 def _fail_abandoned_runs(db: Session) -> int:
@@ -1385,6 +1648,211 @@ def _fail_abandoned_runs(db: Session) -> int:
     return len(stale)
 
 
+def _resumable_run(
+    db: Session,
+    *,
+    billing_cycle: BillingCycle | None,
+    launch_kind: str,
+) -> BillingRun | None:
+    """The interrupted scheduled run a new scheduled run should finish.
+
+    Only the latest scheduled run for the same cycle counts, and only when
+    it failed after committing at least one chunk within
+    ``_RESUMABLE_RUN_MAX_AGE_HOURS``. Its completed chunks are skipped;
+    billing would skip their subscriptions anyway (periods are idempotent),
+    this just avoids re-reading them.
+    """
+    if launch_kind != "scheduled":
+        return None
+    cutoff = datetime.now(UTC) - timedelta(hours=_RESUMABLE_RUN_MAX_AGE_HOURS)
+    cycle_filter = (
+        BillingRun.billing_cycle == billing_cycle.value
+        if billing_cycle
+        else BillingRun.billing_cycle.is_(None)
+    )
+    latest = (
+        db.query(BillingRun)
+        .filter(BillingRun.launch_kind == "scheduled")
+        .filter(cycle_filter)
+        .filter(BillingRun.started_at >= cutoff)
+        .order_by(BillingRun.started_at.desc())
+        .first()
+    )
+    if (
+        latest is None
+        or latest.status != BillingRunStatus.failed
+        or latest.last_account_id is None
+    ):
+        return None
+    logger.info(
+        "billing_run_resume",
+        extra={
+            "event": "billing_run_resume",
+            "billing_run_id": str(latest.id),
+            "chunks_completed": latest.chunks_completed,
+            "last_account_id": str(latest.last_account_id),
+        },
+    )
+    return latest
+
+
+def _invoice_cycle_filter(include_pending: bool):
+    active = and_(
+        Subscription.status == SubscriptionStatus.active,
+        Subscriber.status.in_(BILLABLE_SUBSCRIBER_STATUSES),
+    )
+    # Postpaid only: prepaid periods belong to the prepaid renewal owner.
+    mode_filter = Subscription.billing_mode != BillingMode.prepaid
+    if not include_pending:
+        return and_(active, mode_filter)
+    pending = and_(
+        Subscription.status == SubscriptionStatus.pending,
+        Subscriber.status == SubscriberStatus.active,
+    )
+    return and_(or_(active, pending), mode_filter)
+
+
+def _invoice_cycle_account_ids(
+    db: Session,
+    *,
+    after: UUID | None,
+    limit: int,
+    include_pending: bool,
+    before: UUID | None = None,
+) -> list[UUID]:
+    """Next keyset page of accounts with a billable subscription."""
+    query = (
+        db.query(Subscription.subscriber_id)
+        .join(Subscriber, Subscriber.id == Subscription.subscriber_id)
+        .filter(_invoice_cycle_filter(include_pending))
+    )
+    if after is not None:
+        query = query.filter(Subscription.subscriber_id > after)
+    if before is not None:
+        query = query.filter(Subscription.subscriber_id < before)
+    return [
+        account_id
+        for (account_id,) in query.group_by(Subscription.subscriber_id)
+        .order_by(Subscription.subscriber_id)
+        .limit(limit)
+    ]
+
+
+def _invoice_cycle_subscriptions(
+    db: Session, account_ids: list[UUID], *, include_pending: bool
+) -> list[Subscription]:
+    # Active before pending within an account, as the cycle always billed.
+    pending_last = case((Subscription.status == SubscriptionStatus.pending, 1), else_=0)
+    return (
+        db.query(Subscription)
+        .join(Subscriber, Subscriber.id == Subscription.subscriber_id)
+        .filter(Subscription.subscriber_id.in_(account_ids))
+        .filter(_invoice_cycle_filter(include_pending))
+        .options(selectinload(Subscription.offer))
+        .order_by(Subscription.subscriber_id, pending_last, Subscription.id)
+        .all()
+    )
+
+
+def _finish_invoice_chunk(
+    db: Session,
+    *,
+    run_uuid: UUID | None,
+    after_account_id: UUID,
+    invoices: dict[tuple[str, datetime, datetime, BillingMode], Invoice],
+    newly_created_invoices: list[Invoice],
+    summary: dict[str, Any],
+    suppress_restore_notifications: bool,
+    checkpoint: Callable[[Session, UUID], None],
+) -> None:
+    """Total, credit-settle and commit one chunk together with its checkpoint."""
+    # Persist the invoice lines just added in the loop before recalculating
+    # totals and settling credit. _recalculate_invoice_totals and
+    # settle_open_invoices_from_credit read rows back via queries, which only
+    # see flushed rows when the session has autoflush disabled (the test
+    # harness does); these flushes are harmless no-ops under default autoflush.
+    db.flush()
+    for invoice in invoices.values():
+        _recalculate_invoice_totals(db, invoice)
+    # Recalc writes balance_due/status onto the invoice objects; flush so the
+    # credit settlement below sees the open balance via its query.
+    db.flush()
+
+    # Canonical account credit is always offered to newly-created
+    # receivables. The settlement owner validates current invoice state and
+    # records structural allocation evidence; this is not a runtime option.
+    if newly_created_invoices:
+        from contextlib import nullcontext
+
+        from app.services.notification_suppression import suppress_notifications
+
+        touched_account_ids = {
+            str(invoice.account_id) for invoice in newly_created_invoices
+        }
+        # Restore can emit "service resumed" notifications; suppress them for
+        # a bulk catch-up run so we don't burst-mail a large suspended cohort.
+        restore_notify_ctx = (
+            suppress_notifications()
+            if suppress_restore_notifications
+            else nullcontext()
+        )
+        with restore_notify_ctx:
+            for account_id in touched_account_ids:
+                account = db.get(Subscriber, coerce_uuid(account_id))
+                was_walled = account is not None and account.status in (
+                    SubscriberStatus.suspended,
+                    SubscriberStatus.blocked,
+                )
+                try:
+                    settle_result = settle_open_invoices_from_credit(db, account_id)
+                except Exception:
+                    logger.exception(
+                        "invoice_credit_settlement_failed",
+                        extra={
+                            "event": "invoice_credit_settlement_failed",
+                            "run_id": str(run_uuid) if run_uuid else None,
+                            "account_id": account_id,
+                        },
+                    )
+                    continue
+                if settle_result.changed:
+                    summary["credit_applied"] = round_money(
+                        summary["credit_applied"] + settle_result.applied
+                    )
+                    summary["credit_settled_invoices"] += len(
+                        settle_result.invoices_settled
+                    )
+                # PaymentAllocations owns the exact transfer and hands a paid
+                # invoice to the access-reconciliation owner. This automation
+                # adapter only reports that resulting state transition; it must
+                # not run a second restoration decision path.
+                if (
+                    settle_result.changed
+                    and was_walled
+                    and account is not None
+                    and account.status == SubscriberStatus.active
+                ):
+                    summary["accounts_restored"] += 1
+
+    # The checkpoint commits with the chunk's invoices, so a run that dies
+    # later resumes exactly after the last chunk that is durably billed.
+    checkpoint(db, after_account_id)
+    db.commit()
+
+    # Emit invoice.created events for newly created invoices
+    run_id_str = str(run_uuid) if run_uuid else None
+    for invoice in newly_created_invoices:
+        try:
+            _emit_invoice_created_event(db, invoice, run_id_str)
+        except Exception as event_exc:
+            logger.warning(
+                "Failed to emit invoice.created event for %s: %s",
+                invoice.id,
+                event_exc,
+            )
+    db.commit()
+
+
 def subscription_invoice_eligible(
     subscription: Subscription, *, allow_prepaid: bool = False
 ) -> bool:
@@ -1424,435 +1892,570 @@ def run_billing_notifications(
     }
 
 
-def run_invoice_cycle(
-    db: Session,
-    run_at: datetime | None = None,
-    billing_cycle: BillingCycle | None = None,
-    dry_run: bool = False,
-    include_pending: bool = True,
-    auto_activate_pending: bool = True,
-    suppress_restore_notifications: bool = False,
-    run_prepaid_renewals: bool = True,
-    launch_kind: str = "scheduled",
-    requested_by: str | None = None,
-    preview_fingerprint: str | None = None,
-    source_run_id: UUID | None = None,
-) -> dict[str, Any]:
-    """Run the billing cycle to generate invoices for subscriptions.
+def _new_invoice_cycle_summary(run_at: datetime) -> dict[str, Any]:
+    return {
+        "run_at": run_at,
+        "subscriptions_scanned": 0,
+        "subscriptions_billed": 0,
+        "invoices_created": 0,
+        "lines_created": 0,
+        "skipped": 0,
+        "currency_skipped": 0,
+        "pending_activated": 0,
+        "invoice_reminders_sent": 0,
+        "credit_applied": Decimal("0.00"),
+        "credit_settled_invoices": 0,
+        "accounts_restored": 0,
+        "zero_amount_advanced": 0,
+        "non_cash_service_grants": 0,
+        "non_cash_service_grants_replayed": 0,
+        "billing_treatment_blocked": 0,
+        "chunks": 0,
+    }
 
-    Args:
-        db: Database session
-        run_at: The reference time for the billing run (defaults to now)
-        billing_cycle: Optional filter to only process subscriptions with this cycle
-        dry_run: If True, don't create any records, just return what would be done
-        include_pending: If True, also bill pending subscriptions ready for activation
-        auto_activate_pending: If True, auto-activate pending subscriptions when billed
-        suppress_restore_notifications: If True, mute customer notifications from any
-            service restore triggered when credit settles a suspended account's debt.
-            Off by default (steady-state restores are a legitimate "service resumed"
-            notice); set True for a bulk catch-up run to avoid a notification burst.
-        run_prepaid_renewals: If True, run the independently owned prepaid renewal
-            pass before postpaid invoice generation. Manual invoice-only commands
-            disable this so their preview and execution have one stated scope.
-        launch_kind: Durable provenance for scheduled, manual, or retry launches.
-        requested_by: Staff principal for a confirmed manual or retry launch.
-        preview_fingerprint: Exact staff preview evidence confirmed before launch.
-        source_run_id: Failed run that a reviewed retry supersedes.
-    """
-    run_at = _as_utc(run_at) or datetime.now(UTC)
 
-    from app.services.events.handlers.owner_session import owner_session
-    from app.services.owner_commands import CommandContext
-    from app.services.prepaid_service_renewals import (
-        RunDuePrepaidServiceRenewalsCommand,
-        execute_due_prepaid_service_renewals,
-    )
+@dataclass(slots=True)
+class _InvoiceCycleContext:
+    """Inputs and accumulators shared by every chunk of one invoice cycle."""
+
+    run_at: datetime
+    run_uuid: UUID | None
+    billing_cycle: BillingCycle | None
+    dry_run: bool
+    include_pending: bool
+    auto_activate_pending: bool
+    suppress_restore_notifications: bool
+    global_due_days: int
+    policy: _CycleBillingPolicy
+    summary: dict[str, Any]
+    preview_subscriptions: list[dict[str, object]] = field(default_factory=list)
+    preview_invoice_currencies: dict[
+        tuple[str, datetime, datetime, BillingMode], str
+    ] = field(default_factory=dict)
+    preview_accounts: set[str] = field(default_factory=set)
+    preview_totals: dict[str, Decimal] = field(default_factory=dict)
 
-    prepaid_renewal_summary: dict[str, int | str] = {}
-    if run_prepaid_renewals:
-        # This legacy billing coordinator owns a separate postpaid transaction
-        # lifecycle.  The prepaid owner must therefore enter on a fresh clean
-        # session; it cannot inherit a caller read transaction or be nested in
-        # the postpaid run. The helper preserves the same bind in the external-
-        # transaction test harness while production receives an independent
-        # owner transaction.
-        with owner_session(db) as renewal_db:
-            prepaid_renewal_summary = execute_due_prepaid_service_renewals(
-                renewal_db,
-                RunDuePrepaidServiceRenewalsCommand(
-                    context=CommandContext.system(
-                        actor="system:billing_automation",
-                        scope="prepaid_service_renewals",
-                        reason=f"{launch_kind} billing-cycle renewal pass",
-                        idempotency_key=(
-                            "prepaid-renewal-pass:"
-                            f"{run_at.isoformat()}:{'dry' if dry_run else 'apply'}"
-                        ),
-                    ),
-                    run_at=run_at,
-                    dry_run=dry_run,
-                ),
-            )
 
-    global_due_days = resolve_payment_due_days(db)
+def _record_run_checkpoint(
+    db: Session,
+    run_uuid: UUID | None,
+    after_account_id: UUID,
+    summary: dict[str, Any],
+) -> None:
+    run_db = db.get(BillingRun, run_uuid) if run_uuid else None
+    if run_db:
+        run_db.last_account_id = after_account_id
+        run_db.chunks_completed = summary["chunks"]
+        run_db.subscriptions_scanned = summary["subscriptions_scanned"]
+        run_db.subscriptions_billed = summary["subscriptions_billed"]
+        run_db.invoices_created = summary["invoices_created"]
+        run_db.lines_created = summary["lines_created"]
+        run_db.skipped = summary["skipped"]
+
+
+def _run_invoice_chunks(
+    db: Session,
+    ctx: _InvoiceCycleContext,
+    *,
+    after: UUID | None,
+    before: UUID | None,
+    checkpoint: Callable[[Session, UUID], None],
+) -> None:
+    """Bill the accounts after ``after`` (and below ``before``) chunk by chunk.
 
-    run = BillingRun(
-        run_at=run_at,
-        billing_cycle=billing_cycle.value if billing_cycle else None,
-        launch_kind=launch_kind,
-        requested_by=requested_by,
-        preview_fingerprint=preview_fingerprint,
-        source_run_id=source_run_id,
-        status=BillingRunStatus.running,
-        started_at=datetime.now(UTC),
+    Outside a dry run each chunk is committed by :func:`_finish_invoice_chunk`
+    together with ``checkpoint(db, last_account_id)``.
+    """
+    from app.services.subscription_billing_grants import (
+        SubscriptionBillingGrantError,
+        stage_subscription_billing_grant,
     )
-    run_uuid = None
-    if not dry_run:
-        _fail_abandoned_runs(db)
-        db.add(run)
-        db.commit()
-        db.refresh(run)
-        run_uuid = run.id
-    logger.info(
-        "billing_run_start",
-        extra=_billing_run_extra(
-            run_uuid=run_uuid,
-            run_at=run_at,
-            billing_cycle=billing_cycle,
-            dry_run=dry_run,
-            include_pending=include_pending,
-            auto_activate_pending=auto_activate_pending,
-        ),
+    from app.services.subscription_billing_treatments import (
+        SubscriptionBillingTreatmentError,
+        resolve_subscription_billing_treatments,
     )
 
-    # Query billable active subscriptions. Network/account enforcement states
-    # like blocked/suspended must not suppress invoicing: those accounts still
-    # owe for active service periods and may need the invoice to clear the block.
-    # Postpaid subscriptions are invoiced here. The retired prepaid monthly
-    # draft path was a competing owner for the same service period; all prepaid
-    # periods now belong exclusively to ``financial.prepaid_service_renewals``.
-    mode_filter = Subscription.billing_mode != BillingMode.prepaid
+    run_at = ctx.run_at
+    run_uuid = ctx.run_uuid
+    billing_cycle = ctx.billing_cycle
+    dry_run = ctx.dry_run
+    include_pending = ctx.include_pending
+    auto_activate_pending = ctx.auto_activate_pending
+    suppress_restore_notifications = ctx.suppress_restore_notifications
+    global_due_days = ctx.global_due_days
+    policy = ctx.policy
+    summary = ctx.summary
+    preview_subscriptions = ctx.preview_subscriptions
+    preview_invoice_currencies = ctx.preview_invoice_currencies
+    preview_accounts = ctx.preview_accounts
+    preview_totals = ctx.preview_totals
+    chunk_size = max(1, settings.billing_invoice_chunk_size)
+
+    after_account_id = after
+    while True:
+        account_ids = _invoice_cycle_account_ids(
+            db,
+            after=after_account_id,
+            before=before,
+            limit=chunk_size,
+            include_pending=include_pending,
+        )
+        if not account_ids:
+            break
+        subscriptions = _invoice_cycle_subscriptions(
+            db, account_ids, include_pending=include_pending
+        )
+        summary["subscriptions_scanned"] += len(subscriptions)
+        prefetch = _InvoiceChunkPrefetch.load(db, subscriptions, policy)
+        billing_treatments = resolve_subscription_billing_treatments(
+            db, subscriptions, as_of=run_at
+        )
+        invoices: dict[tuple[str, datetime, datetime, BillingMode], Invoice] = {}
+        newly_created_invoices: list[Invoice] = []
 
-    active_subscriptions = (
-        db.query(Subscription)
-        .join(Subscriber, Subscriber.id == Subscription.subscriber_id)
-        .filter(Subscription.status == SubscriptionStatus.active)
-        .filter(Subscriber.status.in_(BILLABLE_SUBSCRIBER_STATUSES))
-        .filter(mode_filter)
-        .all()
-    )
-
-    # Optionally include pending subscriptions ready for billing
-    pending_subscriptions = []
-    if include_pending:
-        pending_subscriptions = (
-            db.query(Subscription)
-            .join(Subscriber, Subscriber.id == Subscription.subscriber_id)
-            .filter(Subscription.status == SubscriptionStatus.pending)
-            .filter(Subscriber.status == SubscriberStatus.active)
-            .filter(mode_filter)
-            .all()
-        )
-
-    prepaid_skipped_query = (
-        db.query(Subscription)
-        .join(Subscriber, Subscriber.id == Subscription.subscriber_id)
-        .filter(Subscription.status == SubscriptionStatus.active)
-        .filter(Subscriber.status.in_(BILLABLE_SUBSCRIBER_STATUSES))
-        .filter(Subscription.billing_mode == BillingMode.prepaid)
-    )
-    prepaid_skipped = prepaid_skipped_query.count()
-    if prepaid_skipped:
-        logger.info(
-            "Invoice cycle skipped %d prepaid subscription(s) (%s)",
-            prepaid_skipped,
-            "owned by canonical prepaid renewals",
-        )
-
-    subscriptions = active_subscriptions + pending_subscriptions
-
-    from app.services.subscription_billing_grants import (
-        SubscriptionBillingGrantError,
-        stage_subscription_billing_grant,
-    )
-    from app.services.subscription_billing_treatments import (
-        SubscriptionBillingTreatmentError,
-        resolve_subscription_billing_treatments,
-    )
-
-    billing_treatments = resolve_subscription_billing_treatments(
-        db, subscriptions, as_of=run_at
-    )
-
-    invoices: dict[tuple[str, datetime, datetime, BillingMode], Invoice] = {}
-    newly_created_invoices: list[Invoice] = []
-    summary: dict[str, Any] = {
-        "run_at": run_at,
-        "subscriptions_scanned": len(subscriptions),
-        "subscriptions_billed": 0,
-        "invoices_created": 0,
-        "lines_created": 0,
-        "skipped": 0,
-        "prepaid_skipped": prepaid_skipped,
-        "currency_skipped": 0,
-        "pending_activated": 0,
-        "invoice_reminders_sent": 0,
-        "credit_applied": Decimal("0.00"),
-        "credit_settled_invoices": 0,
-        "accounts_restored": 0,
-        "zero_amount_advanced": 0,
-        "non_cash_service_grants": 0,
-        "non_cash_service_grants_replayed": 0,
-        "billing_treatment_blocked": 0,
-        "prepaid_legacy_invoice_path_retired": True,
-        **prepaid_renewal_summary,
-    }
-    preview_subscriptions: list[dict[str, object]] = []
-    preview_invoice_currencies: dict[
-        tuple[str, datetime, datetime, BillingMode], str
-    ] = {}
-    preview_accounts: set[str] = set()
-    preview_totals: dict[str, Decimal] = {}
-
-    for subscription in subscriptions:
-        is_pending = subscription.status == SubscriptionStatus.pending
-        amount, currency, cycle = _resolve_price(db, subscription)
-        if amount is None:
-            summary["skipped"] += 1
-            continue
-        amount = _effective_unit_price(subscription, amount, run_at)
-        effective_cycle = cycle or BillingCycle.monthly
-        if billing_cycle and effective_cycle != billing_cycle:
-            continue
+        for subscription in subscriptions:
+            is_pending = subscription.status == SubscriptionStatus.pending
+            amount, currency, cycle = _resolve_price(db, subscription, prefetch)
+            if amount is None:
+                summary["skipped"] += 1
+                continue
+            amount = _effective_unit_price(subscription, amount, run_at)
+            effective_cycle = cycle or BillingCycle.monthly
+            if billing_cycle and effective_cycle != billing_cycle:
+                continue
 
-        # For pending subscriptions, use run_at as the period start if no start_at
-        if is_pending:
-            period_start = _as_utc(subscription.start_at) or run_at
-        else:
-            period_start = (
-                _as_utc(subscription.next_billing_at or subscription.start_at or run_at)
-                or run_at
-            )
+            # For pending subscriptions, use run_at as the period start if no start_at
+            if is_pending:
+                period_start = _as_utc(subscription.start_at) or run_at
+            else:
+                period_start = (
+                    _as_utc(
+                        subscription.next_billing_at or subscription.start_at or run_at
+                    )
+                    or run_at
+                )
 
-        if period_start > run_at:
-            continue
-        period_end = _period_end(period_start, effective_cycle)
+            if period_start > run_at:
+                continue
+            period_end = _period_end(period_start, effective_cycle)
 
-        if subscription.billing_mode == BillingMode.prepaid:
-            paid_through = _paid_coverage_end_for_subscription(
-                db,
-                subscription.id,
-                subscription.subscriber_id,
-                period_start,
-                period_end,
-            )
-            if paid_through and paid_through > period_start:
-                current_nb = _as_utc(subscription.next_billing_at)
-                if not dry_run and (current_nb is None or current_nb < paid_through):
+            if subscription.billing_mode == BillingMode.prepaid:
+                paid_through = _paid_coverage_end_for_subscription(
+                    db,
+                    subscription.id,
+                    subscription.subscriber_id,
+                    period_start,
+                    period_end,
+                )
+                if paid_through and paid_through > period_start:
+                    current_nb = _as_utc(subscription.next_billing_at)
+                    if not dry_run and (
+                        current_nb is None or current_nb < paid_through
+                    ):
+                        stage_subscription_billing_anchor(
+                            db,
+                            subscription,
+                            BillingAnchorProjectionCommand(
+                                subscription_id=subscription.id,
+                                expected_previous=subscription.next_billing_at,
+                                target=paid_through,
+                                source=BillingAnchorProjectionSource.prepaid_coverage,
+                                evidence_ref=(
+                                    f"paid-coverage:{subscription.id}:"
+                                    f"{paid_through.isoformat()}"
+                                ),
+                            ),
+                        )
+                    logger.info(
+                        "billing_prepaid_paid_coverage_skip",
+                        extra={
+                            "event": "billing_prepaid_paid_coverage_skip",
+                            "run_id": str(run_uuid) if run_uuid else None,
+                            "subscription_id": str(subscription.id),
+                            "subscriber_id": str(subscription.subscriber_id),
+                            "period_start": period_start.isoformat(),
+                            "period_end": period_end.isoformat(),
+                            "paid_through": paid_through.isoformat(),
+                        },
+                    )
+                    summary["skipped"] += 1
+                    continue
+
+            # Skip wholly-past billing periods instead of invoicing every missed
+            # month. Migrated subscribers carry next_billing_at/start_at at
+            # their original signup date — without this, the runner generated a
+            # backdated invoice per missed period per run, double-billing periods
+            # already settled before local billing cutover.
+            # We fast-forward next_billing_at to the current period and bill only
+            # that. Historical arrears require an explicit reviewed repair rather
+            # than a mutable fleet-wide billing mode.
+            if not is_pending and period_end <= run_at:
+                skipped_periods = 0
+                while period_end <= run_at:
+                    period_start = period_end
+                    period_end = _period_end(period_start, effective_cycle)
+                    skipped_periods += 1
+                if not dry_run:
                     stage_subscription_billing_anchor(
                         db,
                         subscription,
                         BillingAnchorProjectionCommand(
                             subscription_id=subscription.id,
                             expected_previous=subscription.next_billing_at,
-                            target=paid_through,
-                            source=BillingAnchorProjectionSource.prepaid_coverage,
+                            target=period_start,
+                            source=BillingAnchorProjectionSource.scheduled_billing,
                             evidence_ref=(
-                                f"paid-coverage:{subscription.id}:"
-                                f"{paid_through.isoformat()}"
+                                f"billing-fast-forward:{subscription.id}:"
+                                f"{period_start.isoformat()}"
                             ),
                         ),
                     )
                 logger.info(
-                    "billing_prepaid_paid_coverage_skip",
+                    "billing_fast_forward",
                     extra={
-                        "event": "billing_prepaid_paid_coverage_skip",
                         "run_id": str(run_uuid) if run_uuid else None,
                         "subscription_id": str(subscription.id),
-                        "subscriber_id": str(subscription.subscriber_id),
-                        "period_start": period_start.isoformat(),
-                        "period_end": period_end.isoformat(),
-                        "paid_through": paid_through.isoformat(),
+                        "skipped_periods": skipped_periods,
+                        "new_period_start": period_start.isoformat(),
                     },
                 )
-                summary["skipped"] += 1
+                if period_start > run_at:
+                    summary["skipped"] += 1
+                    continue
+            end_at = _as_utc(subscription.end_at)
+            start_at = _as_utc(subscription.start_at) or period_start
+            if end_at and end_at <= period_start:
                 continue
-
-        # Skip wholly-past billing periods instead of invoicing every missed
-        # month. Migrated subscribers carry next_billing_at/start_at at
-        # their original signup date — without this, the runner generated a
-        # backdated invoice per missed period per run, double-billing periods
-        # already settled before local billing cutover.
-        # We fast-forward next_billing_at to the current period and bill only
-        # that. Historical arrears require an explicit reviewed repair rather
-        # than a mutable fleet-wide billing mode.
-        if not is_pending and period_end <= run_at:
-            skipped_periods = 0
-            while period_end <= run_at:
-                period_start = period_end
-                period_end = _period_end(period_start, effective_cycle)
-                skipped_periods += 1
-            if not dry_run:
-                stage_subscription_billing_anchor(
-                    db,
-                    subscription,
-                    BillingAnchorProjectionCommand(
-                        subscription_id=subscription.id,
-                        expected_previous=subscription.next_billing_at,
-                        target=period_start,
-                        source=BillingAnchorProjectionSource.scheduled_billing,
-                        evidence_ref=(
-                            f"billing-fast-forward:{subscription.id}:"
-                            f"{period_start.isoformat()}"
-                        ),
-                    ),
-                )
-            logger.info(
-                "billing_fast_forward",
-                extra={
-                    "run_id": str(run_uuid) if run_uuid else None,
-                    "subscription_id": str(subscription.id),
-                    "skipped_periods": skipped_periods,
-                    "new_period_start": period_start.isoformat(),
-                },
+            usage_start = max(period_start, start_at)
+            usage_end = min(period_end, end_at) if end_at else period_end
+            line_amount = _prorated_amount(
+                amount, period_start, period_end, usage_start, usage_end
             )
-            if period_start > run_at:
+            treatment = billing_treatments[subscription.id]
+            if treatment.suppress_customer_billing:
+                if not treatment.grantable:
+                    summary["billing_treatment_blocked"] += 1
+                    summary["skipped"] += 1
+                    logger.error(
+                        "billing_treatment_drift_blocked",
+                        extra={
+                            "event": "billing_treatment_drift_blocked",
+                            "subscription_id": str(subscription.id),
+                            "arrangement_id": (
+                                str(treatment.arrangement_id)
+                                if treatment.arrangement_id
+                                else None
+                            ),
+                            "reason": treatment.drift_reason,
+                        },
+                    )
+                    continue
+                grant_start = max(
+                    period_start, _as_utc(treatment.starts_at) or period_start
+                )
+                grant_end = _period_end(grant_start, effective_cycle)
+                if end_at is not None and end_at < grant_end:
+                    grant_end = end_at
+                if dry_run:
+                    summary["non_cash_service_grants"] += 1
+                    summary["skipped"] += 1
+                    continue
+                try:
+                    grant = stage_subscription_billing_grant(
+                        db,
+                        subscription=subscription,
+                        decision=treatment,
+                        starts_at=grant_start,
+                        ends_at=grant_end,
+                        actor="system:billing_automation",
+                        correlation_id=run_uuid,
+                        reference_amount=line_amount,
+                    )
+                except (
+                    SubscriptionBillingGrantError,
+                    SubscriptionBillingTreatmentError,
+                ) as exc:
+                    summary["billing_treatment_blocked"] += 1
+                    summary["skipped"] += 1
+                    logger.error(
+                        "billing_treatment_grant_blocked",
+                        extra={
+                            "event": "billing_treatment_grant_blocked",
+                            "subscription_id": str(subscription.id),
+                            "arrangement_id": (
+                                str(treatment.arrangement_id)
+                                if treatment.arrangement_id
+                                else None
+                            ),
+                            "code": exc.code,
+                        },
+                    )
+                    continue
+                summary[
+                    "non_cash_service_grants_replayed"
+                    if grant.replayed
+                    else "non_cash_service_grants"
+                ] += 1
                 summary["skipped"] += 1
                 continue
-        end_at = _as_utc(subscription.end_at)
-        start_at = _as_utc(subscription.start_at) or period_start
-        if end_at and end_at <= period_start:
-            continue
-        usage_start = max(period_start, start_at)
-        usage_end = min(period_end, end_at) if end_at else period_end
-        line_amount = _prorated_amount(
-            amount, period_start, period_end, usage_start, usage_end
-        )
-        treatment = billing_treatments[subscription.id]
-        if treatment.suppress_customer_billing:
-            if not treatment.grantable:
-                summary["billing_treatment_blocked"] += 1
+            if line_amount <= Decimal("0.00"):
+                if not dry_run:
+                    stage_subscription_billing_anchor(
+                        db,
+                        subscription,
+                        BillingAnchorProjectionCommand(
+                            subscription_id=subscription.id,
+                            expected_previous=subscription.next_billing_at,
+                            target=period_end,
+                            source=BillingAnchorProjectionSource.scheduled_billing,
+                            evidence_ref=(
+                                f"zero-rated-period:{subscription.id}:"
+                                f"{period_end.isoformat()}"
+                            ),
+                        ),
+                    )
+                summary["zero_amount_advanced"] += 1
                 summary["skipped"] += 1
-                logger.error(
-                    "billing_treatment_drift_blocked",
-                    extra={
-                        "event": "billing_treatment_drift_blocked",
-                        "subscription_id": str(subscription.id),
-                        "arrangement_id": (
-                            str(treatment.arrangement_id)
-                            if treatment.arrangement_id
-                            else None
+                continue
+
+            offer_name = (
+                subscription.offer.name
+                if subscription.offer
+                else f"Subscription {subscription.id}"
+            )
+            description = f"{offer_name} ({period_start.date()} - {period_end.date()})"
+
+            # Idempotency check 1: verify no base invoice line exists for this
+            # subscription+period. Recurring add-ons have their own lines and must
+            # not cause the base service line to be skipped after a partial failure.
+            # This catches cases where the invoice was created but next_billing_at wasn't updated
+            existing_line_for_period = (
+                db.query(InvoiceLine)
+                .join(Invoice, Invoice.id == InvoiceLine.invoice_id)
+                .filter(InvoiceLine.subscription_id == subscription.id)
+                .filter(InvoiceLine.description == description)
+                .filter(Invoice.billing_period_start == period_start)
+                .filter(Invoice.billing_period_end == period_end)
+                .filter(InvoiceLine.is_active.is_(True))
+                .filter(Invoice.is_active.is_(True))
+                .first()
+            )
+            if existing_line_for_period:
+                existing_invoice = existing_line_for_period.invoice
+                current_anchor = _as_utc(subscription.next_billing_at)
+                # Prepaid drafts are not service proof. Only paid prepaid invoices
+                # can advance service coverage; postpaid anchors keep the existing
+                # invoice idempotency behavior.
+                can_advance_anchor = (
+                    subscription.billing_mode != BillingMode.prepaid
+                    or (
+                        existing_invoice is not None
+                        and existing_invoice.status == InvoiceStatus.paid
+                        and (existing_invoice.balance_due or Decimal("0.00"))
+                        <= Decimal("0.00")
+                    )
+                )
+                if (
+                    not dry_run
+                    and can_advance_anchor
+                    and (current_anchor is None or current_anchor < period_end)
+                ):
+                    stage_subscription_billing_anchor(
+                        db,
+                        subscription,
+                        BillingAnchorProjectionCommand(
+                            subscription_id=subscription.id,
+                            expected_previous=subscription.next_billing_at,
+                            target=period_end,
+                            source=BillingAnchorProjectionSource.scheduled_billing,
+                            evidence_ref=(
+                                "existing-invoice-period:"
+                                f"{existing_line_for_period.invoice_id}:"
+                                f"{period_end.isoformat()}"
+                            ),
                         ),
-                        "reason": treatment.drift_reason,
-                    },
+                    )
+                if (
+                    not dry_run
+                    and subscription.billing_mode == BillingMode.prepaid
+                    and existing_invoice is not None
+                    and existing_invoice.status == InvoiceStatus.paid
+                ):
+                    ensure_prepaid_entitlements_for_paid_invoice(db, existing_invoice)
+                logger.debug(
+                    "Skipping subscription %s: already billed for period %s - %s",
+                    subscription.id,
+                    period_start.date(),
+                    period_end.date(),
                 )
+                summary["skipped"] += 1
                 continue
-            grant_start = max(
-                period_start, _as_utc(treatment.starts_at) or period_start
-            )
-            grant_end = _period_end(grant_start, effective_cycle)
-            if end_at is not None and end_at < grant_end:
-                grant_end = end_at
+
             if dry_run:
-                summary["non_cash_service_grants"] += 1
-                summary["skipped"] += 1
+                normalized_currency = (currency or "NGN").upper()
+                preview_invoice_key = (
+                    str(subscription.subscriber_id),
+                    period_start,
+                    period_end,
+                    subscription.billing_mode,
+                )
+                invoice_currency = preview_invoice_currencies.get(preview_invoice_key)
+                if (
+                    invoice_currency is not None
+                    and invoice_currency != normalized_currency
+                ):
+                    summary["currency_skipped"] += 1
+                    summary["skipped"] += 1
+                    continue
+                preview_invoice_currencies[preview_invoice_key] = normalized_currency
+                preview_accounts.add(str(subscription.subscriber_id))
+                preview_totals[normalized_currency] = preview_totals.get(
+                    normalized_currency, Decimal("0.00")
+                ) + round_money(line_amount)
+                preview_subscriptions.append(
+                    {
+                        "id": str(subscription.id),
+                        "account_id": str(subscription.subscriber_id),
+                        "offer_name": offer_name,
+                        "amount": round_money(line_amount),
+                        "currency": normalized_currency,
+                        "period_start": period_start.isoformat(),
+                        "period_end": period_end.isoformat(),
+                        "pending_activation": is_pending,
+                    }
+                )
+                summary["subscriptions_billed"] += 1
+                summary["lines_created"] += 1
+                if is_pending:
+                    summary["pending_activated"] += 1
                 continue
-            try:
-                grant = stage_subscription_billing_grant(
+
+            # Auto-activate pending subscription
+            if is_pending and auto_activate_pending:
+                _activate_pending_subscription(db, subscription, run_at)
+                summary["pending_activated"] += 1
+
+            account_id = str(subscription.subscriber_id)
+            invoice_key = (
+                account_id,
+                period_start,
+                period_end,
+                subscription.billing_mode,
+            )
+            invoice = invoices.get(invoice_key)
+            if not invoice:
+                invoice_query = (
+                    db.query(Invoice)
+                    .filter(Invoice.account_id == subscription.subscriber_id)
+                    .filter(Invoice.billing_period_start == period_start)
+                    .filter(Invoice.billing_period_end == period_end)
+                    .filter(Invoice.is_active.is_(True))
+                )
+                invoice_query = invoice_query.filter(collectible_ar_invoice_filter())
+                invoice = invoice_query.first()
+                if invoice:
+                    invoices[invoice_key] = invoice
+            if not invoice:
+                # Use subscriber-level payment_due_days if set, else global
+                account = db.get(Subscriber, subscription.subscriber_id)
+                due_days = (
+                    resolve_payment_due_days(db, subscriber=account)
+                    if account
+                    else global_due_days
+                )
+                invoice = Invoices.stage_system_invoice(
                     db,
-                    subscription=subscription,
-                    decision=treatment,
-                    starts_at=grant_start,
-                    ends_at=grant_end,
-                    actor="system:billing_automation",
-                    correlation_id=run_uuid,
-                    reference_amount=line_amount,
+                    InvoiceCreate(
+                        account_id=subscription.subscriber_id,
+                        invoice_number=next_invoice_number(db),
+                        status=InvoiceStatus.issued,
+                        currency=currency or "NGN",
+                        billing_period_start=period_start,
+                        billing_period_end=period_end,
+                        issued_at=run_at,
+                        due_at=run_at + timedelta(days=due_days),
+                        due_date_basis=InvoiceDueDateBasis.contract_terms,
+                        due_date_basis_ref=f"subscription:{subscription.id}",
+                        due_date_policy_version="billing-payment-terms-v1",
+                    ),
+                    reason="scheduled_billing_run",
                 )
-            except (
-                SubscriptionBillingGrantError,
-                SubscriptionBillingTreatmentError,
-            ) as exc:
-                summary["billing_treatment_blocked"] += 1
-                summary["skipped"] += 1
-                logger.error(
-                    "billing_treatment_grant_blocked",
+                invoices[invoice_key] = invoice
+                newly_created_invoices.append(invoice)
+                summary["invoices_created"] += 1
+            elif currency and invoice.currency != currency:
+                logger.warning(
+                    "billing_currency_mismatch_skip",
                     extra={
-                        "event": "billing_treatment_grant_blocked",
+                        "event": "billing_currency_mismatch_skip",
                         "subscription_id": str(subscription.id),
-                        "arrangement_id": (
-                            str(treatment.arrangement_id)
-                            if treatment.arrangement_id
-                            else None
-                        ),
-                        "code": exc.code,
+                        "subscriber_id": str(subscription.subscriber_id),
+                        "subscription_currency": currency,
+                        "invoice_currency": invoice.currency,
                     },
                 )
+                summary["skipped"] += 1
+                summary["currency_skipped"] += 1
                 continue
-            summary[
-                "non_cash_service_grants_replayed"
-                if grant.replayed
-                else "non_cash_service_grants"
-            ] += 1
-            summary["skipped"] += 1
-            continue
-        if line_amount <= Decimal("0.00"):
-            if not dry_run:
-                stage_subscription_billing_anchor(
-                    db,
-                    subscription,
-                    BillingAnchorProjectionCommand(
-                        subscription_id=subscription.id,
-                        expected_previous=subscription.next_billing_at,
-                        target=period_end,
-                        source=BillingAnchorProjectionSource.scheduled_billing,
-                        evidence_ref=(
-                            f"zero-rated-period:{subscription.id}:"
-                            f"{period_end.isoformat()}"
-                        ),
-                    ),
-                )
-            summary["zero_amount_advanced"] += 1
-            summary["skipped"] += 1
-            continue
 
-        offer_name = (
-            subscription.offer.name
-            if subscription.offer
-            else f"Subscription {subscription.id}"
-        )
-        description = f"{offer_name} ({period_start.date()} - {period_end.date()})"
-
-        # Idempotency check 1: verify no base invoice line exists for this
-        # subscription+period. Recurring add-ons have their own lines and must
-        # not cause the base service line to be skipped after a partial failure.
-        # This catches cases where the invoice was created but next_billing_at wasn't updated
-        existing_line_for_period = (
-            db.query(InvoiceLine)
-            .join(Invoice, Invoice.id == InvoiceLine.invoice_id)
-            .filter(InvoiceLine.subscription_id == subscription.id)
-            .filter(InvoiceLine.description == description)
-            .filter(Invoice.billing_period_start == period_start)
-            .filter(Invoice.billing_period_end == period_end)
-            .filter(InvoiceLine.is_active.is_(True))
-            .filter(Invoice.is_active.is_(True))
-            .first()
-        )
-        if existing_line_for_period:
-            existing_invoice = existing_line_for_period.invoice
-            current_anchor = _as_utc(subscription.next_billing_at)
-            # Prepaid drafts are not service proof. Only paid prepaid invoices
-            # can advance service coverage; postpaid anchors keep the existing
-            # invoice idempotency behavior.
-            can_advance_anchor = subscription.billing_mode != BillingMode.prepaid or (
-                existing_invoice is not None
-                and existing_invoice.status == InvoiceStatus.paid
-                and (existing_invoice.balance_due or Decimal("0.00")) <= Decimal("0.00")
+            # Double-check for existing line on this specific invoice (belt and suspenders)
+            existing_line = (
+                db.query(InvoiceLine)
+                .filter(InvoiceLine.invoice_id == invoice.id)
+                .filter(InvoiceLine.subscription_id == subscription.id)
+                .filter(InvoiceLine.description == description)
+                .filter(InvoiceLine.is_active.is_(True))
+                .first()
             )
-            if (
-                not dry_run
-                and can_advance_anchor
-                and (current_anchor is None or current_anchor < period_end)
-            ):
+            if existing_line:
+                summary["skipped"] += 1
+                continue
+
+            billing_line_key = _billing_line_key(
+                subscription.id, period_start, period_end, "base"
+            )
+            if _billing_line_key_exists(db, billing_line_key):
+                summary["skipped"] += 1
+                continue
+
+            tax_rate_id = _resolve_tax_rate_id(db, subscription, prefetch)
+            InvoiceLines.stage_system_line(
+                db,
+                SystemInvoiceLineCreate(
+                    invoice_id=invoice.id,
+                    subscription_id=subscription.id,
+                    description=description,
+                    quantity=Decimal("1.000"),
+                    unit_price=round_money(line_amount),
+                    amount=round_money(line_amount),
+                    tax_rate_id=tax_rate_id,
+                    tax_application=(
+                        policy.tax_application if tax_rate_id else TaxApplication.exempt
+                    ),
+                    metadata_={
+                        "kind": "base_subscription",
+                        "billing_period_start": period_start.isoformat(),
+                        "billing_period_end": period_end.isoformat(),
+                    },
+                    billing_line_key=billing_line_key,
+                ),
+                reason="scheduled_base_subscription",
+            )
+            summary["subscriptions_billed"] += 1
+            summary["lines_created"] += 1
+            # Bill active recurring add-ons (e.g. extra IP blocks) on the same invoice.
+            summary["lines_created"] += _bill_recurring_addons(
+                db,
+                invoice,
+                subscription,
+                period_start,
+                period_end,
+                usage_start,
+                usage_end,
+                tax_rate_id,
+                prefetch,
+            )
+            if subscription.billing_mode != BillingMode.prepaid:
                 stage_subscription_billing_anchor(
                     db,
                     subscription,
@@ -1861,318 +2464,245 @@ def run_invoice_cycle(
                         expected_previous=subscription.next_billing_at,
                         target=period_end,
                         source=BillingAnchorProjectionSource.scheduled_billing,
-                        evidence_ref=(
-                            "existing-invoice-period:"
-                            f"{existing_line_for_period.invoice_id}:"
-                            f"{period_end.isoformat()}"
-                        ),
+                        evidence_ref=f"invoice:{invoice.id}:period-end",
                     ),
                 )
-            if (
-                not dry_run
-                and subscription.billing_mode == BillingMode.prepaid
-                and existing_invoice is not None
-                and existing_invoice.status == InvoiceStatus.paid
-            ):
-                ensure_prepaid_entitlements_for_paid_invoice(db, existing_invoice)
-            logger.debug(
-                "Skipping subscription %s: already billed for period %s - %s",
-                subscription.id,
-                period_start.date(),
-                period_end.date(),
-            )
-            summary["skipped"] += 1
-            continue
 
+        after_account_id = account_ids[-1]
+        summary["chunks"] += 1
         if dry_run:
-            normalized_currency = (currency or "NGN").upper()
-            preview_invoice_key = (
-                str(subscription.subscriber_id),
-                period_start,
-                period_end,
-                subscription.billing_mode,
-            )
-            invoice_currency = preview_invoice_currencies.get(preview_invoice_key)
-            if invoice_currency is not None and invoice_currency != normalized_currency:
-                summary["currency_skipped"] += 1
-                summary["skipped"] += 1
-                continue
-            preview_invoice_currencies[preview_invoice_key] = normalized_currency
-            preview_accounts.add(str(subscription.subscriber_id))
-            preview_totals[normalized_currency] = preview_totals.get(
-                normalized_currency, Decimal("0.00")
-            ) + round_money(line_amount)
-            preview_subscriptions.append(
-                {
-                    "id": str(subscription.id),
-                    "account_id": str(subscription.subscriber_id),
-                    "offer_name": offer_name,
-                    "amount": round_money(line_amount),
-                    "currency": normalized_currency,
-                    "period_start": period_start.isoformat(),
-                    "period_end": period_end.isoformat(),
-                    "pending_activation": is_pending,
-                }
-            )
-            summary["subscriptions_billed"] += 1
-            summary["lines_created"] += 1
-            if is_pending:
-                summary["pending_activated"] += 1
             continue
+        _finish_invoice_chunk(
+            db,
+            run_uuid=run_uuid,
+            after_account_id=after_account_id,
+            invoices=invoices,
+            newly_created_invoices=newly_created_invoices,
+            summary=summary,
+            suppress_restore_notifications=suppress_restore_notifications,
+            checkpoint=checkpoint,
+        )
 
-        # Auto-activate pending subscription
-        if is_pending and auto_activate_pending:
-            _activate_pending_subscription(db, subscription, run_at)
-            summary["pending_activated"] += 1
 
-        account_id = str(subscription.subscriber_id)
-        invoice_key = (
-            account_id,
-            period_start,
-            period_end,
-            subscription.billing_mode,
-        )
-        invoice = invoices.get(invoice_key)
-        if not invoice:
-            invoice_query = (
-                db.query(Invoice)
-                .filter(Invoice.account_id == subscription.subscriber_id)
-                .filter(Invoice.billing_period_start == period_start)
-                .filter(Invoice.billing_period_end == period_end)
-                .filter(Invoice.is_active.is_(True))
-            )
-            invoice_query = invoice_query.filter(collectible_ar_invoice_filter())
-            invoice = invoice_query.first()
-            if invoice:
-                invoices[invoice_key] = invoice
-        if not invoice:
-            # Use subscriber-level payment_due_days if set, else global
-            account = db.get(Subscriber, subscription.subscriber_id)
-            due_days = (
-                resolve_payment_due_days(db, subscriber=account)
-                if account
-                else global_due_days
-            )
-            invoice = Invoices.stage_system_invoice(
-                db,
-                InvoiceCreate(
-                    account_id=subscription.subscriber_id,
-                    invoice_number=next_invoice_number(db),
-                    status=InvoiceStatus.issued,
-                    currency=currency or "NGN",
-                    billing_period_start=period_start,
-                    billing_period_end=period_end,
-                    issued_at=run_at,
-                    due_at=run_at + timedelta(days=due_days),
-                    due_date_basis=InvoiceDueDateBasis.contract_terms,
-                    due_date_basis_ref=f"subscription:{subscription.id}",
-                    due_date_policy_version="billing-payment-terms-v1",
+def _run_prepaid_renewal_pass(
+    db: Session, *, run_at: datetime, launch_kind: str, dry_run: bool
+) -> dict[str, int | str]:
+    from app.services.events.handlers.owner_session import owner_session
+    from app.services.owner_commands import CommandContext
+    from app.services.prepaid_service_renewals import (
+        RunDuePrepaidServiceRenewalsCommand,
+        execute_due_prepaid_service_renewals,
+    )
+
+    # This legacy billing coordinator owns a separate postpaid transaction
+    # lifecycle.  The prepaid owner must therefore enter on a fresh clean
+    # session; it cannot inherit a caller read transaction or be nested in
+    # the postpaid run. The helper preserves the same bind in the external-
+    # transaction test harness while production receives an independent
+    # owner transaction.
+    with owner_session(db) as renewal_db:
+        return execute_due_prepaid_service_renewals(
+            renewal_db,
+            RunDuePrepaidServiceRenewalsCommand(
+                context=CommandContext.system(
+                    actor="system:billing_automation",
+                    scope="prepaid_service_renewals",
+                    reason=f"{launch_kind} billing-cycle renewal pass",
+                    idempotency_key=(
+                        "prepaid-renewal-pass:"
+                        f"{run_at.isoformat()}:{'dry' if dry_run else 'apply'}"
+                    ),
                 ),
-                reason="scheduled_billing_run",
-            )
-            invoices[invoice_key] = invoice
-            newly_created_invoices.append(invoice)
-            summary["invoices_created"] += 1
-        elif currency and invoice.currency != currency:
-            logger.warning(
-                "billing_currency_mismatch_skip",
-                extra={
-                    "event": "billing_currency_mismatch_skip",
-                    "subscription_id": str(subscription.id),
-                    "subscriber_id": str(subscription.subscriber_id),
-                    "subscription_currency": currency,
-                    "invoice_currency": invoice.currency,
-                },
+                run_at=run_at,
+                dry_run=dry_run,
+            ),
+        )
+
+
+def run_invoice_cycle(
+    db: Session,
+    run_at: datetime | None = None,
+    billing_cycle: BillingCycle | None = None,
+    dry_run: bool = False,
+    include_pending: bool = True,
+    auto_activate_pending: bool = True,
+    suppress_restore_notifications: bool = False,
+    run_prepaid_renewals: bool = True,
+    launch_kind: str = "scheduled",
+    requested_by: str | None = None,
+    preview_fingerprint: str | None = None,
+    source_run_id: UUID | None = None,
+) -> dict[str, Any]:
+    """Run the billing cycle to generate invoices for subscriptions.
+
+    Args:
+        db: Database session
+        run_at: The reference time for the billing run (defaults to now)
+        billing_cycle: Optional filter to only process subscriptions with this cycle
+        dry_run: If True, don't create any records, just return what would be done
+        include_pending: If True, also bill pending subscriptions ready for activation
+        auto_activate_pending: If True, auto-activate pending subscriptions when billed
+        suppress_restore_notifications: If True, mute customer notifications from any
+            service restore triggered when credit settles a suspended account's debt.
+            Off by default (steady-state restores are a legitimate "service resumed"
+            notice); set True for a bulk catch-up run to avoid a notification burst.
+        run_prepaid_renewals: If True, run the independently owned prepaid renewal
+            pass before postpaid invoice generation. Manual invoice-only commands
+            disable this so their preview and execution have one stated scope.
+        launch_kind: Durable provenance for scheduled, manual, or retry launches.
+        requested_by: Staff principal for a confirmed manual or retry launch.
+        preview_fingerprint: Exact staff preview evidence confirmed before launch.
+        source_run_id: Failed run that a reviewed retry supersedes.
+    """
+    resumed_from: BillingRun | None = None
+    if not dry_run:
+        _fail_abandoned_runs(db)
+        if run_at is None:
+            resumed_from = _resumable_run(
+                db, billing_cycle=billing_cycle, launch_kind=launch_kind
             )
-            summary["skipped"] += 1
-            summary["currency_skipped"] += 1
-            continue
+    if resumed_from is not None:
+        # Finish the interrupted run against the same reference time, so its
+        # periods and fast-forwards match what the completed chunks did.
+        run_at = resumed_from.run_at
+        source_run_id = source_run_id or resumed_from.id
+    run_at = _as_utc(run_at) or datetime.now(UTC)
 
-        # Double-check for existing line on this specific invoice (belt and suspenders)
-        existing_line = (
-            db.query(InvoiceLine)
-            .filter(InvoiceLine.invoice_id == invoice.id)
-            .filter(InvoiceLine.subscription_id == subscription.id)
-            .filter(InvoiceLine.description == description)
-            .filter(InvoiceLine.is_active.is_(True))
-            .first()
+    prepaid_renewal_summary: dict[str, int | str] = {}
+    if run_prepaid_renewals:
+        prepaid_renewal_summary = _run_prepaid_renewal_pass(
+            db, run_at=run_at, launch_kind=launch_kind, dry_run=dry_run
         )
-        if existing_line:
-            summary["skipped"] += 1
-            continue
 
-        billing_line_key = _billing_line_key(
-            subscription.id, period_start, period_end, "base"
-        )
-        if _billing_line_key_exists(db, billing_line_key):
-            summary["skipped"] += 1
-            continue
+    global_due_days = resolve_payment_due_days(db)
 
-        tax_rate_id = _resolve_tax_rate_id(db, subscription)
-        InvoiceLines.stage_system_line(
-            db,
-            SystemInvoiceLineCreate(
-                invoice_id=invoice.id,
-                subscription_id=subscription.id,
-                description=description,
-                quantity=Decimal("1.000"),
-                unit_price=round_money(line_amount),
-                amount=round_money(line_amount),
-                tax_rate_id=tax_rate_id,
-                tax_application=(
-                    _default_tax_application(db)
-                    if tax_rate_id
-                    else TaxApplication.exempt
-                ),
-                metadata_={
-                    "kind": "base_subscription",
-                    "billing_period_start": period_start.isoformat(),
-                    "billing_period_end": period_end.isoformat(),
-                },
-                billing_line_key=billing_line_key,
-            ),
-            reason="scheduled_base_subscription",
-        )
-        summary["subscriptions_billed"] += 1
-        summary["lines_created"] += 1
-        # Bill active recurring add-ons (e.g. extra IP blocks) on the same invoice.
-        summary["lines_created"] += _bill_recurring_addons(
-            db,
-            invoice,
-            subscription,
-            period_start,
-            period_end,
-            usage_start,
-            usage_end,
-            tax_rate_id,
-        )
-        if subscription.billing_mode != BillingMode.prepaid:
-            stage_subscription_billing_anchor(
-                db,
-                subscription,
-                BillingAnchorProjectionCommand(
-                    subscription_id=subscription.id,
-                    expected_previous=subscription.next_billing_at,
-                    target=period_end,
-                    source=BillingAnchorProjectionSource.scheduled_billing,
-                    evidence_ref=f"invoice:{invoice.id}:period-end",
-                ),
-            )
+    run = BillingRun(
+        run_at=run_at,
+        billing_cycle=billing_cycle.value if billing_cycle else None,
+        launch_kind=launch_kind,
+        requested_by=requested_by,
+        preview_fingerprint=preview_fingerprint,
+        source_run_id=source_run_id,
+        status=BillingRunStatus.running,
+        started_at=datetime.now(UTC),
+        last_account_id=resumed_from.last_account_id if resumed_from else None,
+        chunks_completed=0,
+    )
+    run_uuid = None
+    if not dry_run:
+        db.add(run)
+        db.commit()
+        db.refresh(run)
+        run_uuid = run.id
+    logger.info(
+        "billing_run_start",
+        extra=_billing_run_extra(
+            run_uuid=run_uuid,
+            run_at=run_at,
+            billing_cycle=billing_cycle,
+            dry_run=dry_run,
+            include_pending=include_pending,
+            auto_activate_pending=auto_activate_pending,
+        ),
+    )
 
-    if dry_run:
-        summary["invoices_created"] = len(preview_invoice_currencies)
-        summary["accounts_affected"] = len(preview_accounts)
-        summary["subscriptions"] = preview_subscriptions
-        summary["totals_by_currency"] = preview_totals
-        summary["total_amount"] = sum(
-            preview_totals.values(),
-            start=Decimal("0.00"),
-        )
-        summary["run_id"] = None
+    # Billable subscriptions are read in keyset chunks of whole accounts
+    # (every subscription of an account lands in the same chunk, so its
+    # invoice for a period is created, totalled and credit-settled once).
+    # Network/account enforcement states like blocked/suspended must not
+    # suppress invoicing: those accounts still owe for active service periods
+    # and may need the invoice to clear the block. Postpaid subscriptions are
+    # invoiced here. The retired prepaid monthly draft path was a competing
+    # owner for the same service period; all prepaid periods now belong
+    # exclusively to ``financial.prepaid_service_renewals``.
+    prepaid_skipped_query = (
+        db.query(Subscription)
+        .join(Subscriber, Subscriber.id == Subscription.subscriber_id)
+        .filter(Subscription.status == SubscriptionStatus.active)
+        .filter(Subscriber.status.in_(BILLABLE_SUBSCRIBER_STATUSES))
+        .filter(Subscription.billing_mode == BillingMode.prepaid)
+    )
+    prepaid_skipped = prepaid_skipped_query.count()
+    if prepaid_skipped:
         logger.info(
-            "billing_run_dry_run_complete",
-            extra=_billing_run_extra(
-                run_uuid=None,
-                run_at=run_at,
-                billing_cycle=billing_cycle,
-                dry_run=dry_run,
-                include_pending=include_pending,
-                auto_activate_pending=auto_activate_pending,
-                summary=summary,
-            ),
+            "Invoice cycle skipped %d prepaid subscription(s) (%s)",
+            prepaid_skipped,
+            "owned by canonical prepaid renewals",
         )
-        return summary
+
+    summary = _new_invoice_cycle_summary(run_at)
+    summary.update(
+        {
+            "prepaid_skipped": prepaid_skipped,
+            "resumed_from_run_id": str(resumed_from.id) if resumed_from else None,
+            "prepaid_legacy_invoice_path_retired": True,
+            **prepaid_renewal_summary,
+        }
+    )
+    preview_subscriptions: list[dict[str, object]] = []
+    preview_invoice_currencies: dict[
+        tuple[str, datetime, datetime, BillingMode], str
+    ] = {}
+    preview_accounts: set[str] = set()
+    preview_totals: dict[str, Decimal] = {}
+    ctx = _InvoiceCycleContext(
+        run_at=run_at,
+        run_uuid=run_uuid,
+        billing_cycle=billing_cycle,
+        dry_run=dry_run,
+        include_pending=include_pending,
+        auto_activate_pending=auto_activate_pending,
+        suppress_restore_notifications=suppress_restore_notifications,
+        global_due_days=global_due_days,
+        policy=_CycleBillingPolicy.load(db),
+        summary=summary,
+        preview_subscriptions=preview_subscriptions,
+        preview_invoice_currencies=preview_invoice_currencies,
+        preview_accounts=preview_accounts,
+        preview_totals=preview_totals,
+    )
+
+    def _checkpoint(session: Session, after_account_id: UUID) -> None:
+        _record_run_checkpoint(session, run_uuid, after_account_id, summary)
 
     try:
-        # Persist the invoice lines just added in the loop before recalculating
-        # totals and settling credit. _recalculate_invoice_totals and
-        # settle_open_invoices_from_credit read rows back via queries, which only
-        # see flushed rows when the session has autoflush disabled (the test
-        # harness does); these flushes are harmless no-ops under default autoflush.
-        db.flush()
-        # Recalculate totals for all invoices
-        for invoice in invoices.values():
-            _recalculate_invoice_totals(db, invoice)
-        # Recalc writes balance_due/status onto the invoice objects; flush so the
-        # credit settlement below sees the open balance via its query.
-        db.flush()
-
-        # Canonical account credit is always offered to newly-created
-        # receivables. The settlement owner validates current invoice state and
-        # records structural allocation evidence; this is not a runtime option.
-        if newly_created_invoices:
-            from contextlib import nullcontext
-
-            from app.services.notification_suppression import suppress_notifications
-
-            touched_account_ids = {
-                str(invoice.account_id) for invoice in newly_created_invoices
-            }
-            # Restore can emit "service resumed" notifications; suppress them for
-            # a bulk catch-up run so we don't burst-mail a large suspended cohort.
-            restore_notify_ctx = (
-                suppress_notifications()
-                if suppress_restore_notifications
-                else nullcontext()
-            )
-            with restore_notify_ctx:
-                for account_id in touched_account_ids:
-                    account = db.get(Subscriber, coerce_uuid(account_id))
-                    was_walled = account is not None and account.status in (
-                        SubscriberStatus.suspended,
-                        SubscriberStatus.blocked,
-                    )
-                    try:
-                        settle_result = settle_open_invoices_from_credit(db, account_id)
-                    except Exception:
-                        logger.exception(
-                            "invoice_credit_settlement_failed",
-                            extra={
-                                "event": "invoice_credit_settlement_failed",
-                                "run_id": str(run_uuid) if run_uuid else None,
-                                "account_id": account_id,
-                            },
-                        )
-                        continue
-                    if settle_result.changed:
-                        summary["credit_applied"] = round_money(
-                            summary["credit_applied"] + settle_result.applied
-                        )
-                        summary["credit_settled_invoices"] += len(
-                            settle_result.invoices_settled
-                        )
-                    # PaymentAllocations owns the exact transfer and hands a paid
-                    # invoice to the access-reconciliation owner. This automation
-                    # adapter only reports that resulting state transition; it must
-                    # not run a second restoration decision path.
-                    if (
-                        settle_result.changed
-                        and was_walled
-                        and account is not None
-                        and account.status == SubscriberStatus.active
-                    ):
-                        summary["accounts_restored"] += 1
+        _run_invoice_chunks(
+            db,
+            ctx,
+            after=run.last_account_id,
+            before=None,
+            checkpoint=_checkpoint,
+        )
 
-        db.commit()
+        if dry_run:
+            summary["invoices_created"] = len(preview_invoice_currencies)
+            summary["accounts_affected"] = len(preview_accounts)
+            summary["subscriptions"] = preview_subscriptions
+            summary["totals_by_currency"] = preview_totals
+            summary["total_amount"] = sum(
+                preview_totals.values(),
+                start=Decimal("0.00"),
+            )
+            summary["run_id"] = None
+            logger.info(
+                "billing_run_dry_run_complete",
+                extra=_billing_run_extra(
+                    run_uuid=None,
+                    run_at=run_at,
+                    billing_cycle=billing_cycle,
+                    dry_run=dry_run,
+                    include_pending=include_pending,
+                    auto_activate_pending=auto_activate_pending,
+                    summary=summary,
+                ),
+            )
+            return summary
 
-        # Emit invoice.created events for newly created invoices
         run_id_str = str(run_uuid) if run_uuid else None
-        for invoice in newly_created_invoices:
-            try:
-                _emit_invoice_created_event(db, invoice, run_id_str)
-            except Exception as event_exc:
-                logger.warning(
-                    "Failed to emit invoice.created event for %s: %s",
-                    invoice.id,
-                    event_exc,
-                )
-
         # The permanent hourly notification runner owns pre-due reminders so
         # they honour the configured send window. Policy dunning separately
         # owns every overdue notification and consequence.
         summary["invoice_reminders_sent"] = 0
-        db.commit()
-
         summary["run_id"] = run_id_str
         run_db = db.get(BillingRun, run_uuid) if run_uuid else None
         if run_db:
@@ -2216,6 +2746,8 @@ def run_invoice_cycle(
         return summary
 
     except Exception as exc:
+        if dry_run:
+            raise
         db.rollback()
         error_msg = str(exc)
         logger.error(
@@ -2250,6 +2782,387 @@ def run_invoice_cycle(
         raise
 
 
+_UUID_SPACE = 1 << 128
+_PARTITION_SUMMARY_KEYS = (
+    "subscriptions_scanned",
+    "subscriptions_billed",
+    "invoices_created",
+    "lines_created",
+    "skipped",
+    "currency_skipped",
+    "pending_activated",
+    "credit_applied",
+    "credit_settled_invoices",
+    "accounts_restored",
+    "zero_amount_advanced",
+    "non_cash_service_grants",
+    "non_cash_service_grants_replayed",
+    "billing_treatment_blocked",
+    "chunks",
+)
+
+
+def invoice_partition_bounds(
+    partition_index: int, partition_count: int
+) -> tuple[UUID | None, UUID | None]:
+    """Subscriber-id range ``(after, before)`` of one invoice-cycle partition.
+
+    The UUID space is cut into ``partition_count`` equal ranges. Account ids
+    are random UUIDs, so the ranges act as an account hash that still walks
+    the subscriber index in keyset order. Both bounds are exclusive; ``None``
+    leaves that side open.
+    """
+    if partition_count < 1 or not 0 <= partition_index < partition_count:
+        raise ValueError(
+            f"invalid invoice partition {partition_index} of {partition_count}"
+        )
+    low = partition_index * _UUID_SPACE // partition_count
+    high = (partition_index + 1) * _UUID_SPACE // partition_count
+    after = UUID(int=low - 1) if partition_index else None
+    before = UUID(int=high) if partition_index < partition_count - 1 else None
+    return after, before
+
+
+def _partition_summary_json(summary: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: str(summary[key]) if isinstance(summary[key], Decimal) else summary[key]
+        for key in _PARTITION_SUMMARY_KEYS
+        if key in summary
+    }
+
+
+def merge_invoice_partition_summaries(
+    summaries: Iterable[dict[str, Any] | None],
+) -> dict[str, Any]:
+    """Sum the per-partition counters into one run summary."""
+    merged: dict[str, Any] = dict.fromkeys(_PARTITION_SUMMARY_KEYS, 0)
+    merged["credit_applied"] = Decimal("0.00")
+    for summary in summaries:
+        for key, value in (summary or {}).items():
+            if key == "credit_applied":
+                merged[key] += Decimal(str(value))
+            elif key in merged:
+                merged[key] += int(value)
+    return merged
+
+
+def _enqueue_invoice_partitions(
+    db: Session, partitions: Sequence[BillingRunPartition]
+) -> int:
+    """Queue one worker task per partition; a failed enqueue fails it."""
+    from app.services.queue_adapter import enqueue_task
+
+    queued = 0
+    for partition in partitions:
+        dispatch = enqueue_task(
+            "app.tasks.billing.run_invoice_partition",
+            args=(str(partition.run_id), partition.partition_index),
+            correlation_id=f"billing_run:{partition.run_id}",
+            source="billing_automation",
+        )
+        if dispatch.queued:
+            queued += 1
+            continue
+        partition.status = BillingRunStatus.failed
+        partition.finished_at = datetime.now(UTC)
+        partition.error = f"enqueue failed: {dispatch.error}"
+    db.commit()
+    return queued
+
+
+def start_partitioned_invoice_cycle(
+    db: Session,
+    partition_count: int,
+    run_at: datetime | None = None,
+    billing_cycle: BillingCycle | None = None,
+    run_prepaid_renewals: bool = True,
+) -> dict[str, Any]:
+    """Split a scheduled invoice cycle into partitions billed by workers.
+
+    Creates the :class:`BillingRun` and one :class:`BillingRunPartition` per
+    subscriber-id range (see :func:`invoice_partition_bounds`), runs the
+    prepaid renewal pass once, and queues
+    ``app.tasks.billing.run_invoice_partition`` for every partition. The run
+    is finalized by whichever partition settles last.
+    """
+    if partition_count < 1:
+        raise ValueError(f"invalid invoice partition count {partition_count}")
+    _fail_abandoned_runs(db)
+    run_at = _as_utc(run_at) or datetime.now(UTC)
+    if run_prepaid_renewals:
+        _run_prepaid_renewal_pass(
+            db, run_at=run_at, launch_kind="scheduled", dry_run=False
+        )
+
+    run = BillingRun(
+        run_at=run_at,
+        billing_cycle=billing_cycle.value if billing_cycle else None,
+        launch_kind="scheduled",
+        status=BillingRunStatus.running,
+        started_at=datetime.now(UTC),
+        chunks_completed=0,
+    )
+    db.add(run)
+    db.flush()
+    partitions = [
+        BillingRunPartition(
+            run_id=run.id,
+            partition_index=index,
+            partition_count=partition_count,
+            status=BillingRunStatus.running,
+            attempts=0,
+            chunks_completed=0,
+        )
+        for index in range(partition_count)
+    ]
+    db.add_all(partitions)
+    db.commit()
+    logger.info(
+        "billing_run_partitioned_start",
+        extra={
+            "event": "billing_run_partitioned_start",
+            "run_id": str(run.id),
+            "partitions": partition_count,
+        },
+    )
+    queued = _enqueue_invoice_partitions(db, partitions)
+    if queued < partition_count:
+        finalize_partitioned_invoice_cycle(db, run.id)
+    return {"run_id": str(run.id), "partitions": partition_count, "queued": queued}
+
+
+def run_invoice_partition(
+    db: Session, run_id: UUID, partition_index: int
+) -> dict[str, Any]:
+    """Bill one partition of a partitioned run and finalize the run if last.
+
+    The partition is claimed atomically, so a redelivered task is a no-op.
+    It resumes after its own last committed chunk, and its counters are
+    checkpointed with every chunk. A failure is recorded on the partition
+    (not raised) so that :func:`retry_failed_invoice_partitions` can re-run
+    just that range.
+    """
+    claimed = (
+        db.query(BillingRunPartition)
+        .filter(BillingRunPartition.run_id == run_id)
+        .filter(BillingRunPartition.partition_index == partition_index)
+        .filter(BillingRunPartition.status == BillingRunStatus.running)
+        .filter(BillingRunPartition.started_at.is_(None))
+        .update(
+            {
+                BillingRunPartition.started_at: datetime.now(UTC),
+                BillingRunPartition.attempts: BillingRunPartition.attempts + 1,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    if not claimed:
+        return {"run_id": str(run_id), "partition": partition_index, "claimed": False}
+
+    partition = (
+        db.query(BillingRunPartition)
+        .filter(BillingRunPartition.run_id == run_id)
+        .filter(BillingRunPartition.partition_index == partition_index)
+        .one()
+    )
+    run = db.get(BillingRun, run_id)
+    if run is None:
+        return {"run_id": str(run_id), "partition": partition_index, "claimed": False}
+
+    after, before = invoice_partition_bounds(partition_index, partition.partition_count)
+    summary = _new_invoice_cycle_summary(run.run_at)
+    summary.update(
+        merge_invoice_partition_summaries([partition.summary])
+        if partition.summary
+        else {}
+    )
+    ctx = _InvoiceCycleContext(
+        run_at=_as_utc(run.run_at) or run.run_at,
+        run_uuid=run.id,
+        billing_cycle=BillingCycle(run.billing_cycle) if run.billing_cycle else None,
+        dry_run=False,
+        include_pending=True,
+        auto_activate_pending=True,
+        suppress_restore_notifications=False,
+        global_due_days=resolve_payment_due_days(db),
+        policy=_CycleBillingPolicy.load(db),
+        summary=summary,
+    )
+    partition_id = partition.id
+
+    def _checkpoint(session: Session, after_account_id: UUID) -> None:
+        row = session.get(BillingRunPartition, partition_id)
+        if row is not None:
+            row.last_account_id = after_account_id
+            row.chunks_completed = summary["chunks"]
+            row.summary = _partition_summary_json(summary)
+
+    try:
+        _run_invoice_chunks(
+            db,
+            ctx,
+            after=partition.last_account_id or after,
+            before=before,
+            checkpoint=_checkpoint,
+        )
+    except Exception as exc:
+        db.rollback()
+        logger.exception(
+            "billing_run_partition_failed",
+            extra={
+                "event": "billing_run_partition_failed",
+                "run_id": str(run_id),
+                "partition": partition_index,
+            },
+        )
+        row = db.get(BillingRunPartition, partition_id)
+        if row is not None:
+            row.status = BillingRunStatus.failed
+            row.finished_at = datetime.now(UTC)
+            row.error = str(exc)
+        db.commit()
+        status = BillingRunStatus.failed
+    else:
+        row = db.get(BillingRunPartition, partition_id)
+        if row is not None:
+            row.status = BillingRunStatus.success
+            row.finished_at = datetime.now(UTC)
+            row.summary = _partition_summary_json(summary)
+        db.commit()
+        status = BillingRunStatus.success
+
+    finalize_partitioned_invoice_cycle(db, run_id)
+    return {
+        "run_id": str(run_id),
+        "partition": partition_index,
+        "claimed": True,
+        "status": status.value,
+        "invoices_created": summary["invoices_created"],
+    }
+
+
+def finalize_partitioned_invoice_cycle(
+    db: Session, run_id: UUID
+) -> dict[str, Any] | None:
+    """Merge partition summaries into the run once no partition is running.
+
+    The run row is locked, so of several partitions settling at once exactly
+    one finalizes. Returns the merged summary, or None while partitions are
+    still running or the run was already finalized.
+    """
+    run = (
+        db.query(BillingRun)
+        .filter(BillingRun.id == run_id)
+        .with_for_update()
+        .one_or_none()
+    )
+    if run is None or run.status != BillingRunStatus.running:
+        db.commit()
+        return None
+    partitions = (
+        db.query(BillingRunPartition)
+        .filter(BillingRunPartition.run_id == run_id)
+        .order_by(BillingRunPartition.partition_index)
+        .all()
+    )
+    if any(p.status == BillingRunStatus.running for p in partitions):
+        db.commit()
+        return None
+
+    summary = merge_invoice_partition_summaries(p.summary for p in partitions)
+    summary["run_at"] = run.run_at
+    summary["run_id"] = str(run.id)
+    summary["partitions"] = len(partitions)
+    failed = [
+        p.partition_index for p in partitions if p.status != BillingRunStatus.success
+    ]
+    summary["failed_partitions"] = failed
+    run.subscriptions_scanned = summary["subscriptions_scanned"]
+    run.subscriptions_billed = summary["subscriptions_billed"]
+    run.invoices_created = summary["invoices_created"]
+    run.lines_created = summary["lines_created"]
+    run.skipped = summary["skipped"]
+    run.chunks_completed = summary["chunks"]
+    run.finished_at = datetime.now(UTC)
+    error_msg = None
+    if failed:
+        error_msg = "partitions failed: " + ", ".join(str(i) for i in failed)
+        run.status = BillingRunStatus.failed
+        run.error = error_msg
+    else:
+        run.status = BillingRunStatus.success
+        run.error = None
+    db.commit()
+
+    try:
+        _log_billing_run_audit(
+            db, run, summary, "failed" if failed else "success", error_msg
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("billing_run_audit_log_failed", extra={"run_id": str(run_id)})
+    logger.info(
+        "Partitioned billing run %s: %d invoices, %d lines, %d failed partition(s)",
+        run.status.value,
+        summary["invoices_created"],
+        summary["lines_created"],
+        len(failed),
+        extra={"event": "billing_run_partitioned_finish", "run_id": str(run_id)},
+    )
+    return summary
+
+
+def retry_failed_invoice_partitions(db: Session, run_id: UUID) -> dict[str, Any]:
+    """Re-queue the failed partitions of a partitioned run.
+
+    Successful partitions are left alone. Once the run itself has been
+    finalized or swept as abandoned, partitions still marked running (their
+    worker died) are retried too. Each retried partition resumes after its
+    own checkpoint.
+    """
+    run = (
+        db.query(BillingRun)
+        .filter(BillingRun.id == run_id)
+        .with_for_update()
+        .one_or_none()
+    )
+    if run is None:
+        db.commit()
+        return {"run_id": str(run_id), "retried": []}
+    retry_statuses = [BillingRunStatus.failed]
+    if run.status != BillingRunStatus.running:
+        retry_statuses.append(BillingRunStatus.running)
+    partitions = (
+        db.query(BillingRunPartition)
+        .filter(BillingRunPartition.run_id == run_id)
+        .filter(BillingRunPartition.status.in_(retry_statuses))
+        .order_by(BillingRunPartition.partition_index)
+        .all()
+    )
+    if not partitions:
+        db.commit()
+        return {"run_id": str(run_id), "retried": []}
+    for partition in partitions:
+        partition.status = BillingRunStatus.running
+        partition.started_at = None
+        partition.finished_at = None
+        partition.error = None
+    run.status = BillingRunStatus.running
+    run.finished_at = None
+    run.error = None
+    db.commit()
+    queued = _enqueue_invoice_partitions(db, partitions)
+    if queued < len(partitions):
+        finalize_partitioned_invoice_cycle(db, run_id)
+    return {
+        "run_id": str(run_id),
+        "retried": [p.partition_index for p in partitions],
+        "queued": queued,
+    }
+
+
 def generate_prorated_invoice(
     db: Session,
     subscription: Subscription,
@@ -0,0 +1,141 @@
+"""LISTEN/NOTIFY push for event outbox rows.
+
+Migration 555 installs a trigger that notifies the ``event_store`` channel when
+a row is inserted or reaches ``completed``/``failed``. :class:`EventStoreListener`
+holds one dedicated connection subscribed to that channel, so terminal waiters
+and the outbox wake-up listener block until something changes instead of
+polling the table.
+
+Off PostgreSQL, or when the connection cannot be opened, the listener is inert
+and :meth:`EventStoreListener.wait` just sleeps out its timeout. Callers then
+degrade to the polling they did before.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import select
+import time
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+EVENT_STORE_CHANNEL = "event_store"
+
+
+@dataclass(frozen=True, slots=True)
+class EventStoreNotification:
+    id: UUID | None
+    event_id: UUID | None
+    status: str
+    account_id: UUID | None = None
+    subscriber_id: UUID | None = None
+
+
+def _uuid(value: Any) -> UUID | None:
+    try:
+        return UUID(str(value)) if value else None
+    except ValueError:
+        return None
+
+
+def parse_notification(payload: str | bytes) -> EventStoreNotification | None:
+    """Decode one trigger payload; malformed payloads are dropped."""
+    try:
+        data = json.loads(payload)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    return EventStoreNotification(
+        id=_uuid(data.get("id")),
+        event_id=_uuid(data.get("event_id")),
+        status=str(data.get("status") or ""),
+        account_id=_uuid(data.get("account_id")),
+        subscriber_id=_uuid(data.get("subscriber_id")),
+    )
+
+
+class EventStoreListener:
+    """A dedicated connection LISTENing on the ``event_store`` channel.
+
+    Use as a context manager and subscribe *before* the first read of the rows
+    being waited on, so a change committed in between is not missed.
+    """
+
+    def __init__(self, engine: Engine | None) -> None:
+        self._engine = engine
+        self._raw: Any = None
+        self._conn: Any = None
+
+    @property
+    def active(self) -> bool:
+        return self._conn is not None
+
+    def __enter__(self) -> EventStoreListener:
+        self.open()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def open(self) -> None:
+        if self._conn is not None or self._engine is None:
+            return
+        if self._engine.dialect.name != "postgresql":
+            return
+        try:
+            self._raw = self._engine.raw_connection()
+            # LISTEN is per connection; never hand a subscribed one back to
+            # the pool.
+            self._raw.detach()
+            conn: Any = self._raw.driver_connection
+            conn.rollback()
+            conn.autocommit = True
+            conn.execute(f"LISTEN {EVENT_STORE_CHANNEL}")
+        except Exception:
+            logger.warning("event_store_listen_failed", exc_info=True)
+            self.close()
+            return
+        self._conn = conn
+
+    def close(self) -> None:
+        raw, self._raw, self._conn = self._raw, None, None
+        if raw is not None:
+            try:
+                raw.close()
+            except Exception:
+                logger.debug("event_store_listener_close_failed", exc_info=True)
+
+    def _drain(self) -> list[EventStoreNotification]:
+        pgconn = self._conn.pgconn
+        pgconn.consume_input()
+        notifications: list[EventStoreNotification] = []
+        while (notify := pgconn.notifies()) is not None:
+            parsed = parse_notification(notify.extra)
+            if parsed is not None:
+                notifications.append(parsed)
+        return notifications
+
+    def wait(self, timeout: float) -> list[EventStoreNotification]:
+        """Block until notifications arrive or ``timeout`` seconds pass."""
+        timeout = max(0.0, timeout)
+        if self._conn is None:
+            time.sleep(timeout)
+            return []
+        try:
+            notifications = self._drain()
+            if notifications:
+                return notifications
+            ready, _, _ = select.select([self._conn.pgconn.socket], [], [], timeout)
+            return self._drain() if ready else []
+        except Exception:
+            # A dropped connection turns the caller back into a poller.
+            logger.warning("event_store_listener_lost", exc_info=True)
+            self.close()
+            return []
@@ -0,0 +1,104 @@
+"""Cross-process event outbox health: backlog depth and handler latency.
+
+Outbox handlers run in Celery workers and in web requests (after-commit
+dispatch), so in-process Prometheus metrics would only ever show the web
+half. Every dispatch instead folds its per-handler run counts and seconds
+into one Redis hash, and the outbox coordinator publishes the backlog of each
+dispatch lane as the ``event_outbox`` observability state domain. The
+web-process collector (``app.metrics._EventOutboxCollector``) reads the hash
+on scrape.
+
+Imports of the cache client stay inside the functions so ``app.metrics`` can
+import this module.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_FIELD_SEPARATOR = "|"
+
+
+def _timings_key() -> str:
+    from app.services.app_cache import cache_key
+
+    return cache_key("events", "handler_timings")
+
+
+def record_handler_timings(timings: Iterable[tuple[str, str, float]]) -> None:
+    """Add ``(handler, status, seconds)`` runs to the shared totals; fail-soft."""
+    totals: dict[tuple[str, str], tuple[int, float]] = {}
+    for handler, status, seconds in timings:
+        count, total = totals.get((handler, status), (0, 0.0))
+        totals[(handler, status)] = (count + 1, total + max(0.0, seconds))
+    if not totals:
+        return
+    try:
+        from app.services.app_cache import get_cache_redis
+
+        client = get_cache_redis()
+        if client is None:
+            return
+        key = _timings_key()
+        pipe = client.pipeline(transaction=False)
+        for (handler, status), (count, total) in totals.items():
+            field = f"{handler}{_FIELD_SEPARATOR}{status}"
+            pipe.hincrby(key, f"{field}{_FIELD_SEPARATOR}count", count)
+            pipe.hincrbyfloat(key, f"{field}{_FIELD_SEPARATOR}seconds", total)
+        pipe.execute()
+    except Exception:
+        logger.debug("event_handler_timings_record_failed", exc_info=True)
+
+
+def load_handler_timings() -> dict[tuple[str, str], tuple[int, float]]:
+    """``{(handler, status): (runs, seconds)}`` accumulated across processes."""
+    from app.services.app_cache import get_cache_redis
+
+    client = get_cache_redis()
+    if client is None:
+        return {}
+    totals: dict[tuple[str, str], tuple[int, float]] = {}
+    raw = cast(dict[Any, Any], client.hgetall(_timings_key()) or {})
+    for raw_field, raw_value in raw.items():
+        field = raw_field.decode() if isinstance(raw_field, bytes) else raw_field
+        parts = str(field).rsplit(_FIELD_SEPARATOR, 2)
+        if len(parts) != 3:
+            continue
+        handler, status, measure = parts
+        try:
+            value = float(raw_value)
+        except (TypeError, ValueError):
+            continue
+        count, seconds = totals.get((handler, status), (0, 0.0))
+        if measure == "count":
+            count = int(value)
+        elif measure == "seconds":
+            seconds = value
+        else:
+            continue
+        totals[(handler, status)] = (count, seconds)
+    return totals
+
+
+def publish_outbox_backlog(db: Session, *, now: datetime | None = None) -> bool:
+    """Publish pending depth and oldest age per dispatch lane."""
+    from app.services import event_store as event_store_service
+    from app.services.observability import StateObservation, publish_state_snapshot
+
+    backlog = event_store_service.outbox_backlog(db, now=now)
+    observations = [
+        StateObservation(signal=signal, scope=lane, value=float(value))
+        for lane, (depth, oldest_age) in sorted(backlog.items())
+        for signal, value in (
+            ("backlog_depth", depth),
+            ("backlog_oldest_age_seconds", oldest_age),
+        )
+    ]
+    return publish_state_snapshot("event_outbox", observations, now=now)
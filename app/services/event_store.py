@@ -8,7 +8,7 @@ from enum import StrEnum
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.models.event_store import EventHandlerAttempt, EventStatus, EventStore
@@ -38,11 +38,23 @@ class EventTerminalOutcome:
     failed_handlers: tuple[str, ...]
 
 
+# While subscribed, re-read at least this often in case a notification was
+# lost with the listener's connection.
+_NOTIFIED_RECHECK_SECONDS = 5.0
+
+
 def wait_for_event_terminal(
     db: Session,
     query: WaitForEventTerminalQuery,
 ) -> EventTerminalOutcome:
-    """Wait for one exact durable event; never substitute a newer row."""
+    """Wait for one exact durable event; never substitute a newer row.
+
+    On PostgreSQL the wait blocks on the ``event_store`` notification channel
+    and re-reads the row only when this event is notified (or every
+    ``_NOTIFIED_RECHECK_SECONDS``). Elsewhere it polls every
+    ``query.poll_interval``.
+    """
+    from app.services.event_notifications import EventStoreListener
 
     timeout_seconds = query.timeout.total_seconds()
     poll_seconds = query.poll_interval.total_seconds()
@@ -50,46 +62,67 @@ def wait_for_event_terminal(
         raise ValueError("event terminal wait durations must be positive")
     deadline = time.monotonic() + timeout_seconds
     retry_count = 0
-    while True:
-        if db.in_transaction():
-            db.rollback()
-        record = db.scalar(
-            select(EventStore).where(
-                EventStore.event_id == query.event_id,
-                EventStore.event_type == query.event_type.value,
-            )
-        )
-        if record is not None:
-            retry_count = int(record.retry_count or 0)
-            if record.status in {EventStatus.completed, EventStatus.failed}:
-                failures = tuple(
-                    sorted(
-                        str(item.get("handler") or "")
-                        for item in (record.failed_handlers or [])
-                        if item.get("handler")
-                    )
+    bind = db.get_bind()
+    with EventStoreListener(getattr(bind, "engine", None)) as listener:
+        while True:
+            if db.in_transaction():
+                db.rollback()
+            record = db.scalar(
+                select(EventStore).where(
+                    EventStore.event_id == query.event_id,
+                    EventStore.event_type == query.event_type.value,
                 )
+            )
+            if record is not None:
+                retry_count = int(record.retry_count or 0)
+                if record.status in {EventStatus.completed, EventStatus.failed}:
+                    return _terminal_outcome(query, record, retry_count)
+            remaining_seconds = deadline - time.monotonic()
+            if remaining_seconds <= 0:
                 return EventTerminalOutcome(
                     event_id=query.event_id,
                     event_type=query.event_type,
-                    disposition=(
-                        EventTerminalDisposition.completed
-                        if record.status is EventStatus.completed
-                        else EventTerminalDisposition.failed
-                    ),
+                    disposition=EventTerminalDisposition.timed_out,
                     retry_count=retry_count,
-                    failed_handlers=failures,
+                    failed_handlers=(),
                 )
-        remaining_seconds = deadline - time.monotonic()
-        if remaining_seconds <= 0:
-            return EventTerminalOutcome(
-                event_id=query.event_id,
-                event_type=query.event_type,
-                disposition=EventTerminalDisposition.timed_out,
-                retry_count=retry_count,
-                failed_handlers=(),
+            if not listener.active:
+                time.sleep(min(poll_seconds, remaining_seconds))
+                continue
+            recheck_at = time.monotonic() + min(
+                _NOTIFIED_RECHECK_SECONDS, remaining_seconds
             )
-        time.sleep(min(poll_seconds, remaining_seconds))
+            while (wait_seconds := recheck_at - time.monotonic()) > 0:
+                notifications = listener.wait(wait_seconds)
+                if not listener.active or any(
+                    item.event_id == query.event_id for item in notifications
+                ):
+                    break
+
+
+def _terminal_outcome(
+    query: WaitForEventTerminalQuery,
+    record: EventStore,
+    retry_count: int,
+) -> EventTerminalOutcome:
+    failures = tuple(
+        sorted(
+            str(item.get("handler") or "")
+            for item in (record.failed_handlers or [])
+            if item.get("handler")
+        )
+    )
+    return EventTerminalOutcome(
+        event_id=query.event_id,
+        event_type=query.event_type,
+        disposition=(
+            EventTerminalDisposition.completed
+            if record.status is EventStatus.completed
+            else EventTerminalDisposition.failed
+        ),
+        retry_count=retry_count,
+        failed_handlers=failures,
+    )
 
 
 _SENSITIVE_KEYS = {
@@ -167,6 +200,77 @@ def claim_pending_event(db: Session, event_store_id: UUID) -> EventStore | None:
     return record
 
 
+def list_pending_event_keys(
+    db: Session, *, limit: int
+) -> list[tuple[UUID, UUID | None, UUID | None]]:
+    """Oldest-first ``(id, account_id, subscriber_id)`` of pending rows."""
+    rows = (
+        db.query(EventStore.id, EventStore.account_id, EventStore.subscriber_id)
+        .filter(EventStore.status == EventStatus.pending)
+        .filter(EventStore.is_active.is_(True))
+        .order_by(EventStore.created_at.asc(), EventStore.id.asc())
+        .limit(limit)
+        .all()
+    )
+    return [(row[0], row[1], row[2]) for row in rows]
+
+
+# The external lane runs once the core lane settled the row; a row still being
+# processed (or retried) is picked up on a later pass.
+_EXTERNAL_READY_STATUSES = (EventStatus.completed, EventStatus.failed)
+
+
+def list_external_pending_event_ids(db: Session, *, limit: int) -> list[UUID]:
+    rows = (
+        db.query(EventStore.id)
+        .filter(EventStore.external_pending.is_(True))
+        .filter(EventStore.status.in_(_EXTERNAL_READY_STATUSES))
+        .filter(EventStore.is_active.is_(True))
+        .order_by(EventStore.created_at.asc())
+        .limit(limit)
+        .all()
+    )
+    return [row[0] for row in rows]
+
+
+def claim_external_event(db: Session, event_store_id: UUID) -> EventStore | None:
+    return (
+        db.query(EventStore)
+        .filter(EventStore.id == event_store_id)
+        .filter(EventStore.external_pending.is_(True))
+        .filter(EventStore.status.in_(_EXTERNAL_READY_STATUSES))
+        .filter(EventStore.is_active.is_(True))
+        .with_for_update(skip_locked=True)
+        .one_or_none()
+    )
+
+
+def outbox_backlog(
+    db: Session, *, now: datetime | None = None
+) -> dict[str, tuple[int, float]]:
+    """``{lane: (depth, oldest_age_seconds)}`` for the core and external lanes."""
+    now = now or datetime.now(UTC)
+    lanes = {
+        "core": EventStore.status == EventStatus.pending,
+        "external": EventStore.external_pending.is_(True),
+    }
+    backlog: dict[str, tuple[int, float]] = {}
+    for lane, condition in lanes.items():
+        depth, oldest = (
+            db.query(func.count(EventStore.id), func.min(EventStore.created_at))
+            .filter(condition)
+            .filter(EventStore.is_active.is_(True))
+            .one()
+        )
+        age = 0.0
+        if oldest is not None:
+            if oldest.tzinfo is None:
+                oldest = oldest.replace(tzinfo=UTC)
+            age = max(0.0, (now - oldest).total_seconds())
+        backlog[lane] = (int(depth or 0), age)
+    return backlog
+
+
 def mark_event_completed(
     db: Session,
     record: EventStore,
@@ -184,6 +288,21 @@ def mark_event_completed(
     db.flush()
 
 
+def mark_external_completed(
+    db: Session,
+    record: EventStore,
+    failed_handlers: list[dict[str, str]],
+) -> None:
+    """Fold the external lane's failures into the row's failure manifest."""
+    manifest = [
+        failure
+        for failure in record.failed_handlers or []
+        if failure["handler"] not in {item["handler"] for item in failed_handlers}
+    ] + failed_handlers
+    record.external_pending = False
+    mark_event_completed(db, record, manifest)
+
+
 def record_handler_attempt(
     db: Session,
     *,
@@ -264,6 +383,7 @@ def cleanup_completed_events(db: Session, *, retention_days: int) -> dict[str, i
     old_completed_event_ids = (
         db.query(EventStore.id)
         .filter(EventStore.status == EventStatus.completed)
+        .filter(EventStore.external_pending.is_(False))
         .filter(EventStore.created_at < cutoff)
         .scalar_subquery()
     )
@@ -8,6 +8,7 @@ Events are persisted before dispatching to enable retry of failed handlers.
 """
 
 import logging
+import time
 from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
@@ -22,6 +23,12 @@ from app.services.session_hooks import run_after_commit
 
 logger = logging.getLogger(__name__)
 
+# Outbox dispatch lanes. The core lane runs state and communication handlers
+# in per-key order; the external lane runs slow external-stage handlers
+# (integration/webhook delivery) afterwards so they never hold up a key.
+CORE_LANE = "core"
+EXTERNAL_LANE = "external"
+
 
 @contextmanager
 def _isolated_handler_session(db: Session | Any) -> Iterator[Session | Any]:
@@ -51,6 +58,51 @@ def _isolated_handler_session(db: Session | Any) -> Iterator[Session | Any]:
         handler_db.close()
 
 
+def _run_handler(
+    db: Session,
+    step: Any,
+    event: Event,
+    timings: list[tuple[str, str, float]],
+) -> None:
+    """Run one handler in its isolated session and record how long it took."""
+    started = time.perf_counter()
+    status = "failed"
+    try:
+        with _isolated_handler_session(db) as handler_db:
+            step.handler.handle(handler_db, event)
+        status = "success"
+    finally:
+        timings.append((step.handler_name, status, time.perf_counter() - started))
+
+
+def _flush_handler_timings(timings: list[tuple[str, str, float]]) -> None:
+    if not timings:
+        return
+    from app.services.event_outbox_health import record_handler_timings
+
+    record_handler_timings(timings)
+
+
+def _is_external_step(step: Any) -> bool:
+    from app.services.control_relationships import HandlerStage
+
+    return step.stage == HandlerStage.external
+
+
+def _event_from_record(event_record: EventStore) -> Event:
+    return Event(
+        event_type=EventType(event_record.event_type),
+        payload=event_record.payload,
+        event_id=event_record.event_id,
+        actor=event_record.actor,
+        subscriber_id=event_record.subscriber_id,
+        account_id=event_record.account_id,
+        subscription_id=event_record.subscription_id,
+        invoice_id=event_record.invoice_id,
+        service_order_id=event_record.service_order_id,
+    )
+
+
 def _event_extra(
     event: Event,
     *,
@@ -103,6 +155,7 @@ class EventDispatcher:
         event: Event,
         *,
         event_record: EventStore | None = None,
+        lane: str | None = None,
     ) -> None:
         """Dispatch an event to all registered handlers.
 
@@ -110,6 +163,10 @@ class EventDispatcher:
         Each handler is called in sequence. Failed handlers are tracked
         for later retry.
 
+        With ``lane=CORE_LANE`` external-stage handlers are skipped and the
+        record is flagged ``external_pending`` for
+        :meth:`dispatch_external_event`.
+
         IMPORTANT: Event persistence uses a SEPARATE database session to avoid
         committing the caller's pending transaction. This ensures event emission
         doesn't break transaction isolation for callers.
@@ -148,7 +205,12 @@ class EventDispatcher:
         # 2. Process the event-specific plan, tracking failures and dependency blocks.
         succeeded_handlers: set[str] = set()
         failed_handlers: list[dict[str, str]] = []
+        timings: list[tuple[str, str, float]] = []
         for step in plan:
+            if lane == CORE_LANE and _is_external_step(step):
+                if event_record is not None:
+                    event_record.external_pending = True
+                continue
             unmet = sorted(set(step.dependencies) - succeeded_handlers)
             if unmet:
                 error = f"blocked by event dependencies: {', '.join(unmet)}"
@@ -169,8 +231,7 @@ class EventDispatcher:
                     )
                 continue
             try:
-                with _isolated_handler_session(db) as handler_db:
-                    step.handler.handle(handler_db, event)
+                _run_handler(db, step, event, timings)
                 succeeded_handlers.add(step.handler_name)
                 if event_record and event_record.id:
                     event_store_service.record_handler_attempt(
@@ -205,6 +266,7 @@ class EventDispatcher:
                         )
                     except Exception:
                         logger.exception("event_handler_attempt_failed")
+        _flush_handler_timings(timings)
 
         # 3. Update event status.
         if event_record:
@@ -233,23 +295,93 @@ class EventDispatcher:
             ),
         )
 
-    def dispatch_pending_event(self, db: Session, event_store_id: UUID) -> bool:
+    def dispatch_pending_event(
+        self,
+        db: Session,
+        event_store_id: UUID,
+        *,
+        lane: str | None = None,
+    ) -> bool:
         """Claim and dispatch one durable event-store outbox row."""
         event_record = event_store_service.claim_pending_event(db, event_store_id)
         if event_record is None:
             return False
-        event = Event(
-            event_type=EventType(event_record.event_type),
-            payload=event_record.payload,
-            event_id=event_record.event_id,
-            actor=event_record.actor,
-            subscriber_id=event_record.subscriber_id,
-            account_id=event_record.account_id,
-            subscription_id=event_record.subscription_id,
-            invoice_id=event_record.invoice_id,
-            service_order_id=event_record.service_order_id,
-        )
-        self.dispatch(db, event, event_record=event_record)
+        event = _event_from_record(event_record)
+        self.dispatch(db, event, event_record=event_record, lane=lane)
+        return True
+
+    def dispatch_external_event(self, db: Session, event_store_id: UUID) -> bool:
+        """Claim a row the core lane flagged and run its external-stage handlers.
+
+        Handlers the core lane ran satisfy dependencies unless they are in the
+        row's failure manifest; a step whose dependency failed is recorded as
+        blocked so the regular retry path picks both up.
+        """
+        event_record = event_store_service.claim_external_event(db, event_store_id)
+        if event_record is None:
+            return False
+        from app.services.control_relationships import event_execution_plan
+
+        event = _event_from_record(event_record)
+        plan = event_execution_plan(event.event_type.value, self._handlers)
+        succeeded_handlers = {
+            step.handler_name for step in plan
+        } - event_store_service.failed_handler_names(event_record)
+        failures: list[dict[str, str]] = []
+        timings: list[tuple[str, str, float]] = []
+        for step in plan:
+            if not _is_external_step(step):
+                continue
+            succeeded_handlers.discard(step.handler_name)
+            unmet = sorted(set(step.dependencies) - succeeded_handlers)
+            if unmet:
+                error = f"blocked by event dependencies: {', '.join(unmet)}"
+                failures.append(
+                    {
+                        "handler": step.handler_name,
+                        "error": error,
+                        "blocked_by": ",".join(unmet),
+                    }
+                )
+                event_store_service.record_handler_attempt(
+                    db,
+                    event_store_id=event_record.id,
+                    handler_name=step.handler_name,
+                    status="blocked",
+                    error=error,
+                    retry_count=event_record.retry_count,
+                )
+                continue
+            try:
+                _run_handler(db, step, event, timings)
+                succeeded_handlers.add(step.handler_name)
+                event_store_service.record_handler_attempt(
+                    db,
+                    event_store_id=event_record.id,
+                    handler_name=step.handler_name,
+                    status="success",
+                    retry_count=event_record.retry_count,
+                )
+            except Exception as exc:
+                logger.exception(
+                    "event_handler_failed",
+                    extra={
+                        **_event_extra(event, handler_count=len(plan)),
+                        "handler": step.handler_name,
+                        "error": str(exc),
+                    },
+                )
+                failures.append({"handler": step.handler_name, "error": str(exc)})
+                event_store_service.record_handler_attempt(
+                    db,
+                    event_store_id=event_record.id,
+                    handler_name=step.handler_name,
+                    status="failed",
+                    error=str(exc),
+                    retry_count=event_record.retry_count,
+                )
+        _flush_handler_timings(timings)
+        event_store_service.mark_external_completed(db, event_record, failures)
         return True
 
     def retry_event(self, db: Session, event_record) -> bool:
@@ -263,17 +395,7 @@ class EventDispatcher:
             True if all handlers succeeded, False otherwise
         """
         # Reconstruct the Event from stored data
-        event = Event(
-            event_type=EventType(event_record.event_type),
-            payload=event_record.payload,
-            event_id=event_record.event_id,
-            actor=event_record.actor,
-            subscriber_id=event_record.subscriber_id,
-            account_id=event_record.account_id,
-            subscription_id=event_record.subscription_id,
-            invoice_id=event_record.invoice_id,
-            service_order_id=event_record.service_order_id,
-        )
+        event = _event_from_record(event_record)
 
         # Get handlers that failed previously
         failed_handler_names = event_store_service.failed_handler_names(event_record)
@@ -300,9 +422,15 @@ class EventDispatcher:
             plan_names - failed_handler_names if failed_handler_names else set()
         )
         new_failures: list[dict[str, str]] = []
+        timings: list[tuple[str, str, float]] = []
         for step in plan:
             if failed_handler_names and step.handler_name not in failed_handler_names:
                 continue
+            if getattr(event_record, "external_pending", False) and _is_external_step(
+                step
+            ):
+                # Still owned by the external lane, which runs it next.
+                continue
             unmet = sorted(set(step.dependencies) - succeeded_handlers)
             if unmet:
                 error = f"blocked by event dependencies: {', '.join(unmet)}"
@@ -323,8 +451,7 @@ class EventDispatcher:
                 )
                 continue
             try:
-                with _isolated_handler_session(db) as handler_db:
-                    step.handler.handle(handler_db, event)
+                _run_handler(db, step, event, timings)
                 succeeded_handlers.add(step.handler_name)
                 event_store_service.record_handler_attempt(
                     db,
@@ -361,6 +488,8 @@ class EventDispatcher:
                     retry_count=event_record.retry_count,
                 )
 
+        _flush_handler_timings(timings)
+
         # Update final status
         event_store_service.mark_event_completed(db, event_record, new_failures)
         db.commit()
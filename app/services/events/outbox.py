@@ -0,0 +1,134 @@
+"""Partitioned, key-ordered draining of the durable event outbox.
+
+Pending ``EventStore`` rows are split into partitions by aggregate key (the
+account id, else the subscriber id, else the row itself). Each partition is
+drained by at most one worker at a time, oldest first, so events for one key
+are handled in order while different keys proceed in parallel. When a key's
+event cannot be dispatched (raised, or is held by another dispatcher) the
+rest of that key's events wait for the next pass.
+
+The core lane skips external-stage handlers (integration/webhook delivery);
+:func:`dispatch_external_lane` runs them separately so a slow endpoint never
+holds up a partition.
+"""
+
+from __future__ import annotations
+
+import logging
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.services import event_store as event_store_service
+from app.services.events.dispatcher import CORE_LANE, EventDispatcher, get_dispatcher
+
+logger = logging.getLogger(__name__)
+
+_UUID_SPACE = 1 << 128
+
+
+def ordering_key(
+    event_store_id: UUID,
+    account_id: UUID | None,
+    subscriber_id: UUID | None,
+) -> UUID:
+    """The aggregate whose events must be dispatched in order."""
+    return account_id or subscriber_id or event_store_id
+
+
+def partition_of(key: UUID, partitions: int) -> int:
+    """Equal UUID ranges, as the partitioned invoice cycle splits accounts."""
+    if partitions <= 1:
+        return 0
+    return key.int * partitions // _UUID_SPACE
+
+
+def dispatch_partition(
+    db: Session,
+    *,
+    partition: int,
+    partitions: int,
+    batch_size: int,
+    dispatcher: EventDispatcher | None = None,
+) -> dict[str, int]:
+    """Dispatch up to ``batch_size`` pending events of one key partition.
+
+    Commits after every event. The caller holds the partition's lock.
+    """
+    dispatcher = dispatcher or get_dispatcher()
+    window = event_store_service.list_pending_event_keys(
+        db, limit=batch_size * max(partitions, 1)
+    )
+    selected: list[tuple[UUID, UUID]] = []
+    for event_store_id, account_id, subscriber_id in window:
+        key = ordering_key(event_store_id, account_id, subscriber_id)
+        if partition_of(key, partitions) == partition:
+            selected.append((event_store_id, key))
+            if len(selected) >= batch_size:
+                break
+
+    held_keys: set[UUID] = set()
+    dispatched = skipped = failed = deferred = 0
+    for event_store_id, key in selected:
+        if key in held_keys:
+            deferred += 1
+            continue
+        try:
+            if dispatcher.dispatch_pending_event(db, event_store_id, lane=CORE_LANE):
+                dispatched += 1
+            else:
+                # Claimed elsewhere (usually the after-commit dispatch); its
+                # successors wait so they cannot overtake it.
+                skipped += 1
+                held_keys.add(key)
+            db.commit()
+        except Exception:
+            failed += 1
+            held_keys.add(key)
+            db.rollback()
+            logger.exception(
+                "pending_event_dispatch_failed",
+                extra={"event_store_id": str(event_store_id), "partition": partition},
+            )
+    return {
+        "partition": partition,
+        "selected": len(selected),
+        "dispatched": dispatched,
+        "skipped": skipped,
+        "deferred": deferred,
+        "failed": failed,
+    }
+
+
+def dispatch_external_lane(
+    db: Session,
+    *,
+    batch_size: int,
+    dispatcher: EventDispatcher | None = None,
+) -> dict[str, int]:
+    """Run deferred external-stage handlers, committing after every event."""
+    dispatcher = dispatcher or get_dispatcher()
+    event_ids = event_store_service.list_external_pending_event_ids(
+        db, limit=batch_size
+    )
+    dispatched = skipped = failed = 0
+    for event_store_id in event_ids:
+        try:
+            if dispatcher.dispatch_external_event(db, event_store_id):
+                dispatched += 1
+            else:
+                skipped += 1
+            db.commit()
+        except Exception:
+            failed += 1
+            db.rollback()
+            logger.exception(
+                "external_event_dispatch_failed",
+                extra={"event_store_id": str(event_store_id)},
+            )
+    return {
+        "selected": len(event_ids),
+        "dispatched": dispatched,
+        "skipped": skipped,
+        "failed": failed,
+    }
@@ -4,15 +4,18 @@ This module provides a client for interacting with the GenieACS NBI
 (Northbound Interface) to manage TR-069/CWMP devices.
 """
 
+import asyncio
+import importlib.util
 import json
 import logging
 import os
 import re
 import threading
 import time
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import UTC, datetime, timedelta
 from enum import Enum
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 from urllib.parse import quote
 
 import httpx
@@ -110,6 +113,51 @@ class GenieACSTaskQueuedError(GenieACSError):
         self.delivery_code = delivery_code
 
 
+# Pooled NBI transports, one per ACS server and timeout. Provisioning makes
+# dozens of NBI calls per ONT and bulk TR-069 pushes make thousands, so calls
+# reuse kept-alive connections instead of paying TCP/TLS setup each time.
+# Headers stay per request, so clients with different auth share a pool.
+# ``AsyncGenieACSClient`` owns its own transport instead: an async pool is
+# bound to one event loop and must be closed inside it.
+_HTTP_CLIENT_LOCK = threading.Lock()
+_HTTP_CLIENTS: dict[tuple[str, float], httpx.Client] = {}
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _pool_limits() -> httpx.Limits:
+    max_connections = max(
+        GenieACSClient._env_int("GENIEACS_HTTP_MAX_CONNECTIONS", 20), 1
+    )
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=30.0,
+    )
+
+
+def _pooled_client(base_url: str, timeout: float) -> httpx.Client:
+    key = (base_url, timeout)
+    with _HTTP_CLIENT_LOCK:
+        client = _HTTP_CLIENTS.get(key)
+        if client is None:
+            client = httpx.Client(
+                timeout=timeout, limits=_pool_limits(), http2=_http2_available()
+            )
+            _HTTP_CLIENTS[key] = client
+        return client
+
+
+def _forget_pooled_clients() -> None:
+    # A forked worker must not share its parent's sockets; it opens its own.
+    _HTTP_CLIENTS.clear()
+
+
+os.register_at_fork(after_in_child=_forget_pooled_clients)
+
+
 class GenieACSClient:
     """HTTP client for GenieACS NBI (Northbound Interface).
 
@@ -157,42 +205,72 @@ class GenieACSClient:
             GenieACSError: On request failure
         """
         url = f"{self.base_url}{path}"
+        client = _pooled_client(self.base_url, self.timeout)
         try:
-            with httpx.Client(timeout=self.timeout, headers=self.headers) as client:
-                response = client.request(
-                    method, url, params=params, json=json_data, **kwargs
-                )
-                response.raise_for_status()
-                return response
-        except httpx.HTTPStatusError as e:
-            # 405 is expected for some endpoints (handled with fallback), log at debug
-            if e.response.status_code == 405:
-                logger.debug("GenieACS 405 on %s %s (will use fallback)", method, path)
-                raise GenieACSMethodNotAllowedError("API error: 405") from e
-            logger.error(
-                f"GenieACS API error: {e.response.status_code} - {e.response.text}"
+            response = client.request(
+                method,
+                url,
+                params=params,
+                json=json_data,
+                headers=self.headers,
+                **kwargs,
             )
-            raise GenieACSError(f"API error: {e.response.status_code}") from e
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            raise self._status_error(method, path, e) from e
         except httpx.RequestError as e:
             logger.error(f"GenieACS request error: {e}")
             raise GenieACSError(f"Request error: {e}") from e
 
+    @staticmethod
+    def _status_error(
+        method: str, path: str, error: httpx.HTTPStatusError
+    ) -> GenieACSError:
+        # 405 is expected for some endpoints (handled with fallback), log at debug
+        if error.response.status_code == 405:
+            logger.debug("GenieACS 405 on %s %s (will use fallback)", method, path)
+            return GenieACSMethodNotAllowedError("API error: 405")
+        logger.error(
+            f"GenieACS API error: {error.response.status_code} - {error.response.text}"
+        )
+        return GenieACSError(f"API error: {error.response.status_code}")
+
     # -------------------------------------------------------------------------
     # Device Operations
     # -------------------------------------------------------------------------
 
     def list_devices(
-        self, query: dict | None = None, projection: dict | str | None = None
+        self,
+        query: dict | None = None,
+        projection: dict | str | None = None,
+        *,
+        sort: dict | None = None,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         """List devices with optional filtering.
 
         Args:
             query: MongoDB-style query filter
             projection: Fields to include/exclude
+            sort: MongoDB-style sort, e.g. ``{"_lastInform": 1}``
+            limit: Maximum number of devices to return
 
         Returns:
             List of device documents
         """
+        params = self._device_query_params(query, projection, sort=sort, limit=limit)
+        response = self._request("GET", "/devices", params=params)
+        return cast(list[dict[str, Any]], response.json())
+
+    @staticmethod
+    def _device_query_params(
+        query: dict | None,
+        projection: dict | str | None,
+        *,
+        sort: dict | None = None,
+        limit: int | None = None,
+    ) -> dict[str, str]:
         params = {}
         if query:
             params["query"] = json.dumps(query)
@@ -200,9 +278,11 @@ class GenieACSClient:
             params["projection"] = (
                 projection if isinstance(projection, str) else json.dumps(projection)
             )
-
-        response = self._request("GET", "/devices", params=params)
-        return cast(list[dict[str, Any]], response.json())
+        if sort:
+            params["sort"] = json.dumps(sort)
+        if limit:
+            params["limit"] = str(limit)
+        return params
 
     def get_device(self, device_id: str) -> dict[str, Any]:
         """Get device by ID through the portable GenieACS collection query API.
@@ -389,9 +469,8 @@ class GenieACSClient:
         cutoff = datetime.now(UTC) - older_than
         active_tasks: list[dict[str, Any]] = []
         for pending_task in pending_tasks:
-            timestamp = self._parse_timestamp(pending_task.get("timestamp"))
-            task_id = str(pending_task.get("_id") or "").strip()
-            if timestamp and timestamp < cutoff and task_id:
+            task_id = self._stale_pending_task_id(pending_task, cutoff)
+            if task_id:
                 try:
                     self.delete_task(task_id)
                     logger.info(
@@ -410,6 +489,103 @@ class GenieACSClient:
             active_tasks.append(pending_task)
         return active_tasks
 
+    @classmethod
+    def _reject_broad_refresh(
+        cls, task: dict[str, Any], *, enforce_safety: bool, allow_broad_refresh: bool
+    ) -> None:
+        if (
+            enforce_safety
+            and cls._is_broad_refresh_task(task)
+            and not allow_broad_refresh
+        ):
+            raise GenieACSTaskRejectedError(
+                "Broad root refreshObject tasks are blocked because they can slow or "
+                "fail the next inform. Refresh a targeted object instead."
+            )
+
+    @classmethod
+    def _stale_pending_task_id(
+        cls, pending_task: dict[str, Any], cutoff: datetime
+    ) -> str | None:
+        timestamp = cls._parse_timestamp(pending_task.get("timestamp"))
+        task_id = str(pending_task.get("_id") or "").strip()
+        if timestamp and timestamp < cutoff and task_id:
+            return task_id
+        return None
+
+    @classmethod
+    def _dedupe_pending_tasks(
+        cls,
+        device_id: str,
+        task: dict[str, Any],
+        pending_tasks: list[dict[str, Any]],
+    ) -> tuple[list[str], dict[str, Any] | None, list[dict[str, Any]]]:
+        """Split pending tasks into writes to replace, a reusable match, the rest.
+
+        Scanning stops at the first reusable match, so only the writes seen
+        before it are replaced.
+        """
+        signature = cls._task_signature(task)
+        replaced: list[str] = []
+        retained_tasks: list[dict[str, Any]] = []
+        for pending_task in pending_tasks:
+            if (
+                task.get("name") == "setParameterValues"
+                and pending_task.get("name") == "setParameterValues"
+                and cls._task_parameter_names(pending_task)
+                == cls._task_parameter_names(task)
+            ):
+                pending_id = str(pending_task.get("_id") or "").strip()
+                if pending_id:
+                    logger.info(
+                        "Replacing pending GenieACS write task %s for %s",
+                        pending_id,
+                        device_id,
+                    )
+                    replaced.append(pending_id)
+                continue
+            if cls._task_signature(pending_task) == signature:
+                logger.info(
+                    "Reusing pending GenieACS task %s for %s (%s)",
+                    pending_task.get("_id"),
+                    device_id,
+                    task.get("name"),
+                )
+                result = dict(pending_task)
+                result["alreadyPending"] = True
+                return replaced, result, retained_tasks
+            retained_tasks.append(pending_task)
+        return replaced, None, retained_tasks
+
+    @classmethod
+    def _enforce_pending_limits(
+        cls,
+        device_id: str,
+        task: dict[str, Any],
+        pending_tasks: list[dict[str, Any]],
+        *,
+        max_pending_tasks: int | None,
+        allow_when_pending: bool,
+    ) -> None:
+        if (
+            cls._inform_safe_mode_enabled()
+            and pending_tasks
+            and cls._is_inform_safe_deferred_task(task)
+            and not allow_when_pending
+        ):
+            raise GenieACSTaskRejectedError(
+                f"Device {device_id} already has {len(pending_tasks)} pending "
+                "GenieACS task(s). Inform-safe mode blocks read/refresh tasks "
+                "until the device backlog is clear."
+            )
+        limit = max_pending_tasks or cls._max_pending_tasks_per_device()
+        if len(pending_tasks) >= limit:
+            raise GenieACSTaskRejectedError(
+                f"Device {device_id} already has {len(pending_tasks)} pending "
+                f"GenieACS task(s), limit is {limit}. Clear stale tasks before "
+                "queueing more work."
+            )
+
     def _prepare_pending_tasks_for_create(
         self,
         device_id: str,
@@ -421,16 +597,9 @@ class GenieACSClient:
         max_pending_tasks: int | None,
         allow_when_pending: bool,
     ) -> None | dict[str, Any]:
-        if (
-            enforce_safety
-            and self._is_broad_refresh_task(task)
-            and not allow_broad_refresh
-        ):
-            raise GenieACSTaskRejectedError(
-                "Broad root refreshObject tasks are blocked because they can slow or "
-                "fail the next inform. Refresh a targeted object instead."
-            )
-
+        self._reject_broad_refresh(
+            task, enforce_safety=enforce_safety, allow_broad_refresh=allow_broad_refresh
+        )
         if not (dedupe_pending or enforce_safety):
             return None
 
@@ -445,56 +614,22 @@ class GenieACSClient:
             )
 
         if dedupe_pending:
-            signature = self._task_signature(task)
-            retained_tasks: list[dict[str, Any]] = []
-            for pending_task in pending_tasks:
-                if (
-                    task.get("name") == "setParameterValues"
-                    and pending_task.get("name") == "setParameterValues"
-                    and self._task_parameter_names(pending_task)
-                    == self._task_parameter_names(task)
-                ):
-                    pending_id = str(pending_task.get("_id") or "").strip()
-                    if pending_id:
-                        logger.info(
-                            "Replacing pending GenieACS write task %s for %s",
-                            pending_id,
-                            device_id,
-                        )
-                        self.delete_task(pending_id)
-                    continue
-                if self._task_signature(pending_task) == signature:
-                    logger.info(
-                        "Reusing pending GenieACS task %s for %s (%s)",
-                        pending_task.get("_id"),
-                        device_id,
-                        task.get("name"),
-                    )
-                    result = dict(pending_task)
-                    result["alreadyPending"] = True
-                    return result
-                retained_tasks.append(pending_task)
-            pending_tasks = retained_tasks
+            replaced, reused, pending_tasks = self._dedupe_pending_tasks(
+                device_id, task, pending_tasks
+            )
+            for pending_id in replaced:
+                self.delete_task(pending_id)
+            if reused is not None:
+                return reused
 
         if enforce_safety:
-            if (
-                self._inform_safe_mode_enabled()
-                and pending_tasks
-                and self._is_inform_safe_deferred_task(task)
-                and not allow_when_pending
-            ):
-                raise GenieACSTaskRejectedError(
-                    f"Device {device_id} already has {len(pending_tasks)} pending "
-                    "GenieACS task(s). Inform-safe mode blocks read/refresh tasks "
-                    "until the device backlog is clear."
-                )
-            limit = max_pending_tasks or self._max_pending_tasks_per_device()
-            if len(pending_tasks) >= limit:
-                raise GenieACSTaskRejectedError(
-                    f"Device {device_id} already has {len(pending_tasks)} pending "
-                    f"GenieACS task(s), limit is {limit}. Clear stale tasks before "
-                    "queueing more work."
-                )
+            self._enforce_pending_limits(
+                device_id,
+                task,
+                pending_tasks,
+                max_pending_tasks=max_pending_tasks,
+                allow_when_pending=allow_when_pending,
+            )
         return None
 
     def create_task(
@@ -576,17 +711,7 @@ class GenieACSClient:
             if wait_thread is not None:
                 wait_thread.join(timeout=0.1)
 
-        result = response.json() if response.text else {}
-        reason_phrase = str(getattr(response, "reason_phrase", "") or "")
-        if (
-            isinstance(result, dict)
-            and "connectionRequestError" not in result
-            and response.status_code == 202
-            and reason_phrase
-            and reason_phrase.lower() != "accepted"
-        ):
-            result["connectionRequestError"] = reason_phrase
-
+        result = self._task_create_result(response)
         elapsed_ms = int((time.monotonic() - started_at) * 1000)
         logger.info(
             "genieacs_task_create_complete",
@@ -603,6 +728,20 @@ class GenieACSClient:
 
         return result
 
+    @staticmethod
+    def _task_create_result(response: httpx.Response) -> dict:
+        result = response.json() if response.text else {}
+        reason_phrase = str(getattr(response, "reason_phrase", "") or "")
+        if (
+            isinstance(result, dict)
+            and "connectionRequestError" not in result
+            and response.status_code == 202
+            and reason_phrase
+            and reason_phrase.lower() != "accepted"
+        ):
+            result["connectionRequestError"] = reason_phrase
+        return result
+
     @classmethod
     def _ui_task_timeout_seconds(cls) -> int:
         return max(cls._env_int("GENIEACS_UI_TASK_TIMEOUT_SECONDS", 45), 1)
@@ -1297,6 +1436,365 @@ class GenieACSClient:
         return current
 
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+class AsyncGenieACSClient:
+    """Asyncio client for the GenieACS NBI.
+
+    Mirrors the device, task, fault and tag operations of ``GenieACSClient``
+    (same arguments, same queue-safety policy, same errors) for bulk flows
+    that fan out across many devices. Requests share one kept-alive
+    transport, and at most ``max_concurrency`` of this client's requests are
+    in flight at once.
+
+    The transport is opened on the first request and bound to that event
+    loop; close it there with ``aclose()``, or use the client as
+    ``async with create_async_genieacs_client(...) as client:``.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 30.0,
+        headers: dict | None = None,
+        *,
+        max_concurrency: int | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.max_concurrency = max(
+            max_concurrency
+            or GenieACSClient._env_int("GENIEACS_ASYNC_MAX_CONCURRENCY", 10),
+            1,
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._http: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> "AsyncGenieACSClient":
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the kept-alive connections; a later request reopens them."""
+        http, self._http = self._http, None
+        if http is not None:
+            await http.aclose()
+
+    def _transport(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout, limits=_pool_limits(), http2=_http2_available()
+            )
+        return self._http
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict | None = None,
+        json_data: dict | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        url = f"{self.base_url}{path}"
+        client = self._transport()
+        try:
+            async with self._semaphore:
+                response = await client.request(
+                    method,
+                    url,
+                    params=params,
+                    json=json_data,
+                    headers=self.headers,
+                    **kwargs,
+                )
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            raise GenieACSClient._status_error(method, path, e) from e
+        except httpx.RequestError as e:
+            logger.error(f"GenieACS request error: {e}")
+            raise GenieACSError(f"Request error: {e}") from e
+
+    async def fan_out(
+        self,
+        items: Iterable[_T],
+        operation: Callable[[_T], Awaitable[_R]],
+    ) -> list[_R | BaseException]:
+        """Run ``operation`` for every item, bounded by the client's semaphore.
+
+        Every operation is started at once; the semaphore limits the NBI
+        requests in flight, not the operations, so a large batch holds one
+        pending coroutine per item. Results keep the order of ``items``; a
+        failure is returned in its slot rather than cancelling the rest.
+        """
+        return await asyncio.gather(
+            *(operation(item) for item in items), return_exceptions=True
+        )
+
+    # -------------------------------------------------------------------------
+    # Device Operations
+    # -------------------------------------------------------------------------
+
+    async def list_devices(
+        self,
+        query: dict | None = None,
+        projection: dict | str | None = None,
+        *,
+        sort: dict | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        params = GenieACSClient._device_query_params(
+            query, projection, sort=sort, limit=limit
+        )
+        response = await self._request("GET", "/devices", params=params)
+        return cast(list[dict[str, Any]], response.json())
+
+    async def get_device(self, device_id: str) -> dict[str, Any]:
+        devices = await self.list_devices(query={"_id": device_id})
+        if devices:
+            return devices[0]
+
+        parts = device_id.rsplit("-", 1)
+        if len(parts) == 2:
+            devices = await self.list_devices(
+                query={"_id": {"$regex": f".*-{re.escape(parts[1])}$"}}
+            )
+            if devices:
+                return devices[0]
+
+        raise GenieACSError(f"Device not found: {device_id}")
+
+    async def count_devices(self, query: dict | None = None) -> int:
+        params = GenieACSClient._device_query_params(query, None)
+        response = await self._request("HEAD", "/devices", params=params)
+        return int(response.headers.get("X-Total-Count", 0))
+
+    # -------------------------------------------------------------------------
+    # Task Operations
+    # -------------------------------------------------------------------------
+
+    async def get_pending_tasks(self, device_id: str) -> list[dict[str, Any]]:
+        params = {"query": json.dumps({"device": device_id})}
+        response = await self._request("GET", "/tasks", params=params)
+        data = response.json()
+        return cast(list[dict[str, Any]], data if isinstance(data, list) else [])
+
+    async def delete_task(self, task_id: str) -> None:
+        await self._request("DELETE", f"/tasks/{task_id}")
+
+    async def _delete_stale_pending_tasks(
+        self,
+        device_id: str,
+        pending_tasks: list[dict[str, Any]],
+        *,
+        older_than: timedelta,
+    ) -> list[dict[str, Any]]:
+        cutoff = datetime.now(UTC) - older_than
+        active_tasks: list[dict[str, Any]] = []
+        for pending_task in pending_tasks:
+            task_id = GenieACSClient._stale_pending_task_id(pending_task, cutoff)
+            if task_id:
+                try:
+                    await self.delete_task(task_id)
+                    logger.info(
+                        "Deleted stale pending GenieACS task %s for %s",
+                        task_id,
+                        device_id,
+                    )
+                    continue
+                except GenieACSError:
+                    logger.warning(
+                        "Failed to delete stale pending GenieACS task %s for %s",
+                        task_id,
+                        device_id,
+                        exc_info=True,
+                    )
+            active_tasks.append(pending_task)
+        return active_tasks
+
+    async def _prepare_pending_tasks_for_create(
+        self,
+        device_id: str,
+        task: dict[str, Any],
+        *,
+        dedupe_pending: bool,
+        enforce_safety: bool,
+        allow_broad_refresh: bool,
+        max_pending_tasks: int | None,
+        allow_when_pending: bool,
+    ) -> None | dict[str, Any]:
+        GenieACSClient._reject_broad_refresh(
+            task, enforce_safety=enforce_safety, allow_broad_refresh=allow_broad_refresh
+        )
+        if not (dedupe_pending or enforce_safety):
+            return None
+
+        pending_tasks = [
+            item
+            for item in await self.get_pending_tasks(device_id)
+            if isinstance(item, dict)
+        ]
+        if enforce_safety:
+            pending_tasks = await self._delete_stale_pending_tasks(
+                device_id,
+                pending_tasks,
+                older_than=GenieACSClient._pending_task_ttl(),
+            )
+
+        if dedupe_pending:
+            replaced, reused, pending_tasks = GenieACSClient._dedupe_pending_tasks(
+                device_id, task, pending_tasks
+            )
+            for pending_id in replaced:
+                await self.delete_task(pending_id)
+            if reused is not None:
+                return reused
+
+        if enforce_safety:
+            GenieACSClient._enforce_pending_limits(
+                device_id,
+                task,
+                pending_tasks,
+                max_pending_tasks=max_pending_tasks,
+                allow_when_pending=allow_when_pending,
+            )
+        return None
+
+    async def create_task(
+        self,
+        device_id: str,
+        task: dict,
+        connection_request: bool | None = None,
+        dedupe_pending: bool = True,
+        enforce_safety: bool = True,
+        allow_broad_refresh: bool = False,
+        max_pending_tasks: int | None = None,
+        allow_when_pending: bool = False,
+    ) -> dict:
+        """Create a task for a device under the same policy as the sync client."""
+        prepared = await self._prepare_pending_tasks_for_create(
+            device_id,
+            task,
+            dedupe_pending=dedupe_pending,
+            enforce_safety=enforce_safety,
+            allow_broad_refresh=allow_broad_refresh,
+            max_pending_tasks=max_pending_tasks,
+            allow_when_pending=allow_when_pending,
+        )
+        if prepared is not None:
+            return prepared
+
+        encoded_id = quote(device_id, safe="")
+        task_name = str(task.get("name") or "unknown")
+        started_at = time.monotonic()
+        try:
+            response = await self._request(
+                "POST",
+                f"/devices/{encoded_id}/tasks",
+                params={"connection_request": str(connection_request).lower()}
+                if connection_request is not None
+                else None,
+                json_data=task,
+            )
+        except Exception:
+            logger.warning(
+                "genieacs_task_create_failed",
+                extra={
+                    "event": "genieacs_task_create_failed",
+                    "device_id": device_id,
+                    "task_name": task_name,
+                    "elapsed_ms": int((time.monotonic() - started_at) * 1000),
+                },
+            )
+            raise
+
+        result = GenieACSClient._task_create_result(response)
+        logger.info(
+            "genieacs_task_create_complete",
+            extra={
+                "event": "genieacs_task_create_complete",
+                "device_id": device_id,
+                "task_name": task_name,
+                "status_code": response.status_code,
+                "elapsed_ms": int((time.monotonic() - started_at) * 1000),
+                "task_id": result.get("_id"),
+                "already_pending": bool(result.get("alreadyPending")),
+            },
+        )
+        return result
+
+    async def get_parameter_values(
+        self,
+        device_id: str,
+        parameters: list[str],
+        allow_when_pending: bool = False,
+    ) -> dict:
+        task = {"name": "getParameterValues", "parameterNames": parameters}
+        return await self.create_task(
+            device_id, task, allow_when_pending=allow_when_pending
+        )
+
+    async def set_parameter_values(
+        self,
+        device_id: str,
+        parameters: dict[str, Any],
+        *,
+        connection_request: bool | None = True,
+    ) -> dict:
+        param_list = [
+            [k, v, _infer_cwmp_value_type(k, v)] for k, v in parameters.items()
+        ]
+        task = {"name": "setParameterValues", "parameterValues": param_list}
+        return await self.create_task(
+            device_id, task, connection_request=connection_request
+        )
+
+    async def refresh_object(
+        self,
+        device_id: str,
+        object_path: str,
+        allow_broad_refresh: bool = False,
+        allow_when_pending: bool = False,
+    ) -> dict:
+        task = {"name": "refreshObject", "objectName": object_path.rstrip(".")}
+        return await self.create_task(
+            device_id,
+            task,
+            allow_broad_refresh=allow_broad_refresh,
+            allow_when_pending=allow_when_pending,
+        )
+
+    async def reboot_device(self, device_id: str) -> dict:
+        return await self.create_task(device_id, {"name": "reboot"})
+
+    async def factory_reset(self, device_id: str) -> dict:
+        return await self.create_task(device_id, {"name": "factoryReset"})
+
+    # -------------------------------------------------------------------------
+    # Fault and Tag Operations
+    # -------------------------------------------------------------------------
+
+    async def list_faults(self, device_id: str | None = None) -> list[dict[str, Any]]:
+        params = {}
+        if device_id:
+            params["query"] = json.dumps({"device": device_id})
+        response = await self._request("GET", "/faults", params=params)
+        return cast(list[dict[str, Any]], response.json())
+
+    async def add_tag(self, device_id: str, tag: str) -> None:
+        encoded_id = quote(device_id, safe="")
+        await self._request("POST", f"/devices/{encoded_id}/tags/{tag}")
+
+    async def remove_tag(self, device_id: str, tag: str) -> None:
+        encoded_id = quote(device_id, safe="")
+        await self._request("DELETE", f"/devices/{encoded_id}/tags/{tag}")
+
+
 def create_genieacs_client(
     base_url: str,
     *,
@@ -1305,3 +1803,20 @@ def create_genieacs_client(
 ) -> GenieACSClient:
     """Create the concrete GenieACS NBI client used by application services."""
     return GenieACSClient(base_url, timeout=timeout, headers=headers)
+
+
+def create_async_genieacs_client(
+    base_url: str,
+    *,
+    timeout: float = 30.0,
+    headers: dict | None = None,
+    max_concurrency: int | None = None,
+) -> AsyncGenieACSClient:
+    """Create the asyncio GenieACS NBI client for bulk device fan-out.
+
+    The caller owns the client's connections: ``async with`` it, or await
+    ``aclose()`` before its event loop ends.
+    """
+    return AsyncGenieACSClient(
+        base_url, timeout=timeout, headers=headers, max_concurrency=max_concurrency
+    )
@@ -0,0 +1,305 @@
+"""Batched ICMP echo sweeps over one unprivileged socket.
+
+``ping.run_ping`` forks the system ``ping`` binary per host, so a reachability
+sweep over thousands of ONT/device management IPs costs thousands of
+processes. A sweep here sends every echo request from a single ``SOCK_DGRAM``
+ICMP socket (Linux "ping sockets", allowed for the container user by the
+``net.ipv4.ping_group_range`` sysctl — the same permission the ``ping``
+binary relies on), matches replies by sequence number and source address, and
+reports per-host RTT and loss.
+
+Sends are paced by a packets-per-second ceiling shared by every sweep on the
+sweeper, so a burst over the WireGuard tunnels to the OLT management subnets
+stays bounded no matter how many targets are queued.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+import socket
+import struct
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COUNT = 1
+DEFAULT_TIMEOUT_SECONDS = 2.0
+DEFAULT_MAX_PPS = 200
+
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_ICMPV6_ECHO_REQUEST = 128
+_ICMPV6_ECHO_REPLY = 129
+_PAYLOAD = b"dotmac-sweep"
+
+
+class IcmpUnavailableError(OSError):
+    """The host does not allow unprivileged ICMP sockets for this process."""
+
+
+@dataclass
+class PingStats:
+    """Echo results for one target across a sweep."""
+
+    host: str
+    sent: int = 0
+    received: int = 0
+    rtts_ms: list[float] = field(default_factory=list)
+
+    @property
+    def reachable(self) -> bool:
+        return self.received > 0
+
+    @property
+    def loss(self) -> float:
+        """Fraction of echo requests without a reply (1.0 when none were sent)."""
+        if self.sent <= 0:
+            return 1.0
+        return max(0.0, 1.0 - self.received / self.sent)
+
+    @property
+    def avg_rtt_ms(self) -> float | None:
+        if not self.rtts_ms:
+            return None
+        return sum(self.rtts_ms) / len(self.rtts_ms)
+
+    @property
+    def min_rtt_ms(self) -> float | None:
+        return min(self.rtts_ms) if self.rtts_ms else None
+
+    @property
+    def max_rtt_ms(self) -> float | None:
+        return max(self.rtts_ms) if self.rtts_ms else None
+
+
+def _checksum(packet: bytes) -> int:
+    if len(packet) % 2:
+        packet += b"\x00"
+    total = sum(struct.unpack(f"!{len(packet) // 2}H", packet))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _echo_request(family: int, sequence: int) -> bytes:
+    # The kernel rewrites the identifier to the socket's ping id and, for
+    # ICMPv6, fills in the pseudo-header checksum itself.
+    if family == socket.AF_INET6:
+        return struct.pack("!BBHHH", _ICMPV6_ECHO_REQUEST, 0, 0, 0, sequence) + (
+            _PAYLOAD
+        )
+    header = struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, 0, 0, sequence)
+    checksum = _checksum(header + _PAYLOAD)
+    return (
+        struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, checksum, 0, sequence) + _PAYLOAD
+    )
+
+
+@dataclass
+class _Sweep:
+    outstanding: set[tuple[str, int]] = field(default_factory=set)
+    sending: bool = True
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def settle(self) -> None:
+        if not self.sending and not self.outstanding:
+            self.done.set()
+
+
+class IcmpSweeper:
+    """Run echo sweeps on the current event loop from shared ICMP sockets."""
+
+    def __init__(self, *, max_pps: int = DEFAULT_MAX_PPS) -> None:
+        self._min_gap = 1.0 / max(1, int(max_pps))
+        self._next_send_at = 0.0
+        self._sockets: dict[int, socket.socket] = {}
+        self._sequence = 0
+        self._inflight: dict[tuple[str, int], tuple[_Sweep, PingStats, float]] = {}
+
+    async def sweep(
+        self,
+        hosts: Iterable[str],
+        *,
+        count: int = DEFAULT_COUNT,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> dict[str, PingStats]:
+        """Send ``count`` echo requests to every host and collect replies.
+
+        Returns ``{host: PingStats}`` keyed by the caller's host strings.
+        Hosts that do not resolve are reported with nothing sent (full loss).
+        Raises :class:`IcmpUnavailableError` when no ICMP socket can be opened.
+        """
+        targets = await self._resolve(dict.fromkeys(h for h in hosts if h))
+        results = {host: PingStats(host=host) for host in targets}
+        if not targets:
+            return results
+
+        loop = asyncio.get_running_loop()
+        state = _Sweep()
+        try:
+            for _round in range(max(1, int(count))):
+                for host, (family, address) in targets.items():
+                    if address is None:
+                        continue
+                    sock = self._socket_for(family, loop)
+                    await self._pace()
+                    sequence = self._next_sequence()
+                    key = (address, sequence)
+                    stats = results[host]
+                    stats.sent += 1
+                    self._inflight[key] = (state, stats, time.monotonic())
+                    state.outstanding.add(key)
+                    try:
+                        sock.sendto(_echo_request(family, sequence), (address, 0))
+                    except OSError as exc:
+                        # Unroutable targets fail at send time; count as lost.
+                        self._inflight.pop(key, None)
+                        state.outstanding.discard(key)
+                        logger.debug(
+                            "icmp_sweep_send_failed",
+                            extra={"host": host, "error": str(exc)},
+                        )
+            state.sending = False
+            state.settle()
+            try:
+                await asyncio.wait_for(state.done.wait(), timeout=timeout_seconds)
+            except TimeoutError:
+                pass
+        finally:
+            for key in state.outstanding:
+                self._inflight.pop(key, None)
+        return results
+
+    def close(self) -> None:
+        for sock in self._sockets.values():
+            try:
+                asyncio.get_running_loop().remove_reader(sock.fileno())
+            except (RuntimeError, ValueError):
+                pass
+            sock.close()
+        self._sockets.clear()
+        self._inflight.clear()
+
+    # -- internals ----------------------------------------------------------
+
+    async def _resolve(
+        self, hosts: dict[str, None]
+    ) -> dict[str, tuple[int, str | None]]:
+        loop = asyncio.get_running_loop()
+        resolved: dict[str, tuple[int, str | None]] = {}
+        for host in hosts:
+            try:
+                address = ipaddress.ip_address(host)
+            except ValueError:
+                try:
+                    infos = await loop.getaddrinfo(host, None, type=socket.SOCK_DGRAM)
+                except OSError:
+                    resolved[host] = (socket.AF_INET, None)
+                    continue
+                family, _, _, _, sockaddr = infos[0]
+                resolved[host] = (family, str(sockaddr[0]))
+                continue
+            family = socket.AF_INET6 if address.version == 6 else socket.AF_INET
+            resolved[host] = (family, str(address))
+        return resolved
+
+    def _socket_for(
+        self, family: int, loop: asyncio.AbstractEventLoop
+    ) -> socket.socket:
+        sock = self._sockets.get(family)
+        if sock is not None:
+            return sock
+        proto = (
+            socket.IPPROTO_ICMPV6 if family == socket.AF_INET6 else socket.IPPROTO_ICMP
+        )
+        try:
+            sock = socket.socket(family, socket.SOCK_DGRAM, proto)
+        except OSError as exc:
+            raise IcmpUnavailableError(str(exc)) from exc
+        sock.setblocking(False)
+        loop.add_reader(sock.fileno(), self._drain, sock, family)
+        self._sockets[family] = sock
+        return sock
+
+    async def _pace(self) -> None:
+        now = time.monotonic()
+        send_at = max(now, self._next_send_at)
+        self._next_send_at = send_at + self._min_gap
+        if send_at > now:
+            await asyncio.sleep(send_at - now)
+
+    def _next_sequence(self) -> int:
+        # 16-bit sequence space, shared by every sweep on this sweeper; replies
+        # are keyed by (address, sequence) so reuse only collides per target.
+        self._sequence = (self._sequence + 1) & 0xFFFF
+        return self._sequence
+
+    def _drain(self, sock: socket.socket, family: int) -> None:
+        expected_type = (
+            _ICMPV6_ECHO_REPLY if family == socket.AF_INET6 else (_ICMP_ECHO_REPLY)
+        )
+        while True:
+            try:
+                data, addr = sock.recvfrom(2048)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as exc:
+                logger.debug("icmp_sweep_recv_failed", extra={"error": str(exc)})
+                return
+            if len(data) < 8 or data[0] != expected_type:
+                continue
+            sequence = struct.unpack("!H", data[6:8])[0]
+            entry = self._inflight.pop((str(addr[0]), sequence), None)
+            if entry is None:
+                continue
+            state, stats, sent_at = entry
+            stats.received += 1
+            stats.rtts_ms.append(round((time.monotonic() - sent_at) * 1000.0, 3))
+            state.outstanding.discard((str(addr[0]), sequence))
+            state.settle()
+
+
+def sweep_hosts(
+    hosts: Iterable[str],
+    *,
+    count: int = DEFAULT_COUNT,
+    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    max_pps: int | None = None,
+) -> dict[str, PingStats]:
+    """Synchronous sweep for thread-pool and Celery callers.
+
+    ``max_pps`` defaults to ``ICMP_SWEEP_MAX_PPS``. Raises
+    :class:`IcmpUnavailableError` when ICMP sockets are not permitted, so the
+    caller can fall back to ``ping.run_ping``.
+    """
+    from app.config import settings
+
+    host_list = list(hosts)
+
+    async def _main() -> dict[str, PingStats]:
+        sweeper = IcmpSweeper(max_pps=max_pps or settings.icmp_sweep_max_pps)
+        try:
+            return await sweeper.sweep(
+                host_list, count=count, timeout_seconds=timeout_seconds
+            )
+        finally:
+            sweeper.close()
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_main())
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, _main()).result()
+
+
+def sweep_enabled() -> bool:
+    """Whether batch callers should sweep instead of forking ``ping``."""
+    from app.config import settings
+
+    return settings.ping_engine != "subprocess"
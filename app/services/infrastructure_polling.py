@@ -12,7 +12,9 @@ topology live-status warmer (``topology.live_status``) derives the cached
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
+from types import SimpleNamespace
 
 from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
@@ -43,6 +45,14 @@ DEFAULT_MAX_WORKERS = 4
 INTERFACE_IN_OCTETS_METRIC = "core_interface_in_octets_total"
 INTERFACE_OUT_OCTETS_METRIC = "core_interface_out_octets_total"
 
+# Counter reads fan out across devices so one slow router only delays its own
+# samples. Each device read is bounded by a deadline (across all OID chunks),
+# and finished devices are streamed to VictoriaMetrics in chunks of
+# INTERFACE_WRITE_CHUNK_LINES instead of one write at the end of the sweep.
+DEFAULT_INTERFACE_CONCURRENCY = 16
+DEFAULT_INTERFACE_DEADLINE_SECONDS = 15
+INTERFACE_WRITE_CHUNK_LINES = 2000
+
 # Per-probe ping results as VM series (degradation detection before outage
 # detection — rising latency shows up long before a device stops answering).
 # Latency only exists for successful probes; loss is 1/0 per probe.
@@ -107,6 +117,8 @@ def poll_infrastructure(
     max_workers: int = DEFAULT_MAX_WORKERS,
     force: bool = False,
     max_devices: int | None = DEFAULT_MAX_DEVICES_PER_RUN,
+    interface_concurrency: int = DEFAULT_INTERFACE_CONCURRENCY,
+    interface_deadline_seconds: float = DEFAULT_INTERFACE_DEADLINE_SECONDS,
 ) -> dict[str, int]:
     """Run one reachability sweep over the pollable devices.
 
@@ -114,6 +126,8 @@ def poll_infrastructure(
     worker thread with an isolated, self-committing session, honours the
     ``maintenance`` operator override, and rolls status up the parent chain.
     One run probes at most ``max_devices`` (longest-unchecked first).
+    Interface counters are then collected ``interface_concurrency`` devices
+    at a time (see ``push_interface_counters``).
     """
     devices = pollable_devices(db)
     sweep_started = datetime.now(UTC)
@@ -133,7 +147,13 @@ def poll_infrastructure(
     except Exception:  # metrics are additive; never fail the health sweep
         logger.exception("ping_metric_push_failed")
     try:
-        totals.update(push_interface_counters(db))
+        totals.update(
+            push_interface_counters(
+                db,
+                concurrency=interface_concurrency,
+                deadline_seconds=interface_deadline_seconds,
+            )
+        )
     except Exception:  # counters are additive; never fail the health sweep
         logger.exception("interface_counter_push_failed")
     return totals
@@ -219,13 +239,51 @@ def monitored_interface_targets(
     return list(by_device.values())
 
 
+def _interface_counter_lines(
+    device_id: str,
+    interfaces: list[tuple[str, int]],
+    readings: dict,
+    ts_ms: int,
+) -> list[str]:
+    lines: list[str] = []
+    for interface_id, snmp_index in interfaces:
+        reading = readings.get(snmp_index)
+        if reading is None:
+            continue
+        labels = (
+            f'device_id="{device_id}",interface_id="{interface_id}",'
+            f'snmp_index="{snmp_index}"'
+        )
+        if reading.in_octets is not None:
+            lines.append(
+                f"{INTERFACE_IN_OCTETS_METRIC}{{{labels}}} {reading.in_octets} {ts_ms}"
+            )
+        if reading.out_octets is not None:
+            lines.append(
+                f"{INTERFACE_OUT_OCTETS_METRIC}{{{labels}}} "
+                f"{reading.out_octets} {ts_ms}"
+            )
+    return lines
+
+
 def push_interface_counters(
-    db: Session, *, now: datetime | None = None
+    db: Session,
+    *,
+    now: datetime | None = None,
+    concurrency: int = DEFAULT_INTERFACE_CONCURRENCY,
+    deadline_seconds: float = DEFAULT_INTERFACE_DEADLINE_SECONDS,
+    chunk_lines: int = INTERFACE_WRITE_CHUNK_LINES,
 ) -> dict[str, int]:
     """Read IF-MIB octet counters for monitored interfaces, push to VictoriaMetrics.
 
     Feeds the admin live interface-bandwidth panel (``core_router_metrics``),
     which used to read these values from Zabbix items.
+
+    Devices are read ``concurrency`` at a time, each bounded by
+    ``deadline_seconds``. Samples are stamped when their device answers (or
+    with ``now`` when given) and written in chunks of ``chunk_lines`` as
+    devices finish, so a slow router neither holds back nor skews the
+    timestamps of everyone else's samples.
     """
     from app.services.snmp_probe import fetch_interface_octets
 
@@ -237,54 +295,91 @@ def push_interface_counters(
             "interface_write_failed": 0,
         }
 
+    # Snapshot what the readers need as plain values: the rollback below
+    # expires ORM instances, and the reader threads must not lazy-load
+    # through the caller's session.
+    jobs: list[tuple[SimpleNamespace, list[tuple[str, int]]]] = []
+    for device, ifaces in targets:
+        snapshot = SimpleNamespace(
+            id=str(device.id),
+            mgmt_ip=device.mgmt_ip,
+            hostname=device.hostname,
+            snmp_port=device.snmp_port,
+            snmp_version=device.snmp_version,
+            snmp_community=device.snmp_community,
+        )
+        interfaces = [
+            (str(iface.id), int(iface.snmp_index))
+            for iface in ifaces
+            if iface.snmp_index is not None
+        ]
+        jobs.append((snapshot, interfaces))
+
     # Targets are materialized; release the read transaction before slow SNMP
     # network calls and the VM HTTP write.
     _release_postgres_read_transaction(db)
-    ts_ms = int((now or datetime.now(UTC)).timestamp() * 1000)
-    lines: list[str] = []
-    devices_read = 0
-    for device, ifaces in targets:
+
+    def _read(device: SimpleNamespace, interfaces: list[tuple[str, int]]):
         readings = fetch_interface_octets(
-            device, [int(i.snmp_index) for i in ifaces if i.snmp_index is not None]
+            device,
+            [snmp_index for _interface_id, snmp_index in interfaces],
+            deadline_seconds=deadline_seconds,
         )
-        if not readings:
-            continue
-        devices_read += 1
-        for iface in ifaces:
-            if iface.snmp_index is None:
-                continue
-            reading = readings.get(int(iface.snmp_index))
-            if reading is None:
-                continue
-            labels = (
-                f'device_id="{device.id}",interface_id="{iface.id}",'
-                f'snmp_index="{iface.snmp_index}"'
-            )
-            if reading.in_octets is not None:
-                lines.append(
-                    f"{INTERFACE_IN_OCTETS_METRIC}{{{labels}}} "
-                    f"{reading.in_octets} {ts_ms}"
-                )
-            if reading.out_octets is not None:
-                lines.append(
-                    f"{INTERFACE_OUT_OCTETS_METRIC}{{{labels}}} "
-                    f"{reading.out_octets} {ts_ms}"
-                )
-    write_failed = 0
-    if lines:
+        return readings, now or datetime.now(UTC)
+
+    pending: list[str] = []
+    totals = {"devices": 0, "lines": 0, "failed": 0}
+
+    def _flush() -> None:
+        if not pending:
+            return
         write_result = _writer().write_prometheus_lines(
-            lines,
+            list(pending),
             adapter="infrastructure.polling",
             operation="interface_counters",
         )
         # The writer already logs and bumps the VM failure counter; surface
         # the failure in the task result too so ops can see it in task output.
         if not write_result.success:
-            write_failed = len(lines)
+            totals["failed"] += len(pending)
+        pending.clear()
+
+    workers = max(1, min(int(concurrency), len(jobs)))
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {
+            pool.submit(_read, snapshot, interfaces): (snapshot, interfaces)
+            for snapshot, interfaces in jobs
+        }
+        for future in as_completed(futures):
+            snapshot, interfaces = futures[future]
+            try:
+                readings, read_at = future.result()
+            except Exception:
+                logger.exception(
+                    "interface_counter_read_failed",
+                    extra={"device_id": snapshot.id},
+                )
+                continue
+            if not readings:
+                continue
+            totals["devices"] += 1
+            lines = _interface_counter_lines(
+                snapshot.id, interfaces, readings, int(read_at.timestamp() * 1000)
+            )
+            pending.extend(lines)
+            totals["lines"] += len(lines)
+            if len(pending) >= chunk_lines:
+                _flush()
+        _flush()
+    finally:
+        # Same abnormal-exit handling as refresh_devices_health: drop queued
+        # reads, wait only for the in-flight ones.
+        pool.shutdown(wait=True, cancel_futures=True)
     return {
-        "interface_devices": devices_read,
-        "interface_lines": len(lines),
-        "interface_write_failed": write_failed,
+        "interface_devices": totals["devices"],
+        "interface_lines": totals["lines"],
+        "interface_write_failed": totals["failed"],
     }
 
 
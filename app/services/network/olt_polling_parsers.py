@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from app.models.network import OntUnit
 from app.services.network.olt_polling_oids import _SIGNAL_SENTINELS
+from app.services.network.snmp_engine import SnmpVarBind
 
 logger = logging.getLogger(__name__)
 
@@ -145,11 +147,22 @@ def _extract_index_from_oid(oid_part: str, base_oid: str | None = None) -> str |
 
 
 def _parse_snmp_table(
-    lines: list[str], *, base_oid: str | None = None
+    lines: Sequence[str | SnmpVarBind], *, base_oid: str | None = None
 ) -> dict[str, str]:
-    """Parse SNMP walk output into {index: value} dict."""
+    """Parse SNMP walk output into {index: value} dict.
+
+    Accepts net-snmp text lines or typed varbinds from the native engine;
+    varbinds skip the text round-trip entirely.
+    """
     parsed: dict[str, str] = {}
     for line in lines:
+        if isinstance(line, SnmpVarBind):
+            if line.is_exception:
+                continue
+            index = _extract_index_from_oid(line.oid, base_oid=base_oid)
+            if index:
+                parsed[index] = line.text
+            continue
         if " = " not in line:
             continue
         oid_part, value_part = line.split(" = ", 1)
@@ -5,11 +5,13 @@ WireGuard route to all per-OLT mgmt subnets. A simple ICMP ping from this
 host is the cheapest "is the ONT mgmt plane reachable right now" signal
 the planner can use to decide whether ACS-side pushes are worth attempting.
 
-The actual ping runs via ``subprocess`` against the system ``ping`` binary
-(works without elevated privileges on Linux containers with the
-``net.ipv4.ping_group_range`` sysctl set to include the container user —
-the default on most modern setups). Tests substitute a stub via
-``ping_function`` parameter.
+The ping goes out over an unprivileged ICMP socket (``icmp_sweep``), so a
+sweep over thousands of ONTs does not fork a ``ping`` process per ONT. Both
+that and the system ``ping`` binary fallback work without elevated privileges
+on Linux containers with the ``net.ipv4.ping_group_range`` sysctl set to
+include the container user — the default on most modern setups. When ICMP
+sockets are refused, or ``PING_ENGINE=subprocess``, the binary is used. Tests
+substitute a stub via ``ping_function`` parameter.
 
 Failures are silent — a False return means "ONT is not pingable right
 now", which the planner treats as one input to the reachability signal,
@@ -23,12 +25,14 @@ import shutil
 import subprocess
 from collections.abc import Callable
 
+from app.services import icmp_sweep
+
 logger = logging.getLogger(__name__)
 
 
 PingFunction = Callable[[str, int, float], bool]
-"""Signature: ``(ip, count, timeout_sec) -> bool``. Default impl shells out
-to ``ping``; tests pass a stub."""
+"""Signature: ``(ip, count, timeout_sec) -> bool``. Default impl uses an ICMP
+socket, falling back to the ``ping`` binary; tests pass a stub."""
 
 
 def _ping_subprocess(ip: str, count: int, timeout_sec: float) -> bool:
@@ -65,6 +69,18 @@ def _ping_subprocess(ip: str, count: int, timeout_sec: float) -> bool:
     return result.returncode == 0
 
 
+def _ping_socket(ip: str, count: int, timeout_sec: float) -> bool:
+    """Echo ``ip`` from an unprivileged ICMP socket, else via ``ping``."""
+    if not icmp_sweep.sweep_enabled():
+        return _ping_subprocess(ip, count, timeout_sec)
+    try:
+        results = icmp_sweep.sweep_hosts([ip], count=count, timeout_seconds=timeout_sec)
+    except icmp_sweep.IcmpUnavailableError:
+        return _ping_subprocess(ip, count, timeout_sec)
+    stats = results.get(ip)
+    return bool(stats and stats.reachable)
+
+
 def is_pingable(
     ip: str | None,
     *,
@@ -80,11 +96,11 @@ def is_pingable(
         timeout_sec: Per-packet timeout in seconds. Total cap is roughly
             ``count * timeout_sec + 2``.
         ping_function: Override for the actual ICMP send. Tests substitute
-            this; production uses ``_ping_subprocess``.
+            this; production uses ``_ping_socket``.
     """
     if not ip:
         return False
-    fn = ping_function or _ping_subprocess
+    fn = ping_function or _ping_socket
     try:
         return fn(ip, count, timeout_sec)
     except Exception as exc:  # noqa: BLE001 — defensive
@@ -0,0 +1,549 @@
+"""In-process asyncio SNMP engine (v1/v2c GET, GETNEXT and GETBULK walks).
+
+The net-snmp binaries cost a fork/exec per walk and hand back text that every
+caller re-parses. This engine speaks the protocol directly over one UDP socket
+per event loop, so a poller can run hundreds of concurrent walks on a single
+loop and receive typed varbinds.
+
+Only community-based SNMP is implemented: device records carry a community and
+a version string, and nothing in the tree stores USM (v3) credentials yet.
+Callers keep the subprocess path as a fallback (see ``snmp_walk`` and
+``snmp_probe``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+import socket
+import weakref
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_TIMEOUT_SECONDS = 3.0
+DEFAULT_RETRIES = 1
+DEFAULT_MAX_REPETITIONS = 50
+# Upper bound on PDUs awaiting a response per engine. Keeps a burst of walks
+# from overrunning the socket receive buffer on the poller host.
+DEFAULT_MAX_IN_FLIGHT = 256
+
+# BER universal / SNMP application tags.
+_TAG_INTEGER = 0x02
+_TAG_OCTET_STRING = 0x04
+_TAG_NULL = 0x05
+_TAG_OID = 0x06
+_TAG_SEQUENCE = 0x30
+_TAG_IP_ADDRESS = 0x40
+_TAG_COUNTER32 = 0x41
+_TAG_GAUGE32 = 0x42
+_TAG_TIMETICKS = 0x43
+_TAG_OPAQUE = 0x44
+_TAG_COUNTER64 = 0x46
+_TAG_NO_SUCH_OBJECT = 0x80
+_TAG_NO_SUCH_INSTANCE = 0x81
+_TAG_END_OF_MIB_VIEW = 0x82
+
+# PDU tags.
+_PDU_GET = 0xA0
+_PDU_GETNEXT = 0xA1
+_PDU_RESPONSE = 0xA2
+_PDU_GETBULK = 0xA5
+
+# Error-status values we act on.
+_ERR_TOO_BIG = 1
+_ERR_NO_SUCH_NAME = 2
+
+_UNSIGNED_TYPES = {
+    _TAG_COUNTER32: "Counter32",
+    _TAG_GAUGE32: "Gauge32",
+    _TAG_TIMETICKS: "Timeticks",
+    _TAG_COUNTER64: "Counter64",
+}
+_EXCEPTION_TYPES = {
+    _TAG_NO_SUCH_OBJECT: "noSuchObject",
+    _TAG_NO_SUCH_INSTANCE: "noSuchInstance",
+    _TAG_END_OF_MIB_VIEW: "endOfMibView",
+}
+_VERSION_CODES = {"1": 0, "2c": 1}
+
+
+class SnmpError(RuntimeError):
+    """Base error for the native SNMP engine."""
+
+
+class SnmpTimeoutError(SnmpError):
+    """No response arrived within the timeout after all retries."""
+
+
+class SnmpResponseError(SnmpError):
+    """The agent answered with a non-zero error-status."""
+
+    def __init__(self, status: int, index: int) -> None:
+        super().__init__(f"SNMP error-status {status} at varbind {index}")
+        self.status = status
+        self.index = index
+
+
+@dataclass(frozen=True)
+class SnmpTarget:
+    """Where and how to reach one SNMP agent."""
+
+    host: str
+    community: str
+    port: int = 161
+    version: str = "2c"
+    timeout: float = DEFAULT_TIMEOUT_SECONDS
+    retries: int = DEFAULT_RETRIES
+
+
+@dataclass(frozen=True, slots=True)
+class SnmpVarBind:
+    """One typed variable binding from an agent response.
+
+    ``value`` is an ``int`` for INTEGER/counter/gauge/timeticks types, ``bytes``
+    for OCTET STRING/Opaque, ``str`` for OID and IpAddress values, and ``None``
+    for NULL and the v2c exception types.
+    """
+
+    oid: str
+    type: str
+    value: int | str | bytes | None
+
+    @property
+    def is_exception(self) -> bool:
+        return self.type in _EXCEPTION_TYPES.values()
+
+    @property
+    def text(self) -> str:
+        """Render the value the way net-snmp prints it, minus the type prefix."""
+        value = self.value
+        if value is None:
+            return self.type if self.is_exception else ""
+        if isinstance(value, bytes):
+            try:
+                decoded = value.decode("utf-8")
+            except UnicodeDecodeError:
+                decoded = None
+            if decoded is not None and all(
+                ch.isprintable() or ch in "\r\n\t" for ch in decoded
+            ):
+                return decoded
+            return " ".join(f"{byte:02X}" for byte in value)
+        return str(value)
+
+
+# ---------------------------------------------------------------------------
+# BER codec
+# ---------------------------------------------------------------------------
+
+
+def _encode_length(length: int) -> bytes:
+    if length < 0x80:
+        return bytes([length])
+    raw = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([0x80 | len(raw)]) + raw
+
+
+def _tlv(tag: int, payload: bytes) -> bytes:
+    return bytes([tag]) + _encode_length(len(payload)) + payload
+
+
+def _encode_integer(value: int) -> bytes:
+    size = max(1, (value + (value < 0)).bit_length() // 8 + 1)
+    return _tlv(_TAG_INTEGER, value.to_bytes(size, "big", signed=True))
+
+
+def _oid_arcs(oid: str) -> tuple[int, ...]:
+    return tuple(int(arc) for arc in oid.strip().lstrip(".").split(".") if arc)
+
+
+def _encode_oid(oid: str) -> bytes:
+    arcs = _oid_arcs(oid)
+    if len(arcs) < 2:
+        raise SnmpError(f"Invalid OID: {oid!r}")
+    payload = bytearray()
+    for arc in (arcs[0] * 40 + arcs[1], *arcs[2:]):
+        chunk = [arc & 0x7F]
+        arc >>= 7
+        while arc:
+            chunk.append(0x80 | (arc & 0x7F))
+            arc >>= 7
+        payload.extend(reversed(chunk))
+    return _tlv(_TAG_OID, bytes(payload))
+
+
+def _read_tlv(data: bytes, offset: int) -> tuple[int, bytes, int]:
+    """Return ``(tag, value, next_offset)`` for the TLV starting at ``offset``."""
+    try:
+        tag = data[offset]
+        length = data[offset + 1]
+        offset += 2
+        if length & 0x80:
+            width = length & 0x7F
+            length = int.from_bytes(data[offset : offset + width], "big")
+            offset += width
+    except IndexError as exc:
+        raise SnmpError("Truncated SNMP message") from exc
+    end = offset + length
+    if end > len(data):
+        raise SnmpError("Truncated SNMP message")
+    return tag, data[offset:end], end
+
+
+def _decode_oid(raw: bytes) -> str:
+    arcs: list[int] = []
+    value = 0
+    for byte in raw:
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            arcs.append(value)
+            value = 0
+    if not arcs:
+        return ""
+    first = arcs[0]
+    head = [first // 40, first % 40] if first < 80 else [2, first - 80]
+    return ".".join(str(arc) for arc in (*head, *arcs[1:]))
+
+
+def _decode_value(tag: int, raw: bytes) -> tuple[str, int | str | bytes | None]:
+    if tag == _TAG_INTEGER:
+        return "INTEGER", int.from_bytes(raw, "big", signed=True)
+    if tag in _UNSIGNED_TYPES:
+        return _UNSIGNED_TYPES[tag], int.from_bytes(raw, "big", signed=False)
+    if tag == _TAG_OCTET_STRING:
+        return "STRING", bytes(raw)
+    if tag == _TAG_OID:
+        return "OID", _decode_oid(raw)
+    if tag == _TAG_IP_ADDRESS:
+        return "IpAddress", ".".join(str(byte) for byte in raw)
+    if tag == _TAG_OPAQUE:
+        return "Opaque", bytes(raw)
+    if tag == _TAG_NULL:
+        return "NULL", None
+    if tag in _EXCEPTION_TYPES:
+        return _EXCEPTION_TYPES[tag], None
+    return f"0x{tag:02X}", bytes(raw)
+
+
+def _encode_message(
+    version: str,
+    community: str,
+    pdu_tag: int,
+    request_id: int,
+    oids: Sequence[str],
+    *,
+    field_a: int = 0,
+    field_b: int = 0,
+) -> bytes:
+    """Build a request message; ``field_a``/``field_b`` are non-repeaters and
+    max-repetitions for GETBULK, error-status/index (zero) otherwise."""
+    varbinds = b"".join(
+        _tlv(_TAG_SEQUENCE, _encode_oid(oid) + _tlv(_TAG_NULL, b"")) for oid in oids
+    )
+    pdu = _tlv(
+        pdu_tag,
+        _encode_integer(request_id)
+        + _encode_integer(field_a)
+        + _encode_integer(field_b)
+        + _tlv(_TAG_SEQUENCE, varbinds),
+    )
+    return _tlv(
+        _TAG_SEQUENCE,
+        _encode_integer(_VERSION_CODES[version])
+        + _tlv(_TAG_OCTET_STRING, community.encode("utf-8"))
+        + pdu,
+    )
+
+
+@dataclass(frozen=True)
+class _Response:
+    request_id: int
+    error_status: int
+    error_index: int
+    varbinds: list[SnmpVarBind]
+
+
+def _decode_response(data: bytes) -> _Response:
+    tag, message, _ = _read_tlv(data, 0)
+    if tag != _TAG_SEQUENCE:
+        raise SnmpError("SNMP message is not a SEQUENCE")
+    _, _version, offset = _read_tlv(message, 0)
+    _, _community, offset = _read_tlv(message, offset)
+    pdu_tag, pdu, _ = _read_tlv(message, offset)
+    if pdu_tag != _PDU_RESPONSE:
+        raise SnmpError(f"Unexpected PDU type 0x{pdu_tag:02X}")
+    fields: list[int] = []
+    offset = 0
+    for _ in range(3):
+        _, raw, offset = _read_tlv(pdu, offset)
+        fields.append(int.from_bytes(raw, "big", signed=True))
+    _, varbind_list, _ = _read_tlv(pdu, offset)
+    varbinds: list[SnmpVarBind] = []
+    offset = 0
+    while offset < len(varbind_list):
+        _, varbind, offset = _read_tlv(varbind_list, offset)
+        _, raw_oid, value_offset = _read_tlv(varbind, 0)
+        value_tag, raw_value, _ = _read_tlv(varbind, value_offset)
+        type_name, value = _decode_value(value_tag, raw_value)
+        varbinds.append(SnmpVarBind(_decode_oid(raw_oid), type_name, value))
+    return _Response(fields[0], fields[1], fields[2], varbinds)
+
+
+def oid_within(oid: str, base: str) -> bool:
+    """Return whether ``oid`` lies strictly below ``base`` in the OID tree."""
+    base_arcs = _oid_arcs(base)
+    arcs = _oid_arcs(oid)
+    return len(arcs) > len(base_arcs) and arcs[: len(base_arcs)] == base_arcs
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+class _EngineProtocol(asyncio.DatagramProtocol):
+    def __init__(self, engine: SnmpEngine) -> None:
+        self._engine = engine
+
+    def datagram_received(self, data: bytes, addr: tuple) -> None:
+        self._engine._on_datagram(data, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        logger.debug("snmp_engine_socket_error", extra={"error": str(exc)})
+
+
+class SnmpEngine:
+    """Multiplex SNMP requests for many agents over one socket per family.
+
+    An engine belongs to the event loop it was first used on; use
+    :func:`get_engine` to share one across coroutines on the same loop.
+    """
+
+    def __init__(self, *, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> None:
+        self._max_in_flight = max(1, int(max_in_flight))
+        self._semaphore: asyncio.Semaphore | None = None
+        self._transports: dict[int, asyncio.DatagramTransport] = {}
+        self._open_lock: asyncio.Lock | None = None
+        self._pending: dict[int, tuple[asyncio.Future[_Response], str]] = {}
+        self._next_request_id = secrets.randbelow(2**30) + 1
+
+    # -- public API ---------------------------------------------------------
+
+    async def get(self, target: SnmpTarget, oids: Sequence[str]) -> list[SnmpVarBind]:
+        """GET ``oids`` in one PDU.
+
+        SNMPv1 has no per-varbind exceptions, so a ``noSuchName`` answer drops
+        the offending OID and re-asks for the rest, matching ``snmpget``.
+        """
+        remaining = list(oids)
+        while remaining:
+            response = await self._request(target, _PDU_GET, remaining)
+            if response.error_status == 0:
+                return response.varbinds
+            if (
+                target.version == "1"
+                and response.error_status == _ERR_NO_SUCH_NAME
+                and 1 <= response.error_index <= len(remaining)
+            ):
+                del remaining[response.error_index - 1]
+                continue
+            raise SnmpResponseError(response.error_status, response.error_index)
+        return []
+
+    async def walk(
+        self,
+        target: SnmpTarget,
+        oid: str,
+        *,
+        bulk: bool = True,
+        max_repetitions: int = DEFAULT_MAX_REPETITIONS,
+    ) -> list[SnmpVarBind]:
+        """Walk the subtree under ``oid``.
+
+        Uses GETBULK for v2c when ``bulk`` is set and GETNEXT otherwise. As
+        with ``snmpwalk``, a subtree with no children is answered by a plain
+        GET of ``oid`` itself so scalar OIDs still return their value.
+        """
+        base = ".".join(str(arc) for arc in _oid_arcs(oid))
+        use_bulk = bulk and target.version == "2c"
+        repetitions = max(1, int(max_repetitions))
+        current = base
+        results: list[SnmpVarBind] = []
+        while True:
+            if use_bulk:
+                response = await self._request(
+                    target,
+                    _PDU_GETBULK,
+                    [current],
+                    field_a=0,
+                    field_b=repetitions,
+                )
+            else:
+                response = await self._request(target, _PDU_GETNEXT, [current])
+            if response.error_status == _ERR_TOO_BIG and use_bulk and repetitions > 1:
+                repetitions = max(1, repetitions // 2)
+                continue
+            if response.error_status == _ERR_NO_SUCH_NAME and target.version == "1":
+                break
+            if response.error_status:
+                raise SnmpResponseError(response.error_status, response.error_index)
+            finished = not response.varbinds
+            for varbind in response.varbinds:
+                if varbind.type == "endOfMibView" or not oid_within(varbind.oid, base):
+                    finished = True
+                    break
+                if _oid_arcs(varbind.oid) <= _oid_arcs(current):
+                    raise SnmpError(f"OID not increasing: {varbind.oid}")
+                results.append(varbind)
+                current = varbind.oid
+            if finished:
+                break
+        if not results:
+            scalar = await self.get(target, [base])
+            results = [varbind for varbind in scalar if not varbind.is_exception]
+        return results
+
+    def close(self) -> None:
+        for transport in self._transports.values():
+            transport.close()
+        self._transports.clear()
+        for future, _host in self._pending.values():
+            if not future.done():
+                future.set_exception(SnmpError("SNMP engine closed"))
+        self._pending.clear()
+
+    # -- internals ----------------------------------------------------------
+
+    def _allocate_request_id(self) -> int:
+        request_id = self._next_request_id
+        self._next_request_id = request_id + 1 if request_id < 2**31 - 1 else 1
+        return request_id
+
+    async def _transport_for(self, family: int) -> asyncio.DatagramTransport:
+        transport = self._transports.get(family)
+        if transport is not None and not transport.is_closing():
+            return transport
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+        async with self._open_lock:
+            transport = self._transports.get(family)
+            if transport is None or transport.is_closing():
+                loop = asyncio.get_running_loop()
+                transport, _ = await loop.create_datagram_endpoint(
+                    lambda: _EngineProtocol(self), family=family
+                )
+                self._transports[family] = transport
+        return transport
+
+    async def _request(
+        self,
+        target: SnmpTarget,
+        pdu_tag: int,
+        oids: Sequence[str],
+        *,
+        field_a: int = 0,
+        field_b: int = 0,
+    ) -> _Response:
+        version = target.version if target.version in _VERSION_CODES else None
+        if version is None:
+            raise SnmpError(f"Unsupported SNMP version: {target.version!r}")
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(target.host, target.port, type=socket.SOCK_DGRAM)
+        if not infos:
+            raise SnmpError(f"Cannot resolve SNMP host {target.host!r}")
+        family, _, _, _, address = infos[0]
+        transport = await self._transport_for(family)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_in_flight)
+
+        request_id = self._allocate_request_id()
+        message = _encode_message(
+            version,
+            target.community,
+            pdu_tag,
+            request_id,
+            oids,
+            field_a=field_a,
+            field_b=field_b,
+        )
+        future: asyncio.Future[_Response] = loop.create_future()
+        async with self._semaphore:
+            self._pending[request_id] = (future, str(address[0]))
+            try:
+                # Retries resend the same request-id, so a late answer to an
+                # earlier attempt still completes the request.
+                for _attempt in range(max(0, int(target.retries)) + 1):
+                    transport.sendto(message, address)
+                    try:
+                        return await asyncio.wait_for(
+                            asyncio.shield(future), timeout=target.timeout
+                        )
+                    except TimeoutError:
+                        continue
+            finally:
+                self._pending.pop(request_id, None)
+                if not future.done():
+                    future.cancel()
+        raise SnmpTimeoutError(f"Timeout: No Response from {target.host}")
+
+    def _on_datagram(self, data: bytes, addr: tuple) -> None:
+        try:
+            response = _decode_response(data)
+        except (SnmpError, ValueError) as exc:
+            logger.debug(
+                "snmp_engine_undecodable_datagram",
+                extra={"source": addr[0], "error": str(exc)},
+            )
+            return
+        pending = self._pending.get(response.request_id)
+        if pending is None:
+            return
+        future, expected_host = pending
+        if addr[0] != expected_host or future.done():
+            return
+        future.set_result(response)
+
+
+_ENGINES: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SnmpEngine] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_engine() -> SnmpEngine:
+    """Return the shared engine for the running event loop."""
+    loop = asyncio.get_running_loop()
+    engine = _ENGINES.get(loop)
+    if engine is None:
+        engine = SnmpEngine()
+        _ENGINES[loop] = engine
+    return engine
+
+
+def run_blocking(operation: Callable[[SnmpEngine], Awaitable[T]]) -> T:
+    """Run ``operation`` on a private engine from synchronous code.
+
+    Sync callers (Celery tasks, thread-pool probes) get a short-lived loop and
+    socket. When invoked from a thread that already runs a loop, the work is
+    moved to a helper thread rather than nesting loops.
+    """
+
+    async def _main() -> T:
+        engine = SnmpEngine()
+        try:
+            return await operation(engine)
+        finally:
+            engine.close()
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_main())
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, _main()).result()
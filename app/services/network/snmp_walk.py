@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import shutil
 import subprocess  # nosec
 from typing import Any
 
+from app.config import settings
 from app.services.credential_crypto import decrypt_credential
+from app.services.network.snmp_engine import (
+    SnmpEngine,
+    SnmpError,
+    SnmpTarget,
+    SnmpVarBind,
+    get_engine,
+    run_blocking,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +46,34 @@ def run_simple_v2c_walk(
     Returns:
         List of SNMP response lines
     """
+    host, community = _v2c_host_and_community(linked)
+    use_timeout, use_bulk, use_max_reps = _walk_options(
+        linked, timeout=timeout, bulk=bulk, max_repetitions=max_repetitions
+    )
+
+    # Select command and build arguments
+    if use_bulk and shutil.which("snmpbulkwalk"):
+        cmd = "snmpbulkwalk"
+        # -Cr<N> sets max-repetitions for GetBulk PDU efficiency
+        args = [cmd, "-v2c", f"-Cr{use_max_reps}", "-c", community, host, oid]
+    else:
+        cmd = "snmpwalk"
+        args = [cmd, "-v2c", "-c", community, host, oid]
+
+    result = subprocess.run(  # noqa: S603
+        args,
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=use_timeout,
+    )
+    if result.returncode != 0:
+        err = (result.stderr or result.stdout or "SNMP walk failed").strip()
+        raise RuntimeError(f"{oid}: {err}")
+    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+
+
+def _v2c_host_and_community(linked: Any) -> tuple[str, str]:
     host = linked.mgmt_ip or linked.hostname
     if not host:
         raise RuntimeError("Missing SNMP host")
@@ -48,8 +86,17 @@ def run_simple_v2c_walk(
     )
     if not community:
         raise RuntimeError("SNMP community is not configured")
+    return host, community
 
-    # Resolve settings: explicit param > per-OLT attribute > default
+
+def _walk_options(
+    linked: Any,
+    *,
+    timeout: int | None,
+    bulk: bool | None,
+    max_repetitions: int | None,
+) -> tuple[int, bool, int]:
+    """Resolve settings: explicit param > per-OLT attribute > default."""
     use_timeout = timeout
     if use_timeout is None:
         use_timeout = (
@@ -66,24 +113,109 @@ def run_simple_v2c_walk(
             getattr(linked, "snmp_bulk_max_repetitions", None)
             or DEFAULT_BULK_MAX_REPETITIONS
         )
+    return int(use_timeout), bool(use_bulk), int(use_max_reps)
 
-    # Select command and build arguments
-    if use_bulk and shutil.which("snmpbulkwalk"):
-        cmd = "snmpbulkwalk"
-        # -Cr<N> sets max-repetitions for GetBulk PDU efficiency
-        args = [cmd, "-v2c", f"-Cr{use_max_reps}", "-c", community, host, oid]
-    else:
-        cmd = "snmpwalk"
-        args = [cmd, "-v2c", "-c", community, host, oid]
 
-    result = subprocess.run(  # noqa: S603
-        args,
-        capture_output=True,
-        text=True,
-        check=False,
-        timeout=use_timeout,
+def native_engine_enabled() -> bool:
+    """Whether SNMP goes through the in-process engine (``SNMP_ENGINE``)."""
+    return settings.snmp_engine != "subprocess"
+
+
+def varbinds_from_walk_lines(lines: list[str]) -> list[SnmpVarBind]:
+    """Convert net-snmp ``OID = TYPE: value`` lines into varbinds.
+
+    Lets the subprocess fallback feed the same typed consumers as the native
+    engine; values stay strings because the type prefix is all the CLI gives.
+    """
+    varbinds: list[SnmpVarBind] = []
+    for line in lines:
+        if " = " not in line:
+            continue
+        oid_part, value_part = line.split(" = ", 1)
+        oid = oid_part.strip()
+        if oid.startswith("iso."):
+            oid = "1." + oid[len("iso.") :]
+        oid = oid.lstrip(".")
+        type_name, _, raw_value = value_part.partition(": ")
+        if not raw_value:
+            type_name, raw_value = "", value_part
+        value = raw_value.strip().strip('"')
+        if value.lower().startswith("no such"):
+            varbinds.append(SnmpVarBind(oid, "noSuchInstance", None))
+            continue
+        varbinds.append(SnmpVarBind(oid, type_name.strip(), value))
+    return varbinds
+
+
+async def walk_v2c_async(
+    linked: Any,
+    oid: str,
+    *,
+    timeout: int | None = None,
+    bulk: bool | None = None,
+    max_repetitions: int | None = None,
+    engine: SnmpEngine | None = None,
+) -> list[SnmpVarBind]:
+    """Walk ``oid`` on the native engine without leaving the event loop.
+
+    ``timeout`` (or the per-OLT setting) bounds the whole walk, as it bounds
+    the subprocess; individual PDUs use the engine's short per-request timeout
+    so a lost datagram is retried instead of stalling the walk.
+    """
+    host, community = _v2c_host_and_community(linked)
+    use_timeout, use_bulk, use_max_reps = _walk_options(
+        linked, timeout=timeout, bulk=bulk, max_repetitions=max_repetitions
+    )
+    target = SnmpTarget(
+        host=linked.mgmt_ip or linked.hostname,
+        port=int(linked.snmp_port or 161),
+        community=community,
+        version="2c",
+    )
+    active_engine = engine or get_engine()
+    try:
+        return await asyncio.wait_for(
+            active_engine.walk(
+                target, oid, bulk=use_bulk, max_repetitions=use_max_reps
+            ),
+            timeout=use_timeout,
+        )
+    except TimeoutError:
+        raise SnmpError(f"{oid}: Timeout: No Response from {host}") from None
+    except SnmpError as exc:
+        raise SnmpError(f"{oid}: {exc}") from exc
+
+
+def walk_v2c_varbinds(
+    linked: Any,
+    oid: str,
+    *,
+    timeout: int | None = None,
+    bulk: bool | None = None,
+    max_repetitions: int | None = None,
+) -> list[SnmpVarBind]:
+    """Walk ``oid`` and return typed varbinds.
+
+    Uses the native engine unless ``SNMP_ENGINE=subprocess``, in which case
+    the net-snmp output of :func:`run_simple_v2c_walk` is converted so callers
+    see one shape either way.
+    """
+    if not native_engine_enabled():
+        lines = run_simple_v2c_walk(
+            linked,
+            oid,
+            timeout=timeout,
+            bulk=bulk,
+            max_repetitions=max_repetitions,
+        )
+        return varbinds_from_walk_lines(lines)
+    return run_blocking(
+        lambda engine: walk_v2c_async(
+            linked,
+            oid,
+            timeout=timeout,
+            bulk=bulk,
+            max_repetitions=max_repetitions,
+            engine=engine,
+        )
     )
-    if result.returncode != 0:
-        err = (result.stderr or result.stdout or "SNMP walk failed").strip()
-        raise RuntimeError(f"{oid}: {err}")
-    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
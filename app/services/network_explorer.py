@@ -848,6 +848,20 @@ def _device_view(db, device_id) -> NetworkGraphView | None:
                 kind="access",
             )
         )
+    downstream_count = affected.downstream_subscription_count(db, device.id) or 0
+    if downstream_count > subscription_count:
+        cohort = _cohort_node(
+            f"cohort:downstream-subscriptions:{device.id}",
+            f"{downstream_count} subscriptions at or below this device",
+        )
+        nodes.append(cohort)
+        edges.append(
+            NetworkGraphEdge(
+                source_id=cohort.id,
+                target_id=f"device:{device.id}",
+                kind="forwarding",
+            )
+        )
     return _view("device", device_id, nodes, edges)
 
 
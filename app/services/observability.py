@@ -50,6 +50,8 @@ _STATE_SNAPSHOT_SPECS = {
     "celery_queues": {"max_observations": 64, "ttl_seconds": 86_400},
     "credentials": {"max_observations": 500, "ttl_seconds": 7 * 86_400},
     "database_pressure": {"max_observations": 16, "ttl_seconds": 86_400},
+    # Pending depth and oldest age per outbox dispatch lane (core, external).
+    "event_outbox": {"max_observations": 8, "ttl_seconds": 86_400},
     "field_location_retention": {
         "max_observations": 8,
         "ttl_seconds": 7 * 86_400,
@@ -5,6 +5,11 @@ scraped by the web ``/metrics`` endpoint (no multiprocess mode). The poller
 writes a small JSON health snapshot to Redis each cycle and the web-process
 collector (``app.metrics._PollerHealthCollector``) reads it on scrape.
 
+In shard mode (``BANDWIDTH_POLLER_SHARD_MODE``) every poller process writes
+its own snapshot into the :data:`POLLER_SHARD_HEALTH_KEY` hash and
+:func:`load_poller_health` folds them into one fleet-wide snapshot, so the
+collector and operational checks see the same shape either way.
+
 Kept dependency-light (just redis + json) so ``app.metrics`` can import it
 without pulling in the poller module's heavy RouterOS deps.
 """
@@ -16,6 +21,11 @@ import os
 from typing import Any
 
 POLLER_HEALTH_KEY = os.getenv("BANDWIDTH_POLLER_HEALTH_KEY", "bandwidth:poller:health")
+# Shard mode: member id -> that shard's snapshot, and member id -> lease
+# heartbeat (unix time). Members whose lease lapsed are removed from both.
+POLLER_SHARD_HEALTH_KEY = f"{POLLER_HEALTH_KEY}:shards"
+POLLER_SHARD_MEMBERS_KEY = f"{POLLER_HEALTH_KEY}:members"
+_MAX_DEVICE_FAILURES = 100
 
 _redis_client: Any = None
 
@@ -35,12 +45,53 @@ def _get_redis() -> Any:
     return _redis_client
 
 
+def aggregate_health_snapshots(snapshots: list[dict[str, Any]]) -> dict[str, Any]:
+    """Fold per-shard snapshots into one fleet-wide snapshot.
+
+    Device counts add up; the cycle time is the slowest shard's and ``ts`` the
+    oldest shard's, so the liveness age still grows if any shard stalls.
+    """
+    failures = [
+        failure
+        for snapshot in snapshots
+        for failure in snapshot.get("device_failures") or []
+    ]
+    failures.sort(
+        key=lambda item: (
+            -int(item.get("consecutive_failures") or 0),
+            str(item.get("name") or "").lower(),
+        )
+    )
+    cycles = [
+        s["cycle_seconds"] for s in snapshots if s.get("cycle_seconds") is not None
+    ]
+    stamps = [str(s["ts"]) for s in snapshots if s.get("ts")]
+    return {
+        "devices_total": sum(int(s.get("devices_total") or 0) for s in snapshots),
+        "devices_ok": sum(int(s.get("devices_ok") or 0) for s in snapshots),
+        "devices_failing": sum(int(s.get("devices_failing") or 0) for s in snapshots),
+        "device_failures": failures[:_MAX_DEVICE_FAILURES],
+        "cycle_seconds": max(cycles) if cycles else None,
+        "poll_count": min(
+            (int(s.get("poll_count") or 0) for s in snapshots), default=0
+        ),
+        # ISO-8601 UTC strings from the same writer sort chronologically.
+        "ts": min(stamps) if stamps else None,
+        "shards": len(snapshots),
+    }
+
+
 def load_poller_health() -> dict[str, Any] | None:
     """Latest poller health snapshot, or None. Never raises (scrape path)."""
     try:
         client = _get_redis()
         if client is None:
             return None
+        shards = client.hgetall(POLLER_SHARD_HEALTH_KEY)
+        if shards:
+            return aggregate_health_snapshots(
+                [json.loads(raw) for raw in shards.values()]
+            )
         raw = client.get(POLLER_HEALTH_KEY)
         if not raw:
             return None
@@ -8,6 +8,10 @@ Source of truth: dotmac_sub Postgres
 
 No external BSS calls. No double-source. Idempotent (DELETE + INSERT per user).
 
+``populate`` is the full pass (drift repair). ``populate_changed`` is the
+incremental pass: it drains the ``radius_projection_changes`` journal and
+rewrites only logins whose projected rows differ from the target's.
+
 Usage:
   docker exec -e PYTHONPATH=/app -w /app dotmac_sub_app \\
       python -m app.services.radius_population --execute
@@ -25,7 +29,17 @@ from dataclasses import dataclass
 from typing import cast
 
 import psycopg
-from sqlalchemy import Boolean, Column, Integer, String, delete, insert, select, text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Integer,
+    String,
+    delete,
+    func,
+    insert,
+    select,
+    text,
+)
 from sqlalchemy.orm import joinedload
 
 from app.db import SessionLocal
@@ -62,6 +76,11 @@ SUSPENDED_ADDRESS_LIST = DEFAULT_SUSPENDED_ADDRESS_LIST
 
 RadiusAttribute = tuple[str, str, str]
 
+# Logins per IN (...) lookup when reading a target's current rows.
+_OBSERVED_BATCH_SIZE = 1000
+# Journal entries drained per incremental projection pass.
+PROJECTION_JOURNAL_BATCH_SIZE = 5000
+
 
 @dataclass(frozen=True, slots=True)
 class RadiusProjectionWorkItem:
@@ -519,6 +538,62 @@ def _projection_tables(config: dict):
     return radcheck, radreply, radusergroup
 
 
+def _observed_projection_fingerprints(
+    conn,
+    config: dict,
+    usernames: list[str],
+    *,
+    access_groups: Mapping[str, str],
+) -> dict[str, str]:
+    """Fingerprint the target's current rows for ``usernames``.
+
+    Group rows are limited to the ones this writer owns (and deletes), so a
+    login carrying unrelated groups still compares equal.
+    """
+    radcheck, radreply, radusergroup = _projection_tables(config)
+    check_rows: list[Mapping[str, object]] = []
+    reply_rows: list[Mapping[str, object]] = []
+    group_rows: list[Mapping[str, object]] = []
+    owned_groups = sorted({name for name in access_groups.values() if name})
+    for start in range(0, len(usernames), _OBSERVED_BATCH_SIZE):
+        batch = usernames[start : start + _OBSERVED_BATCH_SIZE]
+        check_rows.extend(
+            conn.execute(
+                select(
+                    radcheck.c.username,
+                    radcheck.c.attribute,
+                    radcheck.c.op,
+                    radcheck.c.value,
+                ).where(radcheck.c.username.in_(batch))
+            ).mappings()
+        )
+        reply_rows.extend(
+            conn.execute(
+                select(
+                    radreply.c.username,
+                    radreply.c.attribute,
+                    radreply.c.op,
+                    radreply.c.value,
+                ).where(radreply.c.username.in_(batch))
+            ).mappings()
+        )
+        group_query = select(
+            radusergroup.c.username,
+            radusergroup.c.groupname,
+            radusergroup.c.priority,
+        ).where(radusergroup.c.username.in_(batch))
+        if not config["use_group"]:
+            if not owned_groups:
+                continue
+            group_query = group_query.where(radusergroup.c.groupname.in_(owned_groups))
+        group_rows.extend(conn.execute(group_query).mappings())
+    return fingerprint_observed_radius_rows(
+        radcheck_rows=check_rows,
+        radreply_rows=reply_rows,
+        radusergroup_rows=group_rows,
+    )
+
+
 def _write_radius_projection(
     conn,
     config: dict,
@@ -528,8 +603,14 @@ def _write_radius_projection(
     access_groups: dict[str, str],
     access_group_priority: int,
     group_routing_enabled: bool,
+    only_changed: bool = False,
 ) -> dict[str, int]:
-    """Idempotently project auth, reply, and owned group rows to one target."""
+    """Idempotently project auth, reply, and owned group rows to one target.
+
+    With ``only_changed`` the target's current rows are fingerprinted first
+    (under the same advisory lock) and logins whose rows already match are
+    neither deleted nor rewritten.
+    """
     if conn.dialect.name == "postgresql":
         conn.execute(text("SELECT pg_advisory_xact_lock(3281601275)"))
     radcheck, radreply, radusergroup = _projection_tables(config)
@@ -539,6 +620,45 @@ def _write_radius_projection(
         "radreply_written": 0,
         "radusergroup_written": 0,
     }
+    planned = [
+        (
+            item,
+            _projection_rows_for_item(
+                item,
+                config,
+                access_groups=access_groups,
+                access_group_priority=access_group_priority,
+                group_routing_enabled=group_routing_enabled,
+            ),
+        )
+        for item in work
+    ]
+    if only_changed:
+        observed = _observed_projection_fingerprints(
+            conn,
+            config,
+            sorted({item.username for item, _rows in planned} | set(delete_list)),
+            access_groups=access_groups,
+        )
+        changed = [
+            (item, rows)
+            for item, rows in planned
+            if observed.get(item.username)
+            != _projection_fingerprint(
+                radcheck_rows=rows[0], radreply_rows=rows[1], radusergroup_rows=rows[2]
+            )
+        ]
+        counts["unchanged_skipped"] = len(planned) - len(changed)
+        planned_names = {item.username for item, _rows in planned}
+        changed_names = {item.username for item, _rows in changed}
+        # Rewritten logins are replaced; removed logins are deleted only while
+        # the target still holds rows for them.
+        delete_list = [
+            name
+            for name in delete_list
+            if name in changed_names or (name not in planned_names and name in observed)
+        ]
+        planned = changed
     if delete_list:
         conn.execute(delete(radcheck).where(radcheck.c.username.in_(delete_list)))
         conn.execute(delete(radreply).where(radreply.c.username.in_(delete_list)))
@@ -557,23 +677,21 @@ def _write_radius_projection(
         if delete_group_rows:
             conn.execute(group_delete)
 
-    for item in work:
-        check_rows, reply_rows, group_rows = _projection_rows_for_item(
-            item,
-            config,
-            access_groups=access_groups,
-            access_group_priority=access_group_priority,
-            group_routing_enabled=group_routing_enabled,
-        )
-        if check_rows:
-            conn.execute(insert(radcheck), check_rows)
-            counts["radcheck_written"] += len(check_rows)
-        if reply_rows:
-            conn.execute(insert(radreply), reply_rows)
-            counts["radreply_written"] += len(reply_rows)
-        if group_rows:
-            conn.execute(insert(radusergroup), group_rows)
-            counts["radusergroup_written"] += len(group_rows)
+    # One executemany per table: the driver batches the inserts instead of a
+    # round trip per login.
+    check_rows = [row for _item, rows in planned for row in rows[0]]
+    reply_rows = [row for _item, rows in planned for row in rows[1]]
+    group_rows = [row for _item, rows in planned for row in rows[2]]
+    if check_rows:
+        conn.execute(insert(radcheck), check_rows)
+        counts["radcheck_written"] = len(check_rows)
+    if reply_rows:
+        conn.execute(insert(radreply), reply_rows)
+        counts["radreply_written"] = len(reply_rows)
+    if group_rows:
+        conn.execute(insert(radusergroup), group_rows)
+        counts["radusergroup_written"] = len(group_rows)
+    counts["logins_written"] = len(planned)
     return counts
 
 
@@ -606,8 +724,17 @@ def populate(
     *,
     source_db=None,
     include_expected_fingerprints: bool = False,
+    incremental: bool = False,
 ) -> dict[str, object]:
-    """Project the authoritative subscriber state to every configured target."""
+    """Project the authoritative subscriber state to every configured target.
+
+    ``incremental`` (requires ``only_usernames``) is the journal-driven mode:
+    only the requested logins and their subscribers' services are read, and
+    each target rewrites just the logins whose ``_projection_fingerprint``
+    differs from its current rows.
+    """
+    if incremental and only_usernames is None:
+        raise ValueError("incremental projection requires only_usernames")
     stats: dict[str, object] = {
         "subscriptions_considered": 0,
         "skipped_no_credential": 0,
@@ -673,23 +800,26 @@ def populate(
         # subs get a walled-garden radreply so suspension actually takes
         # effect at the BNG (hard-deleting their rows would fail-closed but
         # lose the captive pay-page treatment).
-        rows = (
-            db.execute(
-                select(Subscription)
-                .options(
-                    joinedload(Subscription.offer),
-                    joinedload(Subscription.radius_profile),
-                    joinedload(Subscription.subscriber).joinedload(Subscriber.reseller),
-                )
-                .where(
-                    Subscription.status.in_(ACTIVE_STATUSES | BLOCKED_STATUSES),
-                    Subscription.login.isnot(None),
-                )
+        source_query = (
+            select(Subscription)
+            .options(
+                joinedload(Subscription.offer),
+                joinedload(Subscription.radius_profile),
+                joinedload(Subscription.subscriber).joinedload(Subscriber.reseller),
+            )
+            .where(
+                Subscription.status.in_(ACTIVE_STATUSES | BLOCKED_STATUSES),
+                Subscription.login.isnot(None),
             )
-            .unique()
-            .scalars()
-            .all()
         )
+        if incremental:
+            # Every subscription of a login is read, so the per-login winner
+            # is the same one the full pass selects.
+            source_query = source_query.where(
+                Subscription.login.in_(sorted(only_usernames or ()))
+            )
+        rows = db.execute(source_query).unique().scalars().all()
+        scope_subscriber_ids = sorted({row.subscriber_id for row in rows})
         stats["subscriptions_considered"] = len(rows)
         logger.info(
             "considering %d active/blocked subscriptions with a login", len(rows)
@@ -697,11 +827,15 @@ def populate(
         login_projections = plan_login_radius_projections(db, rows)
 
         # Pre-fetch all AccessCredentials keyed by username
+        credential_query = select(AccessCredential).where(
+            AccessCredential.is_active.is_(True)
+        )
+        if incremental:
+            credential_query = credential_query.where(
+                AccessCredential.username.in_(sorted(only_usernames or ()))
+            )
         creds_by_username: dict[str, AccessCredential] = {
-            c.username: c
-            for c in db.scalars(
-                select(AccessCredential).where(AccessCredential.is_active.is_(True))
-            ).all()
+            c.username: c for c in db.scalars(credential_query).all()
         }
 
         # Pre-fetch RadiusProfiles by id so a credential-level profile override
@@ -722,18 +856,38 @@ def populate(
         from app.models.network import SubscriberAdditionalRoute
 
         subscriber_service_counts: dict = {}
-        for row in rows:
-            subscriber_service_counts[row.subscriber_id] = (
-                subscriber_service_counts.get(row.subscriber_id, 0) + 1
+        if incremental:
+            # Legacy subscriber-keyed routes/addresses apply only to a
+            # subscriber with one projected service, counted over all of them.
+            subscriber_service_counts = dict(
+                db.execute(
+                    select(Subscription.subscriber_id, func.count())
+                    .where(
+                        Subscription.status.in_(ACTIVE_STATUSES | BLOCKED_STATUSES),
+                        Subscription.login.isnot(None),
+                        Subscription.subscriber_id.in_(scope_subscriber_ids),
+                    )
+                    .group_by(Subscription.subscriber_id)
+                )
+                .tuples()
+                .all()
             )
+        else:
+            for row in rows:
+                subscriber_service_counts[row.subscriber_id] = (
+                    subscriber_service_counts.get(row.subscriber_id, 0) + 1
+                )
 
         routes_by_subscription: dict = {}
         legacy_routes_by_subscriber: dict = {}
-        for r in db.scalars(
-            select(SubscriberAdditionalRoute).where(
-                SubscriberAdditionalRoute.is_active.is_(True)
+        route_query = select(SubscriberAdditionalRoute).where(
+            SubscriberAdditionalRoute.is_active.is_(True)
+        )
+        if incremental:
+            route_query = route_query.where(
+                SubscriberAdditionalRoute.subscriber_id.in_(scope_subscriber_ids)
             )
-        ).all():
+        for r in db.scalars(route_query).all():
             target = (
                 routes_by_subscription.setdefault(r.subscription_id, [])
                 if getattr(r, "subscription_id", None)
@@ -766,7 +920,7 @@ def populate(
         ipv4_primary_by_subscription: dict = {}
         ipv4_candidates_by_subscription: dict = {}
         legacy_ipv4_candidates_by_subscriber: dict = {}
-        for sid, subscription_id, is_primary, addr in db.execute(
+        ipv4_query = (
             select(
                 IPAssignment.subscriber_id,
                 IPAssignment.subscription_id,
@@ -776,7 +930,12 @@ def populate(
             .join(IPv4Address, IPAssignment.ipv4_address_id == IPv4Address.id)
             .where(IPAssignment.is_active.is_(True))
             .where(IPAssignment.ip_version == IPVersion.ipv4)
-        ).all():
+        )
+        if incremental:
+            ipv4_query = ipv4_query.where(
+                IPAssignment.subscriber_id.in_(scope_subscriber_ids)
+            )
+        for sid, subscription_id, is_primary, addr in db.execute(ipv4_query).all():
             if sid and addr:
                 if subscription_id:
                     ipv4_candidates_by_subscription.setdefault(
@@ -798,14 +957,17 @@ def populate(
         if pd_enabled():
             from app.models.network import Ipv6DelegatedPrefix, Ipv6PrefixState
 
-            for sid, subscription_id, prefix, plen in db.execute(
-                select(
-                    Ipv6DelegatedPrefix.subscriber_id,
-                    Ipv6DelegatedPrefix.subscription_id,
-                    Ipv6DelegatedPrefix.prefix,
-                    Ipv6DelegatedPrefix.prefix_length,
-                ).where(Ipv6DelegatedPrefix.state == Ipv6PrefixState.assigned)
-            ).all():
+            pd_query = select(
+                Ipv6DelegatedPrefix.subscriber_id,
+                Ipv6DelegatedPrefix.subscription_id,
+                Ipv6DelegatedPrefix.prefix,
+                Ipv6DelegatedPrefix.prefix_length,
+            ).where(Ipv6DelegatedPrefix.state == Ipv6PrefixState.assigned)
+            if incremental:
+                pd_query = pd_query.where(
+                    Ipv6DelegatedPrefix.subscriber_id.in_(scope_subscriber_ids)
+                )
+            for sid, subscription_id, prefix, plen in db.execute(pd_query).all():
                 if sid and prefix:
                     value = f"{prefix}/{plen}"
                     if subscription_id:
@@ -1058,6 +1220,7 @@ def populate(
                     access_groups=access_groups,
                     access_group_priority=access_group_priority,
                     group_routing_enabled=group_routing_enabled,
+                    only_changed=incremental,
                 )
                 if not scoped:
                     counts.update(
@@ -1120,6 +1283,60 @@ def reconcile_usernames(
     return populate(dry_run=dry_run, only_usernames=targets, source_db=source_db)
 
 
+def populate_changed(
+    dry_run: bool = True,
+    *,
+    source_db=None,
+    limit: int = PROJECTION_JOURNAL_BATCH_SIZE,
+) -> dict[str, object]:
+    """Incremental projection driven by the ``radius_projection_changes`` journal.
+
+    Drains up to ``limit`` journal entries and runs ``populate`` in incremental
+    mode for their logins. Each target rewrites only the logins whose projected
+    rows changed. The entries are deleted once every target is written; after a
+    failure they stay queued for the next pass. Entries journaled during the
+    pass are left for the next one. The full ``populate`` pass remains the drift
+    repair for inputs the journal does not cover.
+    """
+    from app.models.radius import RadiusProjectionChange
+
+    db = source_db or SessionLocal()
+    owns_db = source_db is None
+    try:
+        entries = db.execute(
+            select(RadiusProjectionChange.id, RadiusProjectionChange.username)
+            .order_by(RadiusProjectionChange.created_at)
+            .limit(limit)
+        ).all()
+        usernames = {username for _id, username in entries if username}
+        if not usernames:
+            stats: dict[str, object] = {
+                "journal_entries": 0,
+                "projected_logins": 0,
+                "projection_complete": True,
+            }
+        else:
+            stats = populate(
+                dry_run=dry_run,
+                only_usernames=usernames,
+                source_db=db,
+                incremental=True,
+            )
+            stats["journal_entries"] = len(entries)
+        if entries and not dry_run:
+            entry_ids = [entry_id for entry_id, _username in entries]
+            db.execute(
+                delete(RadiusProjectionChange).where(
+                    RadiusProjectionChange.id.in_(entry_ids)
+                )
+            )
+            db.commit()
+        return stats
+    finally:
+        if owns_db:
+            db.close()
+
+
 def restore_projection_snapshot(db, snapshots: list[dict]) -> dict[str, object]:
     """Restore an operator-approved backup through the projection owner.
 
@@ -0,0 +1,97 @@
+"""Change journal feeding the incremental RADIUS projection.
+
+A ``before_flush`` hook records the login of every Subscription or
+AccessCredential whose projection inputs changed in that flush, as
+:class:`~app.models.radius.RadiusProjectionChange` rows in the same
+transaction. A rolled-back change therefore leaves no entry, and a committed
+one cannot be lost. A login change journals both the old and the new login,
+so the old one is removed from RADIUS.
+
+``app.tasks.radius_population.project_radius_changes`` drains the journal
+through :func:`app.services.radius_population.populate_changed`. Inputs that
+are not journaled (offers, profiles, IP ledger, bulk ``UPDATE`` statements)
+are repaired by the full ``populate`` pass.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+# Attributes that feed the projection built by ``radius_population.populate``.
+_SUBSCRIPTION_ATTRS = (
+    "login",
+    "status",
+    "access_state",
+    "ipv4_address",
+    "offer_id",
+    "radius_profile_id",
+    "subscriber_id",
+)
+_CREDENTIAL_ATTRS = (
+    "username",
+    "secret_hash",
+    "is_active",
+    "radius_profile_id",
+    "subscription_id",
+)
+
+
+def _logins(obj: Any, login_attr: str, attrs: Iterable[str], *, whole: bool) -> set:
+    """The logins an added/deleted (``whole``) or modified object touches."""
+    current = getattr(obj, login_attr, None)
+    if whole:
+        return {current} if current else set()
+    state = inspect(obj)
+    histories = [state.attrs[attr].history for attr in attrs]
+    if not any(history.has_changes() for history in histories):
+        return set()
+    logins = {current} if current else set()
+    # A renamed login must also be removed under its previous name.
+    logins.update(value for value in state.attrs[login_attr].history.deleted if value)
+    return logins
+
+
+def touched_logins(session: Session) -> dict[str, str]:
+    """``{login: source}`` for the projection-relevant changes pending flush."""
+    from app.models.catalog import AccessCredential, Subscription
+
+    touched: dict[str, str] = {}
+    attrs: tuple[str, ...]
+    for objects, whole in (
+        (session.new, True),
+        (session.dirty, False),
+        (session.deleted, True),
+    ):
+        for obj in objects:
+            if isinstance(obj, Subscription):
+                source, login_attr, attrs = "subscription", "login", _SUBSCRIPTION_ATTRS
+            elif isinstance(obj, AccessCredential):
+                source, login_attr, attrs = (
+                    "access_credential",
+                    "username",
+                    _CREDENTIAL_ATTRS,
+                )
+            else:
+                continue
+            for login in _logins(obj, login_attr, attrs, whole=whole):
+                touched.setdefault(str(login), source)
+    return touched
+
+
+@event.listens_for(Session, "before_flush")
+def _journal_projection_changes(
+    session: Session, _flush_context: object, _instances: object
+) -> None:
+    touched = touched_logins(session)
+    if not touched:
+        return
+    from app.models.radius import RadiusProjectionChange
+
+    session.add_all(
+        RadiusProjectionChange(username=login, source=source)
+        for login, source in sorted(touched.items())
+    )
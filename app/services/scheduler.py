@@ -37,6 +37,7 @@ PERMANENT_LIFECYCLE_TASKS = frozenset(
         "app.tasks.radius.run_enforcement_reconciler",
         "app.tasks.radius.reconcile_active_sessions",
         "app.tasks.radius_population.sync_device_login",
+        "app.tasks.radius_population.project_radius_changes",
         "app.tasks.usage.lift_expired_fup_enforcement",
         "app.tasks.provisioning.retry_pending_compensation_failures",
         "app.tasks.campaigns.process_due_campaigns",
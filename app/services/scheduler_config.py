@@ -253,6 +253,7 @@ def get_celery_config() -> dict:
             # Whole-base daily runs (4k+ subscriptions); the default 900s
             # limit can kill a catch-up billing or dunning pass mid-run.
             "app.tasks.billing.run_invoice_cycle": long_limits,
+            "app.tasks.billing.run_invoice_partition": long_limits,
             "app.tasks.collections.run_billing_enforcement": long_limits,
         }
     )
@@ -427,6 +428,20 @@ def build_beat_schedule() -> dict:
             enabled=credential_rotation_enabled,
             interval_seconds=86400,
         )
+        # API-key "last used" stamps are buffered in Redis by the auth
+        # dependency and written here in one statement per flush.
+        _sync_scheduled_task(
+            session,
+            name="api_key_usage_flush",
+            task_name="app.tasks.security.flush_api_key_usage",
+            enabled=True,
+            interval_seconds=max(
+                resolve_integer(
+                    session, SettingDomain.auth, "api_key_usage_flush_interval_seconds"
+                ),
+                15,
+            ),
+        )
         usage_admission_enabled = _scheduler_setting_enabled(
             session,
             SettingDomain.usage,
@@ -444,6 +459,12 @@ def build_beat_schedule() -> dict:
             session, SettingDomain.usage, "fup_evaluation_interval_seconds"
         )
         fup_evaluation_interval_seconds = max(fup_evaluation_interval_seconds, 60)
+        usage_recompute_interval_seconds = resolve_integer(
+            session,
+            SettingDomain.usage,
+            "usage_metering_recompute_interval_seconds",
+        )
+        usage_recompute_interval_seconds = max(usage_recompute_interval_seconds, 600)
         _sync_scheduled_task(
             session,
             name="usage_rating_runner",
@@ -585,6 +606,15 @@ def build_beat_schedule() -> dict:
         _retire_scheduled_task(
             session, "app.tasks.radius_population.refresh_radius_from_subs"
         )
+        # Journal-driven incremental projection: rewrites only the logins whose
+        # subscription/credential changed and whose projected rows differ.
+        _sync_scheduled_task(
+            session,
+            name="radius_projection_changes",
+            task_name="app.tasks.radius_population.project_radius_changes",
+            enabled=True,
+            interval_seconds=30,
+        )
         # stale overdue locks: money-adjacent, so DETECT-only (dry-run) — it
         # WARNs with the candidate count for an operator to clear after review,
         # rather than auto-clearing an overdue lock on a possibly-wrong "no debt".
@@ -628,6 +658,15 @@ def build_beat_schedule() -> dict:
             enabled=usage_admission_enabled,
             interval_seconds=usage_metering_interval_seconds,
         )
+        # Metering above applies only journaled octet deltas; this absolute
+        # recompute is its correctness check and corrects any drift.
+        _sync_scheduled_task(
+            session,
+            name="usage_metering_recompute",
+            task_name="app.tasks.usage.recompute_quota_usage",
+            enabled=usage_admission_enabled,
+            interval_seconds=usage_recompute_interval_seconds,
+        )
         # Evaluate FUP rules against the metered usage and apply / auto-lift
         # throttle/block. Keep this separate from daily usage rating; capped
         # plans need near-real-time enforcement.
@@ -1933,7 +1972,8 @@ def build_beat_schedule() -> dict:
         )
 
         # Durable event outbox recovery. The normal path dispatches immediately
-        # after commit; this runner claims rows left pending by a process crash.
+        # after commit; this runner fans rows left pending (process crash,
+        # outage backlog) out to key-ordered partition workers.
         event_dispatch_interval = resolve_integer(
             session, SettingDomain.scheduler, "event_dispatch_interval_seconds"
         )
@@ -225,3 +225,41 @@ def get_session_revocation_epoch(
     if _fallback_enabled():
         return fallback_epochs.get(str(principal_id))
     return None
+
+
+def latest_session_revocation_epoch(
+    prefix: str,
+    principal_ids: list[str],
+    fallback_epochs: dict[str, str],
+    *,
+    require_durable: bool = False,
+) -> str | None:
+    """The latest revocation epoch among ``principal_ids``, in one round trip.
+
+    With ``require_durable`` an unreadable store raises instead of reading as
+    "never revoked", for callers that trust a cached verdict on the answer.
+    """
+    stamps: list[str] = []
+    client = get_session_redis()
+    durable_read_succeeded = False
+    if client:
+        try:
+            raw_values = cast(
+                list[object],
+                client.mget([_epoch_key(prefix, pid) for pid in principal_ids]),
+            )
+            stamps.extend(_decode_redis_text(raw) for raw in raw_values if raw)
+            durable_read_succeeded = True
+        except redis.RedisError as exc:
+            logger.warning("Session revocation epoch read failed: %s", exc)
+    if require_durable and not durable_read_succeeded:
+        raise RuntimeError("Durable session revocation store is unavailable")
+    if _fallback_enabled():
+        stamps.extend(
+            fallback_epochs[str(pid)]
+            for pid in principal_ids
+            if str(pid) in fallback_epochs
+        )
+    if not stamps:
+        return None
+    return max(stamps, key=lambda stamp: datetime.fromisoformat(stamp))
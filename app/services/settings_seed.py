@@ -120,6 +120,12 @@ def seed_auth_settings(db: Session) -> None:
         value_type=SettingValueType.integer,
         value_text=os.getenv("CREDENTIAL_ROTATION_GRACE_DAYS", "7"),
     )
+    auth_settings.ensure_by_key(
+        db,
+        key="api_key_usage_flush_interval_seconds",
+        value_type=SettingValueType.integer,
+        value_text=os.getenv("API_KEY_USAGE_FLUSH_INTERVAL_SECONDS", "60"),
+    )
     auth_settings.ensure_by_key(
         db,
         key="jwt_algorithm",
@@ -1380,6 +1386,12 @@ def seed_scheduler_settings(db: Session) -> None:
         value_type=SettingValueType.integer,
         value_text=os.getenv("EVENT_DISPATCH_BATCH_SIZE", "100"),
     )
+    scheduler_settings.ensure_by_key(
+        db,
+        key="event_dispatch_partitions",
+        value_type=SettingValueType.integer,
+        value_text=os.getenv("EVENT_DISPATCH_PARTITIONS", "4"),
+    )
     for key, env_name, default in [
         ("crm_ticket_pull_interval_minutes", "CRM_TICKET_PULL_INTERVAL_MINUTES", "5"),
         ("crm_cache_list_seconds", "CRM_CACHE_LIST_SECONDS", "60"),
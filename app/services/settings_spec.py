@@ -234,6 +234,16 @@ SETTINGS_SPECS: list[SettingSpec] = [
         max_value=30,
         label="Previous credential key grace period (days)",
     ),
+    SettingSpec(
+        domain=SettingDomain.auth,
+        key="api_key_usage_flush_interval_seconds",
+        env_var="API_KEY_USAGE_FLUSH_INTERVAL_SECONDS",
+        value_type=SettingValueType.integer,
+        default=60,
+        min_value=15,
+        max_value=900,
+        label="API key last-used batch write interval (seconds)",
+    ),
     SettingSpec(
         domain=SettingDomain.auth,
         key="jwt_algorithm",
@@ -1076,6 +1086,14 @@ SETTINGS_SPECS: list[SettingSpec] = [
         default=60,
         min_value=60,
     ),
+    SettingSpec(
+        domain=SettingDomain.usage,
+        key="usage_metering_recompute_interval_seconds",
+        env_var="USAGE_METERING_RECOMPUTE_INTERVAL_SECONDS",
+        value_type=SettingValueType.integer,
+        default=3600,
+        min_value=600,
+    ),
     SettingSpec(
         domain=SettingDomain.usage,
         key="fup_evaluation_interval_seconds",
@@ -1099,6 +1117,24 @@ SETTINGS_SPECS: list[SettingSpec] = [
         default=60,
         min_value=10,
     ),
+    SettingSpec(
+        domain=SettingDomain.usage,
+        key="radius_accounting_import_batch_size",
+        env_var="RADIUS_ACCOUNTING_IMPORT_BATCH_SIZE",
+        value_type=SettingValueType.integer,
+        default=2000,
+        min_value=100,
+        max_value=20000,
+    ),
+    SettingSpec(
+        domain=SettingDomain.usage,
+        key="radius_accounting_import_max_rows",
+        env_var="RADIUS_ACCOUNTING_IMPORT_MAX_ROWS",
+        value_type=SettingValueType.integer,
+        default=20000,
+        min_value=500,
+        max_value=200000,
+    ),
     SettingSpec(
         domain=SettingDomain.usage,
         key="radius_accounting_source_stale_seconds",
@@ -1573,6 +1609,16 @@ SETTINGS_SPECS: list[SettingSpec] = [
         max_value=1000,
         label="Durable event outbox dispatch batch size",
     ),
+    SettingSpec(
+        domain=SettingDomain.scheduler,
+        key="event_dispatch_partitions",
+        env_var="EVENT_DISPATCH_PARTITIONS",
+        value_type=SettingValueType.integer,
+        default=4,
+        min_value=1,
+        max_value=32,
+        label="Durable event outbox dispatch partitions (parallel key-ordered workers)",
+    ),
     SettingSpec(
         domain=SettingDomain.scheduler,
         key="crm_ticket_pull_enabled",
@@ -3243,6 +3289,26 @@ SETTINGS_SPECS: list[SettingSpec] = [
         default=300,
         min_value=30,
     ),
+    SettingSpec(
+        domain=SettingDomain.network_monitoring,
+        key="infrastructure_interface_concurrency",
+        label="Native Poll Interface Counter Fan-out (devices)",
+        env_var="INFRASTRUCTURE_INTERFACE_CONCURRENCY",
+        value_type=SettingValueType.integer,
+        default=16,
+        min_value=1,
+        max_value=128,
+    ),
+    SettingSpec(
+        domain=SettingDomain.network_monitoring,
+        key="infrastructure_interface_deadline_seconds",
+        label="Native Poll Interface Counter Deadline per Device (seconds)",
+        env_var="INFRASTRUCTURE_INTERFACE_DEADLINE_SECONDS",
+        value_type=SettingValueType.integer,
+        default=15,
+        min_value=2,
+        max_value=120,
+    ),
     SettingSpec(
         domain=SettingDomain.network_monitoring,
         key="infrastructure_poll_skip_streak_threshold",
@@ -3389,6 +3455,15 @@ SETTINGS_SPECS: list[SettingSpec] = [
         default=300,
         min_value=0,
     ),
+    SettingSpec(
+        domain=SettingDomain.network_monitoring,
+        key="outage_syslog_grace_seconds",
+        label="Outage Syslog Burst Grace — Await Poll Corroboration (seconds)",
+        env_var="OUTAGE_SYSLOG_GRACE_SECONDS",
+        value_type=SettingValueType.integer,
+        default=600,
+        min_value=0,
+    ),
     SettingSpec(
         domain=SettingDomain.network_monitoring,
         key="celery_long_running_task_minutes",
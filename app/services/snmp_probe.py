@@ -1,12 +1,27 @@
-"""Direct SNMP probes for monitoring devices (reachability + IF-MIB counters)."""
+"""Direct SNMP probes for monitoring devices (reachability + IF-MIB counters).
+
+Probes go through the in-process SNMP engine by default; ``SNMP_ENGINE=
+subprocess`` switches back to forking ``snmpget``.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import shutil
 import subprocess  # nosec
+import time
 from dataclasses import dataclass
 
 from app.services.credential_crypto import decrypt_credential
+from app.services.network.snmp_engine import (
+    SnmpEngine,
+    SnmpError,
+    SnmpTarget,
+    SnmpTimeoutError,
+    get_engine,
+    run_blocking,
+)
+from app.services.network.snmp_walk import native_engine_enabled
 
 _SYS_DESCR_OID = "1.3.6.1.2.1.1.1.0"
 
@@ -49,6 +64,12 @@ def probe_snmp_reachability(
     proves the app/worker can reach UDP/161 with the configured community even
     when no SNMP items are attached yet.
     """
+    if native_engine_enabled():
+        return run_blocking(
+            lambda engine: probe_snmp_reachability_async(
+                device, timeout_seconds=timeout_seconds, engine=engine
+            )
+        )
     binary = shutil.which("snmpget")
     if not binary:
         return SnmpProbeResult(False, False, "snmpget_not_installed")
@@ -104,6 +125,56 @@ def probe_snmp_reachability(
     return SnmpProbeResult(True, False, error[:240])
 
 
+def _native_target(
+    device, *, timeout_seconds: int
+) -> tuple[SnmpTarget | None, str | None]:
+    """Build an engine target for a device, or ``(None, reason)`` if unusable."""
+    host = str(
+        getattr(device, "mgmt_ip", None) or getattr(device, "hostname", "") or ""
+    ).strip()
+    if not host:
+        return None, "missing_host"
+    version = _snmp_version(getattr(device, "snmp_version", None))
+    if version is None:
+        return None, "unsupported_snmp_version"
+    raw_community = getattr(device, "snmp_community", None)
+    community = decrypt_credential(raw_community) if raw_community else ""
+    if not community:
+        return None, "missing_snmp_community"
+    return (
+        SnmpTarget(
+            host=host,
+            port=int(getattr(device, "snmp_port", None) or 161),
+            community=community,
+            version=version,
+            timeout=max(1, int(timeout_seconds)),
+            retries=0,
+        ),
+        None,
+    )
+
+
+async def probe_snmp_reachability_async(
+    device,
+    *,
+    timeout_seconds: int = 2,
+    engine: SnmpEngine | None = None,
+) -> SnmpProbeResult:
+    """Native-engine variant of :func:`probe_snmp_reachability`."""
+    target, reason = _native_target(device, timeout_seconds=timeout_seconds)
+    if target is None:
+        return SnmpProbeResult(False, False, reason)
+    try:
+        await (engine or get_engine()).get(target, [_SYS_DESCR_OID])
+    except SnmpTimeoutError:
+        return SnmpProbeResult(True, False, "timeout")
+    except SnmpError as exc:
+        return SnmpProbeResult(True, False, str(exc)[:240])
+    except OSError as exc:
+        return SnmpProbeResult(True, False, exc.__class__.__name__)
+    return SnmpProbeResult(True, True)
+
+
 @dataclass(frozen=True)
 class InterfaceOctets:
     """Raw IF-MIB octet counter readings for one ifIndex."""
@@ -140,32 +211,42 @@ def fetch_interface_octets(
     snmp_indexes: list[int],
     *,
     timeout_seconds: int = 3,
+    deadline_seconds: float | None = None,
 ) -> dict[int, InterfaceOctets] | None:
     """Read in/out octet counters for the given ifIndexes in one sweep.
 
     Returns ``{ifIndex: InterfaceOctets}`` (indexes the agent didn't answer for
     are absent) or None when the device can't be queried at all (no snmpget,
-    no address/community, unsupported version, timeout).
+    no address/community, unsupported version, timeout). ``deadline_seconds``
+    bounds the whole device read across all OID chunks; a device that runs
+    past it also returns None.
     """
     if not snmp_indexes:
         return {}
+    if native_engine_enabled():
+        return run_blocking(
+            lambda engine: fetch_interface_octets_async(
+                device,
+                snmp_indexes,
+                timeout_seconds=timeout_seconds,
+                deadline_seconds=deadline_seconds,
+                engine=engine,
+            )
+        )
     target = _snmp_target(device)
     if target is None:
         return None
     prefix, host = target
 
-    version = _snmp_version(getattr(device, "snmp_version", None))
-    in_base = _IF_IN_OCTETS if version == "1" else _IF_HC_IN_OCTETS
-    out_base = _IF_OUT_OCTETS if version == "1" else _IF_HC_OUT_OCTETS
-
-    oid_map: dict[str, tuple[int, str]] = {}
-    for idx in snmp_indexes:
-        oid_map[f"{in_base}.{idx}"] = (idx, "in")
-        oid_map[f"{out_base}.{idx}"] = (idx, "out")
-
+    oid_map = _interface_oid_map(device, snmp_indexes)
     values: dict[str, int] = {}
     oids = list(oid_map)
+    started = time.monotonic()
     for start in range(0, len(oids), _MAX_OIDS_PER_REQUEST):
+        if deadline_seconds is not None and (
+            time.monotonic() - started >= deadline_seconds
+        ):
+            return None
         chunk = oids[start : start + _MAX_OIDS_PER_REQUEST]
         try:
             result = subprocess.run(  # noqa: S603
@@ -197,7 +278,72 @@ def fetch_interface_octets(
                 values[oid] = int(raw_value)
             except ValueError:
                 continue  # noSuchInstance / non-numeric varbind
+    return _readings_from_values(oid_map, values)
+
+
+async def fetch_interface_octets_async(
+    device,
+    snmp_indexes: list[int],
+    *,
+    timeout_seconds: int = 3,
+    deadline_seconds: float | None = None,
+    engine: SnmpEngine | None = None,
+) -> dict[int, InterfaceOctets] | None:
+    """Native-engine variant of :func:`fetch_interface_octets`.
+
+    Same contract; the counters arrive as typed integers, so nothing is parsed
+    out of text.
+    """
+    if not snmp_indexes:
+        return {}
+    if deadline_seconds is not None:
+        try:
+            return await asyncio.wait_for(
+                fetch_interface_octets_async(
+                    device,
+                    snmp_indexes,
+                    timeout_seconds=timeout_seconds,
+                    engine=engine,
+                ),
+                timeout=deadline_seconds,
+            )
+        except TimeoutError:
+            return None
+    target, _reason = _native_target(device, timeout_seconds=timeout_seconds)
+    if target is None:
+        return None
+    active_engine = engine or get_engine()
+    oid_map = _interface_oid_map(device, snmp_indexes)
+    values: dict[str, int] = {}
+    oids = list(oid_map)
+    for start in range(0, len(oids), _MAX_OIDS_PER_REQUEST):
+        chunk = oids[start : start + _MAX_OIDS_PER_REQUEST]
+        try:
+            varbinds = await active_engine.get(target, chunk)
+        except (SnmpError, OSError):
+            return None
+        for varbind in varbinds:
+            if isinstance(varbind.value, int) and not varbind.is_exception:
+                values[varbind.oid] = varbind.value
+    return _readings_from_values(oid_map, values)
+
+
+def _interface_oid_map(device, snmp_indexes: list[int]) -> dict[str, tuple[int, str]]:
+    """Map each counter OID to ``(ifIndex, direction)`` for the device's version."""
+    version = _snmp_version(getattr(device, "snmp_version", None))
+    in_base = _IF_IN_OCTETS if version == "1" else _IF_HC_IN_OCTETS
+    out_base = _IF_OUT_OCTETS if version == "1" else _IF_HC_OUT_OCTETS
+
+    oid_map: dict[str, tuple[int, str]] = {}
+    for idx in snmp_indexes:
+        oid_map[f"{in_base}.{idx}"] = (idx, "in")
+        oid_map[f"{out_base}.{idx}"] = (idx, "out")
+    return oid_map
+
 
+def _readings_from_values(
+    oid_map: dict[str, tuple[int, str]], values: dict[str, int]
+) -> dict[int, InterfaceOctets]:
     readings: dict[int, InterfaceOctets] = {}
     for oid, (idx, direction) in oid_map.items():
         if oid.lstrip(".") not in values:
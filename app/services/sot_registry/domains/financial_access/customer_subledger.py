@@ -96,7 +96,9 @@ SERVICES: tuple[SOTService, ...] = (
                 locking=(
                     "The calling owner holds its canonical account/record "
                     "locks; the idempotency unique constraint serialises "
-                    "duplicate posting attempts."
+                    "duplicate posting attempts. Staging also takes the "
+                    "account/currency/authority position snapshot row lock, "
+                    "which orders that scope's position sequence."
                 ),
                 idempotency=(
                     "One posting group per (producer owner, business "
@@ -120,6 +122,7 @@ SERVICES: tuple[SOTService, ...] = (
                     "financial.customer_subledger.posting_group_already_reversed",
                     "financial.customer_subledger.posting_group_not_found",
                     "financial.customer_subledger.posting_requires_owner_command",
+                    "financial.customer_subledger.position_snapshot_unavailable",
                 ),
                 mapping_owner="the deciding money owners and their adapters",
                 fail_closed_on=(
@@ -0,0 +1,49 @@
+"""Cross-process syslog-listener health snapshot.
+
+The syslog listener runs as its own process (``python -m app.syslog``), so
+Prometheus metrics set there are never scraped by the web ``/metrics``
+endpoint (no multiprocess mode). The listener writes its ingestion counters to
+Redis periodically and ``app.metrics._SyslogListenerHealthCollector`` reads
+them back on scrape — the same arrangement as ``poller_health``.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from typing import Any
+
+SYSLOG_HEALTH_KEY = "syslog:listener:health"
+# A snapshot older than this disappears, so a dead listener stops exporting
+# instead of freezing its last queue depth.
+SYSLOG_HEALTH_TTL_SECONDS = 300
+
+
+def publish_syslog_health(snapshot: dict[str, Any]) -> None:
+    """Store the listener's counters. Never raises (telemetry only)."""
+    try:
+        from app.services.redis_client import get_redis
+
+        client = get_redis()
+        if client is None:
+            return
+        payload = {**snapshot, "ts": datetime.now(UTC).isoformat()}
+        client.set(SYSLOG_HEALTH_KEY, json.dumps(payload), ex=SYSLOG_HEALTH_TTL_SECONDS)
+    except Exception:
+        pass
+
+
+def load_syslog_health() -> dict[str, Any] | None:
+    """Latest listener snapshot, or None. Never raises (scrape path)."""
+    try:
+        from app.services.redis_client import get_redis
+
+        client: Any = get_redis()
+        if client is None:
+            return None
+        raw = client.get(SYSLOG_HEALTH_KEY)
+        if not raw:
+            return None
+        return json.loads(raw)
+    except Exception:
+        return None
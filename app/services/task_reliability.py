@@ -146,9 +146,32 @@ TASK_RELIABILITY_CONTRACTS: dict[str, TaskReliabilityContract] = {
     "app.tasks.billing.run_billing_notifications": _c(
         "billing", STATE, GUARDED, STATUS
     ),
+    "app.tasks.billing.retry_invoice_partitions": _c(
+        "billing",
+        MANUAL,
+        STATEFUL,
+        STATUS,
+        "Operator redrive; re-queues only failed billing_run_partitions rows.",
+    ),
     "app.tasks.billing.run_invoice_cycle": _c(
         "billing", STATE, GUARDED, HEALTH, "Invoice creation must remain idempotent."
     ),
+    "app.tasks.billing.run_invoice_partition": _c(
+        "billing",
+        STATE,
+        STATEFUL,
+        STATUS,
+        "Claims its billing_run_partitions row; resumes from the partition "
+        "checkpoint and records failures there for retry_invoice_partitions.",
+    ),
+    "app.tasks.billing.verify_customer_position_snapshots": _c(
+        "billing",
+        MANUAL,
+        IDEMP,
+        STATUS,
+        "Operator check of derived position checkpoints; each scope commits "
+        "alone and a drifted checkpoint is rebuilt from the full fold.",
+    ),
     "app.tasks.catalog.expire_subscriptions": _c("catalog", SWEEP, GUARDED, HEALTH),
     "app.tasks.catalog.send_expiry_reminders": _c("catalog", SWEEP, GUARDED, STATUS),
     "app.tasks.catalog.apply_due_subscription_changes": _c(
@@ -302,8 +325,27 @@ TASK_RELIABILITY_CONTRACTS: dict[str, TaskReliabilityContract] = {
         SWEEP,
         PER_ITEM,
         STATUS,
-        "Beat-rerun drains committed outbox rows; per-event row state gates "
-        "delivery and records item-level failures.",
+        "Beat-rerun coordinator: publishes lane backlog and queues one "
+        "partition worker per key range plus the external lane; with one "
+        "partition it drains inline. Per-event row state gates delivery.",
+    ),
+    "app.tasks.events.dispatch_event_partition": _c(
+        "events",
+        SWEEP,
+        PER_ITEM,
+        STATUS,
+        "One per-partition advisory lock keeps a key range single-flight so "
+        "each key's events dispatch in order; SKIP LOCKED claims gate each row "
+        "and a key whose event fails waits for the next pass.",
+    ),
+    "app.tasks.events.dispatch_external_events": _c(
+        "events",
+        SWEEP,
+        PER_ITEM,
+        STATUS,
+        "Runs deferred external-stage handlers for rows flagged "
+        "external_pending; the flag clears in the same commit, and failures "
+        "join the row's manifest for retry_failed_events.",
     ),
     "app.tasks.reports.send_scheduled_ncc_report": _c(
         "reporting",
@@ -605,6 +647,14 @@ TASK_RELIABILITY_CONTRACTS: dict[str, TaskReliabilityContract] = {
         "a degraded outcome until desired and observed access converge.",
     ),
     "app.tasks.radius.run_radius_sync_job": _c("radius", SWEEP, IDEMP, STATUS),
+    "app.tasks.radius_population.project_radius_changes": _c(
+        "radius",
+        SWEEP,
+        IDEMP,
+        STATUS,
+        "Drains the radius_projection_changes journal; entries are deleted only "
+        "after every target is written, so the next run retries them.",
+    ),
     "app.tasks.radius_population.refresh_radius_from_subs": _c(
         "radius", SWEEP, IDEMP, STATUS
     ),
@@ -793,6 +843,14 @@ TASK_RELIABILITY_CONTRACTS: dict[str, TaskReliabilityContract] = {
         "Read-only RADIUS accounting/enforcement health pass; every run "
         "recomputes from source, so re-runs are idempotent.",
     ),
+    "app.tasks.security.flush_api_key_usage": _c(
+        "security",
+        SWEEP,
+        IDEMP,
+        LOG,
+        "Writes buffered API-key last-used stamps; the update only moves "
+        "last_used_at forward, so a replayed batch is a no-op.",
+    ),
     "app.tasks.security.run_scheduled_credential_rotation": _c(
         "security",
         SWEEP,
@@ -880,6 +938,14 @@ TASK_RELIABILITY_CONTRACTS: dict[str, TaskReliabilityContract] = {
     "app.tasks.usage.meter_usage_into_quota": _c("usage", STATE, GUARDED, HEALTH),
     "app.tasks.usage.notify_expiring_data_bundles": _c("usage", STATE, GUARDED, STATUS),
     "app.tasks.usage.reap_stale_radius_sessions": _c("usage", SWEEP, IDEMP, HEALTH),
+    "app.tasks.usage.recompute_quota_usage": _c(
+        "usage",
+        SWEEP,
+        IDEMP,
+        HEALTH,
+        "Absolute recompute behind incremental metering; runs under the "
+        "metering and accounting-import locks and skips when either is held.",
+    ),
     "app.tasks.usage.run_usage_rating": _c("usage", STATE, GUARDED, HEALTH),
     "app.tasks.vacation_holds.resume_expired_holds": _c(
         "customer", SWEEP, GUARDED, HEALTH
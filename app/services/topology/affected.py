@@ -12,6 +12,8 @@ from __future__ import annotations
 
 import logging
 from collections import deque
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
@@ -41,6 +43,10 @@ from app.services.network.signal_thresholds import (
     classify_signal,
     normalize_optical_signal_dbm,
 )
+from app.services.topology.forwarding_graph_cache import (
+    CompiledForwardingGraph,
+    load_compiled_forwarding_graph,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +84,73 @@ def list_network_nodes(session: Session) -> list[NetworkDevice]:
 def forwarding_graph_projection(session: Session) -> ForwardingGraph:
     """Return the Sub-owned, reviewed and currently observation-agreeing graph."""
 
-    return project_authoritative_forwarding_graph(session)
+    return compiled_forwarding_graph(session).graph
+
+
+def compiled_forwarding_graph(session: Session) -> CompiledForwardingGraph:
+    """The authoritative graph with its distance and downstream maps compiled.
+
+    Cached by report digest until declarations or observations change (see
+    ``forwarding_graph_cache``), so concurrent impact views share one
+    reconciliation instead of each repeating it.
+    """
+
+    return load_compiled_forwarding_graph(
+        "main",
+        project=lambda: project_authoritative_forwarding_graph(session),
+        compile_graph=lambda graph: _compile_forwarding_graph(session, graph),
+    )
+
+
+def _downstream_closure(adjacency: dict, dist: dict) -> dict:
+    """Every core-reachable node's strict downstream set, deepest nodes first.
+
+    Same expansion rule as ``downstream_nodes``: only edges moving away from
+    core (increasing distance) are followed; unorderable nodes do not expand.
+    """
+    closure: dict = {}
+    for nid in sorted(dist, key=dist.__getitem__, reverse=True):
+        below: set = set()
+        for nb in adjacency.get(nid, ()):
+            nb_d = dist.get(nb)
+            if nb_d is not None and nb_d > dist[nid]:
+                below.add(nb)
+                below |= closure[nb]
+        closure[nid] = frozenset(below)
+    return closure
+
+
+def _compile_forwarding_graph(
+    session: Session, graph: ForwardingGraph
+) -> CompiledForwardingGraph:
+    dist = _dist_to_core(
+        session, adjacency=graph.adjacency, root_ids=graph.root_device_ids
+    )
+    downstream = _downstream_closure(graph.adjacency, dist)
+    by_node = subscriptions_for_nodes(session, downstream)
+    sub_ids = {nid: {s.id for s in subs} for nid, subs in by_node.items()}
+    counts = {
+        nid: len(set().union(*(sub_ids.get(m, ()) for m in (nid, *below))))
+        for nid, below in downstream.items()
+    }
+    return CompiledForwardingGraph(
+        graph=graph,
+        dist_to_core=dist,
+        downstream=downstream,
+        downstream_subscription_counts=counts,
+    )
+
+
+def downstream_subscription_count(session: Session, node_id) -> int | None:
+    """Active subscriptions at/below a node from the compiled graph.
+
+    A quick count for impact previews; ``None`` when the node has no path to
+    core in the authoritative graph. ``affected_customers`` stays the
+    authority for the live subscription set.
+    """
+    return compiled_forwarding_graph(session).downstream_subscription_counts.get(
+        node_id
+    )
 
 
 def _dist_to_core(
@@ -86,9 +158,15 @@ def _dist_to_core(
     *,
     adjacency: dict | None = None,
     root_ids: set | frozenset | None = None,
-) -> dict:
-    """BFS distance to a declared core/border root over authoritative edges."""
+) -> Mapping:
+    """BFS distance to a declared core/border root over authoritative edges.
+
+    Without explicit maps this is the compiled graph's map, shared by every
+    caller in the process, so it comes back as a read-only view.
+    """
 
+    if adjacency is None and root_ids is None:
+        return MappingProxyType(compiled_forwarding_graph(session).dist_to_core)
     if adjacency is None or root_ids is None:
         graph = forwarding_graph_projection(session)
         if adjacency is None:
@@ -110,7 +188,7 @@ def downstream_nodes(
     session: Session,
     root: NetworkDevice,
     *,
-    dist: dict | None = None,
+    dist: Mapping | None = None,
     adjacency: dict | None = None,
 ) -> set:
     """Node ids at/below ``root`` — root plus nodes reachable moving strictly
@@ -118,9 +196,11 @@ def downstream_nodes(
     authoritative graph/root is unknown, so we never over-scope an outage.
 
     ``dist`` is the (root-independent) distance-to-core map and ``adjacency``
-    the authoritative adjacency; callers that invoke this repeatedly can pass
-    both maps to avoid repeating reconciliation and graph traversal.
+    the authoritative adjacency. Without either, the answer is a lookup in the
+    compiled graph's precomputed closure.
     """
+    if adjacency is None and dist is None:
+        return compiled_forwarding_graph(session).downstream_of(root.id)
     if adjacency is None:
         adjacency = forwarding_graph_projection(session).adjacency
     if dist is None:
@@ -661,7 +741,7 @@ def affected_customers(
     basestation: PopSite | None = None,
     fdh: FdhCabinet | None = None,
     *,
-    dist: dict | None = None,
+    dist: Mapping | None = None,
     adjacency: dict | None = None,
 ) -> dict:
     """Subscriptions affected by a failing node and/or basestation.
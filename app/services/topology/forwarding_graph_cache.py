@@ -0,0 +1,222 @@
+"""Compiled forwarding graph, cached by forwarding report digest.
+
+Projecting the authoritative forwarding graph runs the full
+``reconcile_forwarding_topology`` report, and every outage-impact query used to
+repeat it before walking the graph again. The compiled form (the projection
+plus distance-to-core, each node's downstream closure and its downstream
+subscription count) is stored in the app cache under the report's
+``report_sha256``. A short-lived pointer maps the current forwarding-topology
+version to that digest, so between changes an impact query is two cache reads
+and, within a process, no decode at all.
+
+Commits that touch declarations, observations or the device context they are
+checked against bump the version (``forwarding_graph_invalidation``). The
+pointer TTL bounds what those hooks cannot see: control observations expiring
+with time and raw SQL writes. Subscription counts are as fresh as the
+compiled entry's TTL; ``affected_customers`` always resolves subscriptions
+live.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from app.services import app_cache
+from app.services.network.forwarding_topology import ForwardingGraph
+
+logger = logging.getLogger(__name__)
+
+_NAMESPACE = "topology"
+_VERSION_TTL_SECONDS = 30 * 86_400
+# Bounds observation expiry and writes made outside the ORM.
+_POINTER_TTL_SECONDS = 60
+_COMPILED_TTL_SECONDS = 300
+_MEMO_SIZE = 4
+
+
+@dataclass(frozen=True)
+class CompiledForwardingGraph:
+    graph: ForwardingGraph
+    dist_to_core: dict[uuid.UUID, int]
+    downstream: dict[uuid.UUID, frozenset[uuid.UUID]]
+    downstream_subscription_counts: dict[uuid.UUID, int]
+
+    def downstream_of(self, node_id: Any) -> set:
+        """The node plus every node strictly further from core below it."""
+        return {node_id, *self.downstream.get(node_id, ())}
+
+
+def _version_key() -> str:
+    return app_cache.cache_key(_NAMESPACE, "forwarding-graph-version")
+
+
+def forwarding_graph_version() -> str:
+    value = app_cache.get_json(_version_key())
+    return str(value) if value else "0"
+
+
+def bump_forwarding_graph_version() -> bool:
+    """Retire the current pointer in every worker."""
+    return app_cache.set_json(_version_key(), uuid.uuid4().hex, _VERSION_TTL_SECONDS)
+
+
+def _pointer_key(vrf_name: str, version: str) -> str:
+    return app_cache.cache_key(_NAMESPACE, "forwarding-graph", vrf_name, version)
+
+
+def _compiled_key(vrf_name: str, report_sha256: str) -> str:
+    return app_cache.cache_key(
+        _NAMESPACE, "forwarding-graph", vrf_name, "compiled", report_sha256
+    )
+
+
+def _ids(values) -> list[str]:
+    return sorted(str(value) for value in values)
+
+
+def to_payload(compiled: CompiledForwardingGraph) -> dict[str, object]:
+    graph = compiled.graph
+    return {
+        "report_sha256": graph.report_sha256,
+        "adjacency": {str(k): _ids(v) for k, v in graph.adjacency.items()},
+        "upstream_by_downstream": {
+            str(k): str(v) for k, v in graph.upstream_by_downstream.items()
+        },
+        "declaration_by_downstream": {
+            str(k): str(v) for k, v in graph.declaration_by_downstream.items()
+        },
+        "root_device_ids": _ids(graph.root_device_ids),
+        "declaration_ids": [str(value) for value in graph.declaration_ids],
+        "dist_to_core": {str(k): v for k, v in compiled.dist_to_core.items()},
+        "downstream": {str(k): _ids(v) for k, v in compiled.downstream.items()},
+        "downstream_subscription_counts": {
+            str(k): v for k, v in compiled.downstream_subscription_counts.items()
+        },
+    }
+
+
+def from_payload(payload: dict[str, Any]) -> CompiledForwardingGraph:
+    as_id = uuid.UUID
+    graph = ForwardingGraph(
+        report_sha256=str(payload["report_sha256"]),
+        adjacency={
+            as_id(k): frozenset(as_id(v) for v in values)
+            for k, values in payload["adjacency"].items()
+        },
+        upstream_by_downstream={
+            as_id(k): as_id(v) for k, v in payload["upstream_by_downstream"].items()
+        },
+        declaration_by_downstream={
+            as_id(k): as_id(v) for k, v in payload["declaration_by_downstream"].items()
+        },
+        root_device_ids=frozenset(as_id(v) for v in payload["root_device_ids"]),
+        declaration_ids=tuple(as_id(v) for v in payload["declaration_ids"]),
+    )
+    return CompiledForwardingGraph(
+        graph=graph,
+        dist_to_core={as_id(k): int(v) for k, v in payload["dist_to_core"].items()},
+        downstream={
+            as_id(k): frozenset(as_id(v) for v in values)
+            for k, values in payload["downstream"].items()
+        },
+        downstream_subscription_counts={
+            as_id(k): int(v)
+            for k, v in payload["downstream_subscription_counts"].items()
+        },
+    )
+
+
+class _Memo:
+    """Decoded graphs by compiled key, so a hit costs no JSON decode."""
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._lock = Lock()
+        self._entries: OrderedDict[str, tuple[float, CompiledForwardingGraph]] = (
+            OrderedDict()
+        )
+
+    def get(self, key: str) -> CompiledForwardingGraph | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, compiled: CompiledForwardingGraph) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + _POINTER_TTL_SECONDS, compiled)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+
+
+_memo = _Memo(_MEMO_SIZE)
+
+
+def _cached(vrf_name: str, report_sha256: str) -> CompiledForwardingGraph | None:
+    key = _compiled_key(vrf_name, report_sha256)
+    compiled = _memo.get(key)
+    if compiled is not None:
+        return compiled
+    payload = app_cache.get_json(key)
+    if not isinstance(payload, dict):
+        return None
+    try:
+        compiled = from_payload(payload)
+    except (KeyError, TypeError, ValueError) as exc:
+        logger.warning("forwarding_graph_cache_decode_failed: %s", exc)
+        return None
+    _memo.put(key, compiled)
+    return compiled
+
+
+def load_compiled_forwarding_graph(
+    vrf_name: str,
+    *,
+    project: Callable[[], ForwardingGraph],
+    compile_graph: Callable[[ForwardingGraph], CompiledForwardingGraph],
+) -> CompiledForwardingGraph:
+    """The compiled graph for the current forwarding-topology version.
+
+    On a pointer miss one worker re-projects the graph (single-flight); the
+    compile step is skipped when that report digest is already cached.
+    """
+    pointer_key = _pointer_key(vrf_name, forwarding_graph_version())
+    digest = app_cache.get_json(pointer_key)
+    if isinstance(digest, str):
+        compiled = _cached(vrf_name, digest)
+        if compiled is not None:
+            return compiled
+
+    fresh: list[CompiledForwardingGraph] = []
+
+    def _refresh() -> str:
+        graph = project()
+        if _cached(vrf_name, graph.report_sha256) is None:
+            compiled = compile_graph(graph)
+            fresh.append(compiled)
+            key = _compiled_key(vrf_name, graph.report_sha256)
+            if app_cache.set_json(key, to_payload(compiled), _COMPILED_TTL_SECONDS):
+                _memo.put(key, compiled)
+        return graph.report_sha256
+
+    digest = app_cache.get_or_compute_json(pointer_key, _refresh, _POINTER_TTL_SECONDS)
+    if fresh:
+        return fresh[0]
+    compiled = _cached(vrf_name, str(digest))
+    if compiled is not None:
+        return compiled
+    # The compiled entry expired between the pointer write and this read.
+    return compile_graph(project())
@@ -0,0 +1,112 @@
+"""Retire the cached forwarding graph when its inputs change.
+
+The compiled graph (``forwarding_graph_cache``) is reached through a pointer
+keyed by a global forwarding-topology version. These hooks bump the version
+after the commit of any ORM flush or ORM bulk statement that changes
+forwarding declarations, control observations, LLDP links, or the device,
+interface, site and NAS context that declarations are checked against. Only
+the attributes the reconciliation reads count, so routine status polling does
+not churn the cache. Raw SQL and observations expiring with time are bounded
+by the pointer TTL.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.services.session_hooks import run_after_commit
+
+
+def _watched_attrs() -> dict[type, tuple[str, ...] | None]:
+    """Watched models mapped to the attributes that matter (None: all)."""
+    from app.models.catalog import NasDevice
+    from app.models.forwarding_topology import (
+        ForwardingControlObservation,
+        ForwardingTopologyDeclaration,
+    )
+    from app.models.network_monitoring import (
+        DeviceInterface,
+        NetworkDevice,
+        NetworkTopologyLink,
+        PopSite,
+    )
+
+    return {
+        ForwardingTopologyDeclaration: None,
+        ForwardingControlObservation: None,
+        NetworkTopologyLink: (
+            "source",
+            "is_active",
+            "source_device_id",
+            "source_interface_id",
+            "target_device_id",
+            "target_interface_id",
+        ),
+        NetworkDevice: ("is_active", "pop_site_id"),
+        DeviceInterface: ("device_id",),
+        PopSite: ("is_active",),
+        NasDevice: ("is_active", "network_device_id", "pop_site_id"),
+    }
+
+
+def _attrs_for(obj: object, watched: dict[type, tuple[str, ...] | None]):
+    for model, attrs in watched.items():
+        if isinstance(obj, model):
+            return True, attrs
+    return False, None
+
+
+def forwarding_inputs_changed(session: Session) -> bool:
+    """Whether the pending flush changes anything the forwarding report reads."""
+    watched = _watched_attrs()
+    for obj in (*session.new, *session.deleted):
+        if _attrs_for(obj, watched)[0]:
+            return True
+    for obj in session.dirty:
+        matched, attrs = _attrs_for(obj, watched)
+        if not matched:
+            continue
+        if attrs is None:
+            if session.is_modified(obj):
+                return True
+            continue
+        state = inspect(obj)
+        if any(state.attrs[attr].history.has_changes() for attr in attrs):
+            return True
+    return False
+
+
+def _schedule(session: Session) -> None:
+    def _apply(_db: Session) -> None:
+        from app.services.topology.forwarding_graph_cache import (
+            bump_forwarding_graph_version,
+        )
+
+        bump_forwarding_graph_version()
+
+    run_after_commit(session, _apply)
+
+
+@event.listens_for(Session, "before_flush")
+def _retire_on_flush(
+    session: Session, _flush_context: object, _instances: object
+) -> None:
+    if forwarding_inputs_changed(session):
+        _schedule(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _retire_on_bulk_statement(state: ORMExecuteState) -> None:
+    if not (state.is_update or state.is_delete or state.is_insert):
+        return
+    mapper = state.bind_mapper
+    if mapper is None:
+        return
+    if issubclass(mapper.class_, tuple(_watched_attrs())):
+        if not state.session.in_transaction():
+            # The hook runs before the statement autobegins; begin now so the
+            # bump waits for this statement's commit.
+            state.session.begin()
+        # A bulk statement does not say which attributes it touched.
+        _schedule(state.session)
@@ -586,6 +586,78 @@ def resolve_classifier_incident(
     _emit_outage_event(session, incident, "outage.resolved")
 
 
+# Classifications written by the syslog burst correlator all carry this prefix
+# (``syslog_pon_los``, ``syslog_olt_dying_gasp``, ...) until the poll-driven
+# reconcile claims the incident and replaces it with its own verdict.
+SYSLOG_BURST_CLASSIFICATION_PREFIX = "syslog_"
+# A burst is strong but single-source evidence (medium on the classifier's
+# low/medium/high scale) until the poll corroborates it.
+SYSLOG_BURST_CONFIDENCE = 0.6
+
+
+def is_syslog_burst_incident(incident: OutageIncident) -> bool:
+    """True while the incident's only evidence is a syslog burst."""
+    return (incident.classification or "").startswith(
+        SYSLOG_BURST_CLASSIFICATION_PREFIX
+    )
+
+
+def open_syslog_burst_incident(
+    session: Session,
+    *,
+    root_node: NetworkDevice,
+    affected_count: int,
+    classification: str,
+    confidence: float | None = SYSLOG_BURST_CONFIDENCE,
+    now: datetime,
+) -> tuple[OutageIncident, bool]:
+    """Find-or-open the classifier incident for a correlated syslog burst.
+
+    The seconds-level counterpart of the reconcile identity step: an incident
+    already open on ``root_node`` (from the poll or an earlier burst) absorbs
+    the burst — its count only grows and a clearing incident reopens — else a
+    fresh ``suspected`` incident opens. ``affected_count`` is the burst total
+    summed over every latched PON under ``root_node``, so a later PON burst on
+    the same OLT raises the count rather than being swallowed by the first.
+    Confirm/clear stays with the reconcile pass. Returns ``(incident, opened)``.
+    """
+    incident = find_open_classifier_incident(session, root_node_id=root_node.id)
+    if incident is None:
+        incident = open_classifier_incident(
+            session,
+            root_node=root_node,
+            affected_count=affected_count,
+            confidence=confidence,
+            classification=classification,
+            now=now,
+        )
+        return incident, True
+    if (incident.affected_count or 0) < affected_count:
+        update_classifier_snapshot(incident, affected_count=affected_count)
+    if incident.status == OutageStatus.clearing.value:
+        reopen_incident(session, incident)
+    return incident, False
+
+
+def discard_syslog_burst_incident(
+    session: Session, *, root_node_id
+) -> OutageIncident | None:
+    """Discard a still-uncorroborated syslog incident whose ONTs came back.
+
+    Only a ``suspected`` incident that the poll has not claimed is touched;
+    anything the classifier has seen keeps its normal debounce-down.
+    """
+    incident = find_open_classifier_incident(session, root_node_id=root_node_id)
+    if (
+        incident is None
+        or incident.status != OutageStatus.suspected.value
+        or not is_syslog_burst_incident(incident)
+    ):
+        return None
+    discard_incident(session, incident)
+    return incident
+
+
 def open_incident_for_path(
     session: Session,
     path,
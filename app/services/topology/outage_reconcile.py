@@ -66,6 +66,7 @@ from app.services.topology.outage import (
     confirm_incident,
     discard_incident,
     find_open_classifier_incident,
+    is_syslog_burst_incident,
     open_classifier_incident,
     reopen_incident,
     repoint_root,
@@ -91,6 +92,10 @@ CONFIRM_THRESHOLD_LARGE_DEFAULT = 20
 CONFIRM_THRESHOLD_MED_DEFAULT = 5
 # W_resolve (clearing -> resolved): sustained-recovery window, fixed default.
 RESOLVE_SECONDS_DEFAULT = 300
+# A suspected incident opened from a syslog LOS/dying-gasp burst
+# (``app.syslog.correlator``) is ahead of the poll by design, so it is not
+# discarded for lacking a classifier candidate until this grace has elapsed.
+SYSLOG_GRACE_SECONDS_DEFAULT = 600
 
 # Coarse classifier confidence label -> stored Float (the model column is Float;
 # localize_outage still returns the labelled band).
@@ -114,6 +119,7 @@ def _setting_int(session: Session, key: str, default: int) -> int:
 class _Windows:
     confirm: dict
     resolve: int
+    syslog_grace: int = SYSLOG_GRACE_SECONDS_DEFAULT
 
 
 def _resolve_windows(session: Session) -> _Windows:
@@ -150,6 +156,12 @@ def _resolve_windows(session: Session) -> _Windows:
     resolve = max(
         _setting_int(session, "outage_resolve_seconds", RESOLVE_SECONDS_DEFAULT), 0
     )
+    syslog_grace = max(
+        _setting_int(
+            session, "outage_syslog_grace_seconds", SYSLOG_GRACE_SECONDS_DEFAULT
+        ),
+        0,
+    )
     return _Windows(
         confirm={
             "small": small,
@@ -159,6 +171,7 @@ def _resolve_windows(session: Session) -> _Windows:
             "threshold_large": threshold_large,
         },
         resolve=resolve,
+        syslog_grace=syslog_grace,
     )
 
 
@@ -520,6 +533,14 @@ def reconcile_detected_outages(
         try:
             with session.begin_nested():
                 if incident.status == OutageStatus.suspected.value:
+                    if (
+                        is_syslog_burst_incident(incident)
+                        and _elapsed_seconds(now, incident.suspected_at)
+                        < windows.syslog_grace
+                    ):
+                        # Opened from syslog ahead of the poll; give the
+                        # classifier time to see it before calling it false.
+                        continue
                     # Recovered before W_confirm -> false positive, discard.
                     discard_incident(session, incident)
                     counters[OutageStatus.discarded.value] += 1
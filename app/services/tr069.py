@@ -1,6 +1,7 @@
 import logging
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, NamedTuple
 
 from billiard.exceptions import SoftTimeLimitExceeded
 from fastapi import HTTPException
@@ -60,11 +61,15 @@ from app.services.response import ListResponseMixin
 
 _ACS_CREDENTIAL_FIELDS = ("cwmp_password", "connection_request_password")
 _STALE_INFORM_SERVICE_APPLY_DAYS = 5
-# Commit the GenieACS device-sync upsert loop every N devices so a large ACS
-# inventory doesn't accumulate one long write transaction (row locks +
-# delayed autovacuum). Each device upsert is independent, so partial progress
-# on failure is fine.
-_GENIEACS_SYNC_COMMIT_BATCH = 200
+# The GenieACS device sync fetches, matches and commits one page of devices
+# at a time, so a large ACS inventory neither sits in memory as one response
+# nor accumulates one long write transaction (row locks + delayed autovacuum).
+_GENIEACS_SYNC_PAGE_SIZE = 500
+# Incremental syncs re-read this much history before the cursor: GenieACS
+# stamps ``_lastInform`` when a session starts but stores it when it ends.
+_GENIEACS_SYNC_OVERLAP = timedelta(minutes=10)
+# The periodic sync becomes a full reconcile once a day.
+_GENIEACS_FULL_SYNC_INTERVAL = timedelta(hours=24)
 # Commit the auto-link pass in batches too, for the same reason and so a
 # soft-time-limit interrupt mid-pass keeps the links it already made.
 _GENIEACS_AUTOLINK_COMMIT_BATCH = 200
@@ -661,6 +666,163 @@ def refresh_ont_status_snapshot(
     apply_status_snapshot(ont, snapshot)
 
 
+def _nbi_timestamp(value: datetime) -> str:
+    """Format a datetime the way the GenieACS NBI compares stored dates."""
+    return (
+        value.astimezone(UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    )
+
+
+def _genieacs_device_pages(
+    client: GenieACSClient,
+    *,
+    since: datetime | None,
+    projection: str,
+    page_size: int,
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield pages of GenieACS devices in ``_lastInform`` order from ``since``.
+
+    Pages are keyed on ``_lastInform`` rather than skipped by offset, so a
+    device that informs mid-run moves to a later page instead of shifting the
+    rest. Each page starts at the newest inform already seen and drops the
+    devices already returned at that instant, so equal timestamps on a page
+    boundary are neither skipped nor repeated.
+    """
+    cursor = since
+    seen_at_cursor: set[str] = set()
+    while True:
+        limit = page_size + len(seen_at_cursor)
+        page = client.list_devices(
+            query={"_lastInform": {"$gte": _nbi_timestamp(cursor)}} if cursor else None,
+            projection=projection,
+            sort={"_lastInform": 1},
+            limit=limit,
+        )
+        fresh = [
+            device
+            for device in page
+            if str(device.get("_id") or "") not in seen_at_cursor
+        ]
+        if not fresh:
+            return
+        yield fresh
+        if len(page) < limit:
+            return
+        newest = GenieACSClient._parse_timestamp(page[-1].get("_lastInform"))
+        if newest is None:
+            return
+        if newest != cursor:
+            cursor = newest
+            seen_at_cursor = set()
+        seen_at_cursor.update(
+            str(device.get("_id") or "")
+            for device in page
+            if GenieACSClient._parse_timestamp(device.get("_lastInform")) == newest
+        )
+
+
+class _ObservedCpe(NamedTuple):
+    genieacs_device_id: str
+    serial_number: str
+    normalized_serial: str
+    oui: str | None
+    product_class: str | None
+    connection_url: str | None
+    last_inform_at: datetime | None
+
+
+class _CpeSyncIndex:
+    """Existing CPE rows of one ACS server, keyed the ways the sync matches.
+
+    Each page of GenieACS devices loads its candidate rows with one query;
+    rows stay indexed for the rest of the run.
+    """
+
+    def __init__(self, acs_server_id: str) -> None:
+        self._acs_server_id = acs_server_id
+        self._by_device_id: dict[str, Tr069CpeDevice] = {}
+        self._by_serial: dict[str, Tr069CpeDevice] = {}
+        self._by_normalized_serial: dict[str, Tr069CpeDevice] = {}
+        self._by_connection_url: dict[str, Tr069CpeDevice] = {}
+
+    def add(self, device: Tr069CpeDevice) -> None:
+        for index, key in (
+            (self._by_device_id, device.genieacs_device_id),
+            (self._by_serial, device.serial_number),
+            (
+                self._by_normalized_serial,
+                normalize_tr069_serial(device.serial_number),
+            ),
+            (self._by_connection_url, device.connection_request_url),
+        ):
+            if key:
+                index.setdefault(key, device)
+
+    def load(self, db: Session, observed: list[_ObservedCpe]) -> None:
+        device_ids = {
+            item.genieacs_device_id
+            for item in observed
+            if item.genieacs_device_id not in self._by_device_id
+        }
+        serials = {
+            item.serial_number
+            for item in observed
+            if item.serial_number not in self._by_serial
+        }
+        normalized = {
+            item.normalized_serial
+            for item in observed
+            if item.normalized_serial
+            and item.normalized_serial not in self._by_normalized_serial
+        }
+        urls = {
+            item.connection_url
+            for item in observed
+            if item.connection_url
+            and item.connection_url not in self._by_connection_url
+        }
+        clauses = []
+        if device_ids:
+            clauses.append(Tr069CpeDevice.genieacs_device_id.in_(device_ids))
+        if serials:
+            clauses.append(Tr069CpeDevice.serial_number.in_(serials))
+        if normalized:
+            clauses.append(
+                _normalized_serial_expr(Tr069CpeDevice.serial_number).in_(normalized)
+            )
+        if urls:
+            clauses.append(Tr069CpeDevice.connection_request_url.in_(urls))
+        if not clauses:
+            return
+        rows = db.scalars(
+            select(Tr069CpeDevice)
+            .where(Tr069CpeDevice.acs_server_id == self._acs_server_id)
+            .where(or_(*clauses))
+            .order_by(Tr069CpeDevice.created_at, Tr069CpeDevice.id)
+        ).all()
+        for row in rows:
+            self.add(row)
+
+    def match(self, item: _ObservedCpe) -> Tr069CpeDevice | None:
+        # GenieACS id is stable and authoritative; then the exact serial, the
+        # serial without vendor formatting, and the connection URL that legacy
+        # or mis-parsed records still carry.
+        return (
+            self._by_device_id.get(item.genieacs_device_id)
+            or self._by_serial.get(item.serial_number)
+            or (
+                self._by_normalized_serial.get(item.normalized_serial)
+                if item.normalized_serial
+                else None
+            )
+            or (
+                self._by_connection_url.get(item.connection_url)
+                if item.connection_url
+                else None
+            )
+        )
+
+
 def _refresh_synced_ont_acs_observations(
     db: Session,
     *,
@@ -1130,12 +1292,73 @@ class CpeDevices(ListResponseMixin):
         db.commit()
 
     @staticmethod
-    def sync_from_genieacs(db: Session, acs_server_id: str) -> dict:
+    def _observe_genieacs_device(
+        client: GenieACSClient, device_data: dict
+    ) -> _ObservedCpe | None:
+        """The identity and inform state of one GenieACS device, or None to skip."""
+        # Extract GenieACS device ID (the authoritative identifier)
+        genieacs_device_id = str(device_data.get("_id") or "").strip()
+        if not genieacs_device_id:
+            logger.warning("Skipping GenieACS device without _id")
+            return None
+
+        oui, product_class, serial_number = CpeDevices._extract_identity(
+            client, device_data
+        )
+        if not serial_number:
+            logger.warning(
+                "Skipping GenieACS device without serial number: %s",
+                genieacs_device_id,
+            )
+            return None
+
+        # Skip GenieACS discovery service probes — these are not real devices
+        if oui == "DISCOVERYSERVICE" or product_class == "DISCOVERYSERVICE":
+            return None
+
+        # Extract connection request URL if available
+        connection_url = client.extract_parameter_value(
+            device_data, "Device.ManagementServer.ConnectionRequestURL"
+        ) or client.extract_parameter_value(
+            device_data,
+            "InternetGatewayDevice.ManagementServer.ConnectionRequestURL",
+        )
+
+        last_inform = device_data.get("_lastInform")
+        last_inform_at = None
+        if last_inform:
+            try:
+                last_inform_at = datetime.fromisoformat(
+                    last_inform.replace("Z", "+00:00")
+                )
+            except (ValueError, AttributeError):
+                pass
+
+        return _ObservedCpe(
+            genieacs_device_id=genieacs_device_id,
+            serial_number=serial_number,
+            normalized_serial=normalize_tr069_serial(serial_number),
+            oui=oui,
+            product_class=product_class,
+            connection_url=CpeDevices._clip_text(connection_url, 255),
+            last_inform_at=last_inform_at,
+        )
+
+    @staticmethod
+    def sync_from_genieacs(
+        db: Session, acs_server_id: str, *, full: bool | None = None
+    ) -> dict:
         """Sync devices from GenieACS to local database.
 
+        Incremental runs page through the devices whose ``_lastInform`` is
+        newer than the server's sync cursor. A full reconcile pages through
+        every device; it runs when ``full`` is true, and by default when the
+        server has no cursor or its last full pass is a day old.
+
         Args:
             db: Database session
             acs_server_id: ACS server ID to sync from
+            full: Force (True) or skip (False) the full reconcile
 
         Returns:
             Dict with created and updated counts
@@ -1144,142 +1367,96 @@ class CpeDevices(ListResponseMixin):
         if not server:
             raise HTTPException(status_code=404, detail="ACS server not found")
         base_url = server.base_url
+        started_at = datetime.now(UTC)
+        cursor = _normalize_utc_timestamp(server.device_sync_cursor)
+        if full is None:
+            full_sync_at = _normalize_utc_timestamp(server.device_full_sync_at)
+            full = (
+                cursor is None
+                or full_sync_at is None
+                or started_at - full_sync_at >= _GENIEACS_FULL_SYNC_INTERVAL
+            )
+        since = None if full or cursor is None else cursor - _GENIEACS_SYNC_OVERLAP
         # Release the read transaction opened by the lookup above BEFORE the
         # (potentially slow) GenieACS HTTP fetch, so the DB connection isn't left
         # "idle in transaction" across the network round-trip. On a busy ACS that
-        # hold lasted ~a minute, pinning a pool slot and blocking autovacuum. The
-        # device upserts below run in their own transaction (committed as before).
+        # hold lasted ~a minute, pinning a pool slot and blocking autovacuum. Each
+        # page of device upserts below commits in its own transaction.
         db.commit()
 
-        try:
-            client = create_genieacs_client(base_url)
-            devices = client.list_devices(
-                projection=CpeDevices._GENIEACS_SYNC_PROJECTION
-            )
-        except GenieACSError as e:
-            raise HTTPException(status_code=502, detail=f"GenieACS error: {e}")
-
+        client = create_genieacs_client(base_url)
         # A full ACS sync may process thousands of devices.  Resolve ONT serial
         # identity from one authoritative snapshot instead of querying every
         # active ONT once per CPE (and again in the auto-link pass).
         serial_index = build_active_ont_serial_index(db)
-
-        created, updated = 0, 0
-        datetime.now(UTC)
-
-        for idx, device_data in enumerate(devices, start=1):
-            # Extract GenieACS device ID (the authoritative identifier)
-            genieacs_device_id = str(device_data.get("_id") or "").strip()
-            if not genieacs_device_id:
-                logger.warning("Skipping GenieACS device without _id")
-                continue
-
-            oui, product_class, serial_number = CpeDevices._extract_identity(
-                client, device_data
-            )
-            if not serial_number:
-                logger.warning(
-                    "Skipping GenieACS device without serial number: %s",
-                    genieacs_device_id,
-                )
-                continue
-
-            # Skip GenieACS discovery service probes — these are not real devices
-            if oui == "DISCOVERYSERVICE" or product_class == "DISCOVERYSERVICE":
-                continue
-
-            # Extract connection request URL if available
-            connection_url = client.extract_parameter_value(
-                device_data, "Device.ManagementServer.ConnectionRequestURL"
-            ) or client.extract_parameter_value(
-                device_data,
-                "InternetGatewayDevice.ManagementServer.ConnectionRequestURL",
-            )
-            connection_url = CpeDevices._clip_text(connection_url, 255)
-
-            normalized_serial = normalize_tr069_serial(serial_number)
-
-            # Primary lookup: by GenieACS device ID (stable, authoritative)
-            existing = (
-                db.query(Tr069CpeDevice)
-                .filter(Tr069CpeDevice.acs_server_id == acs_server_id)
-                .filter(Tr069CpeDevice.genieacs_device_id == genieacs_device_id)
-                .first()
-            )
-            # Fallback: by exact serial number
-            if not existing:
-                existing = (
-                    db.query(Tr069CpeDevice)
-                    .filter(Tr069CpeDevice.acs_server_id == acs_server_id)
-                    .filter(Tr069CpeDevice.serial_number == serial_number)
-                    .first()
-                )
-            # Fallback: match using normalized serials to tolerate vendor formatting differences.
-            if not existing and normalized_serial:
-                existing = (
-                    db.query(Tr069CpeDevice)
-                    .filter(Tr069CpeDevice.acs_server_id == acs_server_id)
-                    .filter(
-                        _normalized_serial_expr(Tr069CpeDevice.serial_number)
-                        == normalized_serial
+        match_index = _CpeSyncIndex(acs_server_id)
+
+        created, updated, total = 0, 0, 0
+        newest_inform = cursor
+        pages = _genieacs_device_pages(
+            client,
+            since=since,
+            projection=CpeDevices._GENIEACS_SYNC_PROJECTION,
+            page_size=_GENIEACS_SYNC_PAGE_SIZE,
+        )
+        try:
+            for page in pages:
+                observed = [
+                    item
+                    for item in (
+                        CpeDevices._observe_genieacs_device(client, device_data)
+                        for device_data in page
                     )
-                    .first()
-                )
-            # Fallback: update legacy/mis-parsed records by stable connection URL.
-            if not existing and connection_url:
-                existing = (
-                    db.query(Tr069CpeDevice)
-                    .filter(Tr069CpeDevice.acs_server_id == acs_server_id)
-                    .filter(Tr069CpeDevice.connection_request_url == connection_url)
-                    .first()
-                )
+                    if item is not None
+                ]
+                match_index.load(db, observed)
+                for item in observed:
+                    total += 1
+                    existing = match_index.match(item)
+                    if existing:
+                        existing.genieacs_device_id = item.genieacs_device_id
+                        existing.oui = item.oui
+                        existing.product_class = item.product_class
+                        existing.connection_request_url = item.connection_url
+                        existing.last_inform_at = item.last_inform_at
+                        existing.is_active = True
+                        updated += 1
+                    else:
+                        existing = Tr069CpeDevice(
+                            acs_server_id=server.id,
+                            genieacs_device_id=item.genieacs_device_id,
+                            serial_number=item.serial_number,
+                            oui=item.oui,
+                            product_class=item.product_class,
+                            connection_request_url=item.connection_url,
+                            last_inform_at=item.last_inform_at,
+                            is_active=True,
+                        )
+                        db.add(existing)
+                        created += 1
+                    match_index.add(existing)
 
-            # Extract last inform time
-            last_inform = device_data.get("_lastInform")
-            last_inform_at = None
-            if last_inform:
-                try:
-                    last_inform_at = datetime.fromisoformat(
-                        last_inform.replace("Z", "+00:00")
+                    _link_unassigned_inform_device_to_matching_ont(
+                        db,
+                        existing,
+                        serial=item.serial_number,
+                        serial_index=serial_index,
                     )
-                except (ValueError, AttributeError):
-                    pass
-
-            if existing:
-                existing.genieacs_device_id = genieacs_device_id
-                existing.oui = oui
-                existing.product_class = product_class
-                existing.connection_request_url = connection_url
-                existing.last_inform_at = last_inform_at
-                existing.is_active = True
-                updated += 1
-            else:
-                new_device = Tr069CpeDevice(
-                    acs_server_id=server.id,
-                    genieacs_device_id=genieacs_device_id,
-                    serial_number=serial_number,
-                    oui=oui,
-                    product_class=product_class,
-                    connection_request_url=connection_url,
-                    last_inform_at=last_inform_at,
-                    is_active=True,
-                )
-                db.add(new_device)
-                existing = new_device
-                created += 1
-
-            _link_unassigned_inform_device_to_matching_ont(
-                db,
-                existing,
-                serial=serial_number,
-                serial_index=serial_index,
-            )
-
-            # Flush each batch so a large inventory doesn't hold one long write
-            # transaction; the trailing commit below catches the remainder.
-            if idx % _GENIEACS_SYNC_COMMIT_BATCH == 0:
+                    informed_at = _normalize_utc_timestamp(item.last_inform_at)
+                    if informed_at and (
+                        newest_inform is None or informed_at > newest_inform
+                    ):
+                        newest_inform = informed_at
+                # One transaction per page keeps a large inventory from holding
+                # one long write transaction; pages are independent, so partial
+                # progress on failure is fine and the cursor only moves below.
                 db.commit()
+        except GenieACSError as e:
+            raise HTTPException(status_code=502, detail=f"GenieACS error: {e}")
 
+        server.device_sync_cursor = newest_inform
+        if full:
+            server.device_full_sync_at = started_at
         db.commit()
 
         synced_ont_status = 0
@@ -1305,14 +1482,15 @@ class CpeDevices(ListResponseMixin):
         serial_updated = 0
         status_snapshot_updated = 0
         try:
-            unlinked_devices = (
-                db.query(Tr069CpeDevice)
-                .filter(
-                    Tr069CpeDevice.acs_server_id == acs_server_id,
-                    Tr069CpeDevice.is_active.is_(True),
-                )
-                .all()
+            link_query = db.query(Tr069CpeDevice).filter(
+                Tr069CpeDevice.acs_server_id == acs_server_id,
+                Tr069CpeDevice.is_active.is_(True),
             )
+            if since is not None:
+                # Devices that have not informed since the last run keep their
+                # links; the daily full pass revisits them.
+                link_query = link_query.filter(Tr069CpeDevice.last_inform_at >= since)
+            unlinked_devices = link_query.all()
             for link_idx, cpe_dev in enumerate(unlinked_devices, start=1):
                 # Commit periodically so a large fleet doesn't hold one long
                 # write transaction and so a soft-time-limit interrupt keeps the
@@ -1381,15 +1559,17 @@ class CpeDevices(ListResponseMixin):
             db.rollback()
 
         logger.info(
-            "GenieACS sync: created=%d, updated=%d, auto_linked=%d",
+            "GenieACS sync (%s): created=%d, updated=%d, auto_linked=%d",
+            "full" if full else "incremental",
             created,
             updated,
             auto_linked,
         )
         return {
+            "full": full,
             "created": created,
             "updated": updated,
-            "total": len(devices),
+            "total": total,
             "auto_linked": auto_linked,
             "synced_ont_status": synced_ont_status,
             "local_onts_checked": 0,
@@ -4,13 +4,23 @@ import builtins
 import logging
 import os
 import re
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Any, cast
 
 from fastapi import HTTPException
-from sqlalchemy import and_, bindparam, create_engine, func, or_, text
+from sqlalchemy import (
+    and_,
+    bindparam,
+    create_engine,
+    func,
+    insert,
+    or_,
+    text,
+    update,
+)
 from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.orm import Session, selectinload
 
@@ -34,6 +44,7 @@ from app.models.usage import (
     RadiusAccountingSession,
     UsageCharge,
     UsageChargeStatus,
+    UsageOctetDelta,
     UsageRatingRun,
     UsageRatingRunStatus,
     UsageRecord,
@@ -93,6 +104,10 @@ _RADIUS_ACCOUNTING_CURSOR_KEY = "radius_accounting_last_radacctid"
 _REAPED_TERMINATE_CAUSE = "reaped"
 # Per import run, how many locally-open sessions get re-read from radacct.
 _RADIUS_REFRESH_BATCH = 500
+# Fallbacks for radius_accounting_import_batch_size / _max_rows: rows per
+# set-based write, and the most new radacct rows one import run drains.
+_RADIUS_IMPORT_BATCH_DEFAULT = 2000
+_RADIUS_IMPORT_MAX_ROWS_DEFAULT = 20000
 
 # Bandwidth samples derived from RADIUS interim-update deltas are written to
 # the same Redis stream consumed by app.tasks.bandwidth.process_bandwidth_stream
@@ -259,31 +274,6 @@ def _set_radius_accounting_cursor(db: Session, radacctid: int) -> None:
     )
 
 
-def _resolve_subscription_for_credential(
-    db: Session, credential: AccessCredential
-) -> Subscription | None:
-    radius_user = (
-        db.query(RadiusUser)
-        .filter(RadiusUser.access_credential_id == credential.id)
-        .filter(RadiusUser.is_active.is_(True))
-        .first()
-    )
-    if radius_user and radius_user.subscription_id:
-        subscription = db.get(Subscription, radius_user.subscription_id)
-        if subscription:
-            return subscription
-    return (
-        db.query(Subscription)
-        .filter(Subscription.subscriber_id == credential.subscriber_id)
-        .filter(Subscription.status == SubscriptionStatus.active)
-        .order_by(
-            Subscription.start_at.desc().nullslast(),
-            Subscription.created_at.desc(),
-        )
-        .first()
-    )
-
-
 def _status_from_radacct(row: dict[str, object]) -> AccountingStatus:
     if row.get("acctstoptime") is not None:
         return AccountingStatus.stop
@@ -460,133 +450,321 @@ def _coerce_radacct_ip(value: object) -> str | None:
     return raw
 
 
-def _upsert_accounting_row(db: Session, row: dict[str, object]) -> bool:
-    username = str(row.get("username") or "").strip()
-    session_id = str(row.get("acctsessionid") or "").strip()
-    if not username or not session_id:
-        return False
+# Columns of an existing local session the batch upsert needs: the reaped
+# guard, the bandwidth and quota delta anchors, and the keep-last-known fields.
+_SESSION_SNAPSHOT_COLUMNS = (
+    RadiusAccountingSession.id,
+    RadiusAccountingSession.access_credential_id,
+    RadiusAccountingSession.session_id,
+    RadiusAccountingSession.subscription_id,
+    RadiusAccountingSession.session_start,
+    RadiusAccountingSession.input_octets,
+    RadiusAccountingSession.output_octets,
+    RadiusAccountingSession.last_update_at,
+    RadiusAccountingSession.terminate_cause,
+    RadiusAccountingSession.framed_ip_address,
+    RadiusAccountingSession.framed_ipv6_prefix,
+    RadiusAccountingSession.delegated_ipv6_prefix,
+    RadiusAccountingSession.nas_port_id,
+    RadiusAccountingSession.called_station_id,
+)
+
 
-    credential = (
-        db.query(AccessCredential).filter(AccessCredential.username == username).first()
+def _resolve_subscriptions_for_credentials(
+    db: Session, credentials: dict[uuid.UUID, uuid.UUID | None]
+) -> dict[uuid.UUID, uuid.UUID]:
+    """The subscription each accounting credential bills to.
+
+    ``credentials`` maps credential id to subscriber id. An active RadiusUser
+    link wins; otherwise the subscriber's most recent active subscription.
+    """
+    resolved: dict[uuid.UUID, uuid.UUID] = {}
+    if not credentials:
+        return resolved
+    linked = (
+        db.query(RadiusUser.access_credential_id, RadiusUser.subscription_id)
+        .join(Subscription, Subscription.id == RadiusUser.subscription_id)
+        .filter(RadiusUser.access_credential_id.in_(list(credentials)))
+        .filter(RadiusUser.is_active.is_(True))
+        .all()
     )
-    if not credential:
-        return False
-
-    subscription = _resolve_subscription_for_credential(db, credential)
-    nas_ip = str(row.get("nasipaddress") or "").strip()
-    radius_client = None
-    if nas_ip:
-        radius_client = (
-            db.query(RadiusClient)
-            .filter(RadiusClient.client_ip == nas_ip)
-            .filter(RadiusClient.is_active.is_(True))
-            .first()
+    for credential_id, subscription_id in linked:
+        if credential_id is not None:
+            resolved.setdefault(credential_id, subscription_id)
+    subscriber_ids = {
+        subscriber_id
+        for credential_id, subscriber_id in credentials.items()
+        if credential_id not in resolved and subscriber_id is not None
+    }
+    if not subscriber_ids:
+        return resolved
+    latest: dict[uuid.UUID, uuid.UUID] = {}
+    active = (
+        db.query(Subscription.subscriber_id, Subscription.id)
+        .filter(Subscription.subscriber_id.in_(subscriber_ids))
+        .filter(Subscription.status == SubscriptionStatus.active)
+        .order_by(
+            Subscription.start_at.desc().nullslast(),
+            Subscription.created_at.desc(),
         )
+        .all()
+    )
+    for subscriber_id, subscription_id in active:
+        latest.setdefault(subscriber_id, subscription_id)
+    for credential_id, subscriber_id in credentials.items():
+        if credential_id not in resolved and subscriber_id in latest:
+            resolved[credential_id] = latest[subscriber_id]
+    return resolved
+
+
+def _octet_deltas(
+    prior: Any,
+    subscription_id: uuid.UUID | None,
+    session_start: datetime | None,
+    octets: int,
+) -> list[dict[str, object]]:
+    """Journal rows moving one session's octets from ``prior`` to the new state.
+
+    Quota metering attributes a session to its subscription's period by
+    ``session_start``, so a changed subscription or start is journaled as the
+    old total leaving one place and the new total arriving at the other.
+    """
+    deltas: list[dict[str, object]] = []
+    old_key = None
+    old_octets = 0
+    if prior is not None:
+        old_key = (prior.subscription_id, _as_utc(prior.session_start))
+        old_octets = int(prior.input_octets or 0) + int(prior.output_octets or 0)
+    new_key = (subscription_id, _as_utc(session_start))
+    moves: list[tuple[tuple[Any, datetime | None] | None, int]]
+    if old_key == new_key:
+        moves = [(new_key, octets - old_octets)]
+    else:
+        moves = [(old_key, -old_octets), (new_key, octets)]
+    for key, delta in moves:
+        if key is None or key[0] is None or key[1] is None or not delta:
+            continue
+        deltas.append(
+            {
+                "id": uuid.uuid4(),
+                "subscription_id": key[0],
+                "session_start": key[1],
+                "octets": delta,
+            }
+        )
+    return deltas
 
-    status_type = _status_from_radacct(row)
-    existing = (
-        db.query(RadiusAccountingSession)
-        .filter(RadiusAccountingSession.access_credential_id == credential.id)
-        .filter(RadiusAccountingSession.session_id == session_id)
-        .first()
+
+def _upsert_accounting_rows(db: Session, rows: list[dict[str, object]]) -> int:
+    """Upsert a batch of radacct rows into local accounting sessions.
+
+    Credentials, subscriptions, NAS clients and the existing local sessions
+    are each resolved with one query per batch, and the batch is written as
+    one multi-row INSERT for new sessions plus one executemany UPDATE by
+    primary key for known ones. The resulting octet changes are journaled as
+    ``UsageOctetDelta`` rows for incremental quota metering.
+
+    There is no unique key on (credential, session_id) to drive ``ON
+    CONFLICT``, so the split comes from the snapshot read here; the importer's
+    advisory lock keeps that race-free. When a batch carries several rows for
+    one session the latest radacctid wins, which is what applying them one at
+    a time would leave behind. Returns the number of sessions written.
+    """
+    latest: dict[tuple[str, str], dict[str, object]] = {}
+    for row in sorted(rows, key=lambda r: _safe_int(r.get("radacctid")) or 0):
+        username = str(row.get("username") or "").strip()
+        session_id = str(row.get("acctsessionid") or "").strip()
+        if username and session_id:
+            latest[(username, session_id)] = row
+    if not latest:
+        return 0
+
+    credentials: dict[str, tuple[uuid.UUID, uuid.UUID | None]] = {}
+    for credential_id, username, subscriber_id in (
+        db.query(
+            AccessCredential.id,
+            AccessCredential.username,
+            AccessCredential.subscriber_id,
+        )
+        .filter(AccessCredential.username.in_(sorted({u for u, _ in latest})))
+        .all()
+    ):
+        credentials.setdefault(username, (credential_id, subscriber_id))
+    if not credentials:
+        return 0
+    subscriptions = _resolve_subscriptions_for_credentials(
+        db, dict(credentials.values())
     )
-    target = existing or RadiusAccountingSession(
-        access_credential_id=credential.id,
-        session_id=session_id,
+
+    nas_ips = sorted(
+        {str(row.get("nasipaddress") or "").strip() for row in latest.values()} - {""}
     )
-    if not existing:
-        db.add(target)
-
-    prev_input_octets = target.input_octets
-    prev_output_octets = target.output_octets
-    prev_update_at = target.last_update_at
-    new_update_at = _coerce_radacct_ts(row.get("acctupdatetime"))
-    new_stop_at = _coerce_radacct_ts(row.get("acctstoptime"))
-    new_start_at = _coerce_radacct_ts(row.get("acctstarttime"))
-    # Most recent accounting observation for this row: stop beats interim
-    # beats start.
-    observed_at = new_stop_at or new_update_at or new_start_at
-
-    # A session we reaped can show up again via the open-session refresh while
-    # its radacct row is unchanged (still no stop, no fresher update). Without
-    # this guard the upsert would reopen it (session_end back to NULL) and the
-    # reaper would close it again next run — a permanent flap. Only let a
-    # reaped session be revived by genuinely new information: a real stop or a
-    # fresher acctupdatetime.
-    if (
-        existing is not None
-        and existing.terminate_cause == _REAPED_TERMINATE_CAUSE
-        and new_stop_at is None
-    ):
-        observed_utc = _as_utc(observed_at)
-        reaped_seen_utc = _as_utc(existing.last_update_at)
-        if observed_utc is None or (
-            reaped_seen_utc is not None and observed_utc <= reaped_seen_utc
+    clients: dict[str, tuple[uuid.UUID, uuid.UUID | None]] = {}
+    if nas_ips:
+        for client_id, client_ip, nas_device_id in (
+            db.query(
+                RadiusClient.id, RadiusClient.client_ip, RadiusClient.nas_device_id
+            )
+            .filter(RadiusClient.client_ip.in_(nas_ips))
+            .filter(RadiusClient.is_active.is_(True))
+            .all()
         ):
-            return False
-
-    target.subscription_id = subscription.id if subscription else None
-    target.radius_client_id = radius_client.id if radius_client else None
-    target.nas_device_id = radius_client.nas_device_id if radius_client else None
-    target.status_type = status_type
-    target.session_start = new_start_at
-    target.session_end = new_stop_at
-    if observed_at is not None:
-        target.last_update_at = observed_at
-    target.input_octets = cast(int | None, row.get("acctinputoctets"))
-    target.output_octets = cast(int | None, row.get("acctoutputoctets"))
-    target.terminate_cause = cast(str | None, row.get("acctterminatecause"))
-    framed_ipv4 = _coerce_radacct_ip(row.get("framedipaddress"))
-    framed_ipv6_prefix = _coerce_radacct_ip(row.get("framedipv6prefix"))
-    delegated_ipv6_prefix = _coerce_radacct_ip(row.get("delegatedipv6prefix"))
-    nas_port_id = str(row.get("nasportid") or "").strip() or None
-    called_station_id = str(row.get("calledstationid") or "").strip() or None
-    # Keep the last known value when a later row omits it (or the column is
-    # absent from this radacct schema entirely).
-    if framed_ipv4:
-        target.framed_ip_address = framed_ipv4
-    if framed_ipv6_prefix:
-        target.framed_ipv6_prefix = framed_ipv6_prefix
-    if delegated_ipv6_prefix:
-        target.delegated_ipv6_prefix = delegated_ipv6_prefix
-    if nas_port_id:
-        target.nas_port_id = nas_port_id
-    if called_station_id:
-        target.called_station_id = called_station_id
-
-    if (
-        status_type == AccountingStatus.interim
-        and subscription is not None
-        and target.nas_device_id is not None
+            clients.setdefault(str(client_ip), (client_id, nas_device_id))
+
+    existing: dict[tuple[uuid.UUID, str], Any] = {}
+    for snapshot in (
+        db.query(*_SESSION_SNAPSHOT_COLUMNS)
+        .filter(
+            RadiusAccountingSession.access_credential_id.in_(
+                [credential_id for credential_id, _ in credentials.values()]
+            )
+        )
+        .filter(RadiusAccountingSession.session_id.in_(sorted({s for _, s in latest})))
+        .all()
     ):
-        _emit_bandwidth_sample_from_radius_delta(
-            subscription_id=subscription.id,
-            nas_device_id=target.nas_device_id,
-            session_id=session_id,
-            prev_input_octets=prev_input_octets,
-            prev_output_octets=prev_output_octets,
-            prev_update_at=prev_update_at,
-            new_input_octets=target.input_octets,
-            new_output_octets=target.output_octets,
-            new_update_at=new_update_at,
+        existing.setdefault(
+            (snapshot.access_credential_id, snapshot.session_id), snapshot
         )
-    _write_subscription_mac_from_accounting(
-        db,
-        target.subscription_id,
-        cast(str | None, row.get("callingstationid")),
-    )
-    # Only live rows update the subscription's current address — a Stop (or a
-    # backlog of historical rows) shouldn't overwrite it.
-    if new_stop_at is None:
-        _write_subscription_ips_from_accounting(
+
+    inserts: list[dict[str, object]] = []
+    updates: list[dict[str, object]] = []
+    octet_deltas: list[dict[str, object]] = []
+    authenticated: set[uuid.UUID] = set()
+    observed_ips: dict[uuid.UUID, tuple[str | None, str | None]] = {}
+    for (username, session_id), row in latest.items():
+        if username not in credentials:
+            continue
+        credential_id, _subscriber_id = credentials[username]
+        prior = existing.get((credential_id, session_id))
+        new_update_at = _coerce_radacct_ts(row.get("acctupdatetime"))
+        new_stop_at = _coerce_radacct_ts(row.get("acctstoptime"))
+        new_start_at = _coerce_radacct_ts(row.get("acctstarttime"))
+        # Most recent accounting observation for this row: stop beats interim
+        # beats start.
+        observed_at = new_stop_at or new_update_at or new_start_at
+
+        # A session we reaped can show up again via the open-session refresh
+        # while its radacct row is unchanged (still no stop, no fresher
+        # update). Without this guard the upsert would reopen it (session_end
+        # back to NULL) and the reaper would close it again next run — a
+        # permanent flap. Only let a reaped session be revived by genuinely
+        # new information: a real stop or a fresher acctupdatetime.
+        if (
+            prior is not None
+            and prior.terminate_cause == _REAPED_TERMINATE_CAUSE
+            and new_stop_at is None
+        ):
+            observed_utc = _as_utc(observed_at)
+            reaped_seen_utc = _as_utc(prior.last_update_at)
+            if observed_utc is None or (
+                reaped_seen_utc is not None and observed_utc <= reaped_seen_utc
+            ):
+                continue
+
+        subscription_id = subscriptions.get(credential_id)
+        nas_ip = str(row.get("nasipaddress") or "").strip()
+        radius_client_id, nas_device_id = clients.get(nas_ip, (None, None))
+        status_type = _status_from_radacct(row)
+        framed_ipv4 = _coerce_radacct_ip(row.get("framedipaddress"))
+        framed_ipv6_prefix = _coerce_radacct_ip(row.get("framedipv6prefix"))
+        delegated_ipv6_prefix = _coerce_radacct_ip(row.get("delegatedipv6prefix"))
+        nas_port_id = str(row.get("nasportid") or "").strip() or None
+        called_station_id = str(row.get("calledstationid") or "").strip() or None
+        values: dict[str, object] = {
+            "subscription_id": subscription_id,
+            "radius_client_id": radius_client_id,
+            "nas_device_id": nas_device_id,
+            "status_type": status_type,
+            "session_start": new_start_at,
+            "session_end": new_stop_at,
+            "last_update_at": observed_at
+            or (prior.last_update_at if prior is not None else None),
+            "input_octets": row.get("acctinputoctets"),
+            "output_octets": row.get("acctoutputoctets"),
+            "terminate_cause": row.get("acctterminatecause"),
+            # Keep the last known value when a later row omits it (or the
+            # column is absent from this radacct schema entirely).
+            "framed_ip_address": framed_ipv4
+            or (prior.framed_ip_address if prior is not None else None),
+            "framed_ipv6_prefix": framed_ipv6_prefix
+            or (prior.framed_ipv6_prefix if prior is not None else None),
+            "delegated_ipv6_prefix": delegated_ipv6_prefix
+            or (prior.delegated_ipv6_prefix if prior is not None else None),
+            "nas_port_id": nas_port_id
+            or (prior.nas_port_id if prior is not None else None),
+            "called_station_id": called_station_id
+            or (prior.called_station_id if prior is not None else None),
+        }
+        octet_deltas.extend(
+            _octet_deltas(
+                prior,
+                subscription_id,
+                new_start_at,
+                int(cast(int | None, row.get("acctinputoctets")) or 0)
+                + int(cast(int | None, row.get("acctoutputoctets")) or 0),
+            )
+        )
+        if prior is None:
+            inserts.append(
+                {
+                    "id": uuid.uuid4(),
+                    "access_credential_id": credential_id,
+                    "session_id": session_id,
+                    **values,
+                }
+            )
+        else:
+            updates.append({"id": prior.id, **values})
+
+        if (
+            status_type == AccountingStatus.interim
+            and subscription_id is not None
+            and nas_device_id is not None
+        ):
+            _emit_bandwidth_sample_from_radius_delta(
+                subscription_id=subscription_id,
+                nas_device_id=nas_device_id,
+                session_id=session_id,
+                prev_input_octets=prior.input_octets if prior is not None else None,
+                prev_output_octets=prior.output_octets if prior is not None else None,
+                prev_update_at=prior.last_update_at if prior is not None else None,
+                new_input_octets=cast(int | None, row.get("acctinputoctets")),
+                new_output_octets=cast(int | None, row.get("acctoutputoctets")),
+                new_update_at=new_update_at,
+            )
+        _write_subscription_mac_from_accounting(
             db,
-            target.subscription_id,
-            ipv4=framed_ipv4,
-            ipv6=delegated_ipv6_prefix or framed_ipv6_prefix,
+            subscription_id,
+            cast(str | None, row.get("callingstationid")),
         )
-    if status_type in {AccountingStatus.start, AccountingStatus.interim}:
-        credential.last_auth_at = datetime.now(UTC)
-    return True
+        # Only live rows update the subscription's current address — a Stop
+        # (or a backlog of historical rows) shouldn't overwrite it.
+        if new_stop_at is None and subscription_id is not None:
+            ipv6 = delegated_ipv6_prefix or framed_ipv6_prefix
+            if framed_ipv4 or ipv6:
+                observed_ips[subscription_id] = (framed_ipv4, ipv6)
+        if status_type in {AccountingStatus.start, AccountingStatus.interim}:
+            authenticated.add(credential_id)
+
+    if inserts:
+        db.execute(insert(RadiusAccountingSession), inserts)
+    if updates:
+        db.execute(update(RadiusAccountingSession), updates)
+    if octet_deltas:
+        db.execute(insert(UsageOctetDelta), octet_deltas)
+    if observed_ips:
+        # Loaded together so the per-subscription writes below hit the
+        # identity map instead of one SELECT each.
+        db.query(Subscription).filter(Subscription.id.in_(list(observed_ips))).all()
+        for subscription_id, (ipv4, ipv6) in observed_ips.items():
+            _write_subscription_ips_from_accounting(
+                db, subscription_id, ipv4=ipv4, ipv6=ipv6
+            )
+    if authenticated:
+        db.query(AccessCredential).filter(
+            AccessCredential.id.in_(list(authenticated))
+        ).update({"last_auth_at": datetime.now(UTC)}, synchronize_session=False)
+    return len(inserts) + len(updates)
 
 
 _RADACCT_BASE_COLUMNS = (
@@ -723,18 +901,30 @@ def _refresh_open_sessions_from_radacct(
     db.query(RadiusAccountingSession).filter(
         RadiusAccountingSession.id.in_(candidate_ids)
     ).update({"refresh_attempted_at": now}, synchronize_session=False)
-    updated = 0
-    for row in rows:
-        if _upsert_accounting_row(db, row):
-            updated += 1
-    return len(candidates), updated
+    return len(candidates), _upsert_accounting_rows(db, rows)
+
+
+def _radius_import_int_setting(db: Session, key: str, default: int) -> int:
+    raw = settings_spec.resolve_value(db, SettingDomain.usage, key)
+    try:
+        value = int(str(raw)) if raw is not None else default
+    except ValueError:
+        value = default
+    return max(value, 1)
 
 
 def import_radius_accounting(
     db: Session,
     *,
     limit: int | None = None,
-) -> dict[str, int | bool | str | None]:
+) -> dict[str, int | float | bool | str | None]:
+    """Import new radacct rows, then refresh the sessions still held open.
+
+    Up to ``limit`` rows (default ``radius_accounting_import_max_rows``) are
+    streamed past the cursor and written ``radius_accounting_import_batch_size``
+    at a time by ``_upsert_accounting_rows``. The cursor is committed after
+    every batch, so a run that dies midway resumes where it stopped.
+    """
     target = _radius_accounting_target(db)
     if not target:
         return {
@@ -742,6 +932,7 @@ def import_radius_accounting(
             "processed": 0,
             "created_or_updated": 0,
             "cursor": 0,
+            "rows_per_second": 0.0,
             "source_status": "unconfigured",
             "source_latest_at": None,
             "source_age_seconds": None,
@@ -749,7 +940,23 @@ def import_radius_accounting(
 
     db_url = str(target["db_url"])
     radacct_table = str(target["radacct_table"])
-    batch_size = max(limit or 500, 1)
+    max_rows = max(
+        limit
+        or _radius_import_int_setting(
+            db,
+            "radius_accounting_import_max_rows",
+            _RADIUS_IMPORT_MAX_ROWS_DEFAULT,
+        ),
+        1,
+    )
+    batch_size = min(
+        _radius_import_int_setting(
+            db,
+            "radius_accounting_import_batch_size",
+            _RADIUS_IMPORT_BATCH_DEFAULT,
+        ),
+        max_rows,
+    )
     last_radacctid = _get_radius_accounting_cursor(db)
     _release_postgres_read_transaction(db)
     processed = 0
@@ -757,10 +964,13 @@ def import_radius_accounting(
     refreshed = 0
     cursor = last_radacctid
     engine = _radacct_engine(db_url)
+    started = time.monotonic()
     with engine.begin() as conn:
         table_sql = _quoted_table_identifier(conn, radacct_table)
         select_list = _radacct_select_list(conn, radacct_table)
-        result = conn.execute(
+        # Server-side cursor on Postgres: the run's rows are never all held in
+        # memory at once.
+        result = conn.execution_options(stream_results=True).execute(
             text(
                 f"""
                 SELECT {select_list}
@@ -770,17 +980,17 @@ def import_radius_accounting(
                 LIMIT :limit
                 """  # nosec B608  # noqa: S608 — fixed column names; values are bind params
             ),
-            {"cursor": last_radacctid, "limit": batch_size},
+            {"cursor": last_radacctid, "limit": max_rows},
         )
-        rows = [dict(row._mapping) for row in result]
-        for row in rows:
-            processed += 1
-            if _upsert_accounting_row(db, row):
-                created_or_updated += 1
-            cursor = max(cursor, int(row.get("radacctid") or 0))
-        if cursor > last_radacctid:
-            _set_radius_accounting_cursor(db, cursor)
-        db.commit()
+        for partition in result.mappings().partitions(batch_size):
+            rows = [dict(row) for row in partition]
+            processed += len(rows)
+            created_or_updated += _upsert_accounting_rows(db, rows)
+            cursor = max(cursor, *(int(row.get("radacctid") or 0) for row in rows))
+            if cursor > last_radacctid:
+                _set_radius_accounting_cursor(db, cursor)
+            db.commit()
+        import_seconds = time.monotonic() - started
         # New rows first (a fresh Stop may close a session and shrink the
         # refresh set), then re-read radacct for whatever is still open.
         refresh_checked, refreshed = _refresh_open_sessions_from_radacct(
@@ -800,6 +1010,16 @@ def import_radius_accounting(
         )
 
     db.commit()
+    rows_per_second = (
+        round(processed / import_seconds, 1) if import_seconds > 0 else 0.0
+    )
+    if processed:
+        logger.info(
+            "radius accounting import: %d rows (%d written) at %.1f rows/s",
+            processed,
+            created_or_updated,
+            rows_per_second,
+        )
     if refreshed:
         logger.info(
             "radius accounting refresh: %d/%d open sessions updated from radacct",
@@ -816,6 +1036,7 @@ def import_radius_accounting(
         "created_or_updated": created_or_updated,
         "refreshed": refreshed,
         "cursor": cursor,
+        "rows_per_second": rows_per_second,
         "source_status": freshness.state.value,
         "source_latest_at": (
             freshness.observed_at.isoformat()
@@ -984,69 +1205,213 @@ def _carry_forward_rollover(
 _GB_BYTES = 1024**3
 
 
-def meter_usage_into_quota(db: Session, now: datetime | None = None) -> dict:
+# Journal rows drained per incremental metering pass.
+_METERING_DELTA_BATCH = 20000
+
+
+def _period_octets(db: Session, subscription_id: uuid.UUID, bucket: QuotaBucket) -> int:
+    octets = (
+        db.query(
+            func.coalesce(func.sum(RadiusAccountingSession.input_octets), 0)
+            + func.coalesce(func.sum(RadiusAccountingSession.output_octets), 0)
+        )
+        .filter(RadiusAccountingSession.subscription_id == subscription_id)
+        .filter(RadiusAccountingSession.session_start >= bucket.period_start)
+        .filter(RadiusAccountingSession.session_start < bucket.period_end)
+        .scalar()
+    )
+    return int(octets or 0)
+
+
+def _meter_bucket(
+    db: Session, sub: Subscription, bucket: QuotaBucket, octets: int, now: datetime
+) -> bool:
+    """Set the bucket's usage from ``octets``; True when used/top-up/overage moved."""
+    previous_used_gb = Decimal(str(bucket.used_gb or 0))
+    previous_topup_gb = Decimal(str(bucket.topup_gb or 0))
+    previous_overage_gb = Decimal(str(bucket.overage_gb or 0))
+    bucket.used_octets = octets
+    used_gb = _round_bucket_gb(Decimal(octets) / Decimal(_GB_BYTES))
+    bucket.used_gb = used_gb
+    # Refresh top-up from still-valid purchases so expired ones drop out.
+    bucket.topup_gb = _round_bucket_gb(_active_topup_gb(db, sub, now))
+    allowed = (
+        Decimal(str(bucket.included_gb or 0))
+        + Decimal(str(bucket.rollover_gb or 0))
+        + Decimal(str(bucket.topup_gb or 0))
+    )
+    overage = used_gb - allowed
+    bucket.overage_gb = (
+        _round_bucket_gb(overage) if overage > Decimal("0") else Decimal("0.00")
+    )
+    return (
+        previous_used_gb != Decimal(str(bucket.used_gb or 0))
+        or previous_topup_gb != Decimal(str(bucket.topup_gb or 0))
+        or previous_overage_gb != Decimal(str(bucket.overage_gb or 0))
+    )
+
+
+def _capped_subscriptions_query(db: Session):
+    return (
+        db.query(Subscription)
+        .join(CatalogOffer, Subscription.offer_id == CatalogOffer.id)
+        .filter(Subscription.status == SubscriptionStatus.active)
+        .filter(CatalogOffer.usage_allowance_id.isnot(None))
+    )
+
+
+def meter_usage_into_quota(
+    db: Session,
+    now: datetime | None = None,
+    *,
+    full: bool = False,
+    seed: bool = True,
+) -> dict:
     """Populate the current period's ``QuotaBucket.used_gb`` from RADIUS
-    accounting octets, for every active *capped* subscription.
+    accounting octets, for active *capped* subscriptions.
 
     This is the missing link between imported ``RadiusAccountingSession`` traffic
     and the quota/FUP machinery — without it ``used_gb`` stays 0 and nothing ever
-    triggers. Idempotent: ``used_gb`` is recomputed absolutely from the period's
-    sessions each run (never incremented). Uncapped/unlimited plans have no
-    allowance, so they get no bucket and are skipped — so an unlimited plan never
-    looks "exhausted".
+    triggers. Uncapped/unlimited plans have no allowance, so they get no bucket
+    and are skipped — so an unlimited plan never looks "exhausted".
+
+    The default pass is incremental: it drains the ``UsageOctetDelta`` journal
+    the accounting import writes and adds each subscription's deltas to its
+    bucket's exact ``used_octets``, so only subscriptions with new traffic are
+    touched. A current bucket that is missing or has no ``used_octets`` yet (a
+    new period, or one predating the journal) is seeded absolutely instead, so
+    a repeated run without new deltas is a no-op. The seed already counts every
+    journaled session, so that subscription's whole journal is discarded with
+    it; seeding therefore needs the import lock too, or an import committing
+    between the sum and the discard would be lost or counted twice. Callers
+    that could not take it pass ``seed=False`` and unseeded buckets wait for
+    the next pass.
+
+    ``full=True`` is the correctness check: ``used_gb`` is recomputed
+    absolutely from the period's sessions for every capped subscription, which
+    also catches sessions written outside the importer and top-ups that
+    expired without new traffic. Buckets whose incremental total disagreed are
+    counted as ``drift``. The caller must hold the import lock, since pending
+    deltas are discarded as already counted.
     """
     now = now or datetime.now(UTC)
-    subs = (
-        db.query(Subscription)
-        .join(CatalogOffer, Subscription.offer_id == CatalogOffer.id)
-        .filter(Subscription.status == SubscriptionStatus.active)
-        .filter(CatalogOffer.usage_allowance_id.isnot(None))
+    if full:
+        return _meter_usage_full(db, now)
+
+    deltas = (
+        db.query(
+            UsageOctetDelta.id,
+            UsageOctetDelta.subscription_id,
+            UsageOctetDelta.session_start,
+            UsageOctetDelta.octets,
+        )
+        .order_by(UsageOctetDelta.created_at.asc())
+        .limit(_METERING_DELTA_BATCH)
+        .with_for_update(skip_locked=True)
         .all()
     )
+    period_start, period_end = _period_bounds_for_record(now)
+    pending: dict[uuid.UUID, int] = {}
+    for _delta_id, subscription_id, session_start, octets in deltas:
+        # Only the current period is metered, as in the absolute recompute.
+        started = _as_utc(session_start)
+        if started is not None and period_start <= started < period_end:
+            pending[subscription_id] = pending.get(subscription_id, 0) + int(octets)
+
     metered = 0
     changed_subscription_ids: list[str] = []
+    # Subscriptions with new traffic, plus any whose current bucket is missing
+    # or unseeded (a new period, a newly capped plan).
+    due = Subscription.id.in_(list(pending))
+    if seed:
+        due = or_(QuotaBucket.used_octets.is_(None), due)
+    subs = (
+        _capped_subscriptions_query(db)
+        .outerjoin(
+            QuotaBucket,
+            and_(
+                QuotaBucket.subscription_id == Subscription.id,
+                QuotaBucket.period_start == period_start,
+                QuotaBucket.period_end == period_end,
+            ),
+        )
+        .filter(due)
+        .all()
+    )
+    seeded: list[uuid.UUID] = []
     for sub in subs:
         if _resolve_allowance(sub) is None:
             continue
         bucket = _resolve_or_create_quota_bucket(db, sub, now)
-        octets = (
-            db.query(
-                func.coalesce(func.sum(RadiusAccountingSession.input_octets), 0)
-                + func.coalesce(func.sum(RadiusAccountingSession.output_octets), 0)
-            )
-            .filter(RadiusAccountingSession.subscription_id == sub.id)
-            .filter(RadiusAccountingSession.session_start >= bucket.period_start)
-            .filter(RadiusAccountingSession.session_start < bucket.period_end)
-            .scalar()
-        ) or 0
-        previous_used_gb = Decimal(str(bucket.used_gb or 0))
-        previous_topup_gb = Decimal(str(bucket.topup_gb or 0))
-        previous_overage_gb = Decimal(str(bucket.overage_gb or 0))
-        used_gb = _round_bucket_gb(Decimal(int(octets)) / Decimal(_GB_BYTES))
-        bucket.used_gb = used_gb
-        # Refresh top-up from still-valid purchases so expired ones drop out.
-        bucket.topup_gb = _round_bucket_gb(_active_topup_gb(db, sub, now))
-        allowed = (
-            Decimal(str(bucket.included_gb or 0))
-            + Decimal(str(bucket.rollover_gb or 0))
-            + Decimal(str(bucket.topup_gb or 0))
-        )
-        overage = used_gb - allowed
-        bucket.overage_gb = (
-            _round_bucket_gb(overage) if overage > Decimal("0") else Decimal("0.00")
-        )
-        if (
-            previous_used_gb != Decimal(str(bucket.used_gb or 0))
-            or previous_topup_gb != Decimal(str(bucket.topup_gb or 0))
-            or previous_overage_gb != Decimal(str(bucket.overage_gb or 0))
-        ):
+        if bucket.used_octets is None:
+            if not seed:
+                continue
+            octets = _period_octets(db, sub.id, bucket)
+            seeded.append(sub.id)
+        else:
+            octets = max(int(bucket.used_octets) + pending.get(sub.id, 0), 0)
+        if _meter_bucket(db, sub, bucket, octets, now):
             changed_subscription_ids.append(str(sub.id))
         metered += 1
+    if deltas:
+        db.query(UsageOctetDelta).filter(
+            UsageOctetDelta.id.in_([row[0] for row in deltas])
+        ).delete(synchronize_session=False)
+    if seeded:
+        # Journaled past this batch, but already inside the seeded sums.
+        db.query(UsageOctetDelta).filter(
+            UsageOctetDelta.subscription_id.in_(seeded)
+        ).delete(synchronize_session=False)
     logger.info(
         "usage_metered_into_quota",
-        extra={"metered": metered, "changed": len(changed_subscription_ids)},
+        extra={
+            "metered": metered,
+            "changed": len(changed_subscription_ids),
+            "deltas": len(deltas),
+            "seeded": len(seeded),
+        },
     )
-    return {"metered": metered, "changed_subscription_ids": changed_subscription_ids}
+    return {
+        "metered": metered,
+        "changed_subscription_ids": changed_subscription_ids,
+        "deltas": len(deltas),
+    }
+
+
+def _meter_usage_full(db: Session, now: datetime) -> dict:
+    # Everything journaled so far is already in the sessions summed below.
+    db.query(UsageOctetDelta).delete(synchronize_session=False)
+    metered = 0
+    drift = 0
+    changed_subscription_ids: list[str] = []
+    for sub in _capped_subscriptions_query(db).all():
+        if _resolve_allowance(sub) is None:
+            continue
+        bucket = _resolve_or_create_quota_bucket(db, sub, now)
+        octets = _period_octets(db, sub.id, bucket)
+        if bucket.used_octets is not None and int(bucket.used_octets) != octets:
+            drift += 1
+        if _meter_bucket(db, sub, bucket, octets, now):
+            changed_subscription_ids.append(str(sub.id))
+        metered += 1
+    if drift:
+        logger.warning(
+            "usage_metering_drift_corrected",
+            extra={"drift": drift, "metered": metered},
+        )
+    logger.info(
+        "usage_metered_into_quota",
+        extra={
+            "metered": metered,
+            "changed": len(changed_subscription_ids),
+            "full": True,
+        },
+    )
+    return {
+        "metered": metered,
+        "changed_subscription_ids": changed_subscription_ids,
+        "drift": drift,
+    }
 
 
 def _active_topup_gb(db: Session, subscription: Subscription, now: datetime) -> Decimal:
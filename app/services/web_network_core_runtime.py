@@ -19,6 +19,7 @@ from app.models.network_monitoring import (
     MetricType,
     NetworkDevice,
 )
+from app.services import icmp_sweep
 from app.services import ping as ping_service
 from app.services.db_session_adapter import db_session_adapter
 
@@ -31,6 +32,9 @@ logger = logging.getLogger(__name__)
 _OBSERVED_DEVICE_STATUSES = frozenset(
     {DeviceStatus.online, DeviceStatus.offline, DeviceStatus.degraded}
 )
+# How long a device health ping waits for a reply, batched sweep or not: a
+# host with no reply inside it is recorded down with no second attempt.
+_DEVICE_PING_TIMEOUT_SECONDS = 4
 
 
 def set_device_observed_status(device: NetworkDevice, observed: DeviceStatus) -> bool:
@@ -156,12 +160,15 @@ def refresh_devices_health(
     _ = db  # Explicitly unused: each worker uses an isolated DB session.
     totals = {"checked": 0, "ping": 0, "snmp": 0}
     targets: list[tuple[str, bool, bool]] = []
+    ping_hosts: dict[str, str] = {}
     for device in devices:
         if not device.id:
             continue
         do_ping = bool(device.ping_enabled)
         do_snmp = bool(device.snmp_enabled) and include_snmp
         targets.append((str(device.id), do_ping, do_snmp))
+        if do_ping and device.mgmt_ip:
+            ping_hosts[str(device.id)] = str(device.mgmt_ip)
         totals["checked"] += 1
         if do_ping:
             totals["ping"] += 1
@@ -176,10 +183,19 @@ def refresh_devices_health(
     # Release the read transaction before the long ping/SNMP fan-out; each
     # worker opens and commits its own short-lived session.
     _release_postgres_read_transaction(db)
+    # One batched ICMP sweep for every ping target; workers then only persist
+    # the outcome instead of each forking a ping process.
+    sweep = _sweep_ping_targets(ping_hosts)
     pool = ThreadPoolExecutor(max_workers=workers)
     try:
         futures = [
-            pool.submit(_refresh_device_health_worker, device_id, do_ping, do_snmp)
+            pool.submit(
+                _refresh_device_health_worker,
+                device_id,
+                do_ping,
+                do_snmp,
+                sweep.get(device_id),
+            )
             for device_id, do_ping, do_snmp in targets
         ]
         for future in as_completed(futures):
@@ -277,7 +293,41 @@ def refresh_stale_devices_health(
     )
 
 
-def _refresh_device_health_worker(device_id: str, do_ping: bool, do_snmp: bool) -> None:
+def _sweep_ping_targets(
+    ping_hosts: dict[str, str],
+) -> dict[str, tuple[bool, float | None]]:
+    """Ping every ``{device_id: mgmt_ip}`` in one ICMP sweep.
+
+    Waits as long as the per-device ``run_ping`` it replaces, so a slow but
+    reachable device is not marked down. Returns
+    ``{device_id: (success, latency_ms)}``. Empty when the sweep is
+    disabled (``PING_ENGINE=subprocess``) or ICMP sockets are refused; devices
+    without a result fall back to ``ping_service.run_ping`` in the worker.
+    """
+    if not ping_hosts or not icmp_sweep.sweep_enabled():
+        return {}
+    try:
+        stats = icmp_sweep.sweep_hosts(
+            set(ping_hosts.values()), timeout_seconds=_DEVICE_PING_TIMEOUT_SECONDS
+        )
+    except icmp_sweep.IcmpUnavailableError as exc:
+        logger.info("icmp_sweep_unavailable", extra={"error": str(exc)})
+        return {}
+    results: dict[str, tuple[bool, float | None]] = {}
+    for device_id, host in ping_hosts.items():
+        host_stats = stats.get(host)
+        if host_stats is None or host_stats.sent == 0:
+            continue
+        results[device_id] = (host_stats.reachable, host_stats.avg_rtt_ms)
+    return results
+
+
+def _refresh_device_health_worker(
+    device_id: str,
+    do_ping: bool,
+    do_snmp: bool,
+    ping_result: tuple[bool, float | None] | None = None,
+) -> None:
     """Refresh health for a single device in an isolated DB session."""
     db = db_session_adapter.create_session()
     try:
@@ -285,7 +335,7 @@ def _refresh_device_health_worker(device_id: str, do_ping: bool, do_snmp: bool)
         if not device:
             return
         if do_ping:
-            ping_device(db, device_id)
+            ping_device(db, device_id, ping_result=ping_result)
         if do_snmp:
             from app.services.network_vendor_polling import (
                 refresh_device_from_vendor_api,
@@ -301,10 +351,16 @@ def _refresh_device_health_worker(device_id: str, do_ping: bool, do_snmp: bool)
 
 
 def ping_device(
-    db: Session, device_id: str
+    db: Session,
+    device_id: str,
+    *,
+    ping_result: tuple[bool, float | None] | None = None,
 ) -> tuple[NetworkDevice | None, str | None, bool]:
     """Run a ping probe against a core device and persist the result.
 
+    ``ping_result`` is a ``(success, latency_ms)`` already measured by a batch
+    sweep; without it the device is pinged here.
+
     Returns (device, error_message, ping_success).
     """
     device = get_device(db, device_id)
@@ -317,7 +373,12 @@ def ping_device(
     ping_success = False
     latency_ms: float | None = None
     now = datetime.now(UTC)
-    ping_success, latency_ms = ping_service.run_ping(device.mgmt_ip, timeout_seconds=4)
+    if ping_result is not None:
+        ping_success, latency_ms = ping_result
+    else:
+        ping_success, latency_ms = ping_service.run_ping(
+            device.mgmt_ip, timeout_seconds=_DEVICE_PING_TIMEOUT_SECONDS
+        )
 
     # Track if this is a new failure for immediate retry trigger
     was_healthy = device.ping_down_since is None
@@ -922,8 +922,9 @@ def tr069_dashboard_data(
 
 
 def sync_server(db: Session, *, acs_server_id: str) -> dict[str, int]:
+    # An operator-requested sync reconciles the whole ACS inventory.
     return tr069_service.cpe_devices.sync_from_genieacs(
-        db=db, acs_server_id=acs_server_id
+        db=db, acs_server_id=acs_server_id, full=True
     )
 
 
@@ -10,6 +10,8 @@ import os
 import re
 import smtplib
 import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
 from datetime import UTC, date, datetime, time, timedelta
 from decimal import Decimal
 from email.mime.application import MIMEApplication
@@ -17,11 +19,11 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, cast
 from uuid import UUID, uuid4
 
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
 from app.models.audit import AuditActorType, AuditEvent
 from app.models.billing import Invoice, Payment
@@ -35,6 +37,7 @@ from app.models.system_user import SystemUser
 from app.services import email as email_service
 from app.services import settings_spec
 from app.services.audit_adapter import record_audit_event
+from app.services.db_session_adapter import db_session_adapter
 
 logger = logging.getLogger(__name__)
 
@@ -112,6 +115,13 @@ EXPORT_TEMPLATE_KEY_PREFIX = "export_template."
 EXPORT_JOB_KEY_PREFIX = "export_job."
 EXPORT_BG_THRESHOLD_ROWS = 10000
 EXPORT_JOBS_DIR = Path("uploads/system_exports")
+# Formats rendered row by row while the rows are read. JSON and PDF are still
+# built in memory: JSON as one document, PDF as a one-page summary.
+STREAMING_EXPORT_FORMATS = frozenset({"csv", "xlsx"})
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+_EXPORT_YIELD_PER = 1000
+_EXPORT_PROGRESS_EVERY = 5000
+_XLSX_FLUSH_BYTES = 256 * 1024
 
 
 def module_options() -> list[dict[str, str]]:
@@ -179,6 +189,46 @@ def _date_filters(
     return start_dt, end_dt
 
 
+class _ExportRowCounter:
+    """Counts rows as they pass through and reports progress every so often."""
+
+    def __init__(
+        self,
+        rows: Iterable[list[str]],
+        *,
+        on_progress: Callable[[int], None] | None = None,
+        progress_every: int | None = None,
+    ) -> None:
+        self._rows = rows
+        self._on_progress = on_progress
+        self._progress_every = max(progress_every or _EXPORT_PROGRESS_EVERY, 1)
+        self.count = 0
+
+    def __iter__(self) -> Iterator[list[str]]:
+        for row in self._rows:
+            self.count += 1
+            if self._on_progress and self.count % self._progress_every == 0:
+                self._on_progress(self.count)
+            yield row
+
+
+@dataclass
+class StreamingExport:
+    """An export rendered chunk by chunk while its rows are read.
+
+    ``row_count`` is final only once ``chunks`` has been exhausted.
+    """
+
+    chunks: Iterator[bytes]
+    media_type: str
+    extension: str
+    counter: _ExportRowCounter
+
+    @property
+    def row_count(self) -> int:
+        return self.counter.count
+
+
 def export_csv(
     db: Session,
     *,
@@ -191,7 +241,7 @@ def export_csv(
     include_headers: bool = True,
     max_rows: int | None = 10000,
 ) -> tuple[str, int]:
-    rows, fields = _query_rows(
+    fields, rows = iter_export_rows(
         db,
         module=module,
         selected_fields=selected_fields,
@@ -200,33 +250,21 @@ def export_csv(
         status=status,
         max_rows=max_rows,
     )
-    output = io.StringIO()
-    writer = csv.writer(output, delimiter=_coerce_delimiter(delimiter))
-
-    if include_headers:
-        writer.writerow(fields)
-    for row in rows:
-        writer.writerow(
-            [_serialize_value(getattr(row, field, None)) for field in fields]
+    counter = _ExportRowCounter(rows)
+    text = "".join(
+        stream_csv(
+            fields,
+            counter,
+            delimiter=delimiter,
+            include_headers=include_headers,
         )
-
-    return output.getvalue(), len(rows)
+    )
+    return text, counter.count
 
 
-def _query_rows(
-    db: Session,
-    *,
-    module: str,
-    selected_fields: list[str] | None,
-    date_from: str | None = None,
-    date_to: str | None = None,
-    status: str | None = None,
-    max_rows: int | None = 10000,
-) -> tuple[list[Any], list[str]]:
-    cfg = EXPORT_CONFIG.get(module)
-    if not cfg:
+def _export_fields(module: str, selected_fields: list[str] | None) -> list[str]:
+    if not EXPORT_CONFIG.get(module):
         raise ValueError("Unsupported export module")
-
     all_fields = module_fields(module)
     if selected_fields:
         fields = [field for field in selected_fields if field in all_fields]
@@ -234,9 +272,25 @@ def _query_rows(
         fields = all_fields
     if not fields:
         raise ValueError("Select at least one field")
+    return fields
+
 
+def _export_query(
+    db: Session,
+    *,
+    module: str,
+    selected_fields: list[str] | None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    status: str | None = None,
+    max_rows: int | None = 10000,
+) -> tuple[Query, list[str]]:
+    """Column-only query for the export, so rows never hydrate ORM objects."""
+    fields = _export_fields(module, selected_fields)
+    cfg = EXPORT_CONFIG[module]
     model = cfg["model"]
-    query = db.query(model)
+    columns = model.__table__.columns
+    query = db.query(*(columns[field] for field in fields)).select_from(model)
     start_dt, end_dt = _date_filters(date_from, date_to)
 
     date_field_name = cfg.get("date_field")
@@ -256,10 +310,63 @@ def _query_rows(
         query = query.order_by(getattr(model, date_field_name).desc())
 
     if max_rows is not None:
-        rows = query.limit(max_rows).all()
-    else:
-        rows = query.all()
-    return rows, fields
+        query = query.limit(max_rows)
+    return query, fields
+
+
+def iter_export_rows(
+    db: Session,
+    *,
+    module: str,
+    selected_fields: list[str] | None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    status: str | None = None,
+    max_rows: int | None = 10000,
+) -> tuple[list[str], Iterator[list[str]]]:
+    """Export field names and a lazy iterator of serialized rows.
+
+    Rows are read ``_EXPORT_YIELD_PER`` at a time from a server-side cursor
+    on PostgreSQL, so memory stays flat whatever the row count. The query runs
+    on first iteration; filters are validated immediately.
+    """
+    query, fields = _export_query(
+        db,
+        module=module,
+        selected_fields=selected_fields,
+        date_from=date_from,
+        date_to=date_to,
+        status=status,
+        max_rows=max_rows,
+    )
+
+    def _rows() -> Iterator[list[str]]:
+        for row in query.yield_per(_EXPORT_YIELD_PER):
+            yield [_serialize_value(value) for value in row]
+
+    return fields, _rows()
+
+
+def _query_rows(
+    db: Session,
+    *,
+    module: str,
+    selected_fields: list[str] | None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    status: str | None = None,
+    max_rows: int | None = 10000,
+) -> tuple[list[Any], list[str]]:
+    query, fields = _export_query(
+        db,
+        module=module,
+        selected_fields=selected_fields,
+        date_from=date_from,
+        date_to=date_to,
+        status=status,
+        max_rows=max_rows,
+    )
+    return query.all(), fields
 
 
 def count_rows(
@@ -309,71 +416,140 @@ def _xlsx_col_name(index: int) -> str:
     return out
 
 
+def stream_csv(
+    fields: list[str],
+    rows: Iterable[list[str]],
+    *,
+    delimiter: str,
+    include_headers: bool,
+) -> Iterator[str]:
+    """Yield the CSV one line at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=_coerce_delimiter(delimiter))
+
+    def _emit(values: list[str]) -> str:
+        buffer.seek(0)
+        buffer.truncate(0)
+        writer.writerow(values)
+        return buffer.getvalue()
+
+    if include_headers:
+        yield _emit(fields)
+    for row in rows:
+        yield _emit(row)
+
+
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Export" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+_XLSX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    "</Relationships>"
+)
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    "</Types>"
+)
+_XLSX_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    "<sheetData>"
+)
+_XLSX_SHEET_TAIL = "</sheetData></worksheet>"
+
+
+def _xlsx_row_xml(row_idx: int, row: list[str]) -> str:
+    cells: list[str] = []
+    for col_idx, value in enumerate(row):
+        ref = f"{_xlsx_col_name(col_idx)}{row_idx}"
+        safe = (
+            str(value).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        )
+        cells.append(f'<c r="{ref}" t="inlineStr"><is><t>{safe}</t></is></c>')
+    return f'<row r="{row_idx}">{"".join(cells)}</row>'
+
+
+class _ChunkSink:
+    """Write-only, non-seekable zip target whose bytes are drained as chunks.
+
+    Having no ``tell``/``seek`` makes ``zipfile`` write data descriptors after
+    each member instead of seeking back to patch headers.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+        self.pending = 0
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        self.pending += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def drain(self) -> bytes:
+        chunk = b"".join(self._parts)
+        self._parts.clear()
+        self.pending = 0
+        return chunk
+
+
+def stream_xlsx(
+    fields: list[str], rows: Iterable[list[str]], *, include_headers: bool
+) -> Iterator[bytes]:
+    """Yield an .xlsx workbook in chunks while the worksheet rows are written.
+
+    The worksheet is deflated as it is written and drained every
+    ``_XLSX_FLUSH_BYTES``, so neither the sheet XML nor the archive is ever
+    held whole.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(
+        cast(IO[bytes], sink), mode="w", compression=zipfile.ZIP_DEFLATED
+    ) as zf:
+        zf.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES)
+        zf.writestr("_rels/.rels", _XLSX_RELS)
+        zf.writestr("xl/workbook.xml", _XLSX_WORKBOOK)
+        zf.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS)
+        yield sink.drain()
+        # The sheet size is unknown up front, so allow it to pass 4 GiB.
+        with zf.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(_XLSX_SHEET_HEAD.encode("utf-8"))
+            row_idx = 0
+            if include_headers:
+                row_idx += 1
+                sheet.write(_xlsx_row_xml(row_idx, fields).encode("utf-8"))
+            for row in rows:
+                row_idx += 1
+                sheet.write(_xlsx_row_xml(row_idx, row).encode("utf-8"))
+                if sink.pending >= _XLSX_FLUSH_BYTES:
+                    yield sink.drain()
+            sheet.write(_XLSX_SHEET_TAIL.encode("utf-8"))
+    yield sink.drain()
+
+
 def _render_xlsx(
     fields: list[str], data_rows: list[list[str]], include_headers: bool
 ) -> bytes:
-    sheet_rows: list[list[str]] = []
-    if include_headers:
-        sheet_rows.append(fields)
-    sheet_rows.extend(data_rows)
-
-    row_xml: list[str] = []
-    for row_idx, row in enumerate(sheet_rows, start=1):
-        cells: list[str] = []
-        for col_idx, value in enumerate(row):
-            ref = f"{_xlsx_col_name(col_idx)}{row_idx}"
-            safe = (
-                str(value)
-                .replace("&", "&amp;")
-                .replace("<", "&lt;")
-                .replace(">", "&gt;")
-            )
-            cells.append(f'<c r="{ref}" t="inlineStr"><is><t>{safe}</t></is></c>')
-        row_xml.append(f'<row r="{row_idx}">{"".join(cells)}</row>')
-
-    worksheet = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
-        f"<sheetData>{''.join(row_xml)}</sheetData>"
-        "</worksheet>"
-    )
-    workbook = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
-        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
-        '<sheets><sheet name="Export" sheetId="1" r:id="rId1"/></sheets>'
-        "</workbook>"
-    )
-    rels = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
-        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
-        "</Relationships>"
-    )
-    workbook_rels = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
-        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
-        "</Relationships>"
-    )
-    content_types = (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
-        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
-        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
-        '<Default Extension="xml" ContentType="application/xml"/>'
-        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
-        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
-        "</Types>"
-    )
-
-    output = io.BytesIO()
-    with zipfile.ZipFile(output, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr("[Content_Types].xml", content_types)
-        zf.writestr("_rels/.rels", rels)
-        zf.writestr("xl/workbook.xml", workbook)
-        zf.writestr("xl/_rels/workbook.xml.rels", workbook_rels)
-        zf.writestr("xl/worksheets/sheet1.xml", worksheet)
-    return output.getvalue()
+    return b"".join(stream_xlsx(fields, data_rows, include_headers=include_headers))
 
 
 def _escape_pdf_text(value: str) -> str:
@@ -443,7 +619,7 @@ def _render_pdf(
     return out.getvalue()
 
 
-def export_content(
+def stream_export(
     db: Session,
     *,
     module: str,
@@ -454,9 +630,18 @@ def export_content(
     date_to: str | None = None,
     status: str | None = None,
     include_headers: bool = True,
-    max_rows: int | None = 10000,
-) -> tuple[bytes, str, str, int]:
-    rows, fields = _query_rows(
+    max_rows: int | None = None,
+    on_progress: Callable[[int], None] | None = None,
+) -> StreamingExport:
+    """Render a CSV or XLSX export incrementally from a server-side cursor.
+
+    ``on_progress`` is called with the running row count every
+    ``_EXPORT_PROGRESS_EVERY`` rows.
+    """
+    normalized = (export_format or "csv").strip().lower()
+    if normalized not in STREAMING_EXPORT_FORMATS:
+        raise ValueError("Unsupported streaming export format")
+    fields, rows = iter_export_rows(
         db,
         module=module,
         selected_fields=selected_fields,
@@ -465,35 +650,127 @@ def export_content(
         status=status,
         max_rows=max_rows,
     )
-    data_rows = _table_rows(rows, fields)
-    normalized = (export_format or "csv").strip().lower()
+    counter = _ExportRowCounter(rows, on_progress=on_progress)
     if normalized == "csv":
-        text, count = export_csv(
+        lines = stream_csv(
+            fields, counter, delimiter=delimiter, include_headers=include_headers
+        )
+        return StreamingExport(
+            chunks=(line.encode("utf-8") for line in lines),
+            media_type="text/csv",
+            extension="csv",
+            counter=counter,
+        )
+    return StreamingExport(
+        chunks=stream_xlsx(fields, counter, include_headers=include_headers),
+        media_type=XLSX_MEDIA_TYPE,
+        extension="xlsx",
+        counter=counter,
+    )
+
+
+def stream_export_body(
+    *,
+    module: str,
+    selected_fields: list[str] | None,
+    delimiter: str,
+    export_format: str,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    status: str | None = None,
+    include_headers: bool = True,
+    max_rows: int | None = None,
+) -> tuple[Iterator[bytes], str, str]:
+    """CSV/XLSX chunks for a streaming response, read on their own session.
+
+    A streaming body is iterated after the request-scoped session is closed,
+    so the chunks open a read session when iteration starts and close it when
+    the export ends or the client goes away. Module, fields and format are
+    checked here, before the response starts. A database error mid-stream is
+    logged and re-raised so the response aborts instead of ending a truncated
+    file cleanly. Returns ``(chunks, media_type, extension)``.
+    """
+    normalized = (export_format or "csv").strip().lower()
+    if normalized not in STREAMING_EXPORT_FORMATS:
+        raise ValueError("Unsupported streaming export format")
+    _export_fields(module, selected_fields)
+
+    def _chunks() -> Iterator[bytes]:
+        with db_session_adapter.read_session() as db:
+            export = stream_export(
+                db,
+                module=module,
+                selected_fields=selected_fields,
+                delimiter=delimiter,
+                export_format=normalized,
+                date_from=date_from,
+                date_to=date_to,
+                status=status,
+                include_headers=include_headers,
+                max_rows=max_rows,
+            )
+            try:
+                yield from export.chunks
+            except Exception:
+                logger.exception(
+                    "system_export_stream_failed",
+                    extra={
+                        "module": module,
+                        "format": normalized,
+                        "rows": export.row_count,
+                    },
+                )
+                raise
+
+    media_type = XLSX_MEDIA_TYPE if normalized == "xlsx" else "text/csv"
+    return _chunks(), media_type, normalized
+
+
+def export_content(
+    db: Session,
+    *,
+    module: str,
+    selected_fields: list[str] | None,
+    delimiter: str,
+    export_format: str,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    status: str | None = None,
+    include_headers: bool = True,
+    max_rows: int | None = 10000,
+) -> tuple[bytes, str, str, int]:
+    normalized = (export_format or "csv").strip().lower()
+    if normalized in STREAMING_EXPORT_FORMATS:
+        export = stream_export(
             db,
             module=module,
             selected_fields=selected_fields,
             delimiter=delimiter,
+            export_format=normalized,
             date_from=date_from,
             date_to=date_to,
             status=status,
             include_headers=include_headers,
             max_rows=max_rows,
         )
-        return text.encode("utf-8"), "text/csv", "csv", count
+        body = b"".join(export.chunks)
+        return body, export.media_type, export.extension, export.row_count
+    rows, fields = _query_rows(
+        db,
+        module=module,
+        selected_fields=selected_fields,
+        date_from=date_from,
+        date_to=date_to,
+        status=status,
+        max_rows=max_rows,
+    )
+    data_rows = _table_rows(rows, fields)
     if normalized == "json":
         payload = [
             {field: row[idx] for idx, field in enumerate(fields)} for row in data_rows
         ]
         body = json.dumps(payload, indent=2)
         return body.encode("utf-8"), "application/json", "json", len(data_rows)
-    if normalized == "xlsx":
-        body = _render_xlsx(fields, data_rows, include_headers=include_headers)
-        return (
-            body,
-            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            "xlsx",
-            len(data_rows),
-        )
     if normalized == "pdf":
         module_label = EXPORT_CONFIG[module]["label"]
         body = _render_pdf(
@@ -548,6 +825,7 @@ def _parse_export_job_setting(setting: DomainSetting) -> dict[str, Any]:
         "id": job_id,
         "status": str(payload.get("status") or "queued"),
         "row_count": int(payload.get("row_count") or 0),
+        "rows_written": int(payload.get("rows_written") or 0),
         "module": str(payload.get("module") or ""),
         "export_format": str(payload.get("export_format") or "csv"),
         "filename": str(payload.get("filename") or ""),
@@ -793,15 +1071,46 @@ def _set_export_job_state(
     return _parse_export_job_setting(setting)
 
 
-def _write_export_job_file(job_id: str, extension: str, content: bytes) -> str:
+def _write_export_job_file(
+    job_id: str, extension: str, content: bytes | Iterable[bytes]
+) -> str:
+    """Write the job file chunk by chunk; it appears only once complete."""
     safe_ext = (extension or "csv").strip().lower()
     EXPORT_JOBS_DIR.mkdir(parents=True, exist_ok=True)
     filename = f"{job_id}.{safe_ext}"
     path = EXPORT_JOBS_DIR / filename
-    path.write_bytes(content)
+    partial = path.with_name(f"{filename}.part")
+    chunks = [content] if isinstance(content, bytes) else content
+    try:
+        with partial.open("wb") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+        partial.replace(path)
+    finally:
+        partial.unlink(missing_ok=True)
     return str(path)
 
 
+def _record_export_progress(*, job_id: str, rows_written: int) -> None:
+    """Publish progress from a side session; a failed write is only logged.
+
+    Committing the export's own session would end the transaction that holds
+    its server-side cursor open, and progress is not worth aborting a long
+    export over.
+    """
+    try:
+        with db_session_adapter.session() as progress_db:
+            _set_export_job_state(
+                progress_db, job_id=job_id, updates={"rows_written": int(rows_written)}
+            )
+    except Exception:
+        logger.warning(
+            "export_job_progress_write_failed",
+            extra={"job_id": job_id, "rows_written": rows_written},
+            exc_info=True,
+        )
+
+
 def _resolve_export_link_base(db: Session) -> str:
     env_url = (os.getenv("APP_URL") or "").strip()
     if env_url:
@@ -883,23 +1192,38 @@ def process_export_job(db: Session, *, job_id: str) -> dict[str, Any]:
         updates={
             "status": "running",
             "started_at": datetime.now(UTC).isoformat(),
+            "rows_written": 0,
             "error": None,
         },
     )
     try:
-        content, media_type, extension, row_count = export_content(
-            db,
-            module=str(config.get("module") or ""),
-            selected_fields=[str(x) for x in (config.get("selected_fields") or [])],
-            delimiter=str(config.get("delimiter") or ","),
-            export_format=str(config.get("export_format") or "csv"),
-            date_from=(str(config.get("date_from") or "").strip() or None),
-            date_to=(str(config.get("date_to") or "").strip() or None),
-            status=(str(config.get("status") or "").strip() or None),
-            include_headers=bool(config.get("include_headers", True)),
-            max_rows=None,
-        )
-        file_path = _write_export_job_file(job_id, extension, content)
+        export_kwargs: dict[str, Any] = {
+            "module": str(config.get("module") or ""),
+            "selected_fields": [str(x) for x in (config.get("selected_fields") or [])],
+            "delimiter": str(config.get("delimiter") or ","),
+            "export_format": str(config.get("export_format") or "csv"),
+            "date_from": (str(config.get("date_from") or "").strip() or None),
+            "date_to": (str(config.get("date_to") or "").strip() or None),
+            "status": (str(config.get("status") or "").strip() or None),
+            "include_headers": bool(config.get("include_headers", True)),
+            "max_rows": None,
+        }
+        if export_kwargs["export_format"].strip().lower() in STREAMING_EXPORT_FORMATS:
+            export = stream_export(
+                db,
+                **export_kwargs,
+                on_progress=lambda rows_written: _record_export_progress(
+                    job_id=job_id, rows_written=rows_written
+                ),
+            )
+            file_path = _write_export_job_file(job_id, export.extension, export.chunks)
+            media_type, extension = export.media_type, export.extension
+            row_count = export.row_count
+        else:
+            content, media_type, extension, row_count = export_content(
+                db, **export_kwargs
+            )
+            file_path = _write_export_job_file(job_id, extension, content)
         filename = _build_export_filename(
             str(config.get("module") or "export"), extension, row_count
         )
@@ -912,6 +1236,7 @@ def process_export_job(db: Session, *, job_id: str) -> dict[str, Any]:
             updates={
                 "status": "completed",
                 "row_count": int(row_count),
+                "rows_written": int(row_count),
                 "filename": filename,
                 "file_path": file_path,
                 "download_url": download_url,
@@ -0,0 +1,253 @@
+"""Streaming correlation of ONT down/up syslog events into outage bursts.
+
+A fibre cut or a cabinet losing power makes every ONT behind it report LOS or
+dying-gasp within seconds. Individually those events say little; together
+they are an outage that the SNMP poll would only notice on its next sweep.
+The correlator keeps a sliding window of distinct down ONTs per PON
+(``olt_id`` + F/S/P). When ``pon_min_onts`` of them fall inside
+``window_seconds`` the PON is latched as bursting and one
+:class:`BurstCandidate` is emitted; when ``olt_min_pons`` PONs of the same OLT
+are bursting at once, a single OLT-scope candidate supersedes them. Later
+down events on a latched PON only grow its count, so a storm of thousands of
+messages produces one candidate.
+
+Every burst on an OLT lands on one OLT-rooted incident, so each candidate
+also carries ``olt_ont_count``: the down ONTs summed over every latched PON
+of that OLT.
+
+``online`` events take ONTs out of the window (a flap does not count) and,
+once half of a latched PON's ONTs are back, release the latch. The
+:class:`BurstRecovery` is emitted only when no other PON of the OLT is still
+latched, since it discards the shared incident. A latch that sees no recovery
+expires after ``hold_seconds`` so a later outage on the same PON is reported
+again.
+
+The correlator is pure in-memory state with no I/O; ``handle_ont_events``
+feeds it from the listener's single batch consumer, so it is not locked.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from app.syslog.parsers import OntEvent, OntEventType
+
+DEFAULT_WINDOW_SECONDS = 60.0
+DEFAULT_PON_MIN_ONTS = 8
+DEFAULT_OLT_MIN_PONS = 3
+DEFAULT_HOLD_SECONDS = 900.0
+
+DOWN_EVENT_TYPES = frozenset(
+    {OntEventType.los, OntEventType.dying_gasp, OntEventType.offline}
+)
+UP_EVENT_TYPES = frozenset({OntEventType.online})
+
+PON_SCOPE = "pon"
+OLT_SCOPE = "olt"
+
+_PonKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class BurstCandidate:
+    """One correlated outage: a bursting PON, or a whole OLT.
+
+    ``ont_count`` covers ``fsps``; ``olt_ont_count`` covers every PON of the
+    OLT still latched, which is what the OLT-rooted incident is affected by.
+    """
+
+    olt_id: str
+    scope: str
+    fsps: tuple[str, ...]
+    ont_count: int
+    olt_ont_count: int
+    cause: str
+
+    @property
+    def classification(self) -> str:
+        # e.g. "syslog_pon_los" (fibre) vs "syslog_olt_dying_gasp" (power).
+        return f"syslog_{self.scope}_{self.cause}"
+
+
+@dataclass(frozen=True)
+class BurstRecovery:
+    """Every burst reported on an OLT is over; ``fsps`` lists their PONs."""
+
+    olt_id: str
+    scope: str
+    fsps: tuple[str, ...]
+
+
+@dataclass
+class _Burst:
+    latched_at: float
+    onts: set[str] = field(default_factory=set)
+    recovered: set[str] = field(default_factory=set)
+
+
+def _ont_key(event: OntEvent) -> str | None:
+    if event.ont_id is not None:
+        return str(event.ont_id)
+    return event.serial_number or None
+
+
+class OntEventCorrelator:
+    """Sliding-window burst detector for ONT down/up events."""
+
+    def __init__(
+        self,
+        *,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        pon_min_onts: int = DEFAULT_PON_MIN_ONTS,
+        olt_min_pons: int = DEFAULT_OLT_MIN_PONS,
+        hold_seconds: float = DEFAULT_HOLD_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window_seconds = max(1.0, float(window_seconds))
+        self.pon_min_onts = max(1, int(pon_min_onts))
+        self.olt_min_pons = max(1, int(olt_min_pons))
+        self.hold_seconds = max(self.window_seconds, float(hold_seconds))
+        self._clock = clock
+        # PON -> {ont: (seen_at, cause)}; dicts keep insertion order, so the
+        # oldest entries are pruned from the front.
+        self._down: dict[_PonKey, dict[str, tuple[float, str]]] = {}
+        self._pon_bursts: dict[_PonKey, _Burst] = {}
+        self._olt_bursts: dict[str, float] = {}
+        # OLT -> PONs released while a sibling PON was still latched.
+        self._released: dict[str, set[str]] = {}
+        self._next_sweep = 0.0
+
+    def observe(
+        self, olt_id: str, event: OntEvent
+    ) -> list[BurstCandidate | BurstRecovery]:
+        """Feed one event; returns the candidates/recoveries it triggered."""
+        ont = _ont_key(event)
+        if ont is None:
+            return []
+        now = self._clock()
+        self._expire(now)
+        key = (olt_id, event.fsp)
+        if event.event_type in DOWN_EVENT_TYPES:
+            return self._on_down(key, ont, event.event_type.value, now)
+        if event.event_type in UP_EVENT_TYPES:
+            return self._on_up(key, ont)
+        return []
+
+    def _on_down(
+        self, key: _PonKey, ont: str, cause: str, now: float
+    ) -> list[BurstCandidate | BurstRecovery]:
+        burst = self._pon_bursts.get(key)
+        if burst is not None:
+            burst.onts.add(ont)
+            burst.recovered.discard(ont)
+            return []
+
+        window = self._down.setdefault(key, {})
+        window.pop(ont, None)
+        window[ont] = (now, cause)
+        self._prune(key, now)
+        if len(window) < self.pon_min_onts:
+            return []
+
+        causes = Counter(c for _seen, c in window.values())
+        burst = _Burst(latched_at=now, onts=set(window))
+        self._pon_bursts[key] = burst
+        del self._down[key]
+
+        olt_id = key[0]
+        if olt_id in self._olt_bursts:
+            return []
+        pons = sorted(fsp for olt, fsp in self._pon_bursts if olt == olt_id)
+        olt_ont_count = self._olt_ont_count(olt_id)
+        if len(pons) >= self.olt_min_pons:
+            self._olt_bursts[olt_id] = now
+            return [
+                BurstCandidate(
+                    olt_id=olt_id,
+                    scope=OLT_SCOPE,
+                    fsps=tuple(pons),
+                    ont_count=olt_ont_count,
+                    olt_ont_count=olt_ont_count,
+                    cause=causes.most_common(1)[0][0],
+                )
+            ]
+        return [
+            BurstCandidate(
+                olt_id=olt_id,
+                scope=PON_SCOPE,
+                fsps=(key[1],),
+                ont_count=len(burst.onts),
+                olt_ont_count=olt_ont_count,
+                cause=causes.most_common(1)[0][0],
+            )
+        ]
+
+    def _olt_ont_count(self, olt_id: str) -> int:
+        return sum(
+            len(burst.onts)
+            for (olt, _fsp), burst in self._pon_bursts.items()
+            if olt == olt_id
+        )
+
+    def _olt_latched(self, olt_id: str) -> bool:
+        return any(olt == olt_id for olt, _fsp in self._pon_bursts)
+
+    def _on_up(self, key: _PonKey, ont: str) -> list[BurstCandidate | BurstRecovery]:
+        window = self._down.get(key)
+        if window is not None:
+            window.pop(ont, None)
+            if not window:
+                del self._down[key]
+        burst = self._pon_bursts.get(key)
+        if burst is None or ont not in burst.onts:
+            return []
+        burst.recovered.add(ont)
+        if len(burst.recovered) * 2 < len(burst.onts):
+            return []
+        return self._release(key)
+
+    def _release(self, key: _PonKey) -> list[BurstCandidate | BurstRecovery]:
+        """Drop a PON latch; report recovery once the OLT has none left."""
+        self._pon_bursts.pop(key, None)
+        olt_id, fsp = key
+        released = self._released.setdefault(olt_id, set())
+        released.add(fsp)
+        if self._olt_latched(olt_id):
+            return []
+        del self._released[olt_id]
+        scope = OLT_SCOPE if self._olt_bursts.pop(olt_id, None) else PON_SCOPE
+        return [BurstRecovery(olt_id=olt_id, scope=scope, fsps=tuple(sorted(released)))]
+
+    def _prune(self, key: _PonKey, now: float) -> None:
+        window = self._down.get(key)
+        if not window:
+            return
+        cutoff = now - self.window_seconds
+        while window:
+            oldest = next(iter(window))
+            if window[oldest][0] >= cutoff:
+                break
+            del window[oldest]
+        if not window:
+            del self._down[key]
+
+    def _expire(self, now: float) -> None:
+        # At most once per second: prune idle windows so quiet PONs do not
+        # accumulate, and drop latches past hold_seconds. An expired latch is
+        # silent — the poll-driven reconcile owns the incident by then.
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + 1.0
+        for key in list(self._down):
+            self._prune(key, now)
+        for key, burst in list(self._pon_bursts.items()):
+            if now - burst.latched_at < self.hold_seconds:
+                continue
+            del self._pon_bursts[key]
+            olt_id = key[0]
+            if not self._olt_latched(olt_id):
+                self._olt_bursts.pop(olt_id, None)
+                self._released.pop(olt_id, None)
@@ -1,17 +1,37 @@
 """Event handlers for syslog messages.
 
 Routes parsed syslog events to appropriate actions like autofind persistence.
+``handle_ont_events`` is the batch entry point the listener uses; it runs in a
+worker thread, never on the listener's event loop. ONT down/up events from that
+path also feed the burst correlator, which turns a LOS/dying-gasp storm into a
+single suspected outage incident.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from datetime import UTC, datetime
 
 from sqlalchemy import select
 
+from app.config import settings
 from app.models.network import OLTDevice
 from app.services.db_session_adapter import db_session_adapter
+from app.services.network.identity import network_device_for_matched_entity
+from app.services.topology.outage import (
+    discard_syslog_burst_incident,
+    open_syslog_burst_incident,
+)
 from app.services.web_network_ont_autofind import upsert_autofind_from_syslog
+from app.syslog.correlator import (
+    DOWN_EVENT_TYPES,
+    UP_EVENT_TYPES,
+    BurstCandidate,
+    BurstRecovery,
+    OntEventCorrelator,
+)
 from app.syslog.parsers import OntEvent, OntEventType
 
 logger = logging.getLogger(__name__)
@@ -44,27 +64,194 @@ def handle_ont_event(event: OntEvent) -> None:
         )
 
 
+class _OltIpMap:
+    """Active OLT management IP -> OLT id, reloaded periodically.
+
+    A storm from one OLT would otherwise cost one SELECT per message. The map
+    reloads when older than ``SYSLOG_OLT_MAP_REFRESH_SECONDS``; an unknown IP
+    triggers an early reload at most every ``miss_refresh_seconds`` so a newly
+    added OLT is picked up quickly without letting unknown senders force a
+    query per datagram.
+    """
+
+    def __init__(self, *, miss_refresh_seconds: float = 30.0) -> None:
+        self._by_ip: dict[str, str] = {}
+        self._loaded_at: float | None = None
+        self._miss_refresh_seconds = miss_refresh_seconds
+        self._lock = threading.Lock()
+
+    def lookup(self, ip_address: str) -> str | None:
+        with self._lock:
+            now = time.monotonic()
+            age = None if self._loaded_at is None else now - self._loaded_at
+            if age is None or age >= settings.syslog_olt_map_refresh_seconds:
+                self._reload(now)
+            elif ip_address not in self._by_ip and age >= self._miss_refresh_seconds:
+                self._reload(now)
+            return self._by_ip.get(ip_address)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def _reload(self, now: float) -> None:
+        with db_session_adapter.read_session() as db:
+            rows = db.execute(
+                select(OLTDevice.mgmt_ip, OLTDevice.id).where(
+                    OLTDevice.is_active.is_(True),
+                    OLTDevice.mgmt_ip.isnot(None),
+                )
+            ).all()
+        by_ip: dict[str, str] = {}
+        for mgmt_ip, olt_id in rows:
+            # Keep the first match, like the per-message lookup did.
+            by_ip.setdefault(str(mgmt_ip), str(olt_id))
+        self._by_ip = by_ip
+        self._loaded_at = now
+        logger.debug("syslog_olt_map_reloaded", extra={"olts": len(by_ip)})
+
+
+_olt_ip_map = _OltIpMap()
+
+
 def _find_olt_by_ip(ip_address: str) -> str | None:
     """Find OLT ID by management IP address."""
-    with db_session_adapter.read_session() as db:
-        olt = db.scalars(
-            select(OLTDevice).where(
-                OLTDevice.mgmt_ip == ip_address,
-                OLTDevice.is_active.is_(True),
-            )
-        ).first()
-        return str(olt.id) if olt else None
+    return _olt_ip_map.lookup(ip_address)
 
 
-def _handle_autofind_event(event: OntEvent) -> None:
-    """Handle an ONTAUTOFIND syslog event.
+def handle_ont_events(events: list[OntEvent]) -> None:
+    """Handle a batch of ONT events with one DB transaction for autofinds.
 
-    Directly persists the autofind candidate to the database.
-    No SSH polling, no Celery tasks, no cooldown - just immediate persistence.
+    Repeated autofind reports for the same OLT/port/serial within the batch
+    (an OLT re-announcing after a reboot) collapse into one upsert. Each
+    upsert runs in a savepoint so one bad row does not discard the batch.
+    Down/up events go through the burst correlator; only a detected burst or
+    its recovery costs a transaction.
+    """
+    autofinds: dict[tuple[str, str, str], OntEvent] = {}
+    bursts: list[BurstCandidate | BurstRecovery] = []
+    for event in events:
+        if event.event_type != OntEventType.autofind:
+            handle_ont_event(event)
+            bursts.extend(_correlate(event))
+            continue
+        olt_id = _autofind_olt_id(event)
+        if olt_id is None or not event.serial_number:
+            continue
+        autofinds.setdefault((olt_id, event.fsp, event.serial_number), event)
+    if bursts:
+        _record_bursts(bursts)
+    if not autofinds:
+        return
 
-    Args:
-        event: Autofind event with F/S/P and serial number
+    persisted = failed = 0
+    with db_session_adapter.session() as db:
+        for olt_id, fsp, serial_number in autofinds:
+            try:
+                with db.begin_nested():
+                    ok = upsert_autofind_from_syslog(
+                        db, olt_id=olt_id, fsp=fsp, serial_number=serial_number
+                    )
+            except Exception:
+                logger.exception(
+                    "syslog_autofind_persist_error",
+                    extra={
+                        "olt_id": olt_id,
+                        "fsp": fsp,
+                        "serial_number": serial_number,
+                    },
+                )
+                ok = False
+            if ok:
+                persisted += 1
+            else:
+                failed += 1
+    logger.info(
+        "syslog_autofind_batch_persisted",
+        extra={
+            "events": len(events),
+            "candidates": len(autofinds),
+            "persisted": persisted,
+            "failed": failed,
+        },
+    )
+
+
+_correlator = OntEventCorrelator(
+    window_seconds=settings.syslog_burst_window_seconds,
+    pon_min_onts=settings.syslog_burst_pon_min_onts,
+    olt_min_pons=settings.syslog_burst_olt_min_pons,
+)
+
+
+def _correlate(event: OntEvent) -> list[BurstCandidate | BurstRecovery]:
+    """Feed a down/up event to the burst correlator (no DB access)."""
+    if event.event_type not in DOWN_EVENT_TYPES | UP_EVENT_TYPES:
+        return []
+    if not event.source_ip:
+        return []
+    olt_id = _find_olt_by_ip(event.source_ip)
+    if not olt_id:
+        return []
+    return _correlator.observe(olt_id, event)
+
+
+def _record_bursts(bursts: list[BurstCandidate | BurstRecovery]) -> None:
+    """Open (or absorb into) one outage incident per burst; discard on recovery.
+
+    The incident roots at the OLT's topology node — PONs have no node of their
+    own — so it is affected by the ONTs of every latched PON on that OLT, and
+    the correlator reports recovery only once none is left. The reconcile
+    pass takes over confirmation from there.
     """
+    now = datetime.now(UTC)
+    with db_session_adapter.session() as db:
+        for burst in bursts:
+            extra = {
+                "olt_id": burst.olt_id,
+                "scope": burst.scope,
+                "fsps": ",".join(burst.fsps),
+            }
+            try:
+                with db.begin_nested():
+                    root = network_device_for_matched_entity(
+                        db, device_type="olt", device_id=burst.olt_id
+                    )
+                    if root is None:
+                        logger.warning("syslog_burst_no_topology_node", extra=extra)
+                        continue
+                    if isinstance(burst, BurstRecovery):
+                        discarded = discard_syslog_burst_incident(
+                            db, root_node_id=root.id
+                        )
+                        logger.info(
+                            "syslog_burst_recovered",
+                            extra={**extra, "discarded": discarded is not None},
+                        )
+                        continue
+                    incident, opened = open_syslog_burst_incident(
+                        db,
+                        root_node=root,
+                        affected_count=burst.olt_ont_count,
+                        classification=burst.classification,
+                        now=now,
+                    )
+                    logger.info(
+                        "syslog_burst_outage",
+                        extra={
+                            **extra,
+                            "onts": burst.ont_count,
+                            "cause": burst.cause,
+                            "incident_id": str(incident.id),
+                            "opened": opened,
+                        },
+                    )
+            except Exception:
+                logger.exception("syslog_burst_persist_error", extra=extra)
+
+
+def _autofind_olt_id(event: OntEvent) -> str | None:
+    """Validate an autofind event and resolve its OLT; None means skip it."""
     if not event.source_ip:
         logger.warning(
             "syslog_autofind_no_source_ip",
@@ -73,7 +260,7 @@ def _handle_autofind_event(event: OntEvent) -> None:
                 "serial_number": event.serial_number,
             },
         )
-        return
+        return None
 
     if not event.serial_number:
         logger.warning(
@@ -83,7 +270,7 @@ def _handle_autofind_event(event: OntEvent) -> None:
                 "source_ip": event.source_ip,
             },
         )
-        return
+        return None
 
     # Resolve OLT by source IP
     olt_id = _find_olt_by_ip(event.source_ip)
@@ -96,6 +283,21 @@ def _handle_autofind_event(event: OntEvent) -> None:
                 "serial_number": event.serial_number,
             },
         )
+        return None
+    return olt_id
+
+
+def _handle_autofind_event(event: OntEvent) -> None:
+    """Handle an ONTAUTOFIND syslog event.
+
+    Directly persists the autofind candidate to the database.
+    No SSH polling, no Celery tasks, no cooldown - just immediate persistence.
+
+    Args:
+        event: Autofind event with F/S/P and serial number
+    """
+    olt_id = _autofind_olt_id(event)
+    if not olt_id or not event.serial_number:
         return
 
     logger.info(
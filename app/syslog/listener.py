@@ -1,7 +1,9 @@
 """UDP syslog listener for receiving OLT events.
 
 Provides an asyncio-based UDP server that receives syslog messages,
-parses them, and routes events to appropriate handlers.
+parses them, and routes events to appropriate handlers. Datagrams go through
+a bounded batching queue (``pipeline.SyslogPipeline``); parsed events are
+persisted in a worker thread so database work never blocks the socket.
 """
 
 from __future__ import annotations
@@ -10,10 +12,14 @@ import asyncio
 import logging
 import os
 import signal
+from collections.abc import Callable
 from datetime import UTC, datetime
 
-from app.syslog.handlers import handle_ont_event
-from app.syslog.parsers import huawei_parser
+from app.config import settings
+from app.services.syslog_health import publish_syslog_health
+from app.syslog.handlers import handle_ont_events
+from app.syslog.parsers import OntEvent, huawei_parser
+from app.syslog.pipeline import Datagram, SyslogPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +28,14 @@ SYSLOG_LISTEN_HOST = os.getenv("SYSLOG_LISTEN_HOST", "0.0.0.0")  # noqa: S104  #
 SYSLOG_LISTEN_PORT = int(os.getenv("SYSLOG_LISTEN_PORT", "514"))
 SYSLOG_ENABLED = os.getenv("SYSLOG_ENABLED", "true").lower() in ("1", "true", "yes")
 
+# How often the ingestion counters are published for the web /metrics scrape.
+HEALTH_PUBLISH_INTERVAL_SECONDS = 15
+
 
 class SyslogProtocol(asyncio.DatagramProtocol):
     """UDP protocol handler for syslog messages."""
 
-    def __init__(self, callback):
+    def __init__(self, callback: Callable[[bytes, tuple[str, int]], object]):
         self.callback = callback
         self.transport = None
 
@@ -34,8 +43,8 @@ class SyslogProtocol(asyncio.DatagramProtocol):
         self.transport = transport
 
     def datagram_received(self, data: bytes, addr: tuple[str, int]):
-        """Handle incoming UDP datagram."""
-        asyncio.create_task(self.callback(data, addr))
+        """Hand the datagram to the (non-blocking) enqueue callback."""
+        self.callback(data, addr)
 
 
 class SyslogListener:
@@ -55,6 +64,12 @@ class SyslogListener:
         self._ont_event_count = 0
         self._start_time: datetime | None = None
         self._last_stats_log_count = 0
+        self._pipeline = SyslogPipeline(
+            self._process_batch,
+            max_queue=settings.syslog_queue_max,
+            batch_size=settings.syslog_batch_size,
+            flush_interval=settings.syslog_flush_interval_seconds,
+        )
 
     async def run(self) -> None:
         """Start the syslog listener and run until stopped."""
@@ -77,8 +92,9 @@ class SyslogListener:
 
         try:
             loop = asyncio.get_event_loop()
+            self._pipeline.start()
             self._transport, self._protocol = await loop.create_datagram_endpoint(
-                lambda: SyslogProtocol(self._on_message_received),
+                lambda: SyslogProtocol(self._pipeline.offer),
                 local_addr=(self.host, self.port),
             )
 
@@ -91,9 +107,15 @@ class SyslogListener:
             )
 
             # Run until stopped
+            ticks = 0
             while self._running:
                 await asyncio.sleep(1)
                 self._maybe_log_stats()
+                ticks += 1
+                if ticks % HEALTH_PUBLISH_INTERVAL_SECONDS == 0:
+                    await asyncio.to_thread(
+                        publish_syslog_health, self._pipeline.snapshot()
+                    )
 
         except PermissionError:
             logger.error(
@@ -131,6 +153,9 @@ class SyslogListener:
             self._transport.close()
             self._transport = None
 
+        # Persist what was already accepted before reporting final counters.
+        await self._pipeline.stop()
+
         uptime = 0.0
         if self._start_time:
             uptime = (datetime.now(UTC) - self._start_time).total_seconds()
@@ -140,12 +165,23 @@ class SyslogListener:
             extra={
                 "events_received": self._event_count,
                 "ont_events_processed": self._ont_event_count,
+                "datagrams_dropped": self._pipeline.dropped,
                 "uptime_seconds": round(uptime, 1),
             },
         )
 
-    async def _on_message_received(self, data: bytes, addr: tuple[str, int]) -> None:
-        """Process a received syslog message.
+    async def _process_batch(self, batch: list[Datagram]) -> None:
+        """Parse a batch of datagrams and persist its ONT events off-loop."""
+        events = [
+            event
+            for data, addr in batch
+            if (event := self._parse_datagram(data, addr)) is not None
+        ]
+        if events:
+            await asyncio.to_thread(handle_ont_events, events)
+
+    def _parse_datagram(self, data: bytes, addr: tuple[str, int]) -> OntEvent | None:
+        """Parse one datagram into an ONT event, or None if it carries none.
 
         Args:
             data: Raw UDP packet data
@@ -158,13 +194,13 @@ class SyslogListener:
             # Parse the syslog message
             msg = huawei_parser.parse_syslog(data, source_ip=source_ip)
             if not msg:
-                return
+                return None
 
             # Check for ONT events
             event = huawei_parser.parse_ont_event(msg)
             if event:
                 self._ont_event_count += 1
-                handle_ont_event(event)
+            return event
 
         except Exception as e:
             logger.warning(
@@ -175,6 +211,7 @@ class SyslogListener:
                     "data_preview": data[:100].decode("utf-8", errors="replace"),
                 },
             )
+            return None
 
     def _maybe_log_stats(self) -> None:
         """Log statistics periodically (every 100 events)."""
@@ -195,6 +232,8 @@ class SyslogListener:
                 "ont_events_processed": self._ont_event_count,
                 "uptime_seconds": round(uptime, 1),
                 "events_per_second": round(eps, 2),
+                "queue_depth": self._pipeline.depth,
+                "datagrams_dropped": self._pipeline.dropped,
             },
         )
 
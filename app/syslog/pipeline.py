@@ -0,0 +1,157 @@
+"""Bounded, batching ingestion queue between the UDP socket and the handlers.
+
+``datagram_received`` must return quickly: anything slow on the event loop
+thread means the kernel socket buffer overflows and datagrams are lost without
+a trace. The protocol therefore only calls :meth:`SyslogPipeline.offer`, which
+enqueues without awaiting. When the queue is full the datagram is dropped and
+counted, so an OLT reboot storm degrades into measured loss instead of an
+unbounded pile of tasks.
+
+A single consumer drains the queue in batches (up to ``batch_size`` items, or
+whatever arrived within ``flush_interval`` of the first one) and hands each
+batch to the processing callback. Because there is one consumer, the batch
+work is serialized and the queue bound is the only buffer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+Datagram = tuple[bytes, tuple[str, int]]
+BatchProcessor = Callable[[list[Datagram]], Awaitable[None]]
+
+DEFAULT_MAX_QUEUE = 10_000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+
+
+class SyslogPipeline:
+    """Bounded datagram queue with a single batching consumer."""
+
+    def __init__(
+        self,
+        process_batch: BatchProcessor,
+        *,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        self._process_batch = process_batch
+        self.max_queue = max(1, int(max_queue))
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = max(0.0, float(flush_interval))
+        self._queue: asyncio.Queue[Datagram] | None = None
+        self._consumer: asyncio.Task[None] | None = None
+        self.received = 0
+        self.dropped = 0
+        self.batches = 0
+        self.last_flush_seconds: float | None = None
+        self._window_max_flush_seconds = 0.0
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self) -> None:
+        """Create the queue and consumer task on the running loop."""
+        if self._consumer is not None and not self._consumer.done():
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._consumer = asyncio.get_running_loop().create_task(self._consume())
+
+    def offer(self, data: bytes, addr: tuple[str, int]) -> bool:
+        """Enqueue one datagram without blocking; False if it was dropped."""
+        self.received += 1
+        if self._queue is None:
+            self.dropped += 1
+            return False
+        try:
+            self._queue.put_nowait((data, addr))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(
+                    "syslog_queue_overflow",
+                    extra={"dropped": self.dropped, "max_queue": self.max_queue},
+                )
+            return False
+        return True
+
+    async def stop(self, *, drain_timeout: float = 5.0) -> None:
+        """Flush what is queued (bounded by ``drain_timeout``), then stop."""
+        consumer, queue = self._consumer, self._queue
+        if consumer is None or queue is None:
+            return
+        if not consumer.done():
+            try:
+                await asyncio.wait_for(queue.join(), timeout=drain_timeout)
+            except TimeoutError:
+                logger.warning(
+                    "syslog_queue_drain_timeout", extra={"remaining": queue.qsize()}
+                )
+            consumer.cancel()
+            try:
+                await consumer
+            except asyncio.CancelledError:
+                pass
+        self._consumer = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Counters for the health snapshot; resets the max-flush window."""
+        window_max = self._window_max_flush_seconds
+        self._window_max_flush_seconds = 0.0
+        return {
+            "queue_depth": self.depth,
+            "queue_capacity": self.max_queue,
+            "received": self.received,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "last_flush_seconds": self.last_flush_seconds,
+            "max_flush_seconds": round(window_max, 4),
+        }
+
+    async def _next_batch(self, queue: asyncio.Queue[Datagram]) -> list[Datagram]:
+        batch = [await queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _consume(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        while True:
+            batch = await self._next_batch(queue)
+            started = time.monotonic()
+            try:
+                await self._process_batch(batch)
+            except Exception:
+                logger.exception(
+                    "syslog_batch_processing_failed", extra={"batch_size": len(batch)}
+                )
+            finally:
+                elapsed = time.monotonic() - started
+                self.batches += 1
+                self.last_flush_seconds = round(elapsed, 4)
+                self._window_max_flush_seconds = max(
+                    self._window_max_flush_seconds, elapsed
+                )
+                for _ in batch:
+                    queue.task_done()
@@ -7,22 +7,17 @@ insert samples into PostgreSQL, and push aggregates to VictoriaMetrics.
 
 import logging
 import os
-import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import redis
-from sqlalchemy import delete, func, select
 
 from app.celery_app import celery_app
-from app.models.bandwidth import BandwidthSample
-from app.models.catalog import NasDevice
 from app.models.domain_settings import SettingDomain
-from app.services.bandwidth_metrics_adapter import (
-    BandwidthAggregate,
-    get_bandwidth_metrics_adapter,
-)
+from app.services.bandwidth_ingest import BandwidthStreamIngestor, write_samples
+from app.services.bandwidth_partitions import apply_retention
+from app.services.bandwidth_rollup import flush_closed_windows
 from app.services.db_session_adapter import db_session_adapter
 from app.services.settings_spec import resolve_value
 
@@ -37,8 +32,6 @@ _DEFAULT_HOT_RETENTION_HOURS = 24
 _DEFAULT_REDIS_STREAM_MAX_LENGTH = 100000
 _DEFAULT_REDIS_READ_TIMEOUT_MS = 1000
 VM_WRITE_MAX_ATTEMPTS = int(os.getenv("BANDWIDTH_VM_WRITE_MAX_ATTEMPTS", "3"))
-_POSTGRES_INTEGER_MAX = 2_147_483_647
-_POSTGRES_INTEGER_MIN = -2_147_483_648
 
 
 def _parse_int_setting(value: object | None, default: int) -> int:
@@ -106,7 +99,9 @@ def process_bandwidth_stream():
     Consume samples from the Redis stream and insert into PostgreSQL.
 
     This task is designed to run frequently (every 5 seconds) and process
-    batches of bandwidth samples from the Redis stream.
+    one batch per run as a member of the stream's consumer group. It can run
+    alongside the long-running ``app.services.bandwidth_ingest`` workers;
+    Redis delivers each entry to only one member.
     """
     r = _get_redis_client()
 
@@ -116,139 +111,18 @@ def process_bandwidth_stream():
             batch_size = _get_batch_size(db)
             read_timeout_ms = _get_redis_read_timeout_ms(db)
 
-        # Read batch from stream
-        # Use consumer group for reliability
-        group_name = "bandwidth_processor"
-        consumer_name = "worker_1"
-
-        # Create consumer group if it doesn't exist
-        try:
-            r.xgroup_create(REDIS_STREAM, group_name, id="0", mkstream=True)
-        except redis.ResponseError as e:
-            if "BUSYGROUP" not in str(e):
-                raise
-
-        # Read pending messages first (unacked from previous runs)
-        pending = r.xreadgroup(
-            groupname=group_name,
-            consumername=consumer_name,
-            streams={REDIS_STREAM: "0"},
-            count=batch_size,
-            block=0,
-        )
-
-        # Then read new messages
-        new_messages = r.xreadgroup(
-            groupname=group_name,
-            consumername=consumer_name,
-            streams={REDIS_STREAM: ">"},
-            count=batch_size,
-            block=read_timeout_ms,
-        )
-
-        all_messages = []
-        if pending:
-            all_messages.extend(pending[0][1])
-        if new_messages:
-            all_messages.extend(new_messages[0][1])
-
-        if not all_messages:
+        ingestor = BandwidthStreamIngestor(r, stream=REDIS_STREAM)
+        ingestor.ensure_group()
+        result = ingestor.run_once(batch_size=batch_size, block_ms=read_timeout_ms)
+        if not result["messages"]:
             return {"processed": 0}
 
-        nas_device_ids: set[UUID] = set()
-
-        # Parse and insert samples
-        samples: list[tuple[BandwidthSample, dict]] = []
-        message_ids = []
-
-        for msg_id, data in all_messages:
-            message_ids.append(msg_id)
-
-            try:
-                sample_at = datetime.fromisoformat(data[b"sample_at"].decode())
-                nas_device_id_raw = data.get(b"nas_device_id")
-                if nas_device_id_raw:
-                    nas_device_ids.add(UUID(nas_device_id_raw.decode()))
-                rx_bps = int(data[b"rx_bps"])
-                tx_bps = int(data[b"tx_bps"])
-                if not (
-                    _POSTGRES_INTEGER_MIN <= rx_bps <= _POSTGRES_INTEGER_MAX
-                    and _POSTGRES_INTEGER_MIN <= tx_bps <= _POSTGRES_INTEGER_MAX
-                ):
-                    logger.warning(
-                        "Skipped bandwidth sample %s with out-of-range rate rx=%s tx=%s",
-                        msg_id,
-                        rx_bps,
-                        tx_bps,
-                    )
-                    continue
-                samples.append(
-                    (
-                        BandwidthSample(
-                            subscription_id=UUID(data[b"subscription_id"].decode()),
-                            device_id=None,
-                            rx_bps=rx_bps,
-                            tx_bps=tx_bps,
-                            sample_at=sample_at,
-                        ),
-                        data,
-                    )
-                )
-            except Exception as e:
-                logger.error("Failed to parse sample %s: %s", msg_id, e)
-
-        # Bulk insert samples — filter out orphaned subscription IDs first
-        # to prevent a single bad FK from failing the entire batch.
-        # Uses cached subscription ID validation to reduce DB queries.
-        inserted = 0
-        if samples:
-            with db_session_adapter.session() as db:
-                network_device_by_nas: dict[UUID, UUID | None] = {}
-                if nas_device_ids:
-                    network_device_by_nas = {
-                        row.id: row.network_device_id
-                        for row in db.scalars(
-                            select(NasDevice).where(NasDevice.id.in_(nas_device_ids))
-                        ).all()
-                    }
-
-                for sample, data in samples:
-                    nas_device_id_raw = data.get(b"nas_device_id")
-                    if not nas_device_id_raw:
-                        continue
-                    try:
-                        nas_device_id = UUID(nas_device_id_raw.decode())
-                    except ValueError:
-                        continue
-                    sample.device_id = network_device_by_nas.get(nas_device_id)
-
-                adapter = get_bandwidth_metrics_adapter()
-                valid_ids = adapter.filter_valid_subscription_ids(
-                    db, {s.subscription_id for s, _ in samples}
-                )
-                valid_samples = [
-                    s for s, _ in samples if s.subscription_id in valid_ids
-                ]
-                skipped = len(samples) - len(valid_samples)
-                if skipped:
-                    logger.warning(
-                        "Skipped %d bandwidth samples with orphaned subscription_ids",
-                        skipped,
-                    )
-                if valid_samples:
-                    db.bulk_save_objects(valid_samples)
-                    inserted = len(valid_samples)
-
-        # Acknowledge processed messages (including skipped ones — they can't be retried)
-        if message_ids:
-            r.xack(REDIS_STREAM, group_name, *message_ids)
-
         logger.info(
             "Processed %s bandwidth samples (%s total messages)",
-            inserted,
-            len(message_ids),
+            result["processed"],
+            result["messages"],
         )
-        return {"processed": inserted}
+        return {"processed": result["processed"]}
 
     except Exception as e:
         logger.error("Error processing bandwidth stream: %s", e)
@@ -263,19 +137,30 @@ def cleanup_hot_data():
     Remove bandwidth samples older than the retention period.
 
     Hot data (raw samples) is kept in PostgreSQL for the configured retention hours,
-    after which it's deleted. Aggregated data is retained in VictoriaMetrics.
+    after which it's removed. Aggregated data is retained in VictoriaMetrics.
+    On the partitioned table this premakes the upcoming hourly partitions and
+    drops expired ones whole instead of deleting rows.
     """
     try:
         with db_session_adapter.session() as db:
             retention_hours = _get_hot_retention_hours(db)
-            cutoff = datetime.now(UTC) - timedelta(hours=retention_hours)
-            result = db.execute(
-                delete(BandwidthSample).where(BandwidthSample.sample_at < cutoff)
-            )
-            deleted = result.rowcount
+            now = datetime.now(UTC)
+            cutoff = now - timedelta(hours=retention_hours)
+            outcome = apply_retention(db, cutoff=cutoff, now=now)
 
-        logger.info("Cleaned up %s bandwidth samples older than %s", deleted, cutoff)
-        return {"deleted": deleted}
+        logger.info(
+            "Cleaned up bandwidth samples older than %s: dropped %s partitions, "
+            "deleted %s rows, created %s partitions",
+            cutoff,
+            len(outcome.dropped),
+            outcome.deleted,
+            len(outcome.created),
+        )
+        return {
+            "deleted": outcome.deleted,
+            "dropped_partitions": len(outcome.dropped),
+            "created_partitions": len(outcome.created),
+        }
 
     except Exception as e:
         logger.error("Error cleaning up hot data: %s", e)
@@ -285,107 +170,33 @@ def cleanup_hot_data():
 @celery_app.task(name="app.tasks.bandwidth.aggregate_to_metrics")
 def aggregate_to_metrics():
     """
-    Calculate aggregates from hot data and push to VictoriaMetrics.
-
-    This task runs every minute and calculates 1-minute aggregates
-    (avg, max) for each subscription, then pushes them to VictoriaMetrics.
+    Push closed minute rollups to VictoriaMetrics.
 
-    Uses sync VictoriaMetrics writer with batched writes for efficiency.
+    The stream consumers fold every sample into per-subscription minute
+    accumulators in Redis as they ingest it (app.services.bandwidth_rollup);
+    this task runs every minute and writes each window closed for the grace
+    period as 1-minute aggregates (avg, max) in batched writes. PostgreSQL is
+    not queried.
     """
+    r = _get_redis_client()
     try:
-        # Calculate aggregates for the last minute
-        now = datetime.now(UTC)
-        minute_start = now.replace(second=0, microsecond=0)
-        aggregate_timestamp = minute_start - timedelta(minutes=1)
-
-        # Query aggregates grouped by subscription (SQLAlchemy 2.0 style)
-        stmt = (
-            select(
-                BandwidthSample.subscription_id,
-                BandwidthSample.device_id,
-                func.avg(BandwidthSample.rx_bps).label("rx_avg"),
-                func.avg(BandwidthSample.tx_bps).label("tx_avg"),
-                func.max(BandwidthSample.rx_bps).label("rx_max"),
-                func.max(BandwidthSample.tx_bps).label("tx_max"),
-                func.count().label("sample_count"),
-            )
-            .where(
-                BandwidthSample.sample_at >= aggregate_timestamp,
-                BandwidthSample.sample_at < minute_start,
-            )
-            .group_by(BandwidthSample.subscription_id, BandwidthSample.device_id)
-        )
-        with db_session_adapter.read_session() as db:
-            aggregates = db.execute(stmt).all()
-
-            if not aggregates:
-                return {"pushed": 0}
-
-            # Map network device IDs to NAS device IDs
-            nas_device_by_network_device: dict[UUID, UUID] = {}
-            device_ids = {agg.device_id for agg in aggregates if agg.device_id}
-            if device_ids:
-                nas_device_by_network_device = {
-                    row.network_device_id: row.id
-                    for row in db.scalars(
-                        select(NasDevice).where(
-                            NasDevice.network_device_id.in_(device_ids)
-                        )
-                    ).all()
-                    if row.network_device_id
-                }
-
-            # Build batch before the session closes; VM writes must not hold DB.
-            batch: list[BandwidthAggregate] = []
-            for agg in aggregates:
-                nas_device_id = None
-                if agg.device_id and nas_device_by_network_device.get(agg.device_id):
-                    nas_device_id = str(nas_device_by_network_device[agg.device_id])
-
-                batch.append(
-                    BandwidthAggregate(
-                        subscription_id=str(agg.subscription_id),
-                        nas_device_id=nas_device_id,
-                        timestamp=aggregate_timestamp,
-                        rx_avg=float(agg.rx_avg or 0),
-                        tx_avg=float(agg.tx_avg or 0),
-                        rx_max=float(agg.rx_max or 0),
-                        tx_max=float(agg.tx_max or 0),
-                        sample_count=int(agg.sample_count),
-                    )
-                )
-
-        # Push to VictoriaMetrics in a single batched HTTP call (sync)
-        adapter = get_bandwidth_metrics_adapter()
-        # Retry transient VM write failures (network blip / VM restart) before
-        # giving up — otherwise a single failure silently loses that minute's
-        # aggregates with no backfill. Runs once a minute, so a short retry is
-        # cheap relative to the data it saves.
-        result = adapter.write_aggregates_batch(batch)
-        attempts = 1
-        while not result.success and attempts < VM_WRITE_MAX_ATTEMPTS:
-            time.sleep(0.5 * attempts)
-            attempts += 1
-            result = adapter.write_aggregates_batch(batch)
-
-        if result.success:
+        # Transient VM write failures (network blip / VM restart) are retried;
+        # a window that still fails stays pending for the next run instead of
+        # being lost.
+        result = flush_closed_windows(r, max_attempts=VM_WRITE_MAX_ATTEMPTS)
+        if result["windows"]:
             logger.info(
-                "Pushed %d aggregates to VictoriaMetrics (attempt %d)",
-                result.written,
-                attempts,
-            )
-        else:
-            logger.error(
-                "Failed to push aggregates to VictoriaMetrics after %d attempts: %s",
-                attempts,
-                result.error,
+                "Pushed %d aggregates for %d minutes to VictoriaMetrics",
+                result["pushed"],
+                result["windows"],
             )
-
-        return {"pushed": result.written, "success": result.success}
+        return {"pushed": result["pushed"], "success": result["success"]}
 
     except Exception as e:
         logger.error("Error aggregating to metrics: %s", e)
         raise
+    finally:
+        r.close()
 
 
 @celery_app.task(name="app.tasks.bandwidth.trim_redis_stream")
@@ -404,6 +215,16 @@ def trim_redis_stream():
         # Trim stream to max length
         trimmed = r.xtrim(REDIS_STREAM, maxlen=max_length, approximate=True)
         logger.info("Trimmed %s entries from bandwidth stream", trimmed)
+        try:
+            # Restarted ingest workers and recycled Celery children leave
+            # empty consumers behind in the group; drop the long-idle ones.
+            removed = BandwidthStreamIngestor(
+                r, stream=REDIS_STREAM
+            ).prune_idle_consumers()
+            if removed:
+                logger.info("Removed %d idle bandwidth stream consumers", len(removed))
+        except redis.RedisError as e:
+            logger.warning("Skipped bandwidth consumer pruning: %s", e)
         return {"trimmed": trimmed}
 
     except Exception as e:
@@ -431,22 +252,24 @@ def bulk_insert_samples(
     if not samples:
         return 0
 
-    objects = []
-    for s in samples:
-        objects.append(
-            BandwidthSample(
-                subscription_id=UUID(s["subscription_id"])
-                if isinstance(s["subscription_id"], str)
-                else s["subscription_id"],
-                device_id=UUID(s["device_id"])
-                if s.get("device_id") and isinstance(s["device_id"], str)
-                else s.get("device_id"),
-                rx_bps=int(s["rx_bps"]),
-                tx_bps=int(s["tx_bps"]),
-                sample_at=s["sample_at"],
-            )
+    created_at = datetime.now(UTC)
+    rows = [
+        (
+            uuid4(),
+            UUID(s["subscription_id"])
+            if isinstance(s["subscription_id"], str)
+            else s["subscription_id"],
+            UUID(s["device_id"])
+            if s.get("device_id") and isinstance(s["device_id"], str)
+            else s.get("device_id"),
+            int(s["rx_bps"]),
+            int(s["tx_bps"]),
+            s["sample_at"],
+            created_at,
         )
+        for s in samples
+    ]
 
-    db.bulk_save_objects(objects)
+    inserted = write_samples(db, rows)
     db.commit()
-    return len(objects)
+    return inserted
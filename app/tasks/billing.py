@@ -21,6 +21,18 @@ def run_invoice_cycle() -> dict[str, object]:
     return cast(dict[str, object], _run_invoice_cycle_idempotent())
 
 
+@celery_app.task(name="app.tasks.billing.run_invoice_partition")
+def run_invoice_partition(run_id: str, partition_index: int) -> dict[str, object]:
+    """Bill one account partition of a partitioned invoice cycle."""
+    return scheduled_billing.run_invoice_partition(run_id, partition_index)
+
+
+@celery_app.task(name="app.tasks.billing.retry_invoice_partitions")
+def retry_invoice_partitions(run_id: str) -> dict[str, object]:
+    """Re-queue only the failed partitions of a partitioned invoice cycle."""
+    return scheduled_billing.retry_invoice_partitions(run_id)
+
+
 @celery_app.task(name="app.tasks.billing.mark_invoices_overdue")
 @idempotent_task(
     key_func=lambda: f"overdue_check:{datetime.now(UTC).strftime('%Y-%m-%d-%H')}"
@@ -58,6 +70,12 @@ def audit_funded_inactive_exposure_task() -> dict:
     return scheduled_billing.audit_funded_inactive_exposure()
 
 
+@celery_app.task(name="app.tasks.billing.verify_customer_position_snapshots")
+def verify_customer_position_snapshots_task() -> dict:
+    """Advance lagging customer position checkpoints and verify a sample."""
+    return scheduled_billing.verify_customer_position_snapshots()
+
+
 @celery_app.task(name="app.tasks.billing.run_billing_notifications")
 @idempotent_task(
     key_func=lambda: (
@@ -22,6 +22,9 @@ BATCH_SIZE = 100
 _EVENT_RETRY_LOCK_KEY = 70420801
 _EVENT_STALE_LOCK_KEY = 70420802
 _EVENT_DISPATCH_LOCK_KEY = 70420803
+_EVENT_EXTERNAL_DISPATCH_LOCK_KEY = 70420804
+# Partition ``p`` of the outbox dispatcher locks ``_EVENT_PARTITION_LOCK_BASE + p``.
+_EVENT_PARTITION_LOCK_BASE = 70421000
 
 
 def _configured_int(session, key: str, default: int) -> int:
@@ -34,8 +37,14 @@ def _configured_int(session, key: str, default: int) -> int:
 
 @celery_app.task(name="app.tasks.events.dispatch_pending_events")
 def dispatch_pending_events():
-    """Recover committed event outbox rows not handled after caller commit."""
-    from app.services.events.dispatcher import get_dispatcher
+    """Fan the committed event outbox out to key-ordered partition workers.
+
+    Publishes the backlog of each dispatch lane, then queues one
+    ``dispatch_event_partition`` per partition and one
+    ``dispatch_external_events`` run. A single partition is drained inline.
+    """
+    from app.services.event_outbox_health import publish_outbox_backlog
+    from app.services.queue_adapter import enqueue_task
 
     with db_session_adapter.advisory_lock(_EVENT_DISPATCH_LOCK_KEY) as (
         session,
@@ -44,35 +53,66 @@ def dispatch_pending_events():
         if not lock_acquired:
             return {"skipped_due_to_lock": 1}
 
-        batch_size = _configured_int(session, "event_dispatch_batch_size", 100)
-        event_ids = event_store_service.list_pending_event_ids(
-            session,
-            limit=batch_size,
+        partitions = max(_configured_int(session, "event_dispatch_partitions", 4), 1)
+        try:
+            publish_outbox_backlog(session)
+        except Exception:
+            logger.warning("event_outbox_backlog_publish_failed", exc_info=True)
+        if partitions == 1:
+            batch_size = _configured_int(session, "event_dispatch_batch_size", 100)
+            result = _dispatch_partition(session, 0, 1, batch_size)
+            enqueue_task("app.tasks.events.dispatch_external_events")
+            return result
+
+    for partition in range(partitions):
+        enqueue_task(
+            "app.tasks.events.dispatch_event_partition",
+            args=(partition, partitions),
         )
-        dispatcher = get_dispatcher()
-        dispatched = 0
-        skipped = 0
-        failed = 0
-        for event_store_id in event_ids:
-            try:
-                if dispatcher.dispatch_pending_event(session, event_store_id):
-                    dispatched += 1
-                else:
-                    skipped += 1
-                session.commit()
-            except Exception:
-                failed += 1
-                session.rollback()
-                logger.exception(
-                    "pending_event_dispatch_failed",
-                    extra={"event_store_id": str(event_store_id)},
-                )
-        return {
-            "selected": len(event_ids),
-            "dispatched": dispatched,
-            "skipped": skipped,
-            "failed": failed,
-        }
+    enqueue_task("app.tasks.events.dispatch_external_events")
+    return {"partitions": partitions}
+
+
+def _dispatch_partition(
+    session, partition: int, partitions: int, batch_size: int
+) -> dict[str, int]:
+    from app.services.events.outbox import dispatch_partition
+
+    return dispatch_partition(
+        session,
+        partition=partition,
+        partitions=partitions,
+        batch_size=batch_size,
+    )
+
+
+@celery_app.task(name="app.tasks.events.dispatch_event_partition")
+def dispatch_event_partition(partition: int, partitions: int):
+    """Drain one aggregate-key partition of the outbox in per-key order."""
+    with db_session_adapter.advisory_lock(
+        _EVENT_PARTITION_LOCK_BASE + int(partition)
+    ) as (session, lock_acquired):
+        if not lock_acquired:
+            return {"skipped_due_to_lock": 1}
+
+        batch_size = _configured_int(session, "event_dispatch_batch_size", 100)
+        return _dispatch_partition(session, int(partition), int(partitions), batch_size)
+
+
+@celery_app.task(name="app.tasks.events.dispatch_external_events")
+def dispatch_external_events():
+    """Run the external-stage handlers the partition workers deferred."""
+    from app.services.events.outbox import dispatch_external_lane
+
+    with db_session_adapter.advisory_lock(_EVENT_EXTERNAL_DISPATCH_LOCK_KEY) as (
+        session,
+        lock_acquired,
+    ):
+        if not lock_acquired:
+            return {"skipped_due_to_lock": 1}
+
+        batch_size = _configured_int(session, "event_dispatch_batch_size", 100)
+        return dispatch_external_lane(session, batch_size=batch_size)
 
 
 @celery_app.task(name="app.tasks.events.retry_failed_events")
@@ -44,6 +44,8 @@ def run_infrastructure_poll() -> dict[str, Any]:
     """Run one native ping/SNMP sweep over active network devices."""
     from app.services.infrastructure_polling import (
         ADVISORY_LOCK_KEY,
+        DEFAULT_INTERFACE_CONCURRENCY,
+        DEFAULT_INTERFACE_DEADLINE_SECONDS,
         DEFAULT_PING_INTERVAL_SECONDS,
         DEFAULT_SNMP_INTERVAL_SECONDS,
         poll_infrastructure,
@@ -76,11 +78,25 @@ def run_infrastructure_poll() -> dict[str, Any]:
                 DEFAULT_SNMP_INTERVAL_SECONDS,
                 floor=30,
             )
+            interface_concurrency = _interval_setting(
+                db,
+                "infrastructure_interface_concurrency",
+                DEFAULT_INTERFACE_CONCURRENCY,
+                floor=1,
+            )
+            interface_deadline = _interval_setting(
+                db,
+                "infrastructure_interface_deadline_seconds",
+                DEFAULT_INTERFACE_DEADLINE_SECONDS,
+                floor=2,
+            )
             db.rollback()
             result = poll_infrastructure(
                 db,
                 ping_interval_seconds=ping_interval,
                 snmp_interval_seconds=snmp_interval,
+                interface_concurrency=interface_concurrency,
+                interface_deadline_seconds=interface_deadline,
             )
             db.rollback()
             # Stamp the heartbeat only after a committed sweep so a stalled or
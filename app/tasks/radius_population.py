@@ -40,6 +40,27 @@ def refresh_radius_from_subs() -> dict[str, object]:
     return result
 
 
+@celery_app.task(name="app.tasks.radius_population.project_radius_changes")
+def project_radius_changes() -> dict[str, object]:
+    """Re-project only the logins journaled since the last pass.
+
+    Shares the populate lock, so it never interleaves with a full sweep; a
+    skipped pass leaves its journal entries for the next one.
+    """
+    from app.services.radius_population import populate_changed
+
+    with postgres_session_advisory_lock(_POPULATE_LOCK_KEY) as acquired:
+        if not acquired:
+            logger.info(
+                "RADIUS incremental projection: another run holds the lock; skipping"
+            )
+            return {"skipped_locked": 1}
+        result = populate_changed(dry_run=False)
+    if result.get("journal_entries"):
+        logger.info("RADIUS incremental projection complete: %s", result)
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Staff device-login sync task
 # ---------------------------------------------------------------------------
@@ -2,11 +2,17 @@
 
 import logging
 import time
+import uuid
+
+from sqlalchemy import bindparam, or_, update
 
 from app.celery_app import celery_app
+from app.models.auth import ApiKey
+from app.services import auth_cache
 from app.services.credential_rotation_schedule import (
     run_scheduled_credential_rotation as run_rotation,
 )
+from app.services.db_session_adapter import db_session_adapter
 from app.services.observability import (
     publish_state_snapshot,
     record_task_run,
@@ -49,3 +55,33 @@ def run_scheduled_credential_rotation() -> dict[str, object]:
         duration_seconds=time.monotonic() - started,
     )
     return result
+
+
+@celery_app.task(name="app.tasks.security.flush_api_key_usage")
+def flush_api_key_usage() -> dict[str, int]:
+    """Write buffered API-key ``last_used_at`` stamps in one statement."""
+    usage = auth_cache.drain_api_key_usage()
+    rows = []
+    for raw_id, used_at in usage.items():
+        try:
+            rows.append({"key_id": uuid.UUID(raw_id), "used_at": used_at})
+        except ValueError:
+            logger.warning("api_key_usage_invalid_id", extra={"api_key_id": raw_id})
+    if not rows:
+        return {"buffered": len(usage), "updated": 0}
+    statement = (
+        update(ApiKey)
+        .where(ApiKey.id == bindparam("key_id"))
+        .where(
+            or_(
+                ApiKey.last_used_at.is_(None),
+                ApiKey.last_used_at < bindparam("used_at"),
+            )
+        )
+        .values(last_used_at=bindparam("used_at"))
+    )
+    with db_session_adapter.session() as session:
+        # Core executemany: one round trip, no ORM bulk-by-primary-key rules.
+        session.connection().execute(statement, rows)
+    logger.info("api_key_usage_flushed", extra={"api_keys": len(rows)})
+    return {"buffered": len(usage), "updated": len(rows)}
@@ -105,9 +105,52 @@ def notify_expiring_data_bundles():
 @celery_app.task(name="app.tasks.usage.meter_usage_into_quota")
 def meter_usage_into_quota():
     """Roll imported RADIUS accounting into the current period's quota buckets
-    for capped subscriptions (the metering that feeds FUP/overage)."""
-    with db_session_adapter.session() as session:
-        result = usage_service.meter_usage_into_quota(session)
+    for capped subscriptions (the metering that feeds FUP/overage).
+
+    Incremental: only subscriptions with journaled octet deltas since the last
+    run are touched, so this can run every minute. New buckets are seeded only
+    while the import lock is free too; otherwise they wait for the next run."""
+    from app.tasks._postgres_lock import postgres_session_advisory_lock
+
+    with postgres_session_advisory_lock(_USAGE_METERING_LOCK_KEY) as acquired:
+        if not acquired:
+            logger.info("Usage metering skipped: another run is active")
+            return {"metered": 0, "changed_subscription_ids": [], "skipped_locked": 1}
+        with (
+            postgres_session_advisory_lock(
+                _RADIUS_ACCOUNTING_IMPORT_LOCK_KEY
+            ) as import_idle,
+            db_session_adapter.session() as session,
+        ):
+            result = usage_service.meter_usage_into_quota(session, seed=import_idle)
+    _queue_fup_for_changed(result)
+    return result
+
+
+@celery_app.task(name="app.tasks.usage.recompute_quota_usage")
+def recompute_quota_usage():
+    """Absolute recompute of every capped subscription's quota bucket.
+
+    The correctness check behind incremental metering: it catches sessions
+    written outside the accounting import and top-ups that expired without new
+    traffic. Holds the import lock too, so no delta is journaled while the
+    journal is being discarded as counted."""
+    from app.tasks._postgres_lock import postgres_session_advisory_lock
+
+    with (
+        postgres_session_advisory_lock(_USAGE_METERING_LOCK_KEY) as metering,
+        postgres_session_advisory_lock(_RADIUS_ACCOUNTING_IMPORT_LOCK_KEY) as importing,
+    ):
+        if not (metering and importing):
+            logger.info("Quota usage recompute skipped: metering or import is active")
+            return {"metered": 0, "changed_subscription_ids": [], "skipped_locked": 1}
+        with db_session_adapter.session() as session:
+            result = usage_service.meter_usage_into_quota(session, full=True)
+    _queue_fup_for_changed(result)
+    return result
+
+
+def _queue_fup_for_changed(result: dict) -> None:
     changed_subscription_ids = result.get("changed_subscription_ids") or []
     if changed_subscription_ids:
         evaluate_fup_rules.apply_async(
@@ -117,11 +160,11 @@ def meter_usage_into_quota():
             },
             queue="billing",
         )
-    return result
 
 
 _FUP_EVALUATION_LOCK_KEY = 778_003
 _RADIUS_ACCOUNTING_IMPORT_LOCK_KEY = 778_004
+_USAGE_METERING_LOCK_KEY = 778_005
 
 
 @celery_app.task(name="app.tasks.usage.evaluate_fup_rules")
@@ -5,6 +5,7 @@ import json
 import logging
 import re
 from base64 import b64encode
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from io import BytesIO
 from typing import cast
@@ -1071,19 +1072,38 @@ def system_export_download(request: Request, db: Session = Depends(get_db)):
                 status_code=303,
             )
 
-        content, media_type, extension, row_count = (
-            web_system_export_tool_service.export_content(
-                db,
-                module=module,
-                selected_fields=selected_fields,
-                delimiter=delimiter,
-                export_format=export_format,
-                date_from=date_from,
-                date_to=date_to,
-                status=status,
-                include_headers=include_headers,
+        normalized_format = export_format.strip().lower()
+        body: Iterator[bytes]
+        if normalized_format in web_system_export_tool_service.STREAMING_EXPORT_FORMATS:
+            # Rendered while rows are read; the count above names the file.
+            body, media_type, extension = (
+                web_system_export_tool_service.stream_export_body(
+                    module=module,
+                    selected_fields=selected_fields,
+                    delimiter=delimiter,
+                    export_format=normalized_format,
+                    date_from=date_from,
+                    date_to=date_to,
+                    status=status,
+                    include_headers=include_headers,
+                    max_rows=web_system_export_tool_service.EXPORT_BG_THRESHOLD_ROWS,
+                )
             )
-        )
+        else:
+            content, media_type, extension, row_count = (
+                web_system_export_tool_service.export_content(
+                    db,
+                    module=module,
+                    selected_fields=selected_fields,
+                    delimiter=delimiter,
+                    export_format=export_format,
+                    date_from=date_from,
+                    date_to=date_to,
+                    status=status,
+                    include_headers=include_headers,
+                )
+            )
+            body = iter([content])
         timestamp = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
         filename = f"export_{module}_{row_count}_{timestamp}.{extension}"
         web_system_export_tool_service.log_export_audit_event(
@@ -1100,8 +1120,11 @@ def system_export_download(request: Request, db: Session = Depends(get_db)):
                 "filename": filename,
             },
         )
+        # Streaming responses outlive the route function. The body reads on its
+        # own session, so release the request-scoped one before returning.
+        db.close()
         return StreamingResponse(
-            iter([content]),
+            body,
             media_type=media_type,
             headers={"Content-Disposition": f'attachment; filename="{filename}"'},
         )
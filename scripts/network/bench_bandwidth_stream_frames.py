@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+"""Benchmark: per-sample stream entries vs compact per-NAS frames.
+
+Builds synthetic poll cycles (``--devices`` NAS x ``--queues`` queues each)
+and compares the two bandwidth stream formats of
+``app.services.bandwidth_frames``:
+
+  - payload bytes per cycle (field names + values, what goes over the wire),
+  - encode and decode throughput (samples/s),
+  - with ``--redis-url``: XADD throughput and the stream's ``MEMORY USAGE``
+    after ``--cycles`` cycles, written to scratch keys that are deleted
+    afterwards.
+
+Writes nothing outside the scratch keys.
+
+Usage:
+    PYTHONPATH=. python scripts/network/bench_bandwidth_stream_frames.py \
+        --devices 40 --queues 250
+    PYTHONPATH=. python scripts/network/bench_bandwidth_stream_frames.py \
+        --redis-url redis://localhost:6379/15 --cycles 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+from datetime import UTC, datetime
+
+from app.services.bandwidth_frames import decode_entry, encode_frame, encode_sample
+
+Cycle = list[tuple[str, list[tuple[str, str, int, int]]]]
+
+
+def _cycle(devices: int, queues: int, rng: random.Random) -> Cycle:
+    return [
+        (
+            str(uuid.uuid4()),
+            [
+                (
+                    str(uuid.uuid4()),
+                    f"<pppoe-{rng.randrange(10**8)}>",
+                    rng.randrange(200_000_000),
+                    rng.randrange(50_000_000),
+                )
+                for _ in range(queues)
+            ],
+        )
+        for _ in range(devices)
+    ]
+
+
+def _entries(cycle: Cycle, sample_at: datetime) -> list[dict]:
+    return [
+        encode_sample(
+            subscription_id=sub,
+            nas_device_id=nas,
+            queue_name=queue,
+            rx_bps=rx,
+            tx_bps=tx,
+            sample_at=sample_at,
+        )
+        for nas, rows in cycle
+        for sub, queue, rx, tx in rows
+    ]
+
+
+def _frames(cycle: Cycle, sample_at: datetime) -> list[dict]:
+    return [
+        encode_frame(nas, sample_at, [(sub, rx, tx) for sub, _q, rx, tx in rows])
+        for nas, rows in cycle
+    ]
+
+
+def _as_bytes(value) -> bytes:
+    return value if isinstance(value, bytes) else str(value).encode()
+
+
+def _wire(entries: list[dict]) -> list[dict[bytes, bytes]]:
+    return [{_as_bytes(k): _as_bytes(v) for k, v in e.items()} for e in entries]
+
+
+def _payload_bytes(entries: list[dict[bytes, bytes]]) -> int:
+    return sum(len(k) + len(v) for e in entries for k, v in e.items())
+
+
+def _rate(samples: int, seconds: float) -> str:
+    return f"{samples / seconds:,.0f}/s" if seconds > 0 else "n/a"
+
+
+def _bench_format(name, encoder, cycle, samples, rounds) -> list[dict[bytes, bytes]]:
+    sample_at = datetime.now(UTC)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        encoded = encoder(cycle, sample_at)
+    encode_s = time.perf_counter() - started
+    wire = _wire(encoded)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        decoded = sum(len(decode_entry(entry)) for entry in wire)
+    decode_s = time.perf_counter() - started
+    assert decoded == samples
+    print(
+        f"{name:<8} entries={len(wire):>7,} payload={_payload_bytes(wire):>11,} B "
+        f"({_payload_bytes(wire) / samples:6.1f} B/sample) "
+        f"encode={_rate(samples * rounds, encode_s):>13} "
+        f"decode={_rate(samples * rounds, decode_s):>13}"
+    )
+    return wire
+
+
+def _bench_redis(url: str, cycles: int, formats: dict, samples: int) -> None:
+    import redis
+
+    client = redis.from_url(url)
+    try:
+        for name, wire in formats.items():
+            key = f"bench:bandwidth:{name}:{uuid.uuid4().hex}"
+            try:
+                started = time.perf_counter()
+                for _ in range(cycles):
+                    pipe = client.pipeline(transaction=False)
+                    for entry in wire:
+                        pipe.xadd(key, entry)
+                    pipe.execute()
+                elapsed = time.perf_counter() - started
+                memory = int(client.memory_usage(key, samples=0) or 0)
+                print(
+                    f"{name:<8} redis XADD {_rate(samples * cycles, elapsed):>13} "
+                    f"stream memory={memory:>12,} B "
+                    f"({memory / (samples * cycles):6.1f} B/sample)"
+                )
+            finally:
+                client.delete(key)
+    finally:
+        client.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=40)
+    parser.add_argument("--queues", type=int, default=250, help="queues per device")
+    parser.add_argument("--rounds", type=int, default=5, help="encode/decode rounds")
+    parser.add_argument("--redis-url", help="also measure XADD rate and memory")
+    parser.add_argument("--cycles", type=int, default=10, help="cycles for Redis")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    cycle = _cycle(args.devices, args.queues, random.Random(args.seed))  # noqa: S311 — synthetic data
+    samples = args.devices * args.queues
+    print(f"{args.devices} devices x {args.queues} queues = {samples:,} samples/cycle")
+    formats = {
+        "entries": _bench_format("entries", _entries, cycle, samples, args.rounds),
+        "compact": _bench_format("compact", _frames, cycle, samples, args.rounds),
+    }
+    ratio = _payload_bytes(formats["entries"]) / _payload_bytes(formats["compact"])
+    print(f"compact payload is {ratio:.1f}x smaller")
+    if args.redis_url:
+        _bench_redis(args.redis_url, args.cycles, formats, samples)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,10 +9,12 @@ ROOT = Path(__file__).resolve().parents[2]
 SAFE_COLLECTOR_SERVICES = {
     "app.services.billing_health",
     "app.services.connectivity_reconciler",
+    "app.services.event_outbox_health",
     "app.services.ip_consistency_audit",
     "app.services.observability",
     "app.services.poller_health",
     "app.services.radius_reconciliation",
+    "app.services.syslog_health",
 }
 FORBIDDEN_NAMES = {
     "SessionLocal",
@@ -55,6 +55,7 @@ os.environ["RADIUS_DB_DSN"] = ""
 os.environ["RADIUS_DB_HOST"] = ""
 os.environ["RADIUS_SYNC_DB_URL"] = ""
 
+import json
 import sqlite3
 import uuid
 from datetime import UTC
@@ -702,6 +703,121 @@ def region(db_session):
     return rz
 
 
+# ============================================================================
+# App Cache Fixtures
+# ============================================================================
+
+
+class _FakeCachePipeline:
+    def __init__(self, redis: "FakeCacheRedis") -> None:
+        self.redis = redis
+        self.ops: list = []
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+
+        return _queue
+
+    def execute(self):
+        return [getattr(self.redis, n)(*a, **kw) for n, a, kw in self.ops]
+
+
+class FakeCacheRedis:
+    """In-memory stand-in for the app-cache Redis client."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.published: list[dict] = []
+        self.unlinks: list[tuple[str, ...]] = []
+        self.gets = 0
+
+    def pipeline(self, transaction=True):
+        return _FakeCachePipeline(self)
+
+    def get(self, key):
+        self.gets += 1
+        return self.store.get(key)
+
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.store:
+            return False
+        self.store[key] = value
+        return True
+
+    def sadd(self, key, value):
+        self.sets.setdefault(key, set()).add(value)
+
+    def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def expire(self, key, ttl, nx=False, gt=False):
+        return True
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def rename(self, key, new_key):
+        from redis.exceptions import ResponseError
+
+        if key not in self.hashes:
+            raise ResponseError("no such key")
+        self.hashes[new_key] = self.hashes.pop(key)
+
+    def unlink(self, *keys):
+        self.unlinks.append(keys)
+        removed = 0
+        for key in keys:
+            removed += int(self.store.pop(key, None) is not None)
+            removed += int(self.sets.pop(key, None) is not None)
+            removed += int(self.hashes.pop(key, None) is not None)
+        return removed
+
+    delete = unlink
+
+    def scan_iter(self, match, count=None):
+        prefix = match.rstrip("*")
+        return iter([k for k in list(self.store) if k.startswith(prefix)])
+
+    def publish(self, channel, message):
+        self.published.append(json.loads(message))
+
+    def eval(self, _script, _numkeys, key, token):
+        if self.store.get(key) == token:
+            del self.store[key]
+
+
+@pytest.fixture()
+def fake_cache_redis(monkeypatch):
+    """Route the app cache to an in-memory Redis with a private L1.
+
+    The L1 is exposed as ``.local`` on the returned fake.
+    """
+    from app.services import app_cache
+    from app.services.app_cache import LocalCache
+
+    redis = FakeCacheRedis()
+    local = LocalCache(16, 5)
+    monkeypatch.setattr(
+        app_cache, "get_cache_redis", lambda force_reconnect=False: redis
+    )
+    monkeypatch.setattr(app_cache, "_l1", lambda: local)
+    monkeypatch.setattr(app_cache, "_l1_state", (0, local, None))
+    redis.local = local
+    return redis
+
+
 # Skip test modules outside the active regression suite for this branch.
 collect_ignore_glob = [
     "test_admin_actor_ids.py",
@@ -34,6 +34,9 @@ class _FakeRedis:
     def mget(self, keys):
         return [self.store.get(key) for key in keys]
 
+    def publish(self, channel, message):
+        return 0
+
 
 @pytest.fixture
 def fake_cache(monkeypatch):
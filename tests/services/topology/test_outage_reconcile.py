@@ -238,6 +238,56 @@ def test_suspected_discarded_when_recovery_beats_confirm(
     assert "outage.suspected" in kinds and "outage.discarded" in kinds
 
 
+def test_syslog_burst_incident_survives_grace_then_discards(db_session):
+    olt_node = _node(db_session, "olt-burst", mtype="olt", live_status="up")
+    incident, opened = outage_svc.open_syslog_burst_incident(
+        db_session,
+        root_node=olt_node,
+        affected_count=12,
+        classification="syslog_pon_los",
+        now=NOW,
+    )
+    assert opened is True
+    assert incident.status == "suspected"
+
+    # The poll has not seen it yet: kept through the grace window.
+    counters = reconcile_detected_outages(db_session, now=NOW + timedelta(seconds=60))
+    assert incident.status == "suspected"
+    assert counters["discarded"] == 0
+
+    # Never corroborated past the grace -> a false positive like any other.
+    reconcile_detected_outages(db_session, now=NOW + timedelta(seconds=700))
+    assert incident.status == "discarded"
+
+
+def test_repeat_syslog_burst_absorbs_into_open_incident(db_session):
+    olt_node = _node(db_session, "olt-burst-2", mtype="olt", live_status="up")
+    first, _ = outage_svc.open_syslog_burst_incident(
+        db_session,
+        root_node=olt_node,
+        affected_count=8,
+        classification="syslog_pon_los",
+        now=NOW,
+    )
+    second, opened = outage_svc.open_syslog_burst_incident(
+        db_session,
+        root_node=olt_node,
+        affected_count=30,
+        classification="syslog_olt_los",
+        now=NOW + timedelta(seconds=20),
+    )
+
+    assert opened is False
+    assert second.id == first.id
+    assert second.affected_count == 30
+    assert len(_classifier_incidents(db_session)) == 1
+
+    discarded = outage_svc.discard_syslog_burst_incident(
+        db_session, root_node_id=olt_node.id
+    )
+    assert discarded is not None and discarded.status == "discarded"
+
+
 # --- scaled confirm: large confirms now, small waits -----------------------
 
 
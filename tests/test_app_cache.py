@@ -0,0 +1,151 @@
+"""Tests for the two-tier application cache."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+from app.services import app_cache
+from app.services.app_cache import LocalCache, encode_invalidation, key_family
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_local_cache_is_bounded_and_expires() -> None:
+    clock = _Clock()
+    local = LocalCache(2, 5, clock=clock)
+    local.put("a", "1")
+    local.put("b", "2")
+    assert local.get("a") == "1"
+    local.put("c", "3")  # evicts the least recently used "b"
+
+    assert local.get("b") is None
+    assert len(local) == 2
+    local.put("d", "4", ttl_seconds=1)
+    clock.now += 2
+    assert local.get("d") is None
+    assert local.get("c") == "3"
+    clock.now += 4
+    assert local.get("c") is None
+
+
+def test_invalidation_message_evicts_keys_and_prefixes() -> None:
+    local = LocalCache(16, 5)
+    for key in ("appcache:v1:auth:session:1", "appcache:v1:auth:claims:x", "k"):
+        local.put(key, "{}")
+
+    local.apply(encode_invalidation(keys=["k"], prefixes=["appcache:v1:auth:session"]))
+
+    assert local.get("k") is None
+    assert local.get("appcache:v1:auth:session:1") is None
+    assert local.get("appcache:v1:auth:claims:x") == "{}"
+
+
+def test_key_family_strips_namespace() -> None:
+    assert key_family(app_cache.cache_key("auth", "session", "abc")) == "auth:session"
+    assert key_family("topology:live_status:warmed_at") == "topology:live_status"
+
+
+def test_l1_serves_repeat_reads_and_writes_evict_other_workers(
+    fake_cache_redis,
+) -> None:
+    key = app_cache.cache_key("auth", "claims", "u1")
+    fake_cache_redis.store[key] = json.dumps({"roles": ["admin"]})
+
+    first = app_cache.get_json(key)
+    first["roles"].append("mutated")
+    assert app_cache.get_json(key) == {"roles": ["admin"]}
+    assert fake_cache_redis.gets == 1
+
+    assert app_cache.set_json(key, {"roles": []}, 60)
+    assert fake_cache_redis.published[-1] == {"keys": [key], "prefixes": []}
+    assert app_cache.get_json(key) == {"roles": []}
+
+    assert app_cache.delete_key(key)
+    assert app_cache.get_json(key) is None
+
+
+def test_invalidate_tags_deletes_members_in_bulk(fake_cache_redis) -> None:
+    keys = [app_cache.cache_key("topology", "node", n) for n in range(3)]
+    for key in keys:
+        app_cache.set_json(key, {"n": key}, 60, tags=["olt:1"])
+    app_cache.set_json("other", 1, 60)
+
+    assert app_cache.invalidate_tags("olt:1") == 3
+
+    assert set(fake_cache_redis.store) == {"other"}
+    assert fake_cache_redis.unlinks[0] == tuple(sorted(keys))
+    assert fake_cache_redis.published[-1]["keys"] == sorted(keys)
+    assert all(fake_cache_redis.local.get(key) is None for key in keys)
+
+
+def test_scan_delete_unlinks_in_batches(fake_cache_redis, monkeypatch) -> None:
+    monkeypatch.setattr(app_cache, "_DELETE_BATCH", 2)
+    for n in range(5):
+        fake_cache_redis.store[f"p:{n}"] = "1"
+
+    assert app_cache.scan_delete("p:") == 5
+
+    assert [len(batch) for batch in fake_cache_redis.unlinks] == [2, 2, 1]
+    assert fake_cache_redis.published[-1] == {"keys": [], "prefixes": ["p:"]}
+
+
+def test_concurrent_misses_compute_once(fake_cache_redis) -> None:
+    calls = []
+    gate = threading.Event()
+
+    def compute():
+        calls.append(1)
+        gate.wait(1)
+        return {"v": 1}
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                app_cache.get_or_compute_json("k", compute, 60)
+            )
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    gate.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"v": 1}] * 5
+    assert "k:flight" not in fake_cache_redis.store
+
+
+def test_waits_for_another_process_then_falls_back(
+    fake_cache_redis, monkeypatch
+) -> None:
+    monkeypatch.setattr(app_cache, "_FLIGHT_POLL_SECONDS", 0.001)
+    fake_cache_redis.store["k:flight"] = "other-worker"
+
+    def finish_elsewhere():
+        time.sleep(0.02)
+        fake_cache_redis.store["k"] = json.dumps("theirs")
+
+    worker = threading.Thread(target=finish_elsewhere)
+    worker.start()
+    assert app_cache.get_or_compute_json("k", lambda: "ours", 60, wait_seconds=1) == (
+        "theirs"
+    )
+    worker.join()
+
+    fake_cache_redis.store.pop("k")
+    fake_cache_redis.local.clear()
+    assert app_cache.get_or_compute_json(
+        "k", lambda: "ours", 60, wait_seconds=0.01
+    ) == ("ours")
@@ -0,0 +1,307 @@
+"""Tests for compiled permission sets, session verdicts and API-key usage."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from app.models.auth import ApiKey, SessionStatus
+from app.models.auth import Session as AuthSession
+from app.models.rbac import Role, SubscriberRole
+from app.services import (
+    app_cache,
+    auth_cache,
+    auth_cache_invalidation,
+    auth_dependencies,
+    session_store,
+)
+from app.tasks.security import flush_api_key_usage
+
+
+@pytest.fixture
+def fake(fake_cache_redis, monkeypatch):
+    monkeypatch.setattr(session_store, "get_session_redis", lambda: fake_cache_redis)
+    return fake_cache_redis
+
+
+def test_grants_are_compiled_once_per_rbac_version(fake):
+    loads: list[int] = []
+
+    def loader():
+        loads.append(1)
+        return ["billing:read", "billing:read", "network:*"]
+
+    first = auth_cache.load_granted_permissions("system_user", "u1", loader)
+    second = auth_cache.load_granted_permissions("system_user", "u1", loader)
+
+    assert first == second == frozenset({"billing:read", "network:*"})
+    assert len(loads) == 1
+
+    auth_cache.bump_rbac_version()
+    auth_cache.load_granted_permissions("system_user", "u1", loader)
+
+    assert len(loads) == 2
+
+
+def test_session_verdict_is_retired_by_a_later_revocation_epoch(fake):
+    now = datetime.now(UTC)
+    auth_cache.remember_session_valid(
+        "s1",
+        "system_user",
+        "u1",
+        expires_at=now + timedelta(hours=1),
+        verified_at=now,
+    )
+
+    assert auth_cache.session_known_valid("s1", "system_user", "u1", now)
+    assert not auth_cache.session_known_valid("s1", "subscriber", "u1", now)
+    assert not auth_cache.session_known_valid(
+        "s1", "system_user", "u1", now + timedelta(hours=2)
+    )
+
+    auth_cache.stamp_session_revocations([("system_user", "u1")])
+
+    assert not auth_cache.session_known_valid("s1", "system_user", "u1", now)
+
+
+def test_bulk_revocation_stamp_retires_every_principal(fake):
+    now = datetime.now(UTC)
+    auth_cache.remember_session_valid(
+        "s2",
+        "subscriber",
+        "p2",
+        expires_at=now + timedelta(hours=1),
+        verified_at=now,
+    )
+
+    auth_cache.stamp_session_revocations([(auth_cache.ALL_PRINCIPALS_EPOCH, "")])
+
+    assert not auth_cache.session_known_valid("s2", "subscriber", "p2", now)
+
+
+def test_failed_durable_stamp_drops_cached_verdicts(fake, monkeypatch):
+    from redis.exceptions import ConnectionError as RedisConnectionError
+
+    class _DownSessionRedis:
+        def setex(self, *_args):
+            raise RedisConnectionError("session store down")
+
+    now = datetime.now(UTC)
+    auth_cache.remember_session_valid(
+        "s4",
+        "system_user",
+        "u4",
+        expires_at=now + timedelta(hours=1),
+        verified_at=now,
+    )
+    version = auth_cache.rbac_version()
+    monkeypatch.setattr(session_store, "get_session_redis", _DownSessionRedis)
+
+    auth_cache.stamp_session_revocations([("system_user", "u4")])
+
+    monkeypatch.setattr(session_store, "get_session_redis", lambda: fake)
+    assert not auth_cache.session_known_valid("s4", "system_user", "u4", now)
+    assert auth_cache.rbac_version() != version
+
+
+def test_session_verdict_is_not_trusted_without_the_epoch_store(fake, monkeypatch):
+    now = datetime.now(UTC)
+    auth_cache.remember_session_valid(
+        "s3",
+        "system_user",
+        "u3",
+        expires_at=now + timedelta(hours=1),
+        verified_at=now,
+    )
+    monkeypatch.setattr(session_store, "get_session_redis", lambda: None)
+
+    assert not auth_cache.session_known_valid("s3", "system_user", "u3", now)
+
+
+def test_api_key_usage_is_buffered_and_drained_once(fake):
+    earlier = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    later = earlier + timedelta(minutes=3)
+
+    assert auth_cache.buffer_api_key_use("k1", earlier)
+    assert auth_cache.buffer_api_key_use("k1", later)
+    assert auth_cache.buffer_api_key_use("k2", earlier)
+
+    assert auth_cache.drain_api_key_usage() == {"k1": later, "k2": earlier}
+    assert auth_cache.drain_api_key_usage() == {}
+    assert fake.hashes == {}
+
+
+def test_api_key_usage_falls_back_without_redis(monkeypatch):
+    monkeypatch.setattr(
+        app_cache, "get_cache_redis", lambda force_reconnect=False: None
+    )
+
+    assert not auth_cache.buffer_api_key_use("k1", datetime.now(UTC))
+    assert auth_cache.drain_api_key_usage() == {}
+
+
+# --- invalidation hooks ------------------------------------------------------
+
+
+@pytest.fixture
+def retired(monkeypatch):
+    calls: list[object] = []
+    monkeypatch.setattr(
+        auth_cache, "bump_rbac_version", lambda: calls.append("rbac") or True
+    )
+    monkeypatch.setattr(
+        auth_cache,
+        "stamp_session_revocations",
+        lambda principals: calls.append(set(principals)),
+    )
+    return calls
+
+
+def _auth_session(db_session, person) -> AuthSession:
+    auth_session = AuthSession(
+        subscriber_id=person.id,
+        status=SessionStatus.active,
+        token_hash=uuid.uuid4().hex,
+        expires_at=datetime.now(UTC) + timedelta(hours=1),
+    )
+    db_session.add(auth_session)
+    db_session.commit()
+    return auth_session
+
+
+def _role(db_session) -> Role:
+    role = Role(name=f"cache-{uuid.uuid4().hex[:8]}", is_active=True)
+    db_session.add(role)
+    db_session.commit()
+    return role
+
+
+def test_pending_auth_changes_sees_rbac_rows_and_ended_sessions(
+    db_session, person, retired
+):
+    auth_session = _auth_session(db_session, person)
+
+    auth_session.last_seen_at = datetime.now(UTC)
+    assert auth_cache_invalidation.pending_auth_changes(db_session) == (False, set())
+
+    auth_session.revoked_at = datetime.now(UTC)
+    db_session.add(Role(name=f"cache-{uuid.uuid4().hex[:8]}", is_active=True))
+    assert auth_cache_invalidation.pending_auth_changes(db_session) == (
+        True,
+        {("subscriber", str(person.id))},
+    )
+    assert retired == []
+
+
+def test_committed_role_grant_bumps_rbac_version(db_session, person, retired):
+    role = _role(db_session)
+    retired.clear()
+
+    db_session.add(SubscriberRole(subscriber_id=person.id, role_id=role.id))
+    db_session.flush()
+    db_session.rollback()
+    assert retired == []
+
+    db_session.add(SubscriberRole(subscriber_id=person.id, role_id=role.id))
+    db_session.commit()
+    assert retired == ["rbac"]
+
+
+def test_committed_session_revoke_stamps_its_principal(db_session, person, retired):
+    auth_session = _auth_session(db_session, person)
+
+    auth_session.status = SessionStatus.revoked
+    auth_session.revoked_at = datetime.now(UTC)
+    db_session.commit()
+
+    assert retired == [{("subscriber", str(person.id))}]
+
+
+def test_bulk_updates_retire_auth_state_after_commit(db_session, person, retired):
+    session_id = _auth_session(db_session, person).id
+    role_id = _role(db_session).id
+    # The bulk statement below then opens the transaction itself.
+    db_session.commit()
+
+    db_session.query(AuthSession).filter(AuthSession.id == session_id).update(
+        {"status": SessionStatus.revoked, "revoked_at": datetime.now(UTC)},
+        synchronize_session=False,
+    )
+    db_session.query(Role).filter(Role.id == role_id).update(
+        {"is_active": False}, synchronize_session=False
+    )
+    assert retired == []
+    db_session.commit()
+
+    # A bulk UPDATE does not say whose sessions it ended.
+    assert retired == [{(auth_cache.ALL_PRINCIPALS_EPOCH, "")}, "rbac"]
+
+
+def test_require_user_auth_trusts_verdict_until_revocation(
+    db_session, person, fake, monkeypatch
+):
+    monkeypatch.setenv("JWT_SECRET", "test-secret")
+    auth_session = _auth_session(db_session, person)
+    now = datetime.now(UTC)
+    token = jwt.encode(
+        {
+            "sub": str(person.id),
+            "session_id": str(auth_session.id),
+            "typ": "access",
+            "iat": int(now.timestamp()),
+            "exp": int((now + timedelta(minutes=15)).timestamp()),
+        },
+        "test-secret",
+        algorithm="HS256",
+    )
+    checks: list[int] = []
+    check = auth_dependencies._require_active_session
+    monkeypatch.setattr(
+        auth_dependencies,
+        "_require_active_session",
+        lambda *args: checks.append(1) or check(*args),
+    )
+
+    auth_dependencies.require_user_auth(authorization=f"Bearer {token}", db=db_session)
+    auth_dependencies.require_user_auth(authorization=f"Bearer {token}", db=db_session)
+    assert len(checks) == 1
+
+    auth_session.status = SessionStatus.revoked
+    auth_session.revoked_at = datetime.now(UTC)
+    db_session.commit()
+
+    with pytest.raises(HTTPException) as exc:
+        auth_dependencies.require_user_auth(
+            authorization=f"Bearer {token}", db=db_session
+        )
+    assert exc.value.status_code == 401
+    assert len(checks) == 2
+
+
+def test_flush_api_key_usage_writes_buffered_uses(
+    db_session, person, fake, monkeypatch
+):
+    api_key = ApiKey(
+        subscriber_id=person.id,
+        label="flush",
+        key_hash=uuid.uuid4().hex,
+        is_active=True,
+    )
+    db_session.add(api_key)
+    db_session.commit()
+    used_at = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    auth_cache.buffer_api_key_use(str(api_key.id), used_at)
+    auth_cache.buffer_api_key_use("not-a-key-id", used_at)
+    monkeypatch.setattr(db_session, "close", lambda: None)
+    monkeypatch.setattr(
+        "app.services.db_session_adapter.SessionLocal", lambda: db_session
+    )
+
+    assert flush_api_key_usage() == {"buffered": 2, "updated": 1}
+    assert flush_api_key_usage() == {"buffered": 0, "updated": 0}
+    db_session.refresh(api_key)
+    assert api_key.last_used_at.replace(tzinfo=UTC) == used_at
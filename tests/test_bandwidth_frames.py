@@ -0,0 +1,64 @@
+"""Tests for the bandwidth stream wire formats."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from app.services.bandwidth_frames import (
+    FrameError,
+    decode_entry,
+    encode_frame,
+    encode_sample,
+)
+
+
+def _bytes(entry: dict) -> dict[bytes, bytes]:
+    return {
+        k.encode(): v if isinstance(v, bytes) else str(v).encode()
+        for k, v in entry.items()
+    }
+
+
+def test_frame_round_trips_samples_with_shared_timestamp() -> None:
+    nas, subs = uuid4(), [uuid4(), uuid4()]
+    sample_at = datetime(2026, 10, 16, 12, 0, 5, 250000, tzinfo=UTC)
+
+    decoded = decode_entry(
+        _bytes(encode_frame(nas, sample_at, [(subs[0], 10, 20), (subs[1], 30, 40)]))
+    )
+
+    assert [(d.subscription_id, d.rx_bps, d.tx_bps) for d in decoded] == [
+        (subs[0], 10, 20),
+        (subs[1], 30, 40),
+    ]
+    assert {d.nas_device_id for d in decoded} == {nas}
+    assert {d.sample_at for d in decoded} == {sample_at}
+
+
+def test_per_sample_entries_still_decode() -> None:
+    sub = uuid4()
+    entry = encode_sample(
+        subscription_id=str(sub),
+        nas_device_id="",
+        queue_name="q",
+        rx_bps=5,
+        tx_bps=6,
+        sample_at=datetime.now(UTC),
+    )
+
+    (decoded,) = decode_entry(_bytes(entry))
+
+    assert (decoded.subscription_id, decoded.nas_device_id) == (sub, None)
+    assert (decoded.rx_bps, decoded.tx_bps) == (5, 6)
+
+
+def test_truncated_or_unknown_frames_are_rejected() -> None:
+    frame = _bytes(encode_frame(None, datetime.now(UTC), [(uuid4(), 1, 1)]))
+
+    with pytest.raises(FrameError):
+        decode_entry({**frame, b"s": frame[b"s"][:-1]})
+    with pytest.raises(FrameError):
+        decode_entry({**frame, b"v": b"99"})
@@ -0,0 +1,165 @@
+"""Tests for the consumer-group bandwidth stream ingestor."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from app.models.bandwidth import BandwidthSample
+from app.services import bandwidth_ingest
+from app.services.bandwidth_frames import encode_frame
+from app.services.bandwidth_ingest import (
+    BandwidthStreamIngestor,
+    parse_entries,
+    write_samples,
+)
+
+
+def _entry(subscription_id=None, *, rx=b"1000", tx=b"2000") -> dict[bytes, bytes]:
+    return {
+        b"subscription_id": str(subscription_id or uuid4()).encode(),
+        b"rx_bps": rx,
+        b"tx_bps": tx,
+        b"sample_at": datetime.now(UTC).isoformat().encode(),
+    }
+
+
+class _FakeRedis:
+    def __init__(self, *, claimed=(), deleted=(), new=(), deliveries=None) -> None:
+        self.claimed = list(claimed)
+        self.deleted = list(deleted)
+        self.new = list(new)
+        self.deliveries = deliveries or {}
+        self.acked: list[bytes] = []
+        self.read_blocks: list[int | None] = []
+        self._last_claimed: list = []
+
+    def xautoclaim(self, *_args, count, **_kwargs):
+        claimed, self.claimed = self.claimed[:count], self.claimed[count:]
+        self._last_claimed = claimed
+        return [b"0-0", claimed, self.deleted]
+
+    def xpending_range(self, *_args, **_kwargs):
+        return [
+            {"message_id": msg_id, "times_delivered": self.deliveries.get(msg_id, 1)}
+            for msg_id, data in self._last_claimed
+            if data is not None
+        ]
+
+    def xreadgroup(self, *, streams, count, block, **_kwargs):
+        assert list(streams.values()) == [">"]
+        self.read_blocks.append(block)
+        entries, self.new = self.new[:count], self.new[count:]
+        return [("bandwidth:samples", entries)] if entries else []
+
+    def xack(self, _stream, _group, *ids):
+        self.acked.extend(ids)
+        return len(ids)
+
+
+def _ingestor(client, monkeypatch, stored: list) -> BandwidthStreamIngestor:
+    def _store(self, entries):
+        stored.extend(msg_id for msg_id, _data in entries)
+        return len(entries)
+
+    monkeypatch.setattr(BandwidthStreamIngestor, "_store", _store)
+    return BandwidthStreamIngestor(
+        client, stream="bandwidth:samples", consumer="test-1", max_deliveries=3
+    )
+
+
+def test_parse_entries_rejects_out_of_range_rates() -> None:
+    assert [s.rx_bps for s in parse_entries(b"1-0", _entry())] == [1000]
+    assert parse_entries(b"1-1", _entry(rx=str(2**31).encode())) == []
+    assert parse_entries(b"1-2", {b"rx_bps": b"1"}) == []
+
+
+def test_parse_entries_unpacks_compact_frames() -> None:
+    frame = encode_frame(
+        uuid4(), datetime.now(UTC), [(uuid4(), 1, 2), (uuid4(), 2**31, 3)]
+    )
+    data = {key.encode(): value for key, value in frame.items()}
+
+    assert [(s.rx_bps, s.tx_bps) for s in parse_entries(b"1-0", data)] == [(1, 2)]
+
+
+def test_run_once_claims_stale_entries_before_reading_new(monkeypatch) -> None:
+    client = _FakeRedis(
+        claimed=[(b"1-0", _entry())], new=[(b"2-0", _entry()), (b"3-0", _entry())]
+    )
+    stored: list[bytes] = []
+
+    result = _ingestor(client, monkeypatch, stored).run_once(
+        batch_size=10, block_ms=1000
+    )
+
+    assert result == {"processed": 3, "messages": 3}
+    assert stored == [b"1-0", b"2-0", b"3-0"]
+    assert client.acked == [b"1-0", b"2-0", b"3-0"]
+    # Something was already claimed, so the read must not block.
+    assert client.read_blocks == [None]
+
+
+def test_poison_and_trimmed_entries_are_acked_not_stored(monkeypatch) -> None:
+    claimed = [(b"1-0", _entry()), (b"1-1", _entry()), (b"1-2", None)]
+    client = _FakeRedis(claimed=claimed, deleted=[b"0-9"], deliveries={b"1-1": 4})
+    stored: list[bytes] = []
+
+    result = _ingestor(client, monkeypatch, stored).run_once(
+        batch_size=10, block_ms=1000
+    )
+
+    assert stored == [b"1-0"]
+    assert result["messages"] == 1
+    assert sorted(client.acked) == [b"0-9", b"1-0", b"1-1", b"1-2"]
+
+
+def test_failed_store_leaves_entries_pending(monkeypatch) -> None:
+    client = _FakeRedis(new=[(b"2-0", _entry())])
+
+    def _boom(self, entries):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(BandwidthStreamIngestor, "_store", _boom)
+    ingestor = BandwidthStreamIngestor(client, consumer="test-1")
+
+    with pytest.raises(RuntimeError):
+        ingestor.run_once(batch_size=10, block_ms=0)
+    assert client.acked == []
+
+
+def test_write_samples_inserts_rows(db_session, subscription) -> None:
+    sample_at = datetime.now(UTC)
+    rows = [
+        (uuid4(), subscription.id, None, 100, 200, sample_at, sample_at),
+        (uuid4(), subscription.id, None, 300, 400, sample_at, sample_at),
+    ]
+
+    assert write_samples(db_session, rows) == 2
+    db_session.commit()
+
+    stored = (
+        db_session.query(BandwidthSample)
+        .filter(BandwidthSample.subscription_id == subscription.id)
+        .all()
+    )
+    assert sorted(s.rx_bps for s in stored) == [100, 300]
+
+
+def test_nas_map_queries_each_nas_once(db_session, monkeypatch) -> None:
+    nas_map = bandwidth_ingest.NasNetworkDeviceMap(ttl_seconds=300)
+    nas_id = uuid4()
+    calls = []
+    original = db_session.execute
+
+    def _execute(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(db_session, "execute", _execute)
+
+    assert nas_map.resolve(db_session, {nas_id}) == {nas_id: None}
+    assert nas_map.resolve(db_session, {nas_id}) == {nas_id: None}
+    assert len(calls) == 1
@@ -0,0 +1,161 @@
+"""Tests for the per-process live bandwidth fan-out hub."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from app.services import bandwidth_live_hub as hub_module
+from app.services.bandwidth_frames import encode_frame
+
+_STREAM = "bandwidth:samples"
+_VIEWERS = "active:bandwidth:viewers"
+
+
+class _Pipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+    def zadd(self, key, mapping):
+        self._ops.append(("zadd", key, dict(mapping)))
+
+    def zrem(self, key, *members):
+        self._ops.append(("zrem", key, members))
+
+    async def execute(self):
+        self._redis.pipelines.append(self._ops)
+        for op, _key, value in self._ops:
+            if op == "zadd":
+                self._redis.viewers.update(value)
+            else:
+                for member in value:
+                    self._redis.viewers.pop(member, None)
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.entries: asyncio.Queue = asyncio.Queue()
+        self.viewers: dict[str, float] = {}
+        self.pipelines: list[list[tuple]] = []
+        self.reads = 0
+        self.closed = False
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+    async def xread(self, streams, count=None, block=None):
+        self.reads += 1
+        try:
+            entry = await asyncio.wait_for(self.entries.get(), block / 1000)
+        except TimeoutError:
+            return []
+        return [(_STREAM.encode(), [entry])]
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _hub(redis: _FakeRedis) -> hub_module.LiveBandwidthHub:
+    return hub_module.LiveBandwidthHub(
+        stream=_STREAM,
+        viewers_key=_VIEWERS,
+        redis_factory=lambda: redis,
+        heartbeat_seconds=60,
+    )
+
+
+def _frame(*samples):
+    data = encode_frame(uuid4(), datetime.now(UTC), samples)
+    return {key.encode(): value for key, value in data.items()}
+
+
+def test_dispatch_offers_latest_sample_to_each_viewer_of_the_subscription():
+    async def scenario():
+        redis = _FakeRedis()
+        hub = _hub(redis)
+        watched, other = uuid4(), uuid4()
+        async with (
+            hub.watch(watched) as first,
+            hub.watch(watched) as second,
+            hub.watch(other) as third,
+        ):
+            delivered = hub.dispatch(_frame((watched, 800, 300), (uuid4(), 1, 1)))
+
+            assert delivered == 1
+            assert await first.wait(0.1) is True
+            assert await second.wait(0.1) is True
+            assert await third.wait(0.01) is False
+            assert (first.latest.rx_bps, first.latest.tx_bps) == (800.0, 300.0)
+            # Only the newest reading is kept for a slow viewer.
+            hub.dispatch(_frame((watched, 5, 6)))
+            hub.dispatch(_frame((watched, 7, 8)))
+            assert await first.wait(0.1) is True
+            assert first.latest.rx_bps == 7.0
+            assert await first.wait(0.01) is False
+
+    asyncio.run(scenario())
+
+
+def test_hub_tails_the_stream_once_and_batches_viewer_heartbeats():
+    async def scenario():
+        redis = _FakeRedis()
+        hub = _hub(redis)
+        first, second = uuid4(), uuid4()
+        async with hub.watch(first) as viewer, hub.watch(second):
+            await asyncio.sleep(0.05)
+            assert set(redis.viewers) == {str(first), str(second)}
+
+            await redis.entries.put((b"1-0", _frame((first, 10, 20))))
+            assert await viewer.wait(1) is True
+            assert viewer.latest.tx_bps == 20.0
+
+        task = hub._task
+        await asyncio.wait_for(task, 2)
+        assert redis.viewers == {}
+        assert redis.closed is True
+        assert hub.watched == frozenset()
+        # The two joins and the two departures each went out as one pipeline.
+        assert all(len(ops) == 1 for ops in redis.pipelines)
+        assert sorted(redis.pipelines[-1][0][2]) == sorted([str(first), str(second)])
+
+    asyncio.run(scenario())
+
+
+def test_live_events_start_waiting_then_push_new_samples(monkeypatch):
+    monkeypatch.setattr(hub_module, "IDLE_EVENT_SECONDS", 0.05)
+
+    async def scenario():
+        redis = _FakeRedis()
+        hub = _hub(redis)
+        subscription_id = uuid4()
+        remaining = iter([False, False, True])
+
+        async def is_disconnected() -> bool:
+            return next(remaining)
+
+        events = hub_module.live_bandwidth_events(
+            subscription_id=subscription_id,
+            is_disconnected=is_disconnected,
+            hub=hub,
+        )
+        first = json.loads((await anext(events))["data"])
+        hub.dispatch(_frame((subscription_id, 4000, 1000)))
+        second = json.loads((await anext(events))["data"])
+        rest = [event async for event in events]
+
+        assert first["has_sample"] is False
+        assert second["has_sample"] is True
+        assert len(rest) == 1
+        assert json.loads(rest[0]["data"])["has_sample"] is True
+        assert hub.watched == frozenset()
+
+    asyncio.run(scenario())
@@ -0,0 +1,101 @@
+"""Tests for hourly bandwidth_samples partition management."""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from app.models.bandwidth import BandwidthSample
+from app.services import bandwidth_partitions
+from app.services.bandwidth_partitions import (
+    apply_retention,
+    expired_partitions,
+    parse_partition_name,
+    partition_name,
+)
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def begin_nested(self):
+        return nullcontext()
+
+    def execute(self, statement, *_args):
+        self.statements.append(str(statement))
+
+
+def test_partition_name_round_trips_hour_bounds() -> None:
+    ts = datetime(2026, 10, 16, 13, 47, 12, tzinfo=UTC)
+
+    name = partition_name(ts)
+
+    assert name == "bandwidth_samples_p2026101613"
+    assert parse_partition_name(name) == datetime(2026, 10, 16, 13, tzinfo=UTC)
+    assert parse_partition_name("bandwidth_samples_default") is None
+    assert parse_partition_name("bandwidth_samples_pbogus") is None
+
+
+def test_expired_partitions_only_includes_wholly_old_hours() -> None:
+    cutoff = datetime(2026, 10, 16, 12, 30, tzinfo=UTC)
+    names = [
+        "bandwidth_samples_default",
+        "bandwidth_samples_p2026101612",  # straddles the cutoff: kept
+        "bandwidth_samples_p2026101611",
+        "bandwidth_samples_p2026101610",
+        "bandwidth_samples_p2026101613",
+    ]
+
+    assert expired_partitions(names, cutoff) == [
+        "bandwidth_samples_p2026101610",
+        "bandwidth_samples_p2026101611",
+    ]
+
+
+def test_ensure_partitions_skips_existing(monkeypatch) -> None:
+    now = datetime(2026, 10, 16, 13, 5, tzinfo=UTC)
+    monkeypatch.setattr(
+        bandwidth_partitions,
+        "list_partitions",
+        lambda _db: ["bandwidth_samples_p2026101613"],
+    )
+
+    session = _RecordingSession()
+    created = bandwidth_partitions.ensure_partitions(session, now=now, hours_ahead=2)
+
+    assert created == ["bandwidth_samples_p2026101614", "bandwidth_samples_p2026101615"]
+    assert (
+        "FROM ('2026-10-16T14:00:00+00:00') TO ('2026-10-16T15:00:00+00:00')"
+        in (session.statements[0])
+    )
+
+
+def test_apply_retention_deletes_rows_when_not_partitioned(
+    db_session, subscription
+) -> None:
+    now = datetime.now(UTC)
+    for sample_at in (now - timedelta(hours=30), now - timedelta(minutes=5)):
+        db_session.add(
+            BandwidthSample(
+                id=uuid4(),
+                subscription_id=subscription.id,
+                rx_bps=1,
+                tx_bps=1,
+                sample_at=sample_at,
+            )
+        )
+    db_session.commit()
+
+    outcome = apply_retention(db_session, cutoff=now - timedelta(hours=24), now=now)
+    db_session.commit()
+
+    assert outcome.deleted == 1
+    assert outcome.dropped == []
+    remaining = (
+        db_session.query(BandwidthSample)
+        .filter(BandwidthSample.subscription_id == subscription.id)
+        .count()
+    )
+    assert remaining == 1
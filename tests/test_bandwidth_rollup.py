@@ -0,0 +1,157 @@
+"""Tests for in-stream bandwidth minute rollups."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from app.services.bandwidth_metrics_adapter import WriteResult
+from app.services.bandwidth_rollup import (
+    PENDING_KEY,
+    MinuteRollup,
+    done_key,
+    flush_closed_windows,
+    window_aggregates,
+    window_key,
+)
+
+MINUTE = int(datetime(2026, 10, 16, 12, 0, tzinfo=UTC).timestamp())
+
+
+class _FakeRedis:
+    def __init__(self, *, merge_status: int = 0) -> None:
+        self.merge_status = merge_status
+        self.merges: list[tuple[list, list]] = []
+        self.values: dict[str, object] = {}
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.pending: dict[bytes, int] = {}
+
+    def register_script(self, _script):
+        def _run(*, keys, args):
+            self.merges.append((keys, args))
+            return self.merge_status
+
+        return _run
+
+    def set(self, key, value, *, nx=False, ex=None):
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    def get(self, key):
+        value = self.values.get(key)
+        return value.encode() if isinstance(value, str) else value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+        self.hashes.pop(key, None)
+
+    def hgetall(self, key):
+        return self.hashes.get(key, {})
+
+    def zrangebyscore(self, _key, _min, horizon):
+        return sorted(m for m, score in self.pending.items() if score <= horizon)
+
+    def zrem(self, _key, member):
+        self.pending.pop(member, None)
+
+
+class _Adapter:
+    def __init__(self, *results: bool) -> None:
+        self.results = list(results)
+        self.batches: list = []
+
+    def write_aggregates_batch(self, batch):
+        self.batches.append(batch)
+        ok = self.results.pop(0) if self.results else True
+        return WriteResult(success=ok, written=len(batch) if ok else 0, error="down")
+
+
+def _at(seconds: int) -> datetime:
+    return datetime.fromtimestamp(MINUTE + seconds, UTC)
+
+
+def test_rollup_accumulates_per_minute_and_subscription() -> None:
+    sub, nas = uuid4(), uuid4()
+    rollup = MinuteRollup()
+    rollup.add(sub, None, 100, 10, _at(5))
+    rollup.add(sub, nas, 300, 30, _at(50))
+    rollup.add(sub, nas, 700, 70, _at(65))
+    client = _FakeRedis()
+
+    assert rollup.publish(client, ttl_seconds=600) == 0
+
+    assert len(rollup) == 0
+    (keys, args), (next_keys, _next_args) = client.merges
+    assert keys == [window_key(MINUTE), done_key(MINUTE), PENDING_KEY]
+    assert next_keys[0] == window_key(MINUTE + 60)
+    assert args[:2] == [MINUTE, 600]
+    assert args[2:9] == [str(sub), 2, 400, 40, 300, 30, str(nas)]
+
+
+def test_publish_counts_rejected_late_windows() -> None:
+    rollup = MinuteRollup()
+    rollup.add(uuid4(), None, 1, 1, _at(1))
+    rollup.add(uuid4(), None, 1, 1, _at(2))
+
+    assert rollup.publish(_FakeRedis(merge_status=-1)) == 2
+
+
+def test_window_aggregates_compute_average_and_max() -> None:
+    sub = str(uuid4())
+    raw = {
+        f"{sub}:n".encode(): b"4",
+        f"{sub}:rs".encode(): b"1000",
+        f"{sub}:ts".encode(): b"200",
+        f"{sub}:rm".encode(): b"600",
+        f"{sub}:tm".encode(): b"90",
+        f"{sub}:nas".encode(): b"nas-1",
+    }
+
+    (aggregate,) = window_aggregates(MINUTE, raw)
+
+    assert aggregate.subscription_id == sub
+    assert aggregate.nas_device_id == "nas-1"
+    assert aggregate.timestamp == _at(0)
+    assert (aggregate.rx_avg, aggregate.tx_avg) == (250.0, 50.0)
+    assert (aggregate.rx_max, aggregate.tx_max) == (600.0, 90.0)
+    assert aggregate.sample_count == 4
+
+
+def test_flush_pushes_only_closed_windows_and_marks_them_done() -> None:
+    client = _FakeRedis()
+    for epoch in (MINUTE, MINUTE + 60):
+        client.pending[str(epoch).encode()] = epoch
+        client.hashes[window_key(epoch)] = {b"s:n": b"1", b"s:rs": b"5", b"s:ts": b"5"}
+    adapter = _Adapter()
+
+    result = flush_closed_windows(
+        client, now=_at(140), grace_seconds=30, adapter=adapter
+    )
+
+    assert result == {"pushed": 1, "windows": 1, "success": True}
+    assert done_key(MINUTE) in client.values
+    assert window_key(MINUTE) not in client.hashes
+    assert list(client.pending) == [str(MINUTE + 60).encode()]
+
+
+def test_failed_write_keeps_window_pending() -> None:
+    client = _FakeRedis()
+    client.pending[str(MINUTE).encode()] = MINUTE
+    client.hashes[window_key(MINUTE)] = {b"s:n": b"1", b"s:rs": b"5", b"s:ts": b"5"}
+    adapter = _Adapter(False, False)
+
+    result = flush_closed_windows(
+        client,
+        now=_at(600),
+        grace_seconds=30,
+        max_attempts=2,
+        adapter=adapter,
+        sleep=lambda _seconds: None,
+    )
+
+    assert result["success"] is False
+    assert len(adapter.batches) == 2
+    assert window_key(MINUTE) in client.hashes
+    assert str(MINUTE).encode() in client.pending
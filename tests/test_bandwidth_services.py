@@ -292,9 +292,11 @@ def test_process_bandwidth_stream_resolves_network_device_from_nas(
         def xgroup_create(self, *_args, **_kwargs):
             return None
 
+        def xautoclaim(self, *_args, **_kwargs):
+            return [b"0-0", [], []]
+
         def xreadgroup(self, *, streams, **_kwargs):
-            if list(streams.values())[0] == "0":
-                return []
+            assert list(streams.values()) == [">"]
             return [
                 (
                     "bandwidth:samples",
@@ -316,6 +318,9 @@ def test_process_bandwidth_stream_resolves_network_device_from_nas(
         def xack(self, *_args, **_kwargs):
             return 1
 
+        def register_script(self, _script):
+            return lambda **_kwargs: 0
+
         def close(self):
             return None
 
@@ -334,6 +339,7 @@ def test_process_bandwidth_stream_resolves_network_device_from_nas(
     with (
         patch("app.tasks.bandwidth._get_redis_client", return_value=_FakeRedis()),
         patch("app.tasks.bandwidth.db_session_adapter", _SessionAdapter()),
+        patch("app.services.bandwidth_ingest.db_session_adapter", _SessionAdapter()),
     ):
         result = bandwidth_tasks.process_bandwidth_stream()
 
@@ -367,6 +373,9 @@ def test_trim_redis_stream_closes_read_session_before_redis_write(monkeypatch):
             assert session_open is False
             return 3
 
+        def xinfo_consumers(self, *_args, **_kwargs):
+            return []
+
         def close(self):
             return None
 
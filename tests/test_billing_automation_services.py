@@ -1,8 +1,11 @@
 """Tests for billing automation services."""
 
+import uuid
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
+import pytest
+
 from app.models.catalog import BillingCycle
 from app.services import billing_automation
 from app.services.events.types import EventType
@@ -2418,6 +2421,178 @@ class TestBillingRunResilience:
         assert "abandoned" in (stale.error or "")
         assert fresh.status == BillingRunStatus.running
 
+    @staticmethod
+    def _billable_accounts(db_session, catalog_offer, count, run_at):
+        from app.models.catalog import (
+            BillingCycle,
+            BillingMode,
+            OfferPrice,
+            PriceType,
+            Subscription,
+            SubscriptionStatus,
+        )
+        from app.models.subscriber import Subscriber, SubscriberStatus
+
+        db_session.add(
+            OfferPrice(
+                offer_id=catalog_offer.id,
+                price_type=PriceType.recurring,
+                amount=Decimal("100.00"),
+                currency="NGN",
+                billing_cycle=BillingCycle.monthly,
+                is_active=True,
+            )
+        )
+        accounts = []
+        for n in range(count):
+            account = Subscriber(
+                first_name="Chunk",
+                last_name=str(n),
+                email=f"chunk-{uuid.uuid4().hex}@example.com",
+                status=SubscriberStatus.active,
+            )
+            db_session.add(account)
+            db_session.flush()
+            db_session.add(
+                Subscription(
+                    subscriber_id=account.id,
+                    offer_id=catalog_offer.id,
+                    status=SubscriptionStatus.active,
+                    billing_mode=BillingMode.postpaid,
+                    start_at=run_at - timedelta(days=1),
+                    next_billing_at=run_at - timedelta(days=1),
+                )
+            )
+            accounts.append(account)
+        db_session.commit()
+        return sorted(account.id for account in accounts)
+
+    def test_invoice_cycle_commits_account_chunks_with_checkpoint(
+        self, db_session, catalog_offer, monkeypatch
+    ):
+        from app.models.billing import BillingRun
+
+        run_at = datetime(2026, 6, 17)
+        account_ids = self._billable_accounts(db_session, catalog_offer, 3, run_at)
+        monkeypatch.setattr(
+            billing_automation.settings, "billing_invoice_chunk_size", 1
+        )
+
+        summary = billing_automation.run_invoice_cycle(
+            db_session, run_at=run_at, run_prepaid_renewals=False
+        )
+
+        run = db_session.get(BillingRun, summary["run_id"])
+        assert summary["chunks"] == summary["subscriptions_scanned"] >= 3
+        assert summary["invoices_created"] >= 3
+        assert run.chunks_completed == summary["chunks"]
+        assert run.last_account_id >= account_ids[-1]
+
+    def test_failed_scheduled_run_resumes_after_last_committed_chunk(
+        self, db_session, catalog_offer
+    ):
+        from app.models.billing import BillingRun, BillingRunStatus
+
+        run_at = datetime.now(UTC).replace(tzinfo=None)
+        account_ids = self._billable_accounts(db_session, catalog_offer, 3, run_at)
+        failed = BillingRun(
+            run_at=run_at,
+            launch_kind="scheduled",
+            status=BillingRunStatus.failed,
+            started_at=run_at,
+            finished_at=run_at,
+            last_account_id=account_ids[1],
+            chunks_completed=2,
+            error="worker lost",
+        )
+        db_session.add(failed)
+        db_session.commit()
+
+        summary = billing_automation.run_invoice_cycle(
+            db_session, run_prepaid_renewals=False
+        )
+
+        run = db_session.get(BillingRun, summary["run_id"])
+        assert summary["resumed_from_run_id"] == str(failed.id)
+        assert run.source_run_id == failed.id
+        assert summary["subscriptions_scanned"] == 1
+        assert run.last_account_id == account_ids[2]
+
+    def test_invoice_partition_bounds_tile_the_account_space(self):
+        bounds = [billing_automation.invoice_partition_bounds(i, 3) for i in range(3)]
+
+        assert bounds[0][0] is None and bounds[-1][1] is None
+        for (_after, before), (next_after, _before) in zip(bounds, bounds[1:]):
+            assert next_after.int == before.int - 1
+        with pytest.raises(ValueError):
+            billing_automation.invoice_partition_bounds(3, 3)
+
+    def test_partitioned_cycle_rejects_zero_partitions(self, db_session):
+        from app.models.billing import BillingRun
+
+        with pytest.raises(ValueError):
+            billing_automation.start_partitioned_invoice_cycle(
+                db_session, 0, run_prepaid_renewals=False
+            )
+        assert db_session.query(BillingRun).count() == 0
+
+    def test_partitioned_run_merges_summaries_and_retries_failed_partition(
+        self, db_session, catalog_offer, monkeypatch
+    ):
+        from types import SimpleNamespace
+
+        from app.models.billing import BillingRun, BillingRunStatus
+
+        run_at = datetime(2026, 6, 17)
+        self._billable_accounts(db_session, catalog_offer, 3, run_at)
+        queued = []
+        monkeypatch.setattr(
+            "app.services.queue_adapter.enqueue_task",
+            lambda name, *, args, **_kw: (
+                queued.append(args) or SimpleNamespace(queued=True, error=None)
+            ),
+        )
+        started = billing_automation.start_partitioned_invoice_cycle(
+            db_session, 2, run_at=run_at, run_prepaid_renewals=False
+        )
+        run_id = uuid.UUID(started["run_id"])
+        assert [index for _run, index in queued] == [0, 1]
+
+        real_chunks = billing_automation._run_invoice_chunks
+
+        def _fail_last_partition(db, ctx, *, after, before, checkpoint):
+            if before is None:
+                raise RuntimeError("worker lost")
+            return real_chunks(
+                db, ctx, after=after, before=before, checkpoint=checkpoint
+            )
+
+        monkeypatch.setattr(
+            billing_automation, "_run_invoice_chunks", _fail_last_partition
+        )
+        billing_automation.run_invoice_partition(db_session, run_id, 0)
+        failed = billing_automation.run_invoice_partition(db_session, run_id, 1)
+        assert failed["status"] == "failed"
+
+        run = db_session.get(BillingRun, run_id)
+        assert run.status == BillingRunStatus.failed
+        assert run.error == "partitions failed: 1"
+        first_invoices = run.invoices_created
+
+        monkeypatch.setattr(billing_automation, "_run_invoice_chunks", real_chunks)
+        queued.clear()
+        retry = billing_automation.retry_failed_invoice_partitions(db_session, run_id)
+        assert retry["retried"] == [1] and queued == [(str(run_id), 1)]
+        redelivered = billing_automation.run_invoice_partition(db_session, run_id, 0)
+        assert redelivered["claimed"] is False
+        billing_automation.run_invoice_partition(db_session, run_id, 1)
+
+        db_session.refresh(run)
+        assert run.status == BillingRunStatus.success
+        assert run.error is None
+        assert run.invoices_created >= 3
+        assert run.invoices_created >= first_invoices
+
 
 # =============================================================================
 # mark_overdue_invoices — observational overdue checker
@@ -9,18 +9,23 @@ from uuid import uuid4
 import pytest
 
 from app.models.billing_contract import BillingRecordAuthority
+from app.models.customer_subledger import CustomerPositionSnapshot
 from app.services.billing.customer_subledger import (
     CustomerSubledgerError,
     EffectInput,
     PositionEffectKind,
+    PositionSnapshotScope,
     PostingCommandKind,
     PostingProducer,
     PostingSourceKind,
     StagePostingGroupCommand,
     StageReversalCommand,
+    lagging_position_snapshots,
+    repair_position_snapshot,
     resolve_position,
     stage_posting_group,
     stage_reversal,
+    verify_position_snapshots,
 )
 from app.services.owner_commands import (
     CommandContext,
@@ -379,3 +384,119 @@ def test_shadow_rows_never_count_toward_an_authoritative_read(db_session, accoun
     )
 
     assert authoritative.collectible_receivable == Decimal("0")
+
+
+def _effect(kind: PositionEffectKind, amount: str) -> tuple[EffectInput, ...]:
+    return (EffectInput(effect=kind, amount=Decimal(amount)),)
+
+
+def _shadow_receivable(db, account_id) -> Decimal:
+    position = resolve_position(
+        db,
+        account_id=account_id,
+        currency="NGN",
+        authority=BillingRecordAuthority.shadow,
+    )
+    db.commit()
+    return position.collectible_receivable
+
+
+def _snapshot(db, account_id) -> CustomerPositionSnapshot:
+    return (
+        db.query(CustomerPositionSnapshot)
+        .filter(CustomerPositionSnapshot.account_id == account_id)
+        .one()
+    )
+
+
+def test_staging_folds_each_group_into_the_position_snapshot(db_session, account_id):
+    group = _stage(
+        db_session,
+        account_id,
+        effects=_effect(PositionEffectKind.receivable_issued, "100.00"),
+    )
+    group_id = group.id
+    _stage(
+        db_session,
+        account_id,
+        effects=_effect(PositionEffectKind.receivable_settled, "40.00"),
+    )
+    reversal_context = _context()
+    _in_owner_command(
+        db_session,
+        lambda: stage_reversal(
+            db_session,
+            StageReversalCommand(
+                original_group_id=group_id,
+                producer_owner=PostingProducer.account_adjustments,
+                source_kind=PostingSourceKind.account_adjustment,
+                source_id=uuid4(),
+                occurred_at=OCCURRED,
+            ),
+            context=reversal_context,
+        ),
+    )
+
+    snapshot = _snapshot(db_session, account_id)
+    assert snapshot.last_sequence == snapshot.through_sequence == 3
+    assert Decimal(snapshot.collectible_receivable) == Decimal("-40.00")
+    db_session.commit()
+    assert _shadow_receivable(db_session, account_id) == Decimal("-40.00")
+
+
+def test_reads_fold_the_postings_after_a_lagging_checkpoint(db_session, account_id):
+    _stage(
+        db_session,
+        account_id,
+        effects=_effect(PositionEffectKind.receivable_issued, "70.00"),
+    )
+    _stage(
+        db_session,
+        account_id,
+        effects=_effect(PositionEffectKind.receivable_settled, "10.00"),
+    )
+    # A checkpoint established over history it has not folded yet.
+    snapshot = _snapshot(db_session, account_id)
+    snapshot.through_sequence = 0
+    snapshot.collectible_receivable = Decimal("0")
+    db_session.commit()
+
+    assert _shadow_receivable(db_session, account_id) == Decimal("60.00")
+    assert lagging_position_snapshots(db_session, limit=10) == [
+        PositionSnapshotScope(account_id, "NGN", BillingRecordAuthority.shadow)
+    ]
+    db_session.commit()
+
+    # The next staging catches the checkpoint up under its row lock.
+    _stage(
+        db_session,
+        account_id,
+        effects=_effect(PositionEffectKind.receivable_settled, "20.00"),
+    )
+
+    snapshot = _snapshot(db_session, account_id)
+    assert snapshot.through_sequence == 3
+    assert Decimal(snapshot.collectible_receivable) == Decimal("40.00")
+    db_session.commit()
+    assert _shadow_receivable(db_session, account_id) == Decimal("40.00")
+
+
+def test_verifier_rebuilds_a_drifted_position_snapshot(db_session, account_id):
+    _stage(
+        db_session,
+        account_id,
+        effects=_effect(PositionEffectKind.receivable_issued, "90.00"),
+    )
+    snapshot = _snapshot(db_session, account_id)
+    snapshot.collectible_receivable = Decimal("999.00")
+    db_session.commit()
+    scope = PositionSnapshotScope(account_id, "NGN", BillingRecordAuthority.shadow)
+
+    verification = verify_position_snapshots(db_session, sample_size=10)
+
+    assert verification.checked == 1
+    assert verification.suspects == (scope,)
+    assert repair_position_snapshot(db_session, scope) is True
+    db_session.commit()
+    assert _shadow_receivable(db_session, account_id) == Decimal("90.00")
+    assert verify_position_snapshots(db_session, sample_size=10).suspects == ()
@@ -0,0 +1,195 @@
+"""Tests for the partitioned, key-ordered event outbox dispatcher and wake-ups."""
+
+from __future__ import annotations
+
+import uuid
+
+from app.event_listener.wakeup import WAKE_GRACE_SECONDS, OutboxWakeup
+from app.models.event_store import EventStatus
+from app.services import event_store as event_store_service
+from app.services.event_notifications import (
+    EventStoreNotification,
+    parse_notification,
+)
+from app.services.events.dispatcher import CORE_LANE, EventDispatcher
+from app.services.events.outbox import (
+    dispatch_external_lane,
+    dispatch_partition,
+    ordering_key,
+    partition_of,
+)
+from app.services.events.types import Event, EventType
+
+
+class RecordingHandler:
+    def __init__(self) -> None:
+        self.seen: list[uuid.UUID] = []
+
+    def handle(self, db, event) -> None:
+        self.seen.append(event.event_id)
+
+
+class WebhookHandler(RecordingHandler):
+    """Named like the production handler so the plan puts it in the external stage."""
+
+    fail = False
+
+    def handle(self, db, event) -> None:
+        super().handle(db, event)
+        if self.fail:
+            raise RuntimeError("endpoint timed out")
+
+
+def _pending(db_session, *, account_id=None):
+    return event_store_service.create_event_record(
+        db_session,
+        Event(event_type=EventType.custom, payload={}, account_id=account_id),
+        status=EventStatus.pending,
+    )
+
+
+def test_partitions_keep_every_key_in_one_range():
+    keys = [uuid.uuid4() for _ in range(400)]
+
+    assignments = [partition_of(key, 4) for key in keys]
+
+    assert set(assignments) == {0, 1, 2, 3}
+    assert all(partition_of(key, 1) == 0 for key in keys)
+    account, row = uuid.uuid4(), uuid.uuid4()
+    assert ordering_key(row, account, uuid.uuid4()) == account
+    assert ordering_key(row, None, None) == row
+
+
+def test_failed_event_holds_back_only_its_own_key(db_session):
+    held, free = uuid.uuid4(), uuid.uuid4()
+    first = _pending(db_session, account_id=held)
+    second = _pending(db_session, account_id=held)
+    other = _pending(db_session, account_id=free)
+    db_session.commit()
+
+    class _Dispatcher:
+        def __init__(self) -> None:
+            self.calls: list[uuid.UUID] = []
+
+        def dispatch_pending_event(self, db, event_store_id, *, lane=None):
+            assert lane == CORE_LANE
+            self.calls.append(event_store_id)
+            if event_store_id == first.id:
+                raise RuntimeError("handler chain crashed")
+            return True
+
+    dispatcher = _Dispatcher()
+    result = dispatch_partition(
+        db_session,
+        partition=0,
+        partitions=1,
+        batch_size=10,
+        dispatcher=dispatcher,
+    )
+
+    assert dispatcher.calls == [first.id, other.id]
+    assert second.id not in dispatcher.calls
+    assert (result["failed"], result["deferred"], result["dispatched"]) == (1, 1, 1)
+
+
+def test_core_lane_defers_external_handlers_to_the_external_lane(db_session):
+    core, webhook = RecordingHandler(), WebhookHandler()
+    dispatcher = EventDispatcher()
+    dispatcher.register_handler(core)
+    dispatcher.register_handler(webhook)
+    record = _pending(db_session, account_id=uuid.uuid4())
+    db_session.commit()
+
+    dispatch_partition(
+        db_session, partition=0, partitions=1, batch_size=10, dispatcher=dispatcher
+    )
+    db_session.refresh(record)
+
+    assert core.seen == [record.event_id] and webhook.seen == []
+    assert record.status == EventStatus.completed
+    assert record.external_pending is True
+    assert event_store_service.outbox_backlog(db_session)["external"][0] == 1
+
+    result = dispatch_external_lane(db_session, batch_size=10, dispatcher=dispatcher)
+    db_session.refresh(record)
+
+    assert result["dispatched"] == 1
+    assert core.seen == [record.event_id] and webhook.seen == [record.event_id]
+    assert record.external_pending is False
+    assert record.status == EventStatus.completed
+
+
+def test_external_lane_failure_joins_the_retry_manifest(db_session):
+    webhook = WebhookHandler()
+    webhook.fail = True
+    dispatcher = EventDispatcher()
+    dispatcher.register_handler(RecordingHandler())
+    dispatcher.register_handler(webhook)
+    record = _pending(db_session)
+    db_session.commit()
+
+    assert dispatcher.dispatch_pending_event(db_session, record.id, lane=CORE_LANE)
+    db_session.commit()
+    assert dispatcher.dispatch_external_event(db_session, record.id) is True
+    db_session.commit()
+    db_session.refresh(record)
+
+    assert record.status == EventStatus.failed
+    assert record.external_pending is False
+    assert event_store_service.failed_handler_names(record) == {"WebhookHandler"}
+    assert dispatcher.dispatch_external_event(db_session, record.id) is False
+
+
+def test_notification_payload_round_trips():
+    row, account = uuid.uuid4(), uuid.uuid4()
+    payload = (
+        f'{{"id": "{row}", "event_id": "{uuid.uuid4()}", "status": "pending", '
+        f'"account_id": "{account}", "subscriber_id": null}}'
+    )
+
+    notification = parse_notification(payload)
+
+    assert notification is not None
+    assert (notification.id, notification.account_id) == (row, account)
+    assert notification.subscriber_id is None
+    assert parse_notification("not json") is None
+
+
+def test_wakeup_queues_only_partitions_with_rows_still_pending(db_session, monkeypatch):
+    class _Clock:
+        now = 100.0
+
+        def __call__(self) -> float:
+            return self.now
+
+    still_pending = _pending(db_session, account_id=uuid.uuid4())
+    handled = _pending(db_session, account_id=uuid.uuid4())
+    handled.status = EventStatus.completed
+    db_session.commit()
+    queued: list[tuple] = []
+    clock = _Clock()
+    wakeup = OutboxWakeup(
+        lambda: db_session,
+        enqueue=lambda name, args: queued.append((name, args)),
+        clock=clock,
+    )
+    monkeypatch.setattr(db_session, "close", lambda: None)
+
+    wakeup.observe(
+        EventStoreNotification(
+            id=record.id,
+            event_id=record.event_id,
+            status="pending",
+            account_id=record.account_id,
+        )
+        for record in (still_pending, handled)
+    )
+    assert wakeup.flush_due() == []
+
+    clock.now += WAKE_GRACE_SECONDS
+    woken = wakeup.flush_due()
+
+    expected = partition_of(still_pending.account_id, 4)
+    assert woken == [expected]
+    assert queued == [("app.tasks.events.dispatch_event_partition", (expected, 4))]
+    assert wakeup.flush_due() == []
@@ -0,0 +1,223 @@
+"""Tests for the compiled, digest-keyed forwarding graph cache."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import update
+
+from app.models.network_monitoring import (
+    DeviceStatus,
+    NetworkDevice,
+    NetworkTopologyLink,
+)
+from app.services import app_cache
+from app.services.network.forwarding_topology import ForwardingGraph
+from app.services.topology import affected, forwarding_graph_invalidation
+from app.services.topology import forwarding_graph_cache as cache
+
+
+@pytest.fixture
+def fake(fake_cache_redis, monkeypatch):
+    monkeypatch.setattr(cache, "_memo", cache._Memo(4))
+    return fake_cache_redis
+
+
+def _chain_graph(digest: str = "a" * 64):
+    core, agg, access, leaf = (uuid.uuid4() for _ in range(4))
+    adjacency = {
+        core: frozenset({agg}),
+        agg: frozenset({core, access}),
+        access: frozenset({agg, leaf}),
+        leaf: frozenset({access}),
+    }
+    graph = ForwardingGraph(
+        report_sha256=digest,
+        adjacency=adjacency,
+        upstream_by_downstream={agg: core, access: agg, leaf: access},
+        declaration_by_downstream={},
+        root_device_ids=frozenset({core}),
+        declaration_ids=(),
+    )
+    return graph, (core, agg, access, leaf)
+
+
+def _compiled(graph: ForwardingGraph) -> cache.CompiledForwardingGraph:
+    dist = affected._dist_to_core(
+        None, adjacency=graph.adjacency, root_ids=graph.root_device_ids
+    )
+    downstream = affected._downstream_closure(graph.adjacency, dist)
+    return cache.CompiledForwardingGraph(
+        graph=graph,
+        dist_to_core=dist,
+        downstream=downstream,
+        downstream_subscription_counts=dict.fromkeys(downstream, 1),
+    )
+
+
+def test_closure_matches_downstream_bfs():
+    graph, (core, agg, access, leaf) = _chain_graph()
+    compiled = _compiled(graph)
+
+    for node_id in (core, agg, access, leaf):
+        expected = affected.downstream_nodes(
+            None,
+            SimpleNamespace(id=node_id),
+            dist=compiled.dist_to_core,
+            adjacency=graph.adjacency,
+        )
+        assert compiled.downstream_of(node_id) == expected
+    assert compiled.downstream_of(agg) == {agg, access, leaf}
+    unknown = uuid.uuid4()
+    assert compiled.downstream_of(unknown) == {unknown}
+
+
+def test_payload_round_trip():
+    graph, _ = _chain_graph()
+    compiled = _compiled(graph)
+
+    assert cache.from_payload(json.loads(json.dumps(cache.to_payload(compiled)))) == (
+        compiled
+    )
+
+
+def test_shared_compiled_maps_are_not_mutable_through_lookups(monkeypatch):
+    graph, (core, agg, access, leaf) = _chain_graph()
+    compiled = _compiled(graph)
+    monkeypatch.setattr(
+        affected, "compiled_forwarding_graph", lambda _session: compiled
+    )
+
+    dist = affected._dist_to_core(None)
+    with pytest.raises(TypeError):
+        dist[leaf] = 0
+    downstream = affected.downstream_nodes(None, SimpleNamespace(id=agg))
+    downstream.add(core)
+
+    assert compiled.dist_to_core[leaf] == 3
+    assert compiled.downstream_of(agg) == {agg, access, leaf}
+
+
+def test_graph_is_projected_once_per_version(fake):
+    graph, (_, agg, access, leaf) = _chain_graph()
+    projections: list[int] = []
+    compiles: list[int] = []
+
+    def project():
+        projections.append(1)
+        return graph
+
+    def compile_graph(value):
+        compiles.append(1)
+        return _compiled(value)
+
+    first = cache.load_compiled_forwarding_graph(
+        "main", project=project, compile_graph=compile_graph
+    )
+    second = cache.load_compiled_forwarding_graph(
+        "main", project=project, compile_graph=compile_graph
+    )
+
+    assert first.downstream_of(agg) == second.downstream_of(agg) == {agg, access, leaf}
+    assert len(projections) == 1
+    assert len(compiles) == 1
+
+    # A version bump re-projects; an unchanged report digest skips compiling.
+    cache.bump_forwarding_graph_version()
+    cache.load_compiled_forwarding_graph(
+        "main", project=project, compile_graph=compile_graph
+    )
+
+    assert len(projections) == 2
+    assert len(compiles) == 1
+
+
+def test_graph_compiles_without_redis(monkeypatch):
+    monkeypatch.setattr(
+        app_cache, "get_cache_redis", lambda force_reconnect=False: None
+    )
+    monkeypatch.setattr(cache, "_memo", cache._Memo(4))
+    graph, (core, *_rest) = _chain_graph()
+
+    compiled = cache.load_compiled_forwarding_graph(
+        "main", project=lambda: graph, compile_graph=_compiled
+    )
+
+    assert compiled.dist_to_core[core] == 0
+
+
+@pytest.fixture
+def bumps(monkeypatch):
+    calls: list[int] = []
+    monkeypatch.setattr(
+        cache, "bump_forwarding_graph_version", lambda: calls.append(1) or True
+    )
+    return calls
+
+
+def _lldp_link(db_session) -> tuple[NetworkDevice, NetworkTopologyLink]:
+    suffix = uuid.uuid4().hex[:8]
+    core = NetworkDevice(
+        name=f"fg-core-{suffix}", mgmt_ip="10.90.0.1", status=DeviceStatus.online
+    )
+    access = NetworkDevice(
+        name=f"fg-access-{suffix}", mgmt_ip="10.90.0.2", status=DeviceStatus.online
+    )
+    db_session.add_all([core, access])
+    db_session.flush()
+    link = NetworkTopologyLink(
+        source_device_id=access.id,
+        target_device_id=core.id,
+        source="lldp_neighbor",
+        is_active=True,
+    )
+    db_session.add(link)
+    db_session.commit()
+    return access, link
+
+
+def test_committed_watched_change_bumps_version(db_session, bumps):
+    _access, link = _lldp_link(db_session)
+    bumps.clear()
+
+    link.is_active = False
+    db_session.flush()
+    db_session.rollback()
+    assert bumps == []
+
+    link.is_active = False
+    db_session.commit()
+    assert bumps == [1]
+
+
+def test_status_polling_does_not_bump_version(db_session, bumps):
+    access, _link = _lldp_link(db_session)
+    bumps.clear()
+
+    access.status = DeviceStatus.offline
+    access.last_ping_ok = False
+    assert not forwarding_graph_invalidation.forwarding_inputs_changed(db_session)
+    db_session.commit()
+
+    assert bumps == []
+
+
+def test_bulk_update_on_watched_model_bumps_version(db_session, bumps):
+    _access, link = _lldp_link(db_session)
+    link_id = link.id
+    # The bulk statement below then opens the transaction itself.
+    db_session.commit()
+    bumps.clear()
+
+    db_session.execute(
+        update(NetworkTopologyLink)
+        .where(NetworkTopologyLink.id == link_id)
+        .values(is_active=False)
+    )
+    assert bumps == []
+    db_session.commit()
+
+    assert bumps == [1]
@@ -1,18 +1,29 @@
 """Tests for genieacs service."""
 
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
+from app.services import genieacs_client as genieacs_module
 from app.services.genieacs_client import (
+    AsyncGenieACSClient,
     GenieACSClient,
     GenieACSError,
     GenieACSTaskRejectedError,
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_http_pools():
+    """Each test builds its pooled transport from its own patched httpx."""
+    genieacs_module._forget_pooled_clients()
+    yield
+    genieacs_module._forget_pooled_clients()
+
+
 @pytest.fixture
 def client():
     """Create GenieACS client."""
@@ -89,9 +100,7 @@ class TestRequestErrorHandling:
             mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
                 "Not found", request=MagicMock(), response=mock_response
             )
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response
-            )
+            mock_client.return_value.request.return_value = mock_response
 
             with pytest.raises(GenieACSError) as exc_info:
                 client._request("GET", "/devices/test")
@@ -101,8 +110,8 @@ class TestRequestErrorHandling:
     def test_raises_on_connection_error(self, client):
         """Test raises GenieACSError on connection error."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.side_effect = (
-                httpx.RequestError("Connection refused")
+            mock_client.return_value.request.side_effect = httpx.RequestError(
+                "Connection refused"
             )
 
             with pytest.raises(GenieACSError) as exc_info:
@@ -111,6 +120,26 @@ class TestRequestErrorHandling:
             assert "Request error" in str(exc_info.value)
 
 
+class TestPooledTransport:
+    """Tests for the per-ACS-server keep-alive transport."""
+
+    def test_reuses_one_client_per_server(self, mock_response):
+        """Calls and client instances for one server share a transport."""
+        with patch("httpx.Client") as mock_client:
+            mock_client.return_value.request.return_value = mock_response(json_data=[])
+
+            GenieACSClient("http://acs-a:7557").list_devices()
+            GenieACSClient("http://acs-a:7557/", headers={"X-A": "1"}).list_devices()
+            GenieACSClient("http://acs-b:7557").list_devices()
+
+            assert mock_client.call_count == 2
+            assert mock_client.return_value.request.call_count == 3
+            headers = mock_client.return_value.request.call_args_list[1].kwargs[
+                "headers"
+            ]
+            assert headers == {"X-A": "1"}
+
+
 # =============================================================================
 # Device Operations Tests
 # =============================================================================
@@ -124,42 +153,34 @@ class TestDeviceOperations:
         devices = [{"_id": "device1"}, {"_id": "device2"}]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=devices)
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=devices
             )
 
             result = client.list_devices()
 
             assert result == devices
-            mock_client.return_value.__enter__.return_value.request.assert_called_once()
+            mock_client.return_value.request.assert_called_once()
 
     def test_list_devices_with_query(self, client, mock_response):
         """Test list_devices with query filter."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=[])
-            )
+            mock_client.return_value.request.return_value = mock_response(json_data=[])
 
             client.list_devices(query={"_tags": "test"})
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             assert "params" in call_args.kwargs
             assert "query" in call_args.kwargs["params"]
 
     def test_list_devices_with_projection(self, client, mock_response):
         """Test list_devices with projection."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=[])
-            )
+            mock_client.return_value.request.return_value = mock_response(json_data=[])
 
             client.list_devices(projection={"_id": 1})
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             assert "params" in call_args.kwargs
             assert "projection" in call_args.kwargs["params"]
 
@@ -168,16 +189,14 @@ class TestDeviceOperations:
         device = {"_id": "ABC-Model-123"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=[device])
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=[device]
             )
 
             result = client.get_device("ABC-Model-123")
 
             assert result == device
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             assert call_args.args[:2] == ("GET", "http://genieacs:7557/devices")
             assert json.loads(call_args.kwargs["params"]["query"]) == {
                 "_id": "ABC-Model-123"
@@ -213,9 +232,7 @@ class TestDeviceOperations:
     def test_delete_device(self, client, mock_response):
         """Test delete_device succeeds."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             # Should not raise
             client.delete_device("ABC-Model-123")
@@ -223,8 +240,8 @@ class TestDeviceOperations:
     def test_count_devices(self, client, mock_response):
         """Test count_devices returns count."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(headers={"X-Total-Count": "42"})
+            mock_client.return_value.request.return_value = mock_response(
+                headers={"X-Total-Count": "42"}
             )
 
             result = client.count_devices()
@@ -234,8 +251,8 @@ class TestDeviceOperations:
     def test_count_devices_with_query(self, client, mock_response):
         """Test count_devices with query."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(headers={"X-Total-Count": "10"})
+            mock_client.return_value.request.return_value = mock_response(
+                headers={"X-Total-Count": "10"}
             )
 
             result = client.count_devices(query={"_tags": "test"})
@@ -245,9 +262,7 @@ class TestDeviceOperations:
     def test_count_devices_missing_header(self, client, mock_response):
         """Test count_devices returns 0 if header missing."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             result = client.count_devices()
 
@@ -267,8 +282,8 @@ class TestTaskOperations:
         task_result = {"_id": "task123"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=task_result, text=json.dumps(task_result))
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=task_result, text=json.dumps(task_result)
             )
 
             result = client.create_task("device1", {"name": "reboot"})
@@ -288,8 +303,8 @@ class TestTaskOperations:
         }
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=task_result, text=json.dumps(task_result))
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=task_result, text=json.dumps(task_result)
             )
 
             with caplog.at_level("INFO", logger="app.services.genieacs_client"):
@@ -314,9 +329,7 @@ class TestTaskOperations:
     def test_create_task_empty_response(self, client, mock_response):
         """Test create_task handles empty response."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(text="")
-            )
+            mock_client.return_value.request.return_value = mock_response(text="")
 
             result = client.create_task("device1", {"name": "reboot"})
 
@@ -325,15 +338,11 @@ class TestTaskOperations:
     def test_create_task_with_connection_request_false(self, client, mock_response):
         """Test create_task with connection_request=False."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             client.create_task("device1", {"name": "reboot"}, connection_request=False)
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             assert call_args.kwargs["params"]["connection_request"] == "false"
 
     def test_create_task_captures_connection_request_error_from_reason_phrase(
@@ -343,13 +352,11 @@ class TestTaskOperations:
         task_result = {"_id": "task123"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(
-                    status_code=202,
-                    json_data=task_result,
-                    text=json.dumps(task_result),
-                    reason_phrase="Device is offline",
-                )
+            mock_client.return_value.request.return_value = mock_response(
+                status_code=202,
+                json_data=task_result,
+                text=json.dumps(task_result),
+                reason_phrase="Device is offline",
             )
 
             result = client.create_task("device1", {"name": "reboot"})
@@ -364,7 +371,7 @@ class TestTaskOperations:
         task_result = {"_id": "task123"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = mock_response(
+            mock_client.return_value.request.return_value = mock_response(
                 status_code=202,
                 json_data=task_result,
                 text=json.dumps(task_result),
@@ -384,13 +391,11 @@ class TestTaskOperations:
         task_result = {"_id": "task123", "connectionRequestError": "From JSON body"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(
-                    status_code=202,
-                    json_data=task_result,
-                    text=json.dumps(task_result),
-                    reason_phrase="Device is offline",
-                )
+            mock_client.return_value.request.return_value = mock_response(
+                status_code=202,
+                json_data=task_result,
+                text=json.dumps(task_result),
+                reason_phrase="Device is offline",
             )
 
             result = client.create_task("device1", {"name": "reboot"})
@@ -403,13 +408,11 @@ class TestTaskOperations:
         task_result = {"_id": "task123"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(
-                    status_code=202,
-                    json_data=task_result,
-                    text=json.dumps(task_result),
-                    reason_phrase="Accepted",
-                )
+            mock_client.return_value.request.return_value = mock_response(
+                status_code=202,
+                json_data=task_result,
+                text=json.dumps(task_result),
+                reason_phrase="Accepted",
             )
 
             result = client.create_task("device1", {"name": "reboot"})
@@ -420,17 +423,15 @@ class TestTaskOperations:
         pending = [{"_id": "task123", "name": "reboot", "device": "device1"}]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=pending)
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=pending
             )
 
             result = client.create_task("device1", {"name": "reboot"})
 
             assert result["_id"] == "task123"
             assert result["alreadyPending"] is True
-            assert (
-                mock_client.return_value.__enter__.return_value.request.call_count == 1
-            )
+            assert mock_client.return_value.request.call_count == 1
 
     def test_create_task_replaces_pending_parameter_write(self, client, mock_response):
         pending = [
@@ -446,7 +447,7 @@ class TestTaskOperations:
         accepted = {"_id": "new-task"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.side_effect = [
+            mock_client.return_value.request.side_effect = [
                 mock_response(json_data=pending),
                 mock_response(),
                 mock_response(json_data=accepted, text=json.dumps(accepted)),
@@ -458,9 +459,7 @@ class TestTaskOperations:
             )
 
             assert result["_id"] == "new-task"
-            calls = (
-                mock_client.return_value.__enter__.return_value.request.call_args_list
-            )
+            calls = mock_client.return_value.request.call_args_list
             assert calls[1].args[0] == "DELETE"
             assert calls[2].args[0] == "POST"
 
@@ -479,7 +478,7 @@ class TestTaskOperations:
         accepted = {"_id": "new-task"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.side_effect = [
+            mock_client.return_value.request.side_effect = [
                 mock_response(json_data=pending),
                 mock_response(),
                 mock_response(json_data=accepted, text=json.dumps(accepted)),
@@ -491,9 +490,7 @@ class TestTaskOperations:
             )
 
             assert result["_id"] == "new-task"
-            calls = (
-                mock_client.return_value.__enter__.return_value.request.call_args_list
-            )
+            calls = mock_client.return_value.request.call_args_list
             assert calls[1].args[0] == "DELETE"
             assert calls[2].args[0] == "POST"
 
@@ -506,8 +503,8 @@ class TestTaskOperations:
         ]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=pending)
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=pending
             )
 
             with pytest.raises(GenieACSTaskRejectedError, match="already has 3"):
@@ -517,9 +514,7 @@ class TestTaskOperations:
                     max_pending_tasks=3,
                 )
 
-            calls = (
-                mock_client.return_value.__enter__.return_value.request.call_args_list
-            )
+            calls = mock_client.return_value.request.call_args_list
             assert len(calls) == 1
             assert calls[0].args[0] == "GET"
 
@@ -531,8 +526,8 @@ class TestTaskOperations:
         ]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=pending)
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=pending
             )
 
             result = client.create_task(
@@ -543,9 +538,7 @@ class TestTaskOperations:
 
             assert result["_id"] == "existing"
             assert result["alreadyPending"] is True
-            assert (
-                mock_client.return_value.__enter__.return_value.request.call_count == 1
-            )
+            assert mock_client.return_value.request.call_count == 1
 
     def test_inform_safe_mode_rejects_refresh_when_device_has_backlog(
         self, client, mock_response
@@ -560,16 +553,14 @@ class TestTaskOperations:
         ]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=pending)
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=pending
             )
 
             with pytest.raises(GenieACSTaskRejectedError, match="Inform-safe mode"):
                 client.refresh_object("device1", "Device.WiFi.")
 
-            assert (
-                mock_client.return_value.__enter__.return_value.request.call_count == 1
-            )
+            assert mock_client.return_value.request.call_count == 1
 
     def test_inform_safe_mode_rejects_read_when_device_has_backlog(
         self, client, mock_response
@@ -584,8 +575,8 @@ class TestTaskOperations:
         ]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=pending)
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=pending
             )
 
             with pytest.raises(GenieACSTaskRejectedError, match="Inform-safe mode"):
@@ -594,9 +585,7 @@ class TestTaskOperations:
                     ["Device.DeviceInfo.SerialNumber"],
                 )
 
-            assert (
-                mock_client.return_value.__enter__.return_value.request.call_count == 1
-            )
+            assert mock_client.return_value.request.call_count == 1
 
     def test_inform_safe_mode_allows_explicit_read_override(
         self, client, mock_response
@@ -612,7 +601,7 @@ class TestTaskOperations:
         accepted = {"_id": "read-task"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.side_effect = [
+            mock_client.return_value.request.side_effect = [
                 mock_response(json_data=pending),
                 mock_response(json_data=accepted, text=json.dumps(accepted)),
             ]
@@ -624,9 +613,7 @@ class TestTaskOperations:
             )
 
             assert result["_id"] == "read-task"
-            calls = (
-                mock_client.return_value.__enter__.return_value.request.call_args_list
-            )
+            calls = mock_client.return_value.request.call_args_list
             assert calls[0].args[0] == "GET"
             assert calls[1].args[0] == "POST"
 
@@ -644,7 +631,7 @@ class TestTaskOperations:
         accepted = {"_id": "write-task"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.side_effect = [
+            mock_client.return_value.request.side_effect = [
                 mock_response(json_data=pending),
                 mock_response(json_data=accepted, text=json.dumps(accepted)),
             ]
@@ -655,9 +642,7 @@ class TestTaskOperations:
             )
 
             assert result["_id"] == "write-task"
-            calls = (
-                mock_client.return_value.__enter__.return_value.request.call_args_list
-            )
+            calls = mock_client.return_value.request.call_args_list
             assert calls[0].args[0] == "GET"
             assert calls[1].args[0] == "POST"
 
@@ -666,9 +651,7 @@ class TestTaskOperations:
             with pytest.raises(GenieACSTaskRejectedError, match="Broad root"):
                 client.refresh_object("device1", "Device.")
 
-            assert (
-                mock_client.return_value.__enter__.return_value.request.call_count == 0
-            )
+            assert mock_client.return_value.request.call_count == 0
 
     def test_refresh_object_allows_root_refresh_when_explicit(
         self, client, mock_response
@@ -676,7 +659,7 @@ class TestTaskOperations:
         accepted = {"_id": "root-refresh"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.side_effect = [
+            mock_client.return_value.request.side_effect = [
                 mock_response(json_data=[]),
                 mock_response(json_data=accepted, text=json.dumps(accepted)),
             ]
@@ -688,24 +671,18 @@ class TestTaskOperations:
             )
 
             assert result["_id"] == "root-refresh"
-            calls = (
-                mock_client.return_value.__enter__.return_value.request.call_args_list
-            )
+            calls = mock_client.return_value.request.call_args_list
             assert calls[0].args[0] == "GET"
             assert calls[1].args[0] == "POST"
 
     def test_get_parameter_values(self, client, mock_response):
         """Test get_parameter_values creates correct task."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             client.get_parameter_values("device1", ["Device.DeviceInfo.SerialNumber"])
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             task = call_args.kwargs["json"]
             assert task["name"] == "getParameterValues"
             assert "parameterNames" in task
@@ -713,15 +690,11 @@ class TestTaskOperations:
     def test_set_parameter_values(self, client, mock_response):
         """Test set_parameter_values creates correct task."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             client.set_parameter_values("device1", {"Device.WiFi.SSID": "TestNetwork"})
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             task = call_args.kwargs["json"]
             assert task["name"] == "setParameterValues"
             assert "parameterValues" in task
@@ -731,9 +704,7 @@ class TestTaskOperations:
     ):
         """Boolean Enable paths must be sent as xsd:boolean for strict ONTs."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             client.set_parameter_values(
                 "device1",
@@ -746,9 +717,7 @@ class TestTaskOperations:
                 },
             )
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             task = call_args.kwargs["json"]
             assert task["parameterValues"] == [
                 [
@@ -771,15 +740,11 @@ class TestTaskOperations:
     def test_refresh_object(self, client, mock_response):
         """Test refresh_object creates correct task."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             client.refresh_object("device1", "Device.WiFi.")
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             task = call_args.kwargs["json"]
             assert task["name"] == "refreshObject"
             assert task["objectName"] == "Device.WiFi"
@@ -787,30 +752,22 @@ class TestTaskOperations:
     def test_reboot_device(self, client, mock_response):
         """Test reboot_device creates correct task."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             client.reboot_device("device1")
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             task = call_args.kwargs["json"]
             assert task["name"] == "reboot"
 
     def test_factory_reset(self, client, mock_response):
         """Test factory_reset creates correct task."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             client.factory_reset("device1")
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             task = call_args.kwargs["json"]
             assert task["name"] == "factoryReset"
 
@@ -827,8 +784,8 @@ class TestTaskOperations:
             ) as wait_for_task,
             patch.object(client, "list_faults", return_value=[]),
         ):
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data={"_id": "task1", "name": "reboot"})
+            mock_client.return_value.request.return_value = mock_response(
+                json_data={"_id": "task1", "name": "reboot"}
             )
 
             result = client.create_task_and_wait(
@@ -836,7 +793,7 @@ class TestTaskOperations:
             )
 
             assert result["_id"] == "task1"
-            request_call = mock_client.return_value.__enter__.return_value.request
+            request_call = mock_client.return_value.request
             assert request_call.call_args.kwargs["params"] == {
                 "connection_request": "true"
             }
@@ -877,17 +834,13 @@ class TestTaskOperations:
     def test_download(self, client, mock_response):
         """Test download creates correct task."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             client.download(
                 "device1", "1 Firmware Upgrade Image", "http://example.com/fw.bin"
             )
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             task = call_args.kwargs["json"]
             assert task["name"] == "download"
             assert task["fileType"] == "1 Firmware Upgrade Image"
@@ -896,9 +849,7 @@ class TestTaskOperations:
     def test_download_with_filename(self, client, mock_response):
         """Test download with filename creates correct task."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             client.download(
                 "device1",
@@ -907,24 +858,18 @@ class TestTaskOperations:
                 filename="fw.bin",
             )
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             task = call_args.kwargs["json"]
             assert task["filename"] == "fw.bin"
 
     def test_add_object(self, client, mock_response):
         """Test add_object creates correct task."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             client.add_object("device1", "Device.NAT.PortMapping.")
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             task = call_args.kwargs["json"]
             assert task["name"] == "addObject"
             assert task["objectName"] == "Device.NAT.PortMapping"
@@ -934,15 +879,11 @@ class TestTaskOperations:
     ):
         """refreshObject should not queue the broken full-refresh provision first."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             client.refresh_object("device1", "InternetGatewayDevice.DeviceInfo.")
 
-            request_calls = (
-                mock_client.return_value.__enter__.return_value.request.call_args_list
-            )
+            request_calls = mock_client.return_value.request.call_args_list
             post_calls = [call for call in request_calls if call.args[0] == "POST"]
             assert len(post_calls) == 1
             task = post_calls[0].kwargs["json"]
@@ -952,15 +893,11 @@ class TestTaskOperations:
     def test_delete_object(self, client, mock_response):
         """Test delete_object creates correct task."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             client.delete_object("device1", "Device.NAT.PortMapping.1.")
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             task = call_args.kwargs["json"]
             assert task["name"] == "deleteObject"
             assert task["objectName"] == "Device.NAT.PortMapping.1."
@@ -970,8 +907,8 @@ class TestTaskOperations:
         tasks = [{"_id": "task1"}, {"_id": "task2"}]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=tasks)
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=tasks
             )
 
             result = client.get_pending_tasks("device1")
@@ -981,9 +918,7 @@ class TestTaskOperations:
     def test_delete_task(self, client, mock_response):
         """Test delete_task succeeds."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             # Should not raise
             client.delete_task("task123")
@@ -1002,8 +937,8 @@ class TestPresetOperations:
         presets = [{"_id": "preset1"}, {"_id": "preset2"}]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=presets)
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=presets
             )
 
             result = client.list_presets()
@@ -1015,8 +950,8 @@ class TestPresetOperations:
         preset = {"_id": "preset1", "channel": "default"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=preset)
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=preset
             )
 
             result = client.get_preset("preset1")
@@ -1028,8 +963,8 @@ class TestPresetOperations:
         preset = {"_id": "new_preset", "channel": "bootstrap"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=preset, text=json.dumps(preset))
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=preset, text=json.dumps(preset)
             )
 
             result = client.create_preset(preset)
@@ -1041,9 +976,7 @@ class TestPresetOperations:
         preset = {"_id": "new_preset", "channel": "bootstrap"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(text="")
-            )
+            mock_client.return_value.request.return_value = mock_response(text="")
 
             result = client.create_preset(preset)
 
@@ -1052,9 +985,7 @@ class TestPresetOperations:
     def test_delete_preset(self, client, mock_response):
         """Test delete_preset succeeds."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             # Should not raise
             client.delete_preset("preset1")
@@ -1073,8 +1004,8 @@ class TestProvisionOperations:
         provisions = [{"_id": "prov1"}, {"_id": "prov2"}]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=provisions)
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=provisions
             )
 
             result = client.list_provisions()
@@ -1086,8 +1017,8 @@ class TestProvisionOperations:
         provision = {"_id": "prov1", "script": "const now = Date.now();"}
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=provision)
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=provision
             )
 
             result = client.get_provision("prov1")
@@ -1097,9 +1028,7 @@ class TestProvisionOperations:
     def test_create_provision(self, client, mock_response):
         """Test create_provision succeeds."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             # Should not raise
             client.create_provision("prov1", "const now = Date.now();")
@@ -1107,9 +1036,7 @@ class TestProvisionOperations:
     def test_delete_provision(self, client, mock_response):
         """Test delete_provision succeeds."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             # Should not raise
             client.delete_provision("prov1")
@@ -1128,8 +1055,8 @@ class TestFaultOperations:
         faults = [{"_id": "fault1"}, {"_id": "fault2"}]
 
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=faults)
+            mock_client.return_value.request.return_value = mock_response(
+                json_data=faults
             )
 
             result = client.list_faults()
@@ -1139,24 +1066,18 @@ class TestFaultOperations:
     def test_list_faults_with_device_id(self, client, mock_response):
         """Test list_faults with device filter."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response(json_data=[])
-            )
+            mock_client.return_value.request.return_value = mock_response(json_data=[])
 
             client.list_faults(device_id="device1")
 
-            call_args = (
-                mock_client.return_value.__enter__.return_value.request.call_args
-            )
+            call_args = mock_client.return_value.request.call_args
             assert "params" in call_args.kwargs
             assert "query" in call_args.kwargs["params"]
 
     def test_delete_fault(self, client, mock_response):
         """Test delete_fault succeeds."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             # Should not raise
             client.delete_fault("fault1")
@@ -1164,9 +1085,7 @@ class TestFaultOperations:
     def test_retry_fault(self, client, mock_response):
         """Test retry_fault succeeds."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             # Should not raise
             client.retry_fault("fault1")
@@ -1183,9 +1102,7 @@ class TestTagOperations:
     def test_add_tag(self, client, mock_response):
         """Test add_tag succeeds."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             # Should not raise
             client.add_tag("device1", "production")
@@ -1193,9 +1110,7 @@ class TestTagOperations:
     def test_remove_tag(self, client, mock_response):
         """Test remove_tag succeeds."""
         with patch("httpx.Client") as mock_client:
-            mock_client.return_value.__enter__.return_value.request.return_value = (
-                mock_response()
-            )
+            mock_client.return_value.request.return_value = mock_response()
 
             # Should not raise
             client.remove_tag("device1", "production")
@@ -1251,3 +1166,122 @@ class TestHelperMethods:
         device = {"Device": "not_a_dict"}
         value = client.extract_parameter_value(device, "Device.DeviceInfo.SerialNumber")
         assert value is None
+
+
+# =============================================================================
+# Async Client Tests
+# =============================================================================
+
+
+class TestAsyncGenieACSClient:
+    """Tests for the asyncio NBI client."""
+
+    @staticmethod
+    def _transport(handler):
+        transport = httpx.MockTransport(handler)
+        async_client = httpx.AsyncClient
+        return lambda *args, **kwargs: async_client(transport=transport)
+
+    def test_create_task_reuses_pending_task(self):
+        """The async client applies the sync client's dedupe policy."""
+        pending = [{"_id": "task1", "name": "reboot"}]
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(f"{request.method} {request.url.path}")
+            return httpx.Response(200, json=pending)
+
+        async def scenario():
+            async with AsyncGenieACSClient("http://genieacs:7557") as client:
+                return await client.reboot_device("device1")
+
+        with patch.object(httpx, "AsyncClient", self._transport(handler)):
+            result = asyncio.run(scenario())
+
+        assert result["alreadyPending"] is True
+        assert calls == ["GET /tasks"]
+
+    def test_create_task_rejects_broad_refresh(self):
+        """Broad root refreshes are rejected before any request."""
+
+        async def scenario():
+            client = AsyncGenieACSClient("http://genieacs:7557")
+            await client.refresh_object("device1", "Device.")
+
+        with pytest.raises(GenieACSTaskRejectedError):
+            asyncio.run(scenario())
+
+    def test_fan_out_is_bounded_and_keeps_failures_in_place(self):
+        """At most max_concurrency requests run; errors stay per item."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if "missing" in request.url.params["query"]:
+                return httpx.Response(404, text="Not found")
+            return httpx.Response(200, json=[{"_id": "d"}])
+
+        async def scenario():
+            devices = ["a", "b", "missing", "c", "d"]
+            async with AsyncGenieACSClient(
+                "http://genieacs:7557", max_concurrency=2
+            ) as client:
+                return await client.fan_out(
+                    devices, lambda device_id: client.list_devices({"_id": device_id})
+                )
+
+        with patch.object(httpx, "AsyncClient", self._transport(handler)):
+            results = asyncio.run(scenario())
+
+        assert peak == 2
+        assert isinstance(results[2], GenieACSError)
+        assert results[0] == [{"_id": "d"}]
+        assert len(results) == 5
+
+    def test_list_devices_sends_sort_and_limit(self):
+        """The async client pages devices the same way as the sync client."""
+        seen: list[httpx.QueryParams] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.params)
+            return httpx.Response(200, json=[])
+
+        async def scenario():
+            async with AsyncGenieACSClient("http://genieacs:7557") as client:
+                await client.list_devices(
+                    {"_lastInform": {"$gte": "2026-10-01"}},
+                    sort={"_lastInform": 1},
+                    limit=500,
+                )
+
+        with patch.object(httpx, "AsyncClient", self._transport(handler)):
+            asyncio.run(scenario())
+
+        assert json.loads(seen[0]["sort"]) == {"_lastInform": 1}
+        assert seen[0]["limit"] == "500"
+
+    def test_client_owns_and_closes_its_transport(self):
+        """One transport serves every request and closes with the client."""
+        opened: list[httpx.AsyncClient] = []
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+        async_client = httpx.AsyncClient
+
+        def _open(*args, **kwargs):
+            opened.append(async_client(transport=transport))
+            return opened[-1]
+
+        async def scenario():
+            async with AsyncGenieACSClient("http://genieacs:7557") as client:
+                await client.list_devices()
+                await client.get_pending_tasks("device1")
+
+        with patch.object(httpx, "AsyncClient", _open):
+            asyncio.run(scenario())
+
+        assert len(opened) == 1
+        assert opened[0].is_closed
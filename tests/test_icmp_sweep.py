@@ -0,0 +1,109 @@
+"""Tests for the batched ICMP sweeper."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import struct
+
+import pytest
+
+from app.services import icmp_sweep
+from app.services.icmp_sweep import IcmpSweeper, PingStats
+from app.services.network.reconcile.readers import reachability
+
+
+def test_echo_request_has_valid_checksum_and_sequence() -> None:
+    packet = icmp_sweep._echo_request(socket.AF_INET, 513)
+
+    assert packet[0] == 8
+    assert struct.unpack("!H", packet[6:8])[0] == 513
+    assert icmp_sweep._checksum(packet) == 0
+
+    v6 = icmp_sweep._echo_request(socket.AF_INET6, 7)
+    assert v6[0] == 128
+    assert struct.unpack("!H", v6[6:8])[0] == 7
+
+
+def test_ping_stats_summary() -> None:
+    stats = PingStats(host="192.0.2.1", sent=4, received=3, rtts_ms=[1.0, 2.0, 6.0])
+
+    assert stats.reachable is True
+    assert stats.loss == pytest.approx(0.25)
+    assert stats.avg_rtt_ms == pytest.approx(3.0)
+    assert (stats.min_rtt_ms, stats.max_rtt_ms) == (1.0, 6.0)
+
+    silent = PingStats(host="192.0.2.2")
+    assert silent.reachable is False
+    assert silent.loss == 1.0
+    assert silent.avg_rtt_ms is None
+
+
+class _FakeSocket:
+    """Answers every echo request from the addresses in ``alive``."""
+
+    def __init__(self, alive: set[str]) -> None:
+        self.alive = alive
+        self.sent: list[tuple[str, int]] = []
+        self.inbox: list[tuple[bytes, tuple[str, int]]] = []
+
+    def sendto(self, packet: bytes, address: tuple[str, int]) -> None:
+        sequence = struct.unpack("!H", packet[6:8])[0]
+        self.sent.append((address[0], sequence))
+        if address[0] in self.alive:
+            reply = struct.pack("!BBHHH", 0, 0, 0, 0, sequence) + packet[8:]
+            self.inbox.append((reply, (address[0], 0)))
+
+    def recvfrom(self, _size: int) -> tuple[bytes, tuple[str, int]]:
+        if not self.inbox:
+            raise BlockingIOError
+        return self.inbox.pop(0)
+
+
+def test_sweep_matches_replies_per_host(monkeypatch) -> None:
+    fake = _FakeSocket(alive={"192.0.2.10", "192.0.2.11"})
+
+    def _socket_for(self, family, loop):
+        # Deliver replies on the next loop iteration, like a readable socket.
+        loop.call_soon(self._drain, fake, family)
+        return fake
+
+    monkeypatch.setattr(IcmpSweeper, "_socket_for", _socket_for)
+
+    async def _run():
+        sweeper = IcmpSweeper(max_pps=10_000)
+        return await sweeper.sweep(
+            ["192.0.2.10", "192.0.2.11", "192.0.2.12", "192.0.2.10"],
+            count=2,
+            timeout_seconds=0.05,
+        )
+
+    results = asyncio.run(_run())
+
+    assert set(results) == {"192.0.2.10", "192.0.2.11", "192.0.2.12"}
+    assert results["192.0.2.10"].sent == 2
+    assert results["192.0.2.10"].received == 2
+    assert results["192.0.2.11"].reachable is True
+    assert results["192.0.2.12"].reachable is False
+    assert results["192.0.2.12"].loss == 1.0
+    assert len({sequence for _host, sequence in fake.sent}) == 6
+
+
+def test_reachability_falls_back_to_ping_binary_without_icmp_sockets(
+    monkeypatch,
+) -> None:
+    calls = []
+
+    def _refused(*_args, **_kwargs):
+        raise icmp_sweep.IcmpUnavailableError("Permission denied")
+
+    monkeypatch.setattr(icmp_sweep, "sweep_enabled", lambda: True)
+    monkeypatch.setattr(icmp_sweep, "sweep_hosts", _refused)
+    monkeypatch.setattr(
+        reachability,
+        "_ping_subprocess",
+        lambda ip, count, timeout_sec: calls.append(ip) or True,
+    )
+
+    assert reachability.is_pingable("192.0.2.20") is True
+    assert calls == ["192.0.2.20"]
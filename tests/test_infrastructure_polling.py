@@ -95,8 +95,9 @@ def test_refresh_stale_cap_takes_longest_unchecked(db_session, monkeypatch):
     monkeypatch.setattr(
         runtime,
         "_refresh_device_health_worker",
-        lambda device_id, do_ping, do_snmp: probed.append(device_id),
+        lambda device_id, do_ping, do_snmp, ping_result=None: probed.append(device_id),
     )
+    monkeypatch.setattr(runtime, "_sweep_ping_targets", lambda ping_hosts: {})
     now = datetime.now(UTC)
     never = _device("cap-never", "10.80.7.1")
     oldest = _device("cap-oldest", "10.80.7.2", last_ping_at=now - timedelta(hours=3))
@@ -123,8 +124,9 @@ def test_unstampable_devices_never_count_as_stale(db_session, monkeypatch):
     monkeypatch.setattr(
         runtime,
         "_refresh_device_health_worker",
-        lambda device_id, do_ping, do_snmp: probed.append(device_id),
+        lambda device_id, do_ping, do_snmp, ping_result=None: probed.append(device_id),
     )
+    monkeypatch.setattr(runtime, "_sweep_ping_targets", lambda ping_hosts: {})
     hostname_only = _device(
         "stale-hostname-only", None, hostname="ho-1", snmp_enabled=False
     )
@@ -144,6 +146,68 @@ def test_unstampable_devices_never_count_as_stale(db_session, monkeypatch):
     assert probed == [str(real.id)]
 
 
+def test_refresh_hands_batched_sweep_results_to_workers(db_session, monkeypatch):
+    swept = {}
+    probed = {}
+
+    def _fake_sweep(ping_hosts):
+        swept.update(ping_hosts)
+        return dict.fromkeys(ping_hosts, (True, 1.5))
+
+    monkeypatch.setattr(runtime, "_sweep_ping_targets", _fake_sweep)
+    monkeypatch.setattr(
+        runtime,
+        "_refresh_device_health_worker",
+        lambda device_id, do_ping, do_snmp, ping_result=None: probed.update(
+            {device_id: ping_result}
+        ),
+    )
+    up = _device("sweep-up", "10.80.11.1")
+    no_ip = _device("sweep-no-ip", None, hostname="sweep-ho")
+    db_session.add_all([up, no_ip])
+    db_session.commit()
+
+    runtime.refresh_devices_health(db_session, [up, no_ip])
+
+    assert swept == {str(up.id): "10.80.11.1"}
+    assert probed == {str(up.id): (True, 1.5), str(no_ip.id): None}
+
+
+def test_sweep_waits_as_long_as_the_single_device_ping(monkeypatch):
+    from app.services import icmp_sweep
+
+    timeouts = []
+
+    def _sweep(hosts, *, timeout_seconds):
+        timeouts.append(timeout_seconds)
+        return {
+            host: icmp_sweep.PingStats(host=host, sent=1, received=0) for host in hosts
+        }
+
+    monkeypatch.setattr(icmp_sweep, "sweep_enabled", lambda: True)
+    monkeypatch.setattr(icmp_sweep, "sweep_hosts", _sweep)
+
+    results = runtime._sweep_ping_targets({"device-1": "10.80.11.3"})
+
+    assert timeouts == [4]
+    assert results == {"device-1": (False, None)}
+
+
+def test_ping_device_persists_swept_result_without_pinging(db_session, monkeypatch):
+    device = _device("core-swept", "10.80.11.2")
+    db_session.add(device)
+    db_session.commit()
+
+    def _no_ping(host, timeout_seconds=4):
+        raise AssertionError("run_ping must not be called for a swept result")
+
+    monkeypatch.setattr(runtime.ping_service, "run_ping", _no_ping)
+    runtime.ping_device(db_session, str(device.id), ping_result=(True, 4.2))
+
+    assert device.last_ping_ok is True
+    assert device.status == DeviceStatus.online
+
+
 def test_push_ping_metrics_emits_latency_and_loss(db_session, monkeypatch):
     from datetime import UTC, datetime, timedelta
     from uuid import uuid4
@@ -315,6 +379,7 @@ def test_fetch_interface_octets_parses_snmpget_output(monkeypatch):
         snmp_version="2c",
         snmp_community="enc",
     )
+    monkeypatch.setattr(snmp_probe, "native_engine_enabled", lambda: False)
     monkeypatch.setattr(snmp_probe, "decrypt_credential", lambda value: "public")
     monkeypatch.setattr(snmp_probe.shutil, "which", lambda name: "/usr/bin/snmpget")
 
@@ -349,6 +414,7 @@ def test_fetch_interface_octets_unqueryable_device_returns_none(monkeypatch):
 
     from app.services import snmp_probe
 
+    monkeypatch.setattr(snmp_probe, "native_engine_enabled", lambda: False)
     monkeypatch.setattr(snmp_probe.shutil, "which", lambda name: "/usr/bin/snmpget")
     no_community = SimpleNamespace(
         mgmt_ip="10.80.4.2",
@@ -452,6 +518,53 @@ def test_push_interface_counters_surfaces_write_failure(db_session, monkeypatch)
     assert result["interface_write_failed"] == 2
 
 
+def test_push_interface_counters_streams_chunks_per_device(db_session, monkeypatch):
+    from app.models.network_monitoring import DeviceInterface
+    from app.services.snmp_probe import InterfaceOctets
+
+    devices = [
+        _device(f"counter-stream-{n}", f"10.80.6.{n}", snmp_enabled=True)
+        for n in (1, 2, 3)
+    ]
+    db_session.add_all(devices)
+    db_session.flush()
+    db_session.add_all(
+        DeviceInterface(device_id=d.id, name="sfp1", snmp_index=5, monitored=True)
+        for d in devices
+    )
+    db_session.commit()
+
+    seen = []
+
+    def _fetch(dev, indexes, **kw):
+        seen.append(kw)
+        if dev.mgmt_ip == "10.80.6.3":
+            return None  # deadline exceeded / unreachable
+        return {5: InterfaceOctets(100, 200)}
+
+    monkeypatch.setattr("app.services.snmp_probe.fetch_interface_octets", _fetch)
+    writes = []
+
+    class _Writer:
+        def write_prometheus_lines(self, lines, **kwargs):
+            writes.append(list(lines))
+            return SimpleNamespace(success=True, written=len(lines))
+
+    monkeypatch.setattr(infrastructure_polling, "_writer", lambda: _Writer())
+
+    result = infrastructure_polling.push_interface_counters(
+        db_session, concurrency=3, deadline_seconds=4, chunk_lines=2
+    )
+
+    assert result == {
+        "interface_devices": 2,
+        "interface_lines": 4,
+        "interface_write_failed": 0,
+    }
+    assert [len(chunk) for chunk in writes] == [2, 2]
+    assert all(kw["deadline_seconds"] == 4 for kw in seen)
+
+
 def test_poll_results_feed_live_status_warmer(db_session, monkeypatch):
     # End-to-end seam check: a native ping failure surfaces as live_status
     # "down" (what outage auto-detect reads), and recovery flips it back "up".
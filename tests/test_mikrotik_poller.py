@@ -6,10 +6,13 @@ from uuid import uuid4
 import app.poller.mikrotik_poller as mikrotik_poller
 from app.poller.mikrotik_poller import (
     BandwidthPoller,
+    BandwidthSample,
     MikroTikConnection,
     QueueStats,
     _sanitize_exc,
+    _stream_entries,
 )
+from app.services.bandwidth_frames import decode_entry
 
 
 def _run_async(coro):
@@ -66,6 +69,37 @@ def test_mikrotik_queue_rates_are_stored_as_bits_per_second():
     assert published[0].tx_bps == 6_000_000
 
 
+def test_compact_stream_format_packs_one_frame_per_device():
+    sample_at = datetime(2026, 10, 16, 12, 0, 5, tzinfo=UTC)
+    devices = [str(uuid4()), str(uuid4())]
+    samples = [
+        BandwidthSample(
+            subscription_id=str(uuid4()),
+            nas_device_id=devices[i % 2],
+            queue_name=f"q{i}",
+            rx_bps=1000 * i,
+            tx_bps=2000 * i,
+            sample_at=sample_at,
+        )
+        for i in range(5)
+    ]
+
+    entries = _stream_entries(samples, "compact")
+
+    assert len(entries) == 2
+    decoded = [
+        sample
+        for entry in entries
+        for sample in decode_entry({k.encode(): v for k, v in entry.items()})
+    ]
+    assert sorted((str(d.subscription_id), d.rx_bps, d.tx_bps) for d in decoded) == (
+        sorted((s.subscription_id, s.rx_bps, s.tx_bps) for s in samples)
+    )
+    assert {str(d.nas_device_id) for d in decoded} == set(devices)
+    assert {d.sample_at for d in decoded} == {sample_at}
+    assert len(_stream_entries(samples, "entries")) == 5
+
+
 def test_mikrotik_connection_does_not_pass_unsupported_socket_timeout(monkeypatch):
     captured_kwargs = {}
 
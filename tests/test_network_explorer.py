@@ -192,11 +192,18 @@ def test_device_subject_restates_forwarding_adjacency(db_session, monkeypatch):
         declaration_ids=(),
     )
     monkeypatch.setattr(affected, "forwarding_graph_projection", lambda _db: graph)
+    monkeypatch.setattr(
+        affected,
+        "downstream_subscription_count",
+        lambda _db, node_id: 7 if node_id == access.id else None,
+    )
 
     view = explorer.build_explorer_view(db_session, f"device:{access.id}")
 
     labels = {node.label for node in view.nodes if node.kind == "network_device"}
     assert labels == {"Core-1", "Access-1", "Leaf-1"}
+    cohorts = [node.label for node in view.nodes if node.kind == "cohort"]
+    assert cohorts == ["7 subscriptions at or below this device"]
     assert all(edge.kind in ("forwarding", "access") for edge in view.edges)
     # Device nodes carry the owner's binary verdict vocabulary.
     subject_node = next(n for n in view.nodes if n.label == "Access-1")
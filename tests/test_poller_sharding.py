@@ -0,0 +1,133 @@
+"""Tests for bandwidth poller shard ownership and shard health aggregation."""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+from app.poller.sharding import ShardCoordinator, owner_of
+from app.services.poller_health import (
+    POLLER_SHARD_HEALTH_KEY,
+    aggregate_health_snapshots,
+)
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self.redis = redis
+        self.ops: list = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+    def zadd(self, _key, mapping):
+        self.ops.append(lambda: self.redis.members.update(mapping))
+
+    def zrangebyscore(self, _key, _min, max_score):
+        self.ops.append(
+            lambda: [
+                m.encode() for m, s in self.redis.members.items() if s <= max_score
+            ]
+        )
+
+    def zremrangebyscore(self, _key, _min, max_score):
+        def _remove():
+            for member in [m for m, s in self.redis.members.items() if s <= max_score]:
+                del self.redis.members[member]
+
+        self.ops.append(_remove)
+
+    def zrange(self, _key, _start, _end):
+        self.ops.append(lambda: [m.encode() for m in self.redis.members])
+
+    async def execute(self):
+        return [op() for op in self.ops]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.members: dict[str, float] = {}
+        self.health: dict[str, str] = {}
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def hdel(self, key, *fields):
+        assert key == POLLER_SHARD_HEALTH_KEY
+        for field in fields:
+            self.health.pop(field.decode() if isinstance(field, bytes) else field, None)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rendezvous_ownership_only_moves_departed_members_devices() -> None:
+    devices = [uuid4() for _ in range(600)]
+    members = ["a", "b", "c"]
+    before = {d: owner_of(d, members) for d in devices}
+
+    after = {d: owner_of(d, ["a", "c"]) for d in devices}
+
+    assert {before[d] for d in devices} == {"a", "b", "c"}
+    moved = [d for d in devices if before[d] != after[d]]
+    assert moved and all(before[d] == "b" for d in moved)
+    assert owner_of(devices[0], []) is None
+
+
+def test_lapsed_member_is_expired_and_its_devices_taken_over() -> None:
+    redis, clock = _FakeRedis(), _Clock()
+    a = ShardCoordinator("a", lease_seconds=30, clock=clock)
+    b = ShardCoordinator("b", lease_seconds=30, clock=clock)
+    redis.health = {"a": "{}", "b": "{}"}
+
+    assert asyncio.run(a.heartbeat(redis)) is False
+    assert asyncio.run(b.heartbeat(redis)) is True
+    assert asyncio.run(a.heartbeat(redis)) is True
+    device = next(d for d in (uuid4() for _ in range(100)) if b.owns(d))
+    assert not a.owns(device)
+
+    clock.now += 31  # b stops heartbeating
+    assert asyncio.run(a.heartbeat(redis)) is True
+
+    assert a.members == ("a",)
+    assert a.owns(device)
+    assert redis.health == {"a": "{}"}
+
+
+def test_shard_health_snapshots_are_aggregated() -> None:
+    failure = {"name": "nas-2", "consecutive_failures": 4}
+    snapshot = aggregate_health_snapshots(
+        [
+            {
+                "devices_total": 10,
+                "devices_ok": 9,
+                "devices_failing": 1,
+                "device_failures": [{"name": "nas-1", "consecutive_failures": 1}],
+                "cycle_seconds": 1.5,
+                "ts": "2026-10-16T12:00:05+00:00",
+            },
+            {
+                "devices_total": 12,
+                "devices_ok": 11,
+                "devices_failing": 1,
+                "device_failures": [failure],
+                "cycle_seconds": 3.0,
+                "ts": "2026-10-16T12:00:01+00:00",
+            },
+        ]
+    )
+
+    assert (snapshot["devices_total"], snapshot["devices_ok"]) == (22, 20)
+    assert snapshot["devices_failing"] == 2
+    assert snapshot["device_failures"][0] == failure
+    assert snapshot["cycle_seconds"] == 3.0
+    assert snapshot["ts"] == "2026-10-16T12:00:01+00:00"
+    assert snapshot["shards"] == 2
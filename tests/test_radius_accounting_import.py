@@ -16,7 +16,11 @@ from datetime import UTC, datetime, timedelta
 from sqlalchemy import create_engine, text
 
 from app.models.catalog import AccessCredential, SubscriptionStatus
-from app.models.usage import AccountingStatus, RadiusAccountingSession
+from app.models.usage import (
+    AccountingStatus,
+    RadiusAccountingSession,
+    UsageOctetDelta,
+)
 from app.services import usage as usage_service
 
 _RADACCT_DDL = """
@@ -174,6 +178,48 @@ def test_import_persists_last_update_at(
     assert local.status_type == AccountingStatus.interim
 
 
+def test_import_writes_in_batches_and_collapses_repeated_sessions(
+    db_session, subscription, tmp_path, monkeypatch
+):
+    engine = _make_radacct(tmp_path, monkeypatch)
+    first = _credential(db_session, subscription, username="40001001")
+    second = _credential(db_session, subscription, username="40001002")
+    monkeypatch.setattr(
+        usage_service,
+        "_radius_import_int_setting",
+        lambda _db, key, default: 2 if key.endswith("batch_size") else default,
+    )
+    start = datetime.now(UTC) - timedelta(minutes=30)
+    for radacctid, username, session_id, octets in (
+        (1, first.username, "sess-a", 100),
+        (2, second.username, "sess-b", 200),
+        (3, "unknown-user", "sess-x", 300),
+        (4, first.username, "sess-a", 400),
+        (5, first.username, "sess-a", 500),
+    ):
+        _insert_radacct_row(
+            engine,
+            radacctid=radacctid,
+            acctsessionid=session_id,
+            username=username,
+            acctstarttime=start.isoformat(),
+            acctupdatetime=(start + timedelta(minutes=radacctid)).isoformat(),
+            acctinputoctets=octets,
+            acctoutputoctets=octets,
+        )
+
+    result = usage_service.import_radius_accounting(db_session)
+
+    assert result["processed"] == 5
+    assert result["created_or_updated"] == 3
+    assert result["cursor"] == 5
+    assert result["rows_per_second"] > 0
+    assert _local_session(db_session, first).input_octets == 500
+    assert _local_session(db_session, second).input_octets == 200
+    db_session.refresh(first)
+    assert first.last_auth_at is not None
+
+
 def test_refresh_window_round_robins_instead_of_starving(
     db_session, subscription, tmp_path, monkeypatch
 ):
@@ -316,6 +362,42 @@ def test_import_persists_framed_ips_as_observations(
     assert subscription.last_seen_framed_ipv6 == "2a02:db8:100::/56"
 
 
+def test_import_journals_octet_deltas_for_quota_metering(
+    db_session, subscription, tmp_path, monkeypatch
+):
+    engine = _make_radacct(tmp_path, monkeypatch)
+    credential = _credential(db_session, subscription)
+    _activate(db_session, subscription)
+    start = datetime.now(UTC) - timedelta(minutes=30)
+    _insert_radacct_row(
+        engine,
+        radacctid=1,
+        acctsessionid="sess-1",
+        username=credential.username,
+        acctstarttime=start.isoformat(),
+        acctupdatetime=(start + timedelta(minutes=5)).isoformat(),
+        acctinputoctets=1000,
+        acctoutputoctets=2000,
+    )
+    usage_service.import_radius_accounting(db_session)
+    _update_radacct_row(
+        engine,
+        1,
+        acctupdatetime=(start + timedelta(minutes=10)).isoformat(),
+        acctinputoctets=1500,
+        acctoutputoctets=2600,
+    )
+    usage_service.import_radius_accounting(db_session)  # refresh pass
+
+    deltas = sorted(
+        delta.octets
+        for delta in db_session.query(UsageOctetDelta)
+        .filter(UsageOctetDelta.subscription_id == subscription.id)
+        .all()
+    )
+    assert deltas == [1100, 3000]
+
+
 def test_import_survives_radacct_without_framed_ip_columns(
     db_session, subscription, tmp_path, monkeypatch
 ):
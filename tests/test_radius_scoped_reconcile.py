@@ -334,3 +334,99 @@ def test_partial_target_failure_is_reported_and_raises(
 
     assert [outcome["ok"] for outcome in error.value.outcomes] == [True, False]
     assert error.value.outcomes[1]["error_type"] == "OperationalError"
+
+
+def _sqlite_target(path, name: str) -> dict:
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE radcheck (username TEXT, attribute TEXT, op TEXT, value TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE radreply (username TEXT, attribute TEXT, op TEXT, value TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE radusergroup (username TEXT, groupname TEXT, priority INTEGER)"
+        )
+    return {
+        "target_name": name,
+        "target_fingerprint": name,
+        "db_url": f"sqlite:///{path}",
+        "radcheck_table": "radcheck",
+        "radreply_table": "radreply",
+        "radusergroup_table": "radusergroup",
+        "nas_table": "nas",
+        "password_attribute": "Cleartext-Password",
+        "password_op": ":=",
+        "default_reply_op": ":=",
+        "use_group": False,
+        "group_priority": 0,
+    }
+
+
+def test_incremental_projection_rewrites_only_changed_logins(
+    monkeypatch, db_session, tmp_path
+):
+    from app.models.radius import RadiusProjectionChange
+
+    monkeypatch.setenv("CREDENTIAL_ENCRYPTION_KEY", Fernet.generate_key().decode())
+    a1, _a2, b1 = _seed(db_session)
+    target = _sqlite_target(tmp_path / "radius.db", "incremental")
+    monkeypatch.setattr(
+        radius_population,
+        "active_external_radius_targets",
+        lambda _db, capability=None: [target],
+    )
+    monkeypatch.setattr(
+        radius_population, "assert_legacy_target_alignment", lambda _db: []
+    )
+    monkeypatch.setattr(
+        radius_population,
+        "simultaneous_use_enforcement_enabled",
+        lambda _db: True,
+    )
+
+    first = radius_population.populate_changed(dry_run=False, source_db=db_session)
+
+    assert first["journal_entries"] >= 3
+    assert first["target_outcomes"][0]["logins_written"] == 3
+    assert db_session.query(RadiusProjectionChange).count() == 0
+
+    credential = db_session.query(AccessCredential).filter_by(username=a1).one()
+    credential.secret_hash = encrypt_credential_with_key(
+        "rotated", get_encryption_key()
+    )
+    db_session.add(RadiusProjectionChange(username=b1, source="test"))
+    db_session.commit()
+
+    second = radius_population.populate_changed(dry_run=False, source_db=db_session)
+
+    outcome = second["target_outcomes"][0]
+    assert (outcome["logins_written"], outcome["unchanged_skipped"]) == (1, 1)
+    with sqlite3.connect(tmp_path / "radius.db") as conn:
+        assert conn.execute(
+            "SELECT value FROM radcheck "
+            "WHERE username = ? AND attribute = 'Cleartext-Password'",
+            (a1,),
+        ).fetchall() == [("rotated",)]
+        assert conn.execute(
+            "SELECT COUNT(*) FROM radcheck WHERE username = ?", (b1,)
+        ).fetchone() == (2,)
+
+
+def test_login_rename_journals_old_and_new_login(monkeypatch, db_session):
+    from app.services.radius_projection_journal import touched_logins
+
+    monkeypatch.setenv("CREDENTIAL_ENCRYPTION_KEY", Fernet.generate_key().decode())
+    offer = _offer(db_session)
+    account = _account(db_session)
+    login = _service(db_session, account, offer, get_encryption_key())
+    subscription = db_session.query(Subscription).filter_by(login=login).one()
+
+    subscription.login = "renamed-" + login
+    subscription.cancel_reason = "not a projection input"
+
+    assert touched_logins(db_session) == {
+        login: "subscription",
+        "renamed-" + login: "subscription",
+    }
+    db_session.rollback()
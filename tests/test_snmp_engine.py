@@ -0,0 +1,198 @@
+"""Tests for the in-process SNMP engine."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.network import snmp_engine
+from app.services.network.snmp_engine import SnmpTarget, SnmpVarBind
+
+_IF_DESCR = "1.3.6.1.2.1.2.2.1.2"
+_TABLE = {
+    **{f"{_IF_DESCR}.{idx}": (0x04, f"eth{idx}".encode()) for idx in range(1, 31)},
+    "1.3.6.1.2.1.1.1.0": (0x04, b"Fake agent"),
+    "1.3.6.1.2.1.31.1.1.1.6.5": (0x46, (2**40).to_bytes(6, "big")),
+}
+_ORDERED = sorted(_TABLE, key=snmp_engine._oid_arcs)
+
+
+class _FakeAgent(asyncio.DatagramProtocol):
+    """Tiny v2c agent answering GET / GETNEXT / GETBULK from ``_TABLE``."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self.requests += 1
+        read = snmp_engine._read_tlv
+        _, message, _ = read(data, 0)
+        _, version, offset = read(message, 0)
+        _, community, offset = read(message, offset)
+        pdu_tag, pdu, _ = read(message, offset)
+        fields = []
+        offset = 0
+        for _ in range(3):
+            _, raw, offset = read(pdu, offset)
+            fields.append(int.from_bytes(raw, "big"))
+        _, varbind_list, _ = read(pdu, offset)
+        oids = []
+        offset = 0
+        while offset < len(varbind_list):
+            _, varbind, offset = read(varbind_list, offset)
+            _, raw_oid, _ = read(varbind, 0)
+            oids.append(snmp_engine._decode_oid(raw_oid))
+        oid = oids[0]
+
+        answers = []
+        if pdu_tag == snmp_engine._PDU_GET:
+            answers.extend((key, _TABLE.get(key, (0x81, b""))) for key in oids)
+        else:
+            repetitions = fields[2] if pdu_tag == snmp_engine._PDU_GETBULK else 1
+            current = snmp_engine._oid_arcs(oid)
+            for _ in range(repetitions):
+                following = [
+                    key for key in _ORDERED if snmp_engine._oid_arcs(key) > current
+                ]
+                if not following:
+                    answers.append((oid, (0x82, b"")))
+                    break
+                answers.append((following[0], _TABLE[following[0]]))
+                current = snmp_engine._oid_arcs(following[0])
+
+        tlv = snmp_engine._tlv
+        varbinds = b"".join(
+            tlv(0x30, snmp_engine._encode_oid(answer_oid) + tlv(tag, raw))
+            for answer_oid, (tag, raw) in answers
+        )
+        body = (
+            snmp_engine._encode_integer(fields[0])
+            + snmp_engine._encode_integer(0)
+            + snmp_engine._encode_integer(0)
+            + tlv(0x30, varbinds)
+        )
+        response = tlv(
+            0x30,
+            snmp_engine._encode_integer(version[0])
+            + tlv(0x04, community)
+            + tlv(snmp_engine._PDU_RESPONSE, body),
+        )
+        self.transport.sendto(response, addr)
+
+
+async def _with_agent(operation):
+    loop = asyncio.get_running_loop()
+    transport, agent = await loop.create_datagram_endpoint(
+        _FakeAgent, local_addr=("127.0.0.1", 0)
+    )
+    port = transport.get_extra_info("sockname")[1]
+    engine = snmp_engine.SnmpEngine()
+    target = SnmpTarget(host="127.0.0.1", port=port, community="public")
+    try:
+        return await operation(engine, target), agent
+    finally:
+        engine.close()
+        transport.close()
+
+
+def test_ber_round_trip_for_integers_and_oids() -> None:
+    for value in (0, 1, 127, 128, 255, 256, -1, -128, -129, 2**31 - 1):
+        _, raw, _ = snmp_engine._read_tlv(snmp_engine._encode_integer(value), 0)
+        assert int.from_bytes(raw, "big", signed=True) == value
+
+    oid = "1.3.6.1.4.1.2011.6.128.1.1.2.51.1.4.4194320384.3"
+    _, raw, _ = snmp_engine._read_tlv(snmp_engine._encode_oid("." + oid), 0)
+    assert snmp_engine._decode_oid(raw) == oid
+
+
+def test_bulk_walk_returns_typed_varbinds_in_few_round_trips() -> None:
+    varbinds, agent = asyncio.run(
+        _with_agent(
+            lambda engine, target: engine.walk(target, _IF_DESCR, max_repetitions=25)
+        )
+    )
+
+    assert [vb.text for vb in varbinds] == [f"eth{idx}" for idx in range(1, 31)]
+    assert all(vb.type == "STRING" for vb in varbinds)
+    assert agent.requests == 2
+
+
+def test_getnext_walk_and_scalar_fallback() -> None:
+    async def _operation(engine, target):
+        table = await engine.walk(target, _IF_DESCR, bulk=False)
+        scalar = await engine.walk(target, "1.3.6.1.2.1.1.1.0")
+        counters = await engine.get(
+            target, ["1.3.6.1.2.1.31.1.1.1.6.5", "1.3.6.1.2.1.31.1.1.1.6.6"]
+        )
+        return table, scalar, counters
+
+    (table, scalar, counters), _agent = asyncio.run(_with_agent(_operation))
+
+    assert len(table) == 30
+    assert [vb.text for vb in scalar] == ["Fake agent"]
+    assert counters[0] == SnmpVarBind("1.3.6.1.2.1.31.1.1.1.6.5", "Counter64", 2**40)
+    assert counters[1].is_exception
+
+
+def test_get_times_out_without_agent() -> None:
+    async def _operation():
+        engine = snmp_engine.SnmpEngine()
+        try:
+            await engine.get(
+                SnmpTarget(
+                    host="127.0.0.1",
+                    port=9,
+                    community="public",
+                    timeout=0.05,
+                    retries=1,
+                ),
+                ["1.3.6.1.2.1.1.1.0"],
+            )
+        finally:
+            engine.close()
+
+    with pytest.raises(snmp_engine.SnmpError):
+        asyncio.run(_operation())
+
+
+def test_varbind_text_matches_net_snmp_rendering() -> None:
+    assert SnmpVarBind("1.1", "STRING", b"HWTC1234").text == "HWTC1234"
+    assert SnmpVarBind("1.1", "STRING", b"HWTC\x01\xff").text == "48 57 54 43 01 FF"
+    assert SnmpVarBind("1.1", "INTEGER", -1950).text == "-1950"
+
+
+def test_walk_v2c_varbinds_converts_subprocess_output(monkeypatch) -> None:
+    from app.services.network import snmp_walk
+    from app.services.network.olt_polling_parsers import _parse_snmp_table
+
+    monkeypatch.setattr(snmp_walk, "native_engine_enabled", lambda: False)
+    monkeypatch.setattr(
+        snmp_walk,
+        "run_simple_v2c_walk",
+        lambda *args, **kwargs: [
+            "iso.3.6.1.4.1.2011.6.128.1.1.2.51.1.4.4194320384.3 = INTEGER: -1950",
+            "iso.3.6.1.4.1.2011.6.128.1.1.2.51.1.4.4194320384.4 = No Such Instance",
+        ],
+    )
+    linked = SimpleNamespace(
+        mgmt_ip="192.0.2.10",
+        hostname=None,
+        snmp_port=None,
+        snmp_version="v2c",
+        snmp_community="public",
+    )
+
+    varbinds = snmp_walk.walk_v2c_varbinds(linked, ".1.3.6.1.4.1.2011")
+
+    assert varbinds[0] == SnmpVarBind(
+        "1.3.6.1.4.1.2011.6.128.1.1.2.51.1.4.4194320384.3", "INTEGER", "-1950"
+    )
+    assert varbinds[1].is_exception
+    assert _parse_snmp_table(
+        varbinds, base_oid=".1.3.6.1.4.1.2011.6.128.1.1.2.51.1.4"
+    ) == {"4194320384.3": "-1950"}
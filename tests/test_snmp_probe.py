@@ -1,8 +1,18 @@
+import asyncio
 from types import SimpleNamespace
 
+import pytest
+
 from app.services import snmp_probe
 
 
+@pytest.fixture(autouse=True)
+def _subprocess_engine(monkeypatch):
+    # These cases cover the snmpget fallback; the native engine has its own
+    # tests in test_snmp_engine.py.
+    monkeypatch.setattr(snmp_probe, "native_engine_enabled", lambda: False)
+
+
 def _device(**kwargs):
     values = {
         "mgmt_ip": "192.0.2.10",
@@ -62,3 +72,61 @@ def test_probe_snmp_reachability_failed_response(monkeypatch):
     assert result.handled is True
     assert result.success is False
     assert result.error == "Timeout"
+
+
+def test_probe_snmp_reachability_native_engine(monkeypatch):
+    monkeypatch.setattr(snmp_probe, "native_engine_enabled", lambda: True)
+    monkeypatch.setattr(snmp_probe, "decrypt_credential", lambda value: value)
+    seen = {}
+
+    class _Engine:
+        async def get(self, target, oids):
+            seen["target"] = target
+            seen["oids"] = oids
+            return []
+
+    monkeypatch.setattr(
+        snmp_probe, "run_blocking", lambda operation: asyncio.run(operation(_Engine()))
+    )
+
+    result = snmp_probe.probe_snmp_reachability(_device())
+
+    assert result == snmp_probe.SnmpProbeResult(True, True)
+    assert seen["target"].host == "192.0.2.10"
+    assert seen["target"].version == "2c"
+    assert seen["oids"] == ["1.3.6.1.2.1.1.1.0"]
+
+
+def test_probe_snmp_reachability_native_timeout(monkeypatch):
+    monkeypatch.setattr(snmp_probe, "native_engine_enabled", lambda: True)
+    monkeypatch.setattr(snmp_probe, "decrypt_credential", lambda value: value)
+
+    class _Engine:
+        async def get(self, target, oids):
+            raise snmp_probe.SnmpTimeoutError("Timeout")
+
+    monkeypatch.setattr(
+        snmp_probe, "run_blocking", lambda operation: asyncio.run(operation(_Engine()))
+    )
+
+    result = snmp_probe.probe_snmp_reachability(_device())
+
+    assert result == snmp_probe.SnmpProbeResult(True, False, "timeout")
+
+
+def test_fetch_interface_octets_native_deadline(monkeypatch):
+    monkeypatch.setattr(snmp_probe, "native_engine_enabled", lambda: True)
+    monkeypatch.setattr(snmp_probe, "decrypt_credential", lambda value: value)
+
+    class _Engine:
+        async def get(self, target, oids):
+            await asyncio.sleep(1)
+            return []
+
+    monkeypatch.setattr(
+        snmp_probe, "run_blocking", lambda operation: asyncio.run(operation(_Engine()))
+    )
+
+    assert (
+        snmp_probe.fetch_interface_octets(_device(), [5], deadline_seconds=0.05) is None
+    )
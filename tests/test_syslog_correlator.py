@@ -0,0 +1,146 @@
+"""Tests for the syslog ONT down/up burst correlator."""
+
+from __future__ import annotations
+
+from app.syslog.correlator import (
+    BurstCandidate,
+    BurstRecovery,
+    OntEventCorrelator,
+)
+from app.syslog.parsers import OntEvent, OntEventType
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _event(event_type: OntEventType, ont_id: int, *, port: int = 0) -> OntEvent:
+    return OntEvent(
+        event_type=event_type,
+        frame=0,
+        slot=1,
+        port=port,
+        ont_id=ont_id,
+        serial_number=None,
+        raw_message="test message",
+        source_ip="10.0.0.50",
+    )
+
+
+def _correlator(clock: _Clock, **kwargs) -> OntEventCorrelator:
+    kwargs.setdefault("window_seconds", 60)
+    kwargs.setdefault("pon_min_onts", 3)
+    kwargs.setdefault("olt_min_pons", 2)
+    return OntEventCorrelator(clock=clock, **kwargs)
+
+
+def _down(correlator, ont_ids, *, port=0, event_type=OntEventType.los):
+    results = []
+    for ont_id in ont_ids:
+        results.extend(
+            correlator.observe("olt-1", _event(event_type, ont_id, port=port))
+        )
+    return results
+
+
+def test_pon_burst_emits_one_candidate():
+    correlator = _correlator(_Clock())
+
+    results = _down(correlator, [1, 2, 3, 4, 5, 1])
+
+    assert results == [
+        BurstCandidate(
+            olt_id="olt-1",
+            scope="pon",
+            fsps=("0/1/0",),
+            ont_count=3,
+            olt_ont_count=3,
+            cause="los",
+        )
+    ]
+    assert results[0].classification == "syslog_pon_los"
+
+
+def test_events_outside_window_do_not_correlate():
+    clock = _Clock()
+    correlator = _correlator(clock)
+
+    _down(correlator, [1, 2])
+    clock.now += 61
+    assert _down(correlator, [3, 4]) == []
+    assert len(_down(correlator, [5])) == 1
+
+
+def test_flapping_ont_leaves_the_window():
+    correlator = _correlator(_Clock())
+
+    _down(correlator, [1, 2])
+    correlator.observe("olt-1", _event(OntEventType.online, 2))
+
+    assert _down(correlator, [3]) == []
+
+
+def test_bursting_pons_escalate_to_one_olt_candidate():
+    correlator = _correlator(_Clock())
+
+    first = _down(correlator, [1, 2, 3], port=0, event_type=OntEventType.dying_gasp)
+    second = _down(correlator, [1, 2, 3, 4], port=1, event_type=OntEventType.dying_gasp)
+    third = _down(correlator, [1, 2, 3], port=2, event_type=OntEventType.dying_gasp)
+
+    assert [r.scope for r in first] == ["pon"]
+    assert second == [
+        BurstCandidate(
+            olt_id="olt-1",
+            scope="olt",
+            fsps=("0/1/0", "0/1/1"),
+            ont_count=6,
+            olt_ont_count=6,
+            cause="dying_gasp",
+        )
+    ]
+    assert third == []
+
+
+def test_recovery_releases_latch_after_half_return():
+    correlator = _correlator(_Clock())
+    _down(correlator, [1, 2, 3, 4])
+
+    assert correlator.observe("olt-1", _event(OntEventType.online, 1)) == []
+    assert correlator.observe("olt-1", _event(OntEventType.online, 2)) == [
+        BurstRecovery(olt_id="olt-1", scope="pon", fsps=("0/1/0",))
+    ]
+    # Released: a fresh burst on the same PON is reported again.
+    assert len(_down(correlator, [5, 6, 7])) == 1
+
+
+def test_pon_recovery_waits_for_sibling_pons_on_the_olt():
+    correlator = _correlator(_Clock(), olt_min_pons=3)
+
+    first = _down(correlator, [1, 2, 3, 4], port=0)
+    second = _down(correlator, [1, 2, 3], port=1)
+
+    assert [(r.ont_count, r.olt_ont_count) for r in first] == [(3, 3)]
+    assert [(r.ont_count, r.olt_ont_count) for r in second] == [(3, 7)]
+
+    # PON 0 is back, but PON 1 still bursts on the same OLT-rooted incident.
+    for ont_id in (1, 2):
+        assert correlator.observe("olt-1", _event(OntEventType.online, ont_id)) == []
+    assert correlator.observe("olt-1", _event(OntEventType.online, 1, port=1)) == []
+
+    assert correlator.observe("olt-1", _event(OntEventType.online, 2, port=1)) == [
+        BurstRecovery(olt_id="olt-1", scope="pon", fsps=("0/1/0", "0/1/1"))
+    ]
+
+
+def test_latch_expires_after_hold():
+    clock = _Clock()
+    correlator = _correlator(clock, hold_seconds=300)
+    _down(correlator, [1, 2, 3])
+
+    assert _down(correlator, [4, 5, 6]) == []
+    clock.now += 301
+    assert len(_down(correlator, [7, 8, 9])) == 1
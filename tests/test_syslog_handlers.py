@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from app.models.network import OLTDevice
-from app.syslog.handlers import _handle_autofind_event, handle_ont_event
+from app.syslog.correlator import OntEventCorrelator
+from app.syslog.handlers import (
+    _handle_autofind_event,
+    _OltIpMap,
+    handle_ont_event,
+    handle_ont_events,
+)
 from app.syslog.parsers import OntEvent, OntEventType
 
 
@@ -238,3 +244,186 @@ class TestOntEventFspProperty:
         )
 
         assert event.fsp == "10/15/7"
+
+
+def _autofind(serial: str, port: int = 2, source_ip: str = "10.0.0.50") -> OntEvent:
+    return OntEvent(
+        event_type=OntEventType.autofind,
+        frame=0,
+        slot=1,
+        port=port,
+        ont_id=None,
+        serial_number=serial,
+        raw_message="test message",
+        source_ip=source_ip,
+    )
+
+
+def _los(ont_id: int, port: int = 2) -> OntEvent:
+    return _ont_event(OntEventType.los, ont_id, port)
+
+
+def _online(ont_id: int, port: int = 2) -> OntEvent:
+    return _ont_event(OntEventType.online, ont_id, port)
+
+
+def _ont_event(event_type: OntEventType, ont_id: int, port: int) -> OntEvent:
+    return OntEvent(
+        event_type=event_type,
+        frame=0,
+        slot=1,
+        port=port,
+        ont_id=ont_id,
+        serial_number=None,
+        raw_message="test message",
+        source_ip="10.0.0.50",
+    )
+
+
+class TestHandleOntEvents:
+    """Tests for the batched handle_ont_events entry point."""
+
+    def test_duplicate_autofinds_collapse_into_one_upsert(self):
+        events = [
+            _autofind("HWTC12345678"),
+            _autofind("HWTC12345678"),
+            _autofind("HWTC87654321", port=3),
+        ]
+
+        with (
+            patch("app.syslog.handlers._find_olt_by_ip", return_value="olt-1"),
+            patch("app.syslog.handlers.db_session_adapter") as mock_adapter,
+            patch(
+                "app.syslog.handlers.upsert_autofind_from_syslog", return_value=True
+            ) as mock_upsert,
+        ):
+            handle_ont_events(events)
+
+        assert mock_adapter.session.call_count == 1
+        assert [
+            call.kwargs["serial_number"] for call in mock_upsert.call_args_list
+        ] == [
+            "HWTC12345678",
+            "HWTC87654321",
+        ]
+
+    def test_failed_upsert_does_not_abort_batch(self):
+        events = [_autofind("HWTC00000001"), _autofind("HWTC00000002", port=3)]
+
+        with (
+            patch("app.syslog.handlers._find_olt_by_ip", return_value="olt-1"),
+            patch("app.syslog.handlers.db_session_adapter"),
+            patch(
+                "app.syslog.handlers.upsert_autofind_from_syslog",
+                side_effect=[RuntimeError("boom"), True],
+            ) as mock_upsert,
+        ):
+            handle_ont_events(events)
+
+        assert mock_upsert.call_count == 2
+
+    def test_unknown_olt_skips_persistence(self):
+        with (
+            patch("app.syslog.handlers._find_olt_by_ip", return_value=None),
+            patch("app.syslog.handlers.db_session_adapter") as mock_adapter,
+        ):
+            handle_ont_events([_autofind("HWTC12345678", source_ip="192.0.2.9")])
+
+        mock_adapter.session.assert_not_called()
+
+    def test_los_burst_opens_one_outage_candidate(self):
+        correlator = OntEventCorrelator(pon_min_onts=3, olt_min_pons=10)
+
+        with (
+            patch("app.syslog.handlers._correlator", correlator),
+            patch("app.syslog.handlers._find_olt_by_ip", return_value="olt-1"),
+            patch("app.syslog.handlers.db_session_adapter") as mock_adapter,
+            patch(
+                "app.syslog.handlers.network_device_for_matched_entity",
+                return_value=MagicMock(id="node-1"),
+            ),
+            patch(
+                "app.syslog.handlers.open_syslog_burst_incident",
+                return_value=(MagicMock(id="incident-1"), True),
+            ) as mock_open,
+        ):
+            handle_ont_events([_los(ont_id) for ont_id in range(1, 7)])
+
+        assert mock_adapter.session.call_count == 1
+        mock_open.assert_called_once()
+        assert mock_open.call_args.kwargs["affected_count"] == 3
+        assert mock_open.call_args.kwargs["classification"] == "syslog_pon_los"
+
+    def test_pon_recovery_keeps_incident_while_sibling_pon_bursts(self):
+        correlator = OntEventCorrelator(pon_min_onts=3, olt_min_pons=10)
+
+        with (
+            patch("app.syslog.handlers._correlator", correlator),
+            patch("app.syslog.handlers._find_olt_by_ip", return_value="olt-1"),
+            patch("app.syslog.handlers.db_session_adapter"),
+            patch(
+                "app.syslog.handlers.network_device_for_matched_entity",
+                return_value=MagicMock(id="node-1"),
+            ),
+            patch(
+                "app.syslog.handlers.open_syslog_burst_incident",
+                return_value=(MagicMock(id="incident-1"), True),
+            ) as mock_open,
+            patch("app.syslog.handlers.discard_syslog_burst_incident") as mock_discard,
+        ):
+            handle_ont_events(
+                [_los(ont_id, port=1) for ont_id in range(1, 4)]
+                + [_los(ont_id, port=2) for ont_id in range(1, 5)]
+            )
+            handle_ont_events([_online(ont_id, port=1) for ont_id in range(1, 3)])
+
+            assert [
+                call.kwargs["affected_count"] for call in mock_open.call_args_list
+            ] == [3, 6]
+            mock_discard.assert_not_called()
+
+            handle_ont_events([_online(ont_id, port=2) for ont_id in range(1, 3)])
+
+        mock_discard.assert_called_once()
+
+    def test_scattered_down_events_do_not_touch_db(self):
+        correlator = OntEventCorrelator(pon_min_onts=3, olt_min_pons=10)
+
+        with (
+            patch("app.syslog.handlers._correlator", correlator),
+            patch("app.syslog.handlers._find_olt_by_ip", return_value="olt-1"),
+            patch("app.syslog.handlers.db_session_adapter") as mock_adapter,
+        ):
+            handle_ont_events([_los(1, port=1), _los(2, port=2), _los(3, port=3)])
+
+        mock_adapter.session.assert_not_called()
+
+
+class TestOltIpMap:
+    """Tests for the periodically reloaded source-IP -> OLT map."""
+
+    def test_lookup_reuses_loaded_map(self):
+        olt_map = _OltIpMap(miss_refresh_seconds=3600)
+
+        with patch("app.syslog.handlers.db_session_adapter") as mock_adapter:
+            db = mock_adapter.read_session.return_value.__enter__.return_value
+            db.execute.return_value.all.return_value = [("10.0.0.50", "olt-1")]
+
+            assert olt_map.lookup("10.0.0.50") == "olt-1"
+            assert olt_map.lookup("10.0.0.50") == "olt-1"
+            assert olt_map.lookup("10.0.0.99") is None
+
+        assert db.execute.call_count == 1
+
+    def test_miss_triggers_rate_limited_reload(self):
+        olt_map = _OltIpMap(miss_refresh_seconds=0)
+
+        with patch("app.syslog.handlers.db_session_adapter") as mock_adapter:
+            db = mock_adapter.read_session.return_value.__enter__.return_value
+            db.execute.return_value.all.side_effect = [
+                [("10.0.0.50", "olt-1")],
+                [("10.0.0.50", "olt-1"), ("10.0.0.51", "olt-2")],
+            ]
+
+            assert olt_map.lookup("10.0.0.51") is None
+            assert olt_map.lookup("10.0.0.51") == "olt-2"
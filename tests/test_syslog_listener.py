@@ -7,6 +7,7 @@ from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.syslog.listener import SyslogListener, SyslogProtocol
+from app.syslog.pipeline import SyslogPipeline
 
 
 def _run_async(coro):
@@ -22,25 +23,20 @@ class TestSyslogProtocol:
     """Tests for SyslogProtocol class."""
 
     def test_datagram_received_calls_callback(self):
-        """Test that datagram_received creates task with callback."""
-        callback = AsyncMock()
+        """Test that datagram_received hands the datagram over synchronously."""
+        callback = MagicMock()
         protocol = SyslogProtocol(callback)
 
         data = b"<134>Jan 1 00:00:00 host test message"
         addr = ("10.0.0.1", 514)
 
-        async def _drive():
-            protocol.datagram_received(data, addr)
-            # Give the task a chance to run
-            await asyncio.sleep(0.01)
-
-        _run_async(_drive())
+        protocol.datagram_received(data, addr)
 
         callback.assert_called_once_with(data, addr)
 
     def test_connection_made_stores_transport(self):
         """Test that connection_made stores transport."""
-        protocol = SyslogProtocol(AsyncMock())
+        protocol = SyslogProtocol(MagicMock())
         transport = MagicMock()
 
         protocol.connection_made(transport)
@@ -88,7 +84,7 @@ class TestSyslogListener:
         mock_transport.close.assert_called_once()
         assert listener._transport is None
 
-    def test_on_message_received_increments_count(self):
+    def test_process_batch_increments_count(self):
         """Test that message handling increments event count."""
         listener = SyslogListener()
         listener._event_count = 0
@@ -97,12 +93,12 @@ class TestSyslogListener:
             mock_parser.parse_syslog.return_value = MagicMock(message="test")
             mock_parser.parse_ont_event.return_value = None
 
-            _run_async(listener._on_message_received(b"<134>test", ("10.0.0.1", 514)))
+            _run_async(listener._process_batch([(b"<134>test", ("10.0.0.1", 514))]))
 
         assert listener._event_count == 1
 
-    def test_on_message_received_parses_and_handles_event(self):
-        """Test that valid ONT event is parsed and handled."""
+    def test_process_batch_parses_and_handles_events(self):
+        """Test that valid ONT events are parsed and handled as one batch."""
         listener = SyslogListener()
         listener._ont_event_count = 0
 
@@ -111,35 +107,48 @@ class TestSyslogListener:
 
         with (
             patch("app.syslog.listener.huawei_parser") as mock_parser,
-            patch("app.syslog.listener.handle_ont_event") as mock_handler,
+            patch("app.syslog.listener.handle_ont_events") as mock_handler,
         ):
             mock_parser.parse_syslog.return_value = mock_msg
             mock_parser.parse_ont_event.return_value = mock_event
 
             _run_async(
-                listener._on_message_received(
-                    b"<134>ONTAUTOFIND OntSn=HWTC12345678 Fsp=0/0/0",
-                    ("10.0.0.1", 514),
+                listener._process_batch(
+                    [
+                        (
+                            b"<134>ONTAUTOFIND OntSn=HWTC12345678 Fsp=0/0/0",
+                            ("10.0.0.1", 514),
+                        ),
+                        (
+                            b"<134>ONTAUTOFIND OntSn=HWTC12345678 Fsp=0/0/0",
+                            ("10.0.0.1", 514),
+                        ),
+                    ]
                 )
             )
 
-        assert listener._ont_event_count == 1
-        mock_handler.assert_called_once_with(mock_event)
+        assert listener._ont_event_count == 2
+        mock_handler.assert_called_once_with([mock_event, mock_event])
 
-    def test_on_message_received_handles_parse_failure(self):
+    def test_process_batch_handles_parse_failure(self):
         """Test that parse failure is handled gracefully."""
         listener = SyslogListener()
 
-        with patch("app.syslog.listener.huawei_parser") as mock_parser:
+        with (
+            patch("app.syslog.listener.huawei_parser") as mock_parser,
+            patch("app.syslog.listener.handle_ont_events") as mock_handler,
+        ):
             mock_parser.parse_syslog.return_value = None
 
             # Should not raise
-            _run_async(listener._on_message_received(b"invalid", ("10.0.0.1", 514)))
+            _run_async(listener._process_batch([(b"invalid", ("10.0.0.1", 514))]))
+
+        mock_handler.assert_not_called()
 
         assert listener._event_count == 1
         assert listener._ont_event_count == 0
 
-    def test_on_message_received_handles_exception(self):
+    def test_process_batch_handles_exception(self):
         """Test that exceptions during processing are caught."""
         listener = SyslogListener()
 
@@ -147,7 +156,7 @@ class TestSyslogListener:
             mock_parser.parse_syslog.side_effect = Exception("Parse error")
 
             # Should not raise
-            _run_async(listener._on_message_received(b"test", ("10.0.0.1", 514)))
+            _run_async(listener._process_batch([(b"test", ("10.0.0.1", 514))]))
 
         assert listener._event_count == 1
 
@@ -200,13 +209,21 @@ class TestSyslogListenerIntegration:
         # Mock the handler to track calls
         handled_events = []
 
-        def capture_event(event):
-            handled_events.append(event)
+        def capture_events(events):
+            handled_events.extend(events)
 
-        # Simulate a complete message flow
-        with patch("app.syslog.listener.handle_ont_event", side_effect=capture_event):
+        # Simulate a complete message flow: socket -> queue -> batch -> handler
+        with patch("app.syslog.listener.handle_ont_events", side_effect=capture_events):
             data = b"<134>Jan 1 00:00:00 OLT %%01GPON/4/ONTAUTOFIND: OntSn=HWTC12345678 Fsp=0/1/2"
-            _run_async(listener._on_message_received(data, ("10.0.0.100", 514)))
+
+            async def _drive():
+                listener._pipeline.start()
+                SyslogProtocol(listener._pipeline.offer).datagram_received(
+                    data, ("10.0.0.100", 514)
+                )
+                await listener._pipeline.stop()
+
+            _run_async(_drive())
 
         assert len(handled_events) == 1
         event = handled_events[0]
@@ -215,3 +232,97 @@ class TestSyslogListenerIntegration:
         assert event.slot == 1
         assert event.port == 2
         assert event.source_ip == "10.0.0.100"
+
+
+class TestSyslogPipeline:
+    """Tests for the bounded batching ingest queue."""
+
+    def test_overflow_is_dropped_and_counted(self):
+        batches = []
+
+        async def _drive():
+            pipeline = SyslogPipeline(
+                AsyncMock(side_effect=batches.append), max_queue=3, batch_size=10
+            )
+            pipeline.start()
+            accepted = [pipeline.offer(b"x", ("10.0.0.1", 514)) for _ in range(5)]
+            depth = pipeline.depth
+            await pipeline.stop()
+            return pipeline, accepted, depth
+
+        pipeline, accepted, depth = _run_async(_drive())
+
+        assert accepted == [True, True, True, False, False]
+        assert depth == 3
+        assert pipeline.received == 5
+        assert pipeline.dropped == 2
+        assert [len(batch) for batch in batches] == [3]
+
+    def test_batches_are_capped_and_timed(self):
+        batches = []
+
+        async def _drive():
+            pipeline = SyslogPipeline(
+                AsyncMock(side_effect=batches.append),
+                batch_size=4,
+                flush_interval=0.01,
+            )
+            pipeline.start()
+            for n in range(6):
+                pipeline.offer(str(n).encode(), ("10.0.0.1", 514))
+            await pipeline.stop()
+            return pipeline.snapshot()
+
+        snapshot = _run_async(_drive())
+
+        assert [len(batch) for batch in batches] == [4, 2]
+        assert snapshot["batches"] == 2
+        assert snapshot["queue_depth"] == 0
+        assert snapshot["last_flush_seconds"] is not None
+
+    def test_failing_batch_does_not_stop_consumer(self):
+        calls = []
+
+        async def _process(batch):
+            calls.append(len(batch))
+            if len(calls) == 1:
+                raise RuntimeError("db down")
+
+        async def _drive():
+            pipeline = SyslogPipeline(_process, batch_size=1, flush_interval=0)
+            pipeline.start()
+            pipeline.offer(b"a", ("10.0.0.1", 514))
+            pipeline.offer(b"b", ("10.0.0.1", 514))
+            await pipeline.stop()
+
+        _run_async(_drive())
+
+        assert calls == [1, 1]
+
+
+def test_health_collector_describes_every_family_it_collects(monkeypatch):
+    from datetime import UTC, datetime
+
+    from app import metrics
+    from app.services import syslog_health
+
+    monkeypatch.setattr(
+        syslog_health,
+        "load_syslog_health",
+        lambda: {
+            "queue_depth": 3,
+            "queue_capacity": 10000,
+            "received": 120,
+            "dropped": 2,
+            "last_flush_seconds": 0.01,
+            "max_flush_seconds": 0.2,
+            "ts": datetime.now(UTC).isoformat(),
+        },
+    )
+    collector = metrics._SyslogListenerHealthCollector()
+
+    described = {family.name for family in collector.describe()}
+    collected = {family.name for family in collector.collect()}
+
+    assert collected == described
+    assert {"syslog_listener_received", "syslog_listener_dropped"} <= described
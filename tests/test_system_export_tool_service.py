@@ -363,9 +363,170 @@ def test_process_export_job_writes_file_and_marks_completed(db_session, monkeypa
     file_path = Path(str(result["file_path"]))
     assert file_path.exists()
     assert file_path.read_bytes()
+    assert result["rows_written"] == result["row_count"] >= 1
     events = (
         db_session.query(AuditEvent)
         .filter(AuditEvent.action == "export_job_completed")
         .all()
     )
     assert events
+
+
+def test_failed_progress_write_does_not_abort_export_job(db_session, monkeypatch):
+    from contextlib import contextmanager
+
+    db_session.add(
+        Subscriber(
+            first_name="Progress",
+            last_name="Down",
+            email="progress-down@example.com",
+        )
+    )
+    db_session.commit()
+    job = export_service.create_export_job(
+        db_session,
+        module="subscribers",
+        selected_fields=["email"],
+        delimiter=",",
+        export_format="csv",
+        date_from=None,
+        date_to=None,
+        status=None,
+        include_headers=True,
+        recipient_email="ops@example.com",
+        requested_by_email="ops@example.com",
+        row_count=12001,
+    )
+
+    class _DownAdapter:
+        @contextmanager
+        def session(self):
+            raise RuntimeError("database unavailable")
+            yield
+
+    monkeypatch.setattr(export_service, "db_session_adapter", _DownAdapter())
+    monkeypatch.setattr(export_service, "_EXPORT_PROGRESS_EVERY", 1)
+    monkeypatch.setattr(
+        export_service.email_service, "send_email", lambda **kwargs: True
+    )
+
+    result = export_service.process_export_job(db_session, job_id=str(job["id"]))
+
+    assert result["status"] == "completed"
+    assert result["rows_written"] == result["row_count"] >= 1
+
+
+def test_stream_export_renders_csv_lazily_and_reports_progress(db_session, monkeypatch):
+    for idx in range(5):
+        db_session.add(
+            Subscriber(
+                first_name="Stream",
+                last_name=str(idx),
+                email=f"stream-export-{idx}@example.com",
+            )
+        )
+    db_session.commit()
+    monkeypatch.setattr(export_service, "_EXPORT_PROGRESS_EVERY", 2)
+    progress: list[int] = []
+
+    export = export_service.stream_export(
+        db_session,
+        module="subscribers",
+        selected_fields=["email"],
+        delimiter=",",
+        export_format="csv",
+        on_progress=progress.append,
+    )
+    assert export.row_count == 0
+
+    body = b"".join(export.chunks).decode("utf-8")
+
+    assert body.splitlines()[0] == "email"
+    assert "stream-export-4@example.com" in body
+    assert export.row_count >= 5
+    assert progress[:2] == [2, 4]
+
+
+def test_stream_export_xlsx_is_a_readable_workbook(db_session):
+    import io
+    import zipfile
+
+    db_session.add(
+        Subscriber(
+            first_name="Stream",
+            last_name="Xlsx",
+            email="stream-xlsx@example.com",
+        )
+    )
+    db_session.commit()
+
+    export = export_service.stream_export(
+        db_session,
+        module="subscribers",
+        selected_fields=["email"],
+        delimiter=",",
+        export_format="xlsx",
+    )
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(export.chunks)))
+
+    assert archive.testzip() is None
+    sheet = archive.read("xl/worksheets/sheet1.xml").decode("utf-8")
+    assert "stream-xlsx@example.com" in sheet
+    assert export.media_type == export_service.XLSX_MEDIA_TYPE
+
+
+def test_stream_export_rejects_in_memory_formats(db_session):
+    with pytest.raises(ValueError):
+        export_service.stream_export(
+            db_session,
+            module="subscribers",
+            selected_fields=["email"],
+            delimiter=",",
+            export_format="pdf",
+        )
+
+
+def test_stream_export_body_reads_on_its_own_session(db_session, monkeypatch):
+    from contextlib import contextmanager
+
+    db_session.add(
+        Subscriber(
+            first_name="Stream",
+            last_name="Body",
+            email="stream-body@example.com",
+        )
+    )
+    db_session.commit()
+    sessions: list[str] = []
+
+    class _Adapter:
+        @contextmanager
+        def read_session(self):
+            sessions.append("open")
+            try:
+                yield db_session
+            finally:
+                sessions.append("closed")
+
+    monkeypatch.setattr(export_service, "db_session_adapter", _Adapter())
+
+    chunks, media_type, extension = export_service.stream_export_body(
+        module="subscribers",
+        selected_fields=["email"],
+        delimiter=",",
+        export_format="csv",
+    )
+    assert sessions == []
+
+    body = b"".join(chunks).decode("utf-8")
+
+    assert "stream-body@example.com" in body
+    assert (media_type, extension) == ("text/csv", "csv")
+    assert sessions == ["open", "closed"]
+    with pytest.raises(ValueError):
+        export_service.stream_export_body(
+            module="nope",
+            selected_fields=None,
+            delimiter=",",
+            export_format="csv",
+        )
@@ -1064,6 +1064,112 @@ class TestAutoLinkOnts:
             )
 
 
+class TestIncrementalDeviceSync:
+    @staticmethod
+    def _server(db_session, name: str) -> Tr069AcsServer:
+        from app.services.tr069 import acs_servers
+
+        return acs_servers.create(
+            db_session,
+            Tr069AcsServerCreate(
+                name=name,
+                base_url="http://genieacs:7557",
+                cwmp_url="http://acs/cwmp",
+                cwmp_username="u",
+                cwmp_password="p",
+                connection_request_username="cu",
+                connection_request_password="cp",
+            ),
+        )
+
+    def test_sync_fetches_only_devices_after_the_cursor(self, db_session) -> None:
+        from app.services.tr069 import _GENIEACS_SYNC_OVERLAP, CpeDevices
+
+        server = self._server(db_session, "Incremental ACS")
+        cursor = datetime.now(UTC) - timedelta(hours=1)
+        server.device_sync_cursor = cursor
+        server.device_full_sync_at = datetime.now(UTC) - timedelta(hours=2)
+        device = Tr069CpeDevice(
+            acs_server_id=server.id,
+            serial_number="INCR-0001",
+            is_active=True,
+        )
+        db_session.add(device)
+        db_session.commit()
+
+        last_inform_at = datetime.now(UTC).replace(microsecond=0)
+        mock_device = {
+            "_id": "00D09E-TestProduct-INCR-0001",
+            "_lastInform": last_inform_at.isoformat(),
+        }
+        with patch("app.services.tr069.create_genieacs_client") as MockClient:
+            instance = MockClient.return_value
+            instance.list_devices.return_value = [mock_device]
+            instance.parse_device_id.return_value = (
+                "00D09E",
+                "TestProduct",
+                "INCR-0001",
+            )
+            instance.extract_parameter_value.return_value = None
+
+            result = CpeDevices.sync_from_genieacs(db_session, str(server.id))
+
+        assert result["full"] is False
+        assert (result["created"], result["updated"]) == (0, 1)
+        kwargs = instance.list_devices.call_args.kwargs
+        since = datetime.fromisoformat(
+            kwargs["query"]["_lastInform"]["$gte"].replace("Z", "+00:00")
+        )
+        assert abs(since - (cursor - _GENIEACS_SYNC_OVERLAP)) < timedelta(seconds=1)
+        assert kwargs["sort"] == {"_lastInform": 1}
+        db_session.refresh(device)
+        db_session.refresh(server)
+        assert device.genieacs_device_id == "00D09E-TestProduct-INCR-0001"
+        cursor_after = server.device_sync_cursor.replace(tzinfo=UTC)
+        assert cursor_after == last_inform_at
+
+    def test_sync_without_cursor_is_a_full_reconcile(self, db_session) -> None:
+        from app.services.tr069 import CpeDevices
+
+        server = self._server(db_session, "First Sync ACS")
+        with patch("app.services.tr069.create_genieacs_client") as MockClient:
+            instance = MockClient.return_value
+            instance.list_devices.return_value = []
+
+            result = CpeDevices.sync_from_genieacs(db_session, str(server.id))
+
+        assert result["full"] is True
+        assert instance.list_devices.call_args.kwargs["query"] is None
+        db_session.refresh(server)
+        assert server.device_full_sync_at is not None
+
+    def test_device_pages_keep_ties_on_a_page_boundary(self) -> None:
+        from app.services.tr069 import _genieacs_device_pages
+
+        stamp = "2026-01-01T00:00:00.000Z"
+        later = "2026-01-01T00:00:01.000Z"
+        devices = [
+            {"_id": "a", "_lastInform": stamp},
+            {"_id": "b", "_lastInform": stamp},
+            {"_id": "c", "_lastInform": stamp},
+            {"_id": "d", "_lastInform": later},
+        ]
+
+        def list_devices(*, query, projection, sort, limit):
+            floor = query["_lastInform"]["$gte"] if query else ""
+            return [d for d in devices if d["_lastInform"] >= floor][:limit]
+
+        client = SimpleNamespace(list_devices=list_devices)
+        pages = list(
+            _genieacs_device_pages(client, since=None, projection="_id", page_size=2)
+        )
+
+        assert [[d["_id"] for d in page] for page in pages] == [
+            ["a", "b"],
+            ["c", "d"],
+        ]
+
+
 class TestCreateOntFromTr069Device:
     def test_create_ont_from_tr069_device_creates_inactive_ont(
         self, db_session
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
 from app.models.catalog import (
@@ -21,6 +21,7 @@ from app.models.usage import (
     AccountingStatus,
     QuotaBucket,
     RadiusAccountingSession,
+    UsageOctetDelta,
 )
 from app.services.usage import meter_usage_into_quota
 
@@ -150,3 +151,117 @@ def test_metering_is_idempotent(db_session, subscriber):
     )
     assert Decimal(str(bucket.used_gb)) == Decimal("3.00")
     assert result["changed_subscription_ids"] == []
+
+
+def _delta(db, sub, octets, *, session_start=None):
+    db.add(
+        UsageOctetDelta(
+            subscription_id=sub.id,
+            session_start=session_start or datetime.now(UTC),
+            octets=octets,
+        )
+    )
+    db.flush()
+
+
+def test_incremental_metering_applies_only_journaled_deltas(db_session, subscriber):
+    allowance = _allowance(db_session, 10)
+    offer = _offer(db_session, "capped-delta", allowance=allowance)
+    sub = _sub(db_session, subscriber, offer)
+    _session(db_session, sub, gb_in=2, gb_out=0)
+    db_session.commit()
+    meter_usage_into_quota(db_session)  # seeds the bucket absolutely: 2 GB
+
+    _delta(db_session, sub, 3 * _GB)
+    _delta(
+        db_session, sub, 1 * _GB, session_start=datetime.now(UTC) - timedelta(days=40)
+    )
+    db_session.commit()
+    result = meter_usage_into_quota(db_session)
+
+    assert result["changed_subscription_ids"] == [str(sub.id)]
+    assert result["deltas"] == 2
+    bucket = (
+        db_session.query(QuotaBucket)
+        .filter(QuotaBucket.subscription_id == sub.id)
+        .one()
+    )
+    # The delta from a previous period is drained but not counted.
+    assert bucket.used_octets == 5 * _GB
+    assert Decimal(str(bucket.used_gb)) == Decimal("5.00")
+    assert db_session.query(UsageOctetDelta).count() == 0
+
+
+def test_full_recompute_corrects_incremental_drift(db_session, subscriber):
+    allowance = _allowance(db_session, 10)
+    offer = _offer(db_session, "capped-drift", allowance=allowance)
+    sub = _sub(db_session, subscriber, offer)
+    _session(db_session, sub, gb_in=4, gb_out=0)
+    db_session.commit()
+    meter_usage_into_quota(db_session)
+
+    # A journaled delta whose session never reached the table.
+    _delta(db_session, sub, 1 * _GB)
+    db_session.commit()
+    meter_usage_into_quota(db_session)
+    result = meter_usage_into_quota(db_session, full=True)
+
+    assert result["drift"] == 1
+    bucket = (
+        db_session.query(QuotaBucket)
+        .filter(QuotaBucket.subscription_id == sub.id)
+        .one()
+    )
+    assert Decimal(str(bucket.used_gb)) == Decimal("4.00")
+
+
+def test_seed_absorbs_an_import_that_lands_after_the_delta_read(
+    db_session, subscriber, monkeypatch
+):
+    from app.services import usage as usage_service
+
+    allowance = _allowance(db_session, 10)
+    offer = _offer(db_session, "capped-seed-race", allowance=allowance)
+    sub = _sub(db_session, subscriber, offer)
+    _session(db_session, sub, gb_in=2, gb_out=0)
+    _delta(db_session, sub, 2 * _GB)
+    db_session.commit()
+    real_period_octets = usage_service._period_octets
+
+    def _import_then_sum(db, subscription_id, bucket):
+        # An import commits its session and delta after the batch was read.
+        _session(db, sub, gb_in=1, gb_out=0)
+        _delta(db, sub, 1 * _GB)
+        return real_period_octets(db, subscription_id, bucket)
+
+    monkeypatch.setattr(usage_service, "_period_octets", _import_then_sum)
+    meter_usage_into_quota(db_session)
+    monkeypatch.setattr(usage_service, "_period_octets", real_period_octets)
+    db_session.commit()
+    result = meter_usage_into_quota(db_session)
+
+    bucket = (
+        db_session.query(QuotaBucket)
+        .filter(QuotaBucket.subscription_id == sub.id)
+        .one()
+    )
+    assert bucket.used_octets == 3 * _GB
+    assert result["changed_subscription_ids"] == []
+    assert db_session.query(UsageOctetDelta).count() == 0
+
+
+def test_seed_waits_when_the_import_lock_is_busy(db_session, subscriber):
+    allowance = _allowance(db_session, 10)
+    offer = _offer(db_session, "capped-seed-wait", allowance=allowance)
+    sub = _sub(db_session, subscriber, offer)
+    _session(db_session, sub, gb_in=2, gb_out=0)
+    db_session.commit()
+
+    assert meter_usage_into_quota(db_session, seed=False)["metered"] == 0
+    assert meter_usage_into_quota(db_session)["metered"] == 1
+    bucket = (
+        db_session.query(QuotaBucket)
+        .filter(QuotaBucket.subscription_id == sub.id)
+        .one()
+    )
+    assert bucket.used_octets == 2 * _GB